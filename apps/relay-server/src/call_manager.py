@@ -20,6 +20,7 @@ if TYPE_CHECKING:
     from fastapi import WebSocket
 
     from src.realtime.audio_router import AudioRouter
+    from src.realtime.first_message import GreetingPrefetch
     from src.realtime.sessions.session_manager import DualSessionManager
 
 logger = logging.getLogger(__name__)
@@ -34,6 +35,7 @@ class CallManager:
         self._routers: dict[str, "AudioRouter"] = {}
         self._app_ws: dict[str, "WebSocket"] = {}
         self._listen_tasks: dict[str, asyncio.Task] = {}
+        self._greeting_prefetches: dict[str, "GreetingPrefetch"] = {}
         self._cleanup_locks: dict[str, asyncio.Lock] = {}
 
     # --- Register ---
@@ -53,6 +55,9 @@ class CallManager:
     def register_listen_task(self, call_id: str, task: asyncio.Task) -> None:
         self._listen_tasks[call_id] = task
 
+    def register_greeting_prefetch(self, call_id: str, prefetch: "GreetingPrefetch") -> None:
+        self._greeting_prefetches[call_id] = prefetch
+
     # --- Get (읽기 전용) ---
 
     def get_call(self, call_id: str) -> ActiveCall | None:
@@ -67,6 +72,9 @@ class CallManager:
     def get_app_ws(self, call_id: str) -> "WebSocket | None":
         return self._app_ws.get(call_id)
 
+    def get_greeting_prefetch(self, call_id: str) -> "GreetingPrefetch | None":
+        return self._greeting_prefetches.get(call_id)
+
     @property
     def active_call_count(self) -> int:
         return len(self._calls)
@@ -126,7 +134,11 @@ class CallManager:
                     from src.db.supabase_client import get_client
 
                     client = await get_client()
-                    pre_result = "ERROR" if reason in ("error", "server_shutdown") else "SUCCESS"
+                    pre_result = (
+                        "ERROR"
+                        if reason in ("error", "server_shutdown", "session_failed")
+                        else "SUCCESS"
+                    )
                     await (
                         client.table("calls")
                         .update({"status": "COMPLETED", "result": pre_result})
@@ -167,9 +179,16 @@ class CallManager:
                 except (asyncio.CancelledError, Exception):
                     pass
 
+            # 2-1. 첫 고지 prefetch 취소 (Media Stream 연결 전 종료 시 WebSocket 직접 읽기 중)
+            prefetch = self._greeting_prefetches.pop(call_id, None)
+            if prefetch:
+                await prefetch.cancel()
+
             # 3. DualSession close
             session = self._sessions.pop(call_id, None)
             if session:
+                if call:
+                    call.call_metrics.dispatch_lag_ms = session.dispatch_lag_summary()
                 try:
                     await session.close()
                 except Exception as e:
@@ -212,7 +231,8 @@ class CallManager:
                     "  session_a: avg=%.0fms  samples=%d  %s\n"
                     "  session_b: avg_e2e=%.0fms  samples=%d  %s\n"
                     "  first_msg=%.0fms  echo=%d  echo_breakthroughs=%d  interrupts=%d\n"
-                    "  guardrail: level2=%d  level3=%d  tokens=%d",
+                    "  guardrail: level2=%d  level3=%d  rule=%d  llm=%d  llm_failed=%d  tokens=%d\n"
+                    "  prompt_cache: realtime=%.0f%%  chat=%.0f%%  saved=$%.4f",
                     call.call_id, call.mode.value, call.communication_mode.value,
                     duration_s, m.turn_count, call.cost_tokens.cost_usd,
                     avg_a, len(m.session_a_latencies_ms),
@@ -222,7 +242,11 @@ class CallManager:
                     m.first_message_latency_ms, m.echo_suppressions,
                     m.echo_gate_breakthroughs, m.interrupt_count,
                     m.guardrail_level2_count, m.guardrail_level3_count,
+                    m.guardrail_rule_rewrites, m.guardrail_llm_calls, m.guardrail_llm_failures,
                     call.cost_tokens.total,
+                    call.cost_tokens.realtime_cache_hit_rate * 100,
+                    call.cost_tokens.chat_cache_hit_rate * 100,
+                    call.cost_tokens.cache_savings_usd,
                 )
 
                 # call_result_data에 메트릭 삽입 (기존 JSONB 컬럼 활용)
@@ -10,6 +10,8 @@ try:
 except IndexError:
     _ROOT_DIR = Path(__file__).resolve().parent  # Docker fallback → env vars 사용
 _ENV_FILE = _ROOT_DIR / ".env"
+# relay-server 앱 루트 (config.py → src → relay-server, Docker에서는 /app) — 런타임 데이터 경로 기준
+_APP_DIR = Path(__file__).resolve().parent.parent
 
 
 class Settings(BaseSettings):
@@ -21,8 +23,28 @@ class Settings(BaseSettings):
     # OpenAI
     openai_api_key: str = ""
     openai_realtime_model: str = "gpt-realtime"
+    realtime_voice: str = ""  # Session A TTS 음성 (빈 값이면 OpenAI 기본 음성)
     openai_ws_connect_timeout_s: float = 30.0  # WebSocket handshake timeout (기본 10s → 30s)
     openai_ws_connect_retries: int = 2  # 연결 실패 시 재시도 횟수
+    # Realtime 세션 풀: 사전 연결된 유휴 WebSocket을 통화 시작 시 claim (핸드셰이크 생략)
+    realtime_session_pool_enabled: bool = True
+    realtime_session_pool_min_idle: int = 2  # 최소 유휴 연결 (1통화 = Session A + B)
+    realtime_session_pool_max_idle: int = 10
+    realtime_session_pool_max_age_s: float = 900.0  # 유휴 연결 교체 주기 (세션 최대 수명 - 최대 통화 시간 이내)
+    realtime_session_pool_lookahead_s: float = 60.0  # 목표 유휴 수 = claim 도착률 × lookahead
+    # Media Stream 연결 시 세션 준비 대기 한도 (세션 연결은 Twilio 발신과 병렬 진행)
+    session_ready_timeout_s: float = 15.0
+    # 첫 고지 ring-time prefetch: 벨이 울리는 동안 고지 오디오 생성 (Relay Mode)
+    greeting_prefetch_enabled: bool = True
+    greeting_prefetch_timeout_s: float = 10.0  # 생성 최대 대기
+    greeting_prefetch_handover_timeout_s: float = 1.0  # Media Stream 연결 시 진행 중인 생성 완료 대기
+    greeting_prefetch_max_hold_s: float = 2.5  # 수신자 첫 발화 종료를 기다리는 최대 보류 시간
+    # 공유 OpenAI HTTP 클라이언트 (ChatTranslator / FallbackLLM / Recovery Whisper 공용)
+    openai_http2_enabled: bool = True  # h2 패키지 미설치 시 HTTP/1.1로 fallback
+    openai_http_max_connections: int = 50
+    openai_http_max_keepalive: int = 20
+    openai_http_keepalive_expiry_s: float = 120.0  # 유휴 keep-alive 연결 유지 시간 (httpx 기본 5s)
+    openai_http_warmup_requests: int = 2  # 워밍업 시 동시에 여는 연결 수
 
     # Supabase
     supabase_url: str = ""
@@ -78,6 +100,9 @@ class Settings(BaseSettings):
 
     # STT 모델 (input_audio_transcription)
     stt_model: str = "whisper-1"
+    # 원문 자막 잠정 표시: STT delta를 발화 중 스트리밍 (gpt-4o-transcribe 계열에서 delta 제공)
+    stt_partial_captions_enabled: bool = True
+    stt_filter_extra_data_dir: str = ""  # STT 할루시네이션 규칙 추가 JSON 디렉토리 (내장 data/에 병합, 코드 변경 없이 확장)
 
     # Anti-Hallucination: 발화 길이 대비 번역 최대 비율 (chars/sec)
     # 한국어 평균 발화: ~4음절/sec, 영어 번역: ~15 chars/sec → 100 c/s는 충분한 마진
@@ -106,6 +131,12 @@ class Settings(BaseSettings):
     local_vad_silence_threshold: float = 0.35
     local_vad_min_speech_frames: int = 5    # 5 × 32ms = 160ms (96ms는 노이즈 버스트 오감지, 160ms로 발화 onset 안정 확보)
     local_vad_min_silence_frames: int = 25  # 25 × 32ms = 800ms (인트라-문장 쉼 200-500ms 무시, 진짜 발화 종료 1-3s만 감지)
+    # 운율/의미 기반 조기 발화 종료 (Silero 확률 + 에너지/피치 하강 + 부분 STT 종결 어미)
+    local_vad_endpointing_enabled: bool = True
+    local_vad_endpoint_min_silence_frames: int = 8  # 8 × 32ms = 256ms (이보다 짧은 쉼에서는 조기 종료 안 함)
+    local_vad_endpoint_score_threshold: float = 0.7  # 턴 완료 점수 임계값 (높을수록 보수적, 미달 시 800ms 폴백)
+    local_vad_endpoint_shadow: bool = True  # True: 판정만 기록하고 조기 종료 안 함 (오프라인 평가용 trace 수집)
+    local_vad_endpoint_trace_path: str = ""  # 턴별 endpointer trace JSONL 경로 (빈 값이면 비활성)
 
     # 클라이언트 측 오디오 에너지 게이트 (무음/소음 필터링)
     # 에너지 게이트: 임계값 이하 오디오를 silence로 교체하여 VAD에 전달
@@ -117,6 +148,13 @@ class Settings(BaseSettings):
     echo_settling_rms_threshold: float = 200.0  # Settling 중 VAD 통과 임계값 (에코 이미 감쇠, 정상 발화 수준)
     session_b_min_peak_rms: float = 300.0  # Peak RMS 품질 필터: 조용한 PSTN 발화(200-500)도 통과
 
+    # Session A 입력 무음 억제 (V2V, App pcm16 → Session A)
+    # 긴 무음을 서버에서 잘라 업링크 대역폭 + Realtime audio_input 토큰 절감
+    user_audio_silence_suppression_enabled: bool = True  # Client commit 모드 전용 (Server VAD 시 비활성)
+    user_audio_silence_rms_threshold: float = 200.0  # pcm16 RMS: 조용한 발화(~500) 아래, 실내 소음 위
+    user_audio_silence_hangover_ms: float = 500.0  # 발화 직후 무음 유지 구간 (단어 사이 쉼 보존)
+    user_audio_silence_preroll_ms: float = 300.0  # 발화 시작 전 포함할 오디오 (onset 잘림 방지)
+
     # Max speech duration: 에너지 게이트로도 VAD speech_stopped가 지연되는 극단 케이스 안전망
     # 이 시간 초과 시 오디오 버퍼를 강제 commit하여 번역 시작
     max_speech_duration_s: float = 8.0
@@ -124,11 +162,51 @@ class Settings(BaseSettings):
     # Speculative STT: 발화 중 조기 commit으로 STT 선행 시작 (T2V/Agent Chat API 경로)
     speculative_stt_enabled: bool = True
     speculative_stt_delay_s: float = 1.0  # speech_started 후 N초 뒤 중간 commit (P50 speech=1183ms 기반 튜닝)
+    speculative_stt_adaptive: bool = True  # 통화별 발화 길이 분포로 commit 지연 조정 (초기 표본 전에는 위 고정값)
+    speculative_stt_min_delay_s: float = 0.6  # 적응 지연 하한 (Part 1이 너무 짧으면 STT 정확도 저하)
+    speculative_stt_max_delay_s: float = 2.5  # 적응 지연 상한 (짧은 응답 위주 통화에서 낭비 commit 방지)
+    speculative_stt_min_gain_s: float = 0.3  # commit 후 남은 발화가 이보다 짧으면 waste로 집계
+    speculative_stt_pause_trigger: bool = True  # Local VAD 발화 내 쉼에서 즉시 commit (타이머보다 우선)
+    speculative_stt_pause_frames: int = 6  # 6 × 32ms = 192ms 쉼 (조기 종료 256ms보다 짧게)
+    speculative_translation_enabled: bool = True  # Part 1 STT 도착 즉시 선행 번역, Part 2는 이어 번역
 
     # Session B Chat API 번역 (T2V/Agent 모드 한정)
     session_b_use_chat_translation: bool = True
     session_b_chat_translation_model: str = "gpt-4o-mini"
-    session_b_chat_translation_timeout_ms: int = 3000
+    session_b_chat_translation_timeout_ms: int = 3000  # 스트리밍: 첫 토큰 / 청크 간 정체 한도
+    session_b_chat_translation_streaming: bool = True  # 토큰 단위 자막 스트리밍 (TTFT 단축)
+    # Hedged 요청: 첫 요청이 적응형 임계값(최근 지연 percentile) 내 미응답 시 두 번째 요청 발송
+    session_b_chat_hedge_enabled: bool = True
+    session_b_chat_hedge_model: str = ""  # hedge 요청 모델 (빈 값이면 번역 모델과 동일)
+    session_b_chat_hedge_percentile: float = 0.9
+    session_b_chat_hedge_min_samples: int = 20  # 이 미만이면 initial 임계값 사용
+    session_b_chat_hedge_initial_ms: float = 1200.0
+    session_b_chat_hedge_min_ms: float = 300.0
+    session_b_chat_hedge_max_ms: float = 2500.0
+    # 번역 메모 캐시: 반복되는 짧은 발화("네", "잠시만요")의 Chat API 번역 재사용 (프로세스 전역)
+    translation_cache_enabled: bool = True
+    translation_cache_max_entries: int = 2000
+    translation_cache_ttl_s: float = 3600.0
+    translation_cache_max_chars: int = 24  # 정규화 후 이 길이 이하 발화만 캐시
+    translation_cache_hot_set_size: int = 200  # 반복 hit 항목은 LRU 축출 제외
+    translation_cache_context_aware: bool = False  # True면 직전 대화 턴 지문을 키에 포함
+    # 필러 오디오 캐시: 정형 문구(타이핑/Guardrail 필러) g711_ulaw 클립을 Realtime 왕복 없이 재생
+    filler_audio_cache_enabled: bool = True
+    filler_audio_cache_max_entries: int = 64
+    filler_audio_cache_dir: str = str(_APP_DIR / "cache" / "filler_audio")  # 클립 영속화 경로 (빈 값이면 메모리만)
+    # T2V 연속 텍스트 입력 병합: 병합 창 안 또는 앞 응답 진행 중 도착한 메시지를 한 번에 번역 요청
+    t2v_coalesce_enabled: bool = True
+    t2v_coalesce_window_ms: float = 150.0  # 마지막 입력 후 추가 입력을 기다리는 시간 (유휴 입력은 대기 없음)
+    # T2V 긴 텍스트 입력 문장 단위 파이프라이닝: 첫 문장 응답을 즉시 요청, 나머지는 순서대로 이어서 요청
+    t2v_sentence_pipeline_enabled: bool = True
+    t2v_sentence_pipeline_min_chars: int = 40  # 입력이 이 길이 미만이면 분할 안 함
+    t2v_sentence_min_chars: int = 12  # 이보다 짧은 문장은 다음 문장과 합쳐서 요청
+    # 대화 컨텍스트 주입: 토큰 예산 (최근 턴 원문 + 예산 밖 오래된 턴은 롤링 요약)
+    context_token_budget: int = 200
+    context_summary_token_budget: int = 60  # 예산 중 롤링 요약 몫 상한
+    context_summary_turn_tokens: int = 16  # 요약으로 접을 때 턴당 남기는 토큰
+    # Realtime 세션별 대화 아이템 토큰 예산 (초과 시 오래된 아이템 일괄 삭제, 0이면 제한 없음)
+    conversation_token_budget: int = 2000
 
     # Logging
     log_level: str = "INFO"
@@ -140,6 +218,16 @@ class Settings(BaseSettings):
     guardrail_enabled: bool = True
     guardrail_fallback_model: str = "gpt-4o-mini"
     guardrail_fallback_timeout_ms: int = 2000
+    guardrail_rule_rewrite_enabled: bool = True  # 규칙 재작성으로 처리 가능한 교정은 Fallback LLM 생략
+    guardrail_early_correction_enabled: bool = True  # Level 3 상향 시점에 교정 시작 (transcript.done 대기 X)
+    # Level 2 백그라운드 교정 워커 (프로세스 전역 큐)
+    guardrail_correction_queue_size: int = 64  # 대기 작업 상한 (초과 시 폐기)
+    guardrail_correction_concurrency: int = 2  # 동시 LLM 교정 요청 상한
+    guardrail_correction_batch_size: int = 8  # LLM 요청 1회당 최대 텍스트 수
+    guardrail_correction_batch_wait_ms: float = 200.0  # 배치를 모으는 대기 시간
+    guardrail_correction_sample_rate: float = 1.0  # LLM 교정 샘플링 비율 (0~1)
+    guardrail_correction_batch_timeout_ms: int = 8000  # 배치 교정 타임아웃 (백그라운드라 Level 3보다 길게)
+    guardrail_correction_log_file: str = ""  # log_dir 하위 JSONL (opt-in, 예: guardrail_corrections.jsonl — 빈 값이면 기록 안 함)
 
     model_config = {
         "env_file": str(_ENV_FILE),
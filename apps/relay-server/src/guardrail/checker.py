@@ -7,7 +7,7 @@ PRD 텍스트 델타 검사 메커니즘:
   response.text.delta (텍스트 먼저 도착)
     -> Guardrail Checker: 규칙 필터 매칭
       - 매칭 없음 -> Level 1 PASS
-      - 반말/비격식 -> Level 2 (비동기 교정)
+      - 반말/비격식 -> Level 2 (백그라운드 교정 큐)
       - 금지어/욕설 -> Level 3 (TTS 차단)
 
   response.audio.delta (오디오 약간 후에 도착)
@@ -21,10 +21,15 @@ import logging
 import time
 from dataclasses import dataclass
 from enum import IntEnum
+from typing import Callable
 
+from src.config import settings
+from src.guardrail.correction_worker import correction_worker
 from src.guardrail.dictionary import get_filler_text
 from src.guardrail.fallback_llm import FallbackLLM
-from src.guardrail.filter import FilterResult, TextFilter
+from src.guardrail.filter import FilterCategory, FilterResult, TextFilter
+from src.guardrail.rewriter import RuleRewriter
+from src.guardrail.stream_filter import StreamingTextFilter
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +50,7 @@ class GuardrailResult:
     filler_text: str = ""
     filter_result: FilterResult | None = None
     correction_time_ms: float = 0.0
+    correction_source: str = ""  # "rule" (규칙 재작성) / "llm" (Fallback LLM) / "llm_failed" (LLM 실패, 원문 유지)
 
     @property
     def is_blocked(self) -> bool:
@@ -63,6 +69,7 @@ class GuardrailChecker:
     PRD: 100자 단위로 규칙 필터 매칭.
     텍스트 델타가 오디오보다 먼저 도착하므로,
     오디오가 Twilio로 전달되기 전에 텍스트를 검사하여 차단할 수 있다.
+    델타 검사는 StreamingTextFilter로 증분 수행한다 (새 문자만 스캔).
     """
 
     def __init__(
@@ -73,10 +80,11 @@ class GuardrailChecker:
         self._target_language = target_language
         self._enabled = enabled
         self._text_filter = TextFilter(target_language=target_language)
+        self._stream_filter = StreamingTextFilter(target_language=target_language)
+        self._rewriter = RuleRewriter(target_language=target_language)
         self._fallback_llm = FallbackLLM()
 
-        # 텍스트 델타 버퍼 (100자 단위 검사)
-        self._text_buffer: str = ""
+        # 텍스트 델타 버퍼(100자 단위 검사)는 StreamingTextFilter가 소유
         self._current_level: GuardrailLevel = GuardrailLevel.LEVEL_1
 
     @property
@@ -91,7 +99,7 @@ class GuardrailChecker:
 
     def reset(self) -> None:
         """새 응답 시작 시 상태를 초기화한다."""
-        self._text_buffer = ""
+        self._stream_filter.reset()
         self._current_level = GuardrailLevel.LEVEL_1
 
     def check_text_delta(self, delta: str) -> GuardrailLevel:
@@ -106,18 +114,22 @@ class GuardrailChecker:
         if not self._enabled:
             return GuardrailLevel.LEVEL_1
 
-        self._text_buffer += delta
+        self._stream_filter.feed(delta)
+        # Level 3은 최고 레벨 — 더 상향될 수 없으므로 검사 생략
+        if self._current_level == GuardrailLevel.LEVEL_3:
+            return self._current_level
 
         # 100자 단위 검사 또는 문장 끝 감지
-        if len(self._text_buffer) >= 100 or delta.rstrip().endswith((".", "!", "?", "요", "다")):
-            level = self._classify(self._text_buffer)
+        buffer = self._stream_filter.text
+        if len(buffer) >= 100 or delta.rstrip().endswith((".", "!", "?", "요", "다")):
+            level = self._level_for(self._stream_filter.checkpoint())
             # Level은 상향만 가능
             if level > self._current_level:
                 self._current_level = level
                 logger.info(
                     "Guardrail level escalated to %d for text: '%s'",
                     level,
-                    self._text_buffer[:60],
+                    buffer[:60],
                 )
 
         return self._current_level
@@ -135,13 +147,7 @@ class GuardrailChecker:
             )
 
         filter_result = self._text_filter.check(text)
-
-        if filter_result.has_profanity or filter_result.has_threat:
-            level = GuardrailLevel.LEVEL_3
-        elif filter_result.has_informal:
-            level = GuardrailLevel.LEVEL_2
-        else:
-            level = GuardrailLevel.LEVEL_1
+        level = self._level_for({m.category for m in filter_result.matches})
 
         return GuardrailResult(
             level=level,
@@ -151,9 +157,11 @@ class GuardrailChecker:
         )
 
     async def correct_text(self, text: str) -> GuardrailResult:
-        """Level 3 텍스트를 Fallback LLM으로 교정한다 (동기).
+        """Level 2/3 텍스트를 교정한다.
 
-        PRD: 2초 타임아웃, 초과 시 원문 그대로 전달.
+        규칙 재작성(RuleRewriter)이 모든 매칭을 처리하면 LLM 호출 없이 사용하고,
+        하나라도 처리하지 못하면 Fallback LLM으로 교정한다.
+        PRD: LLM 2초 타임아웃, 초과 시 원문 그대로 전달.
         """
         start = time.monotonic()
         result = self.check_full_text(text)
@@ -161,7 +169,19 @@ class GuardrailChecker:
         if result.level == GuardrailLevel.LEVEL_1:
             return result
 
-        corrected = await self._fallback_llm.correct(text, self._target_language)
+        rewrite = None
+        if settings.guardrail_rule_rewrite_enabled:
+            rewrite = self._rewriter.rewrite(text, result.filter_result)
+
+        if rewrite is not None and rewrite.covered:
+            corrected = rewrite.text
+            result.correction_source = "rule"
+        else:
+            corrected = await self._fallback_llm.try_correct(text, self._target_language)
+            result.correction_source = "llm"
+            if corrected is None:
+                corrected = text  # PRD: 타임아웃/에러 시 원문 그대로 전달
+                result.correction_source = "llm_failed"
         elapsed_ms = (time.monotonic() - start) * 1000
 
         result.corrected_text = corrected
@@ -169,31 +189,62 @@ class GuardrailChecker:
 
         return result
 
-    async def correct_async(self, text: str) -> None:
-        """Level 2 텍스트를 비동기로 교정한다 (로그 기록만).
+    def submit_level2_correction(
+        self,
+        text: str,
+        on_result: Callable[[GuardrailResult], None] | None = None,
+    ) -> bool:
+        """Level 2 텍스트를 백그라운드 교정한다 (로그 기록만).
+
+        PRD Level 2: TTS 출력은 일단 Twilio로 전달, 동시에 교정 요청.
+        규칙 재작성으로 처리되면 즉시 결과를 전달하고, 아니면 프로세스 전역
+        correction_worker 큐에 넣는다 (동시 LLM 요청 상한, 중복 제거, 샘플링, 배치).
+        교정 결과는 교정 로그(학습 데이터)에 기록된다.
 
-        PRD Level 2: TTS 출력은 일단 Twilio로 전달, 동시에 Fallback LLM에 교정 요청.
-        교정 결과가 다르면 로그에 기록 (학습 데이터).
+        Args:
+            on_result: 교정 완료 시 호출 (규칙 재작성이면 반환 전에 호출)
+
+        Returns:
+            교정이 수행/예약되었으면 True (Level 1, 샘플링 제외, 큐 초과면 False)
         """
-        try:
-            result = await self.correct_text(text)
-            if result.corrected_text and result.corrected_text != text:
+        start = time.monotonic()
+        result = self.check_full_text(text)
+        if result.level == GuardrailLevel.LEVEL_1:
+            return False
+
+        if settings.guardrail_rule_rewrite_enabled:
+            rewrite = self._rewriter.rewrite(text, result.filter_result)
+            if rewrite.covered:
+                result.corrected_text = rewrite.text
+                result.correction_source = "rule"
+                result.correction_time_ms = (time.monotonic() - start) * 1000
+                correction_worker.record(self._target_language, text, rewrite.text, "rule")
+                if on_result:
+                    on_result(result)
+                return True
+
+        def _on_llm_result(corrected: str | None, elapsed_ms: float) -> None:
+            result.corrected_text = text if corrected is None else corrected
+            result.correction_source = "llm_failed" if corrected is None else "llm"
+            result.correction_time_ms = elapsed_ms
+            if corrected != text:
                 logger.info(
-                    "Async correction (Level 2): '%s' -> '%s' (%.0fms)",
+                    "Async correction (Level 2, llm): '%s' -> '%s' (%.0fms)",
                     text[:60],
-                    result.corrected_text[:60],
-                    result.correction_time_ms,
+                    corrected[:60],
+                    elapsed_ms,
                 )
-        except Exception:
-            logger.exception("Async correction failed for: '%s'", text[:60])
+            if on_result:
+                on_result(result)
 
-    def _classify(self, text: str) -> GuardrailLevel:
-        """텍스트를 분석하여 Guardrail Level을 결정한다."""
-        filter_result = self._text_filter.check(text)
+        return correction_worker.submit(text, self._target_language, _on_llm_result)
 
-        if filter_result.has_profanity or filter_result.has_threat:
+    @staticmethod
+    def _level_for(categories: set[FilterCategory]) -> GuardrailLevel:
+        """매칭 카테고리 → Guardrail Level."""
+        if FilterCategory.PROFANITY in categories or FilterCategory.THREAT in categories:
             return GuardrailLevel.LEVEL_3
-        elif filter_result.has_informal:
+        elif categories:
             return GuardrailLevel.LEVEL_2
         else:
             return GuardrailLevel.LEVEL_1
@@ -0,0 +1,288 @@
+"""Level 2 백그라운드 교정 워커 (프로세스 싱글톤).
+
+Level 2 교정은 통화 턴마다 correct_async task를 만들어 Fallback LLM을 호출했고,
+결과는 로그에만 남았다. 부하가 몰리면 task와 LLM 요청이 통화 수에 비례해 무제한으로 쌓인다.
+
+이 워커는 LLM이 필요한 Level 2 교정을 프로세스 전체에서 한 큐로 모은다:
+  - 상한: 대기 작업 수(queue_size) 초과 시 새 작업 폐기, 동시 LLM 요청 수는 concurrency로 고정
+  - 중복 제거: 같은 (언어, 텍스트)가 대기 중이면 합치고, 최근 교정 결과는 재사용
+  - 샘플링: sample_rate 비율만 LLM으로 교정 (나머지는 건너뜀)
+  - 배치: 같은 언어 작업을 batch_wait_ms 동안 모아 한 번의 LLM 요청으로 교정
+  - 기록: 교정 결과를 JSONL 로그(guardrail_correction_log_file 설정 시)에 남겨 오프라인 튜닝에 사용.
+    파일 쓰기는 asyncio.to_thread로 수행해 이벤트 루프를 막지 않는다.
+
+워커 task는 대기 작업이 있을 때만 떠 있다 (큐가 비면 종료).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from src.config import settings
+from src.guardrail.fallback_llm import FallbackLLM
+
+logger = logging.getLogger(__name__)
+
+_Key = tuple[str, str]  # (언어, 텍스트)
+ResultCallback = Callable[[str | None, float], None]  # (교정 텍스트 — LLM 실패면 None, 소요 ms)
+
+
+@dataclass
+class _Job:
+    language: str
+    text: str
+    enqueued_at: float
+    callbacks: list[ResultCallback] = field(default_factory=list)
+
+
+class CorrectionWorker:
+    """프로세스 전역 Level 2 LLM 교정 큐."""
+
+    def __init__(
+        self,
+        queue_size: int = 64,
+        concurrency: int = 2,
+        batch_size: int = 8,
+        batch_wait_ms: float = 200.0,
+        sample_rate: float = 1.0,
+        recent_size: int = 256,
+        log_path: str | Path | None = None,
+    ):
+        self._queue_size = queue_size
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._batch_wait_s = batch_wait_ms / 1000
+        self._sample_rate = sample_rate
+        self._recent_size = recent_size
+        self._log_path = Path(log_path) if log_path else None
+
+        self._pending: OrderedDict[_Key, _Job] = OrderedDict()  # 도착 순서 유지
+        self._inflight: dict[_Key, _Job] = {}  # LLM 요청 중인 작업 (중복 제거 대상)
+        self._recent: OrderedDict[_Key, str] = OrderedDict()  # 최근 교정 결과 (LRU)
+        self._workers: set[asyncio.Task] = set()
+        self._log_writes: set[asyncio.Task] = set()  # record()의 백그라운드 로그 쓰기
+        self._fallback_llm: FallbackLLM | None = None
+
+        self._submitted = 0
+        self._deduped = 0
+        self._cache_hits = 0
+        self._sampled_out = 0
+        self._dropped = 0
+        self._batches = 0
+        self._corrected = 0
+        self._failed = 0  # LLM 타임아웃/에러로 교정하지 못한 텍스트 수 (캐시하지 않음 → 재요청 가능)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def active_workers(self) -> int:
+        return len(self._workers)
+
+    def submit(self, text: str, language: str, on_result: ResultCallback | None = None) -> bool:
+        """LLM 교정 작업을 큐에 넣는다.
+
+        Args:
+            text: 교정할 텍스트 (규칙 재작성으로 처리되지 않은 Level 2 텍스트)
+            language: 대상 언어 코드
+            on_result: 교정 완료 시 호출 (교정 텍스트 — LLM 실패면 None, 소요 ms). 최근 결과 재사용 시 즉시 호출.
+
+        Returns:
+            교정이 예약(또는 재사용)되었으면 True, 샘플링/큐 초과로 건너뛰었으면 False
+        """
+        key = (language, text.strip())
+        self._submitted += 1
+
+        cached = self._recent.get(key)
+        if cached is not None:
+            self._recent.move_to_end(key)
+            self._cache_hits += 1
+            if on_result:
+                on_result(cached, 0.0)
+            return True
+
+        job = self._pending.get(key) or self._inflight.get(key)
+        if job is not None:
+            self._deduped += 1
+            if on_result:
+                job.callbacks.append(on_result)
+            return True
+
+        if self._sample_rate < 1.0 and random.random() >= self._sample_rate:
+            self._sampled_out += 1
+            return False
+
+        if len(self._pending) >= self._queue_size:
+            self._dropped += 1
+            logger.debug("Correction queue full (%d), dropping: '%s'", self._queue_size, text[:40])
+            return False
+
+        job = _Job(language=language, text=key[1], enqueued_at=time.monotonic())
+        if on_result:
+            job.callbacks.append(on_result)
+        self._pending[key] = job
+        self._spawn_worker()
+        return True
+
+    def record(self, language: str, original: str, corrected: str, source: str) -> None:
+        """큐를 거치지 않은 교정(규칙 재작성)도 교정 로그에 남긴다 (쓰기는 스레드에서)."""
+        if not self._log_path or corrected == original:
+            return
+        entries = [self._log_entry(language, original, corrected, source)]
+        try:
+            task = asyncio.get_running_loop().create_task(asyncio.to_thread(self._append_log, entries))
+        except RuntimeError:
+            # 이벤트 루프 밖 (스크립트 등)
+            self._append_log(entries)
+            return
+        self._log_writes.add(task)
+        task.add_done_callback(self._log_writes.discard)
+
+    async def stop(self) -> None:
+        """진행 중인 워커를 취소하고 대기 작업을 버린다 (lifespan 종료 시)."""
+        workers = list(self._workers)
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+        # 이미 시작한 로그 쓰기는 마저 끝낸다 (교정 로그 유실 방지)
+        await asyncio.gather(*self._log_writes, return_exceptions=True)
+        self._inflight.clear()
+        if self._pending:
+            logger.info("Correction worker stopped (%d pending discarded)", len(self._pending))
+        self._pending.clear()
+
+    def stats(self) -> dict[str, int]:
+        """큐 상태/지표 스냅샷 (health 엔드포인트용)."""
+        return {
+            "pending": len(self._pending),
+            "active_workers": len(self._workers),
+            "submitted": self._submitted,
+            "deduped": self._deduped,
+            "cache_hits": self._cache_hits,
+            "sampled_out": self._sampled_out,
+            "dropped": self._dropped,
+            "batches": self._batches,
+            "corrected": self._corrected,
+            "failed": self._failed,
+        }
+
+    # --- Internal ---
+
+    def _spawn_worker(self) -> None:
+        if len(self._workers) >= self._concurrency:
+            return
+        task = asyncio.create_task(self._worker_loop())
+        self._workers.add(task)
+        task.add_done_callback(self._workers.discard)
+
+    async def _worker_loop(self) -> None:
+        while self._pending:
+            # 배치가 차지 않았으면 같은 언어 작업이 더 모이도록 잠시 대기
+            if len(self._pending) < self._batch_size and self._batch_wait_s > 0:
+                await asyncio.sleep(self._batch_wait_s)
+            batch = self._take_batch()
+            if not batch:
+                continue
+            try:
+                await self._process_batch(batch)
+            except Exception:
+                logger.exception("Correction batch failed (%d texts)", len(batch))
+
+    def _take_batch(self) -> list[_Job]:
+        """가장 오래된 작업과 같은 언어의 작업을 batch_size개까지 꺼낸다."""
+        if not self._pending:
+            return []
+        language = next(iter(self._pending.values())).language
+        keys = [key for key in self._pending if key[0] == language][:self._batch_size]
+        batch = [self._pending.pop(key) for key in keys]
+        for job in batch:
+            self._inflight[(job.language, job.text)] = job
+        return batch
+
+    async def _process_batch(self, batch: list[_Job]) -> None:
+        if self._fallback_llm is None:
+            self._fallback_llm = FallbackLLM()
+        language = batch[0].language
+        try:
+            corrected = await self._fallback_llm.correct_batch([job.text for job in batch], language)
+        finally:
+            for job in batch:
+                self._inflight.pop((language, job.text), None)
+        self._batches += 1
+
+        now = time.monotonic()
+        if corrected is None:
+            # 실패는 교정 결과가 아니다 — 캐시/로그에 남기지 않아 같은 텍스트가 다시 오면 재시도
+            self._failed += len(batch)
+            for job in batch:
+                self._notify(job, None, (now - job.enqueued_at) * 1000)
+            return
+
+        entries = []
+        for job, text in zip(batch, corrected):
+            self._remember((language, job.text), text)
+            elapsed_ms = (now - job.enqueued_at) * 1000
+            if text != job.text:
+                self._corrected += 1
+                entries.append(self._log_entry(language, job.text, text, "llm"))
+            self._notify(job, text, elapsed_ms)
+        if entries and self._log_path:
+            await asyncio.to_thread(self._append_log, entries)
+
+    @staticmethod
+    def _notify(job: _Job, corrected: str | None, elapsed_ms: float) -> None:
+        for callback in job.callbacks:
+            try:
+                callback(corrected, elapsed_ms)
+            except Exception:
+                logger.exception("Correction result callback failed")
+
+    def _remember(self, key: _Key, corrected: str) -> None:
+        self._recent[key] = corrected
+        self._recent.move_to_end(key)
+        while len(self._recent) > self._recent_size:
+            self._recent.popitem(last=False)
+
+    @staticmethod
+    def _log_entry(language: str, original: str, corrected: str, source: str) -> dict[str, str | float]:
+        return {
+            "ts": round(time.time(), 3),
+            "language": language,
+            "source": source,
+            "original": original,
+            "corrected": corrected,
+        }
+
+    def _append_log(self, entries: list[dict[str, str | float]]) -> None:
+        if not self._log_path:
+            return
+        try:
+            self._log_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._log_path.open("a", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning("Failed to write correction log %s: %s", self._log_path, e)
+
+
+correction_worker = CorrectionWorker(
+    queue_size=settings.guardrail_correction_queue_size,
+    concurrency=settings.guardrail_correction_concurrency,
+    batch_size=settings.guardrail_correction_batch_size,
+    batch_wait_ms=settings.guardrail_correction_batch_wait_ms,
+    sample_rate=settings.guardrail_correction_sample_rate,
+    log_path=(
+        Path(settings.log_dir) / settings.guardrail_correction_log_file
+        if settings.guardrail_correction_log_file else None
+    ),
+)
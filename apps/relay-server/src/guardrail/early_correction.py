@@ -0,0 +1,108 @@
+"""Level 3 조기 교정 (에스컬레이션 시점에 교정 시작).
+
+기존에는 response.audio_transcript.done 이후에야 교정을 시작했기 때문에,
+수신자는 필러("잠시만요") 이후 응답 생성 잔여 시간 + LLM 왕복을 모두 기다렸다.
+
+EarlyCorrection은 check_text_delta가 Level 3으로 상향된 시점의 텍스트로 즉시 교정을
+시작하고, 이후 도착하는 문장을 완성되는 대로 세그먼트로 추가 교정한다.
+transcript.done 시점에는 남은 꼬리만 교정하면 되므로, 교정 대부분이 응답 생성과 겹친다.
+
+세그먼트는 문장 경계에서만 자른다 (진행 중인 문장은 완성되거나 finish까지 대기 —
+문장 일부만 교정하면 LLM이 뒷부분을 추측해 채우거나 이어 붙일 때 문장이 깨진다). 각 세그먼트는 GuardrailChecker.correct_text로
+독립 교정되며 (깨끗한 문장은 그대로, 규칙 재작성 가능하면 규칙, 나머지는 LLM),
+원문 순서대로 이어 붙인다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.guardrail.checker import GuardrailChecker, GuardrailResult
+
+logger = logging.getLogger(__name__)
+
+# 문장 경계 (종결 부호 + 뒤따르는 공백까지 세그먼트에 포함)
+_SENTENCE_END_RE = re.compile(r"[.!?。！？]+\s*")
+
+
+class EarlyCorrection:
+    """응답 1개의 Level 3 세그먼트 교정 (SessionAHandler가 에스컬레이션 시 생성)."""
+
+    def __init__(self, checker: GuardrailChecker):
+        self._checker = checker
+        self._segments: list[tuple[str, asyncio.Task[GuardrailResult]]] = []
+        self._submitted = 0  # 교정 요청한 transcript 길이
+        self._started_at = time.monotonic()
+
+    def start(self, text: str) -> None:
+        """에스컬레이션 시점의 transcript로 교정을 시작한다.
+
+        완성된 문장만 보낸다. 진행 중인 문장은 extend()에서 완성되거나 finish()의 꼬리로 교정된다.
+        """
+        self.extend(text)
+
+    def extend(self, text: str) -> None:
+        """transcript(누적)에서 새로 완성된 문장을 세그먼트로 교정 요청한다."""
+        end = self._submitted
+        for m in _SENTENCE_END_RE.finditer(text, self._submitted):
+            end = m.end()
+        if end > self._submitted and text[self._submitted:end].strip():
+            self._submit(text[self._submitted:end])
+            self._submitted = end
+
+    async def finish(self, transcript: str) -> GuardrailResult:
+        """남은 꼬리를 교정 요청하고 모든 세그먼트 결과를 이어 붙인다."""
+        submitted = "".join(segment for segment, _ in self._segments)
+        if not transcript.startswith(submitted):
+            # 델타 누적과 최종 transcript가 다름 → 전체 재교정
+            logger.warning("[Guardrail] Early correction text mismatch — correcting full transcript")
+            self.cancel()
+            return await self._checker.correct_text(transcript)
+
+        tail = transcript[len(submitted):]
+        if tail.strip():
+            self._submit(tail)
+
+        results = await asyncio.gather(*(task for _, task in self._segments))
+        parts = []
+        sources = set()
+        for (segment, _), result in zip(self._segments, results):
+            if result.corrected_text:
+                sources.add(result.correction_source)
+                parts.append(_with_segment_spacing(segment, result.corrected_text))
+            else:
+                parts.append(segment)
+
+        if not sources:
+            # 세그먼트 단위로는 매칭이 없음 (경계에 걸친 표현) → 전체 교정
+            return await self._checker.correct_text(transcript)
+
+        result = self._checker.check_full_text(transcript)
+        result.corrected_text = "".join(parts).strip()
+        # 세그먼트 하나라도 LLM 실패면 실패로 집계 (그 세그먼트는 원문 유지)
+        result.correction_source = next(
+            (source for source in ("llm_failed", "llm") if source in sources), "rule"
+        )
+        result.correction_time_ms = (time.monotonic() - self._started_at) * 1000
+        return result
+
+    def cancel(self) -> None:
+        for _, task in self._segments:
+            task.cancel()
+        self._segments = []
+
+    def _submit(self, segment: str) -> None:
+        task = asyncio.create_task(self._checker.correct_text(segment.strip()))
+        self._segments.append((segment, task))
+
+
+def _with_segment_spacing(segment: str, corrected: str) -> str:
+    """원문 세그먼트의 앞뒤 공백을 교정 결과에 복원한다."""
+    lead = segment[:len(segment) - len(segment.lstrip())]
+    trail = segment[len(segment.rstrip()):]
+    return lead + corrected.strip() + trail
@@ -10,12 +10,12 @@ PRD M-2:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import time
 
-from openai import AsyncOpenAI
-
 from src.config import settings
+from src.openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,13 @@ _CORRECTION_PROMPTS: dict[str, str] = {
     ),
 }
 
+# 배치 교정 지시 (언어별 교정 프롬프트 뒤에 덧붙임)
+_BATCH_INSTRUCTION = (
+    "\n\nThe input is a JSON array of sentences. Correct each sentence independently and "
+    'respond with a JSON object {"corrections": [...]} containing the corrected sentences '
+    "in the same order and the same count."
+)
+
 
 class FallbackLLM:
     """GPT-4o-mini를 사용한 텍스트 교정."""
@@ -63,7 +70,7 @@ class FallbackLLM:
         model: str | None = None,
         timeout_ms: int | None = None,
     ):
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = get_openai_client()
         self._model = model or settings.guardrail_fallback_model
         self._timeout_s = (timeout_ms or settings.guardrail_fallback_timeout_ms) / 1000
 
@@ -77,6 +84,15 @@ class FallbackLLM:
         Returns:
             교정된 텍스트. 타임아웃 또는 에러 시 원문 반환.
         """
+        corrected = await self.try_correct(text, language)
+        return text if corrected is None else corrected
+
+    async def try_correct(self, text: str, language: str = "en") -> str | None:
+        """텍스트를 교정한다 (실패를 원문과 구분해야 하는 호출자용).
+
+        Returns:
+            교정된 텍스트 (변경 불필요면 원문). 타임아웃 또는 에러 시 None.
+        """
         system_prompt = _CORRECTION_PROMPTS.get(language, _CORRECTION_PROMPTS["en"])
 
         start = time.monotonic()
@@ -117,8 +133,72 @@ class FallbackLLM:
                 elapsed_ms,
                 self._timeout_s * 1000,
             )
-            return text
+            return None
 
         except Exception:
             logger.exception("Fallback LLM error, using original text")
-            return text
+            return None
+
+    async def correct_batch(self, texts: list[str], language: str = "en") -> list[str] | None:
+        """여러 텍스트를 한 번의 요청으로 교정한다 (Level 2 백그라운드 워커용).
+
+        Args:
+            texts: 교정할 텍스트 목록
+            language: 대상 언어 코드
+
+        Returns:
+            입력과 같은 순서/개수의 교정 텍스트. 타임아웃, 에러, 개수 불일치 시 None
+            (호출자가 실패를 교정 결과로 캐시하지 않도록 원문과 구분).
+        """
+        if len(texts) == 1:
+            corrected = await self.try_correct(texts[0], language)
+            return None if corrected is None else [corrected]
+
+        system_prompt = _CORRECTION_PROMPTS.get(language, _CORRECTION_PROMPTS["en"]) + _BATCH_INSTRUCTION
+        timeout_s = settings.guardrail_correction_batch_timeout_ms / 1000
+
+        start = time.monotonic()
+        try:
+            response = await asyncio.wait_for(
+                self._client.chat.completions.create(
+                    model=self._model,
+                    temperature=0,
+                    max_tokens=200 * len(texts),
+                    response_format={"type": "json_object"},
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": json.dumps(texts, ensure_ascii=False)},
+                    ],
+                ),
+                timeout=timeout_s,
+            )
+            content = response.choices[0].message.content or ""
+            corrections = json.loads(content).get("corrections")
+            elapsed_ms = (time.monotonic() - start) * 1000
+
+            if (
+                not isinstance(corrections, list)
+                or len(corrections) != len(texts)
+                or not all(isinstance(c, str) for c in corrections)
+            ):
+                logger.warning(
+                    "Fallback LLM batch: malformed response for %d texts (%.0fms), using originals",
+                    len(texts),
+                    elapsed_ms,
+                )
+                return None
+
+            logger.info("Fallback LLM batch corrected %d texts (%s, %.0fms)", len(texts), language, elapsed_ms)
+            return [c.strip() or t for c, t in zip(corrections, texts)]
+
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Fallback LLM batch timeout (%d texts, %.0fms limit), using originals",
+                len(texts),
+                timeout_s * 1000,
+            )
+            return None
+
+        except Exception:
+            logger.exception("Fallback LLM batch error, using originals")
+            return None
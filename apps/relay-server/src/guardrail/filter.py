@@ -76,6 +76,16 @@ _KO_IMPERATIVE = re.compile(
 )
 
 
+def is_safe_imperative(text: str, m: re.Match[str]) -> bool:
+    """명령형 매칭이 safe phrase("안녕하세요" 등)의 일부인지 확인한다.
+
+    매칭 위치 앞 10자 문맥까지 포함하여 safe phrase가 있으면 명령형이 아니다.
+    """
+    context_start = max(0, m.start() - 10)
+    context = text[context_start:m.end()].rstrip(".!? ")
+    return any(safe in context for safe in _KO_SAFE_PHRASES)
+
+
 class TextFilter:
     """규칙 기반 텍스트 필터."""
 
@@ -148,11 +158,7 @@ class TextFilter:
     def _check_imperative(self, text: str, result: FilterResult) -> None:
         for m in _KO_IMPERATIVE.finditer(text):
             # Safe phrase 체크: "안녕하세요" 등은 제외
-            start = m.start()
-            # 매칭 위치 앞의 문맥을 확인하여 safe phrase에 해당하면 스킵
-            context_start = max(0, start - 10)
-            context = text[context_start:m.end()].rstrip(".!? ")
-            if any(safe in context for safe in _KO_SAFE_PHRASES):
+            if is_safe_imperative(text, m):
                 continue
 
             matched = m.group().rstrip(".!? ")
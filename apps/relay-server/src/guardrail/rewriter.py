@@ -0,0 +1,266 @@
+"""규칙 기반 교정 엔진 (Fallback LLM 앞단).
+
+Level 2/3 교정은 항상 Fallback LLM(gpt-4o-mini, 2초 타임아웃)을 호출했지만,
+대부분의 매칭은 사전(CORRECTION_MAP)과 어미 변환만으로 교정된다.
+이 엔진은 TextFilter 매칭 위치의 어절을 결정적으로 재작성하고,
+모든 매칭을 처리할 수 있을 때만 결과를 사용한다 (하나라도 못 하면 LLM으로 escalate).
+
+어절 처리 순서 (ko):
+  1. 이미 존댓말 어미(요/니다/까/죠)로 끝남 → 변경 없음
+  2. 명령형 어미 (~하세요 → ~해주세요), safe phrase(안녕하세요 등) 제외
+  3. 어절 전체가 교정 사전 키 (응 → 네, 고마워 → 감사합니다)
+     문장으로 바꾸는 항목(그래 → 네, 그렇습니다)은 발화 전체가 그 어절일 때만
+  4. 문장 끝 어절의 반말 어미 → 해요체 (알겠어 → 알겠어요, 냐 → 나요, 줘 → 주세요)
+  5. 문장 중간 어절 내부의 부분 문자열 매칭 (어떻게 ⊃ "어") → 오탐, 변경 없음
+  그 외 (문장 끝인데 알 수 없는 어미) → 처리 불가
+
+금지어/위협(Level 3 사유)은 의미를 바꾸지 않고 제거할 수 없으므로 항상 LLM으로 보낸다.
+
+결과 검증: TextFilter를 다시 돌리고, 문장 끝 어절마다 존댓말로 끝나는지도 직접 확인한다.
+TextFilter 어미 정규식은 공백 뒤 어절(그래 좋아)이나 목록에 없는 어미(어디 가?)를 놓친다.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from src.guardrail.dictionary import get_correction_map
+from src.guardrail.filter import _KO_SAFE_PHRASES, FilterCategory, FilterResult, TextFilter
+
+# 어절 (공백 구분) + 뒤따르는 종결/구분 부호
+_WORD_RE = re.compile(r"(\S+?)([.!?,~…。！？、]*)(?=\s|$)")
+
+# 문장 종결 부호 (어절 뒤에 오면 문장 끝)
+_SENTENCE_PUNCT = frozenset(".!?…。！？")
+
+# 이미 존댓말인 어절 끝
+_KO_POLITE_SUFFIXES = ("요", "니다", "니까", "죠")
+
+# 명령형 어미 → 요청형 (TextFilter _KO_IMPERATIVE 대상)
+_KO_IMPERATIVE_REWRITES = (
+    ("하세요", "해주세요"),
+    ("드세요", "드셔주세요"),
+    ("가세요", "가주세요"),
+    ("오세요", "와주세요"),
+    ("보세요", "봐주세요"),
+    ("해라", "해주세요"),
+)
+
+# 문장 끝 반말 어미 → 해요체 (긴 어미 우선, TextFilter _KO_INFORMAL_ENDINGS + 교정 사전 어미)
+_KO_ENDING_REWRITES = (
+    ("알겠어", "알겠어요"),
+    ("줄래", "주실래요"),
+    ("해줘", "해주세요"),
+    ("거든", "거든요"),
+    ("잖아", "잖아요"),
+    ("인데", "인데요"),
+    ("건데", "건데요"),
+    ("는데", "는데요"),
+    ("할래", "할래요"),
+    ("할게", "할게요"),
+    ("갈게", "갈게요"),
+    ("올게", "올게요"),
+    ("했어", "했어요"),
+    ("됐어", "됐어요"),
+    ("없어", "없어요"),
+    ("있어", "있어요"),
+    ("몰라", "몰라요"),
+    ("싫어", "싫어요"),
+    ("좋아", "좋아요"),
+    ("워", "워요"),
+    ("뭐야", "뭐예요"),
+    ("이야", "이에요"),
+    ("냐", "나요"),
+    ("줘", "주세요"),
+    ("해", "해요"),
+    ("래", "래요"),
+    ("어", "어요"),
+)
+
+# 일본어 문장 끝 보통체 → 정중체 (긴 어미 우선)
+_JA_ENDING_REWRITES = (
+    ("じゃない", "ではありません"),
+    ("だよね", "ですよね"),
+    ("だよ", "ですよ"),
+    ("だね", "ですね"),
+    ("でしょ", "でしょう"),
+    ("てる", "ています"),
+)
+
+_ENDING_REWRITES: dict[str, tuple[tuple[str, str], ...]] = {
+    "ko": _KO_ENDING_REWRITES,
+    "ja": _JA_ENDING_REWRITES,
+}
+_POLITE_SUFFIXES: dict[str, tuple[str, ...]] = {
+    "ko": _KO_POLITE_SUFFIXES,
+    "ja": ("です", "ます", "ください", "ません", "でしょう", "ですよ", "ですね", "ますよ", "ますね"),
+}
+
+
+@dataclass
+class RewriteResult:
+    """규칙 재작성 결과."""
+    text: str
+    covered: bool  # 모든 매칭을 규칙으로 처리했는지 (False면 LLM 필요)
+    rewrites: list[tuple[str, str]] = field(default_factory=list)  # (원 어절, 교정 어절)
+
+
+@dataclass
+class _Word:
+    start: int
+    end: int
+    word: str
+    sentence_final: bool
+
+
+class RuleRewriter:
+    """TextFilter 매칭 위치 기반 결정적 교정 (ko/ja)."""
+
+    def __init__(self, target_language: str = "ko"):
+        self._target_language = target_language
+        self._correction_map = get_correction_map(target_language)
+        self._endings = _ENDING_REWRITES.get(target_language, ())
+        self._polite = _POLITE_SUFFIXES.get(target_language, ())
+        self._text_filter = TextFilter(target_language=target_language)
+        # 사전 교정값을 이루는 어절 (네, 그렇습니다 → 네 / 그렇습니다) — 문장 끝에 와도 존댓말
+        self._polite_words = frozenset(
+            m.group(1) for formal in self._correction_map.values() for m in _WORD_RE.finditer(formal)
+        )
+        # 교정값이 한 어절이 아닌 문장인 사전 키 (그래 → 네, 그렇습니다) — 발화 전체일 때만 치환
+        self._whole_utterance_keys = frozenset(
+            casual for casual, formal in self._correction_map.items() if len(_WORD_RE.findall(formal)) > 1
+        )
+
+    @property
+    def supported(self) -> bool:
+        return bool(self._endings)
+
+    def rewrite(self, text: str, filter_result: FilterResult | None = None) -> RewriteResult:
+        """매칭된 어절을 재작성한다.
+
+        Args:
+            text: 교정할 텍스트
+            filter_result: TextFilter.check(text) 결과 (None이면 내부에서 검사)
+        """
+        if filter_result is None:
+            filter_result = self._text_filter.check(text)
+        if not self.supported or filter_result.has_profanity or filter_result.has_threat:
+            return RewriteResult(text=text, covered=False)
+
+        words = self._split_words(text)
+        whole_utterance = len(words) == 1
+        edits: dict[int, str] = {}  # 어절 start → 교정된 어절 (부호 제외)
+        for match in filter_result.matches:
+            positions = [match.position]
+            if match.category == FilterCategory.CASUAL:
+                # TextFilter는 교정 사전 키의 첫 위치만 보고 — 나머지 출현도 처리
+                positions = self._occurrences(text, match.matched_text)
+            for position in positions:
+                word = self._word_at(words, position)
+                if word is None:
+                    return RewriteResult(text=text, covered=False)
+                replacement = self._rewrite_word(
+                    word, text[position:position + len(match.matched_text)], whole_utterance
+                )
+                if replacement is None:
+                    return RewriteResult(text=text, covered=False)
+                if replacement != word.word:
+                    edits[word.start] = replacement
+
+        rewritten = text
+        rewrites = []
+        for word in reversed(words):
+            if word.start in edits:
+                rewrites.append((word.word, edits[word.start]))
+                rewritten = rewritten[:word.start] + edits[word.start] + rewritten[word.start + len(word.word):]
+        rewrites.reverse()
+
+        # 일본어는 띄어쓰기가 없어 "문장 중간 오탐" 판정이 불가 — 바뀐 것이 없으면 처리 못 한 것
+        if not rewrites and self._target_language == "ja":
+            return RewriteResult(text=text, covered=False)
+
+        # 검증: 재작성 결과의 모든 매칭이 오탐(변경 불필요)이고 문장 끝이 모두 존댓말이어야 한다
+        if not self._is_resolved(rewritten):
+            return RewriteResult(text=text, covered=False)
+        return RewriteResult(text=rewritten, covered=True, rewrites=rewrites)
+
+    # --- Internal ---
+
+    def _rewrite_word(self, word: _Word, matched: str, whole_utterance: bool = False) -> str | None:
+        """어절 1개의 교정 결과 (변경 불필요면 원 어절, 처리 불가면 None).
+
+        Args:
+            whole_utterance: 발화 전체가 이 어절 하나인지 (문장 단위 사전 치환 허용)
+        """
+        w = word.word
+        if self._target_language == "ko":
+            if any(safe in w for safe in _KO_SAFE_PHRASES):
+                return w
+            if word.sentence_final:
+                for informal, polite in _KO_IMPERATIVE_REWRITES:
+                    if w.endswith(informal):
+                        return w[:-len(informal)] + polite
+        if w.endswith(self._polite):
+            return w
+        if w in self._correction_map:
+            if w in self._whole_utterance_keys and not whole_utterance:
+                return None  # 발화 중간에 문장을 끼워 넣게 됨 (그래 좋아 → 네, 그렇습니다 좋아)
+            return self._correction_map[w]
+        if self._target_language == "ja":
+            # 일본어는 띄어쓰기가 없으므로 사전 키를 어절 내부에서 치환한 뒤 어미 변환
+            for casual, formal in self._correction_map.items():
+                w = w.replace(casual, formal)
+        if word.sentence_final and not w.endswith(self._polite):
+            for informal, polite in self._endings:
+                if w.endswith(informal):
+                    return w[:-len(informal)] + polite
+            # 문장 끝 어절이 매칭 문자열로 끝나는데 어미 규칙이 없음 → 처리 불가
+            if w.endswith(matched.strip(".!? ")):
+                return None
+        # 문장 중간 어절 내부의 부분 문자열 (예: "어떻게" ⊃ "어") → 오탐, 변경 없음
+        return w
+
+    def _is_resolved(self, text: str) -> bool:
+        result = self._text_filter.check(text)
+        if result.has_profanity or result.has_threat:
+            return False
+        words = self._split_words(text)
+        whole_utterance = len(words) == 1
+        for match in result.matches:
+            word = self._word_at(words, match.position)
+            if word is None or self._rewrite_word(word, match.matched_text, whole_utterance) != word.word:
+                return False
+        return all(self._is_polite_final(word.word) for word in words if word.sentence_final)
+
+    def _is_polite_final(self, w: str) -> bool:
+        """문장 끝 어절이 존댓말로 끝나는지 (모르는 어미는 False → LLM)."""
+        if w.endswith(self._polite) or w in self._polite_words:
+            return True
+        return self._target_language == "ko" and any(safe in w for safe in _KO_SAFE_PHRASES)
+
+    @staticmethod
+    def _split_words(text: str) -> list[_Word]:
+        words = []
+        for m in _WORD_RE.finditer(text):
+            punct = m.group(2)
+            rest = text[m.end():]
+            sentence_final = bool(set(punct) & _SENTENCE_PUNCT) or not rest.strip() or rest.startswith("\n")
+            words.append(_Word(m.start(1), m.end(1), m.group(1), sentence_final))
+        return words
+
+    @staticmethod
+    def _word_at(words: list[_Word], position: int) -> _Word | None:
+        for word in words:
+            if word.start <= position < word.end:
+                return word
+        return None
+
+    @staticmethod
+    def _occurrences(text: str, needle: str) -> list[int]:
+        positions = []
+        idx = text.find(needle)
+        while idx != -1:
+            positions.append(idx)
+            idx = text.find(needle, idx + 1)
+        return positions
@@ -0,0 +1,159 @@
+"""스트리밍 증분 Guardrail 필터 (Session A 텍스트 델타용).
+
+기존 GuardrailChecker.check_text_delta는 검사 시점(문장 끝 델타, 100자 이후 매 델타)마다
+누적 버퍼 전체에 TextFilter.check를 다시 실행했다 (금지어/위협/교정 사전 find 루프 +
+정규식 2종). 응답이 길어질수록 비용이 제곱으로 증가한다.
+
+이 필터는 같은 판정을 증분으로 계산한다:
+  - 사전 매칭 (금지어, 위협, 교정 매핑): Aho-Corasick 오토마톤 상태를 델타 사이에 유지하여
+    새로 도착한 문자만 1회 스캔 (부분 문자열 존재는 버퍼가 자라도 유지되므로 플래그 누적)
+  - 정규식 (반말 어미, 명령형): 검사 시점마다 직전 검사 이후의 꼬리 구간만 스캔.
+    직전 검사 시점에 끝난 매칭은 그때 이미 발견되어 레벨이 상향되었으므로 다시 볼 필요 없다.
+
+Level 판정(1/2/3)은 TextFilter.check 기반 판정과 동일하다 (매칭 목록/위치는 제공하지 않음).
+"""
+
+from __future__ import annotations
+
+from src.guardrail.dictionary import get_banned_words, get_correction_map, get_threat_phrases
+from src.guardrail.filter import _KO_IMPERATIVE, _KO_INFORMAL_ENDINGS, FilterCategory, is_safe_imperative
+
+# 오토마톤 출력 태그 (비트마스크)
+_TAG_PROFANITY = 1
+_TAG_THREAT = 2
+_TAG_CASUAL = 4
+
+_TAG_CATEGORIES = (
+    (_TAG_PROFANITY, FilterCategory.PROFANITY),
+    (_TAG_THREAT, FilterCategory.THREAT),
+    (_TAG_CASUAL, FilterCategory.CASUAL),
+)
+
+# 정규식 꼬리 스캔 시 직전 검사 지점 이전으로 되돌아볼 문자 수
+# 매칭의 비공백 핵심부(어미 ≤3자 + 종결 부호 1자) + lookbehind 1자보다 커야 한다
+_REGEX_TAIL_LOOKBACK = 8
+
+
+class AhoCorasick:
+    """재개 가능한 Aho-Corasick 다중 패턴 오토마톤 (태그 비트마스크 출력)."""
+
+    def __init__(self, patterns: dict[str, int]):
+        """
+        Args:
+            patterns: 패턴 → 태그 비트마스크
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[int] = [0]
+
+        for pattern, tag in patterns.items():
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(0)
+                state = nxt
+            self._out[state] |= tag
+
+        # BFS로 failure 링크 구성, 출력은 failure 체인을 따라 병합
+        queue = list(self._goto[0].values())  # 깊이 1 상태의 failure = 루트 (초기값 0)
+        for state in queue:
+            for ch, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] |= self._out[self._fail[nxt]]
+                queue.append(nxt)
+
+    def feed(self, state: int, text: str) -> tuple[int, int]:
+        """state에서 text를 이어서 스캔한다.
+
+        Returns:
+            (새 상태, 스캔 중 완성된 패턴들의 태그 OR)
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        found = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            found |= out[state]
+        return state, found
+
+
+class StreamingTextFilter:
+    """응답 1개의 텍스트 델타를 증분 검사한다 (GuardrailChecker 소유, 응답마다 reset)."""
+
+    def __init__(self, target_language: str = "ko"):
+        self._target_language = target_language
+
+        # 금지어/위협은 소문자 비교 (TextFilter와 동일).
+        # 교정 매핑은 대소문자 구분 비교 — 대소문자가 없는 문구(한국어/일본어)는 소문자
+        # 스트림에서 매칭해도 결과가 같으므로 한 오토마톤에 합치고, 나머지만 원문 스트림에서 매칭.
+        lowered: dict[str, int] = {}
+        raw: dict[str, int] = {}
+        for word in get_banned_words(target_language):
+            lowered[word.lower()] = lowered.get(word.lower(), 0) | _TAG_PROFANITY
+        for phrase in get_threat_phrases(target_language):
+            lowered[phrase.lower()] = lowered.get(phrase.lower(), 0) | _TAG_THREAT
+        for casual in get_correction_map(target_language):
+            if casual.lower() == casual == casual.upper():
+                lowered[casual] = lowered.get(casual, 0) | _TAG_CASUAL
+            else:
+                raw[casual] = raw.get(casual, 0) | _TAG_CASUAL
+        self._lowered_ac = AhoCorasick(lowered)
+        self._raw_ac = AhoCorasick(raw) if raw else None
+        self._check_ko_endings = target_language == "ko"
+
+        self._buffer = ""
+        self._lowered_state = 0
+        self._raw_state = 0
+        self._tags = 0
+        self._scanned_len = 0  # 직전 검사 시점의 버퍼 길이
+
+    @property
+    def text(self) -> str:
+        return self._buffer
+
+    def reset(self) -> None:
+        self._buffer = ""
+        self._lowered_state = 0
+        self._raw_state = 0
+        self._tags = 0
+        self._scanned_len = 0
+
+    def feed(self, delta: str) -> None:
+        """델타를 버퍼에 추가하고 새 문자만 사전 오토마톤으로 스캔한다."""
+        self._buffer += delta
+        self._lowered_state, found = self._lowered_ac.feed(self._lowered_state, delta.lower())
+        self._tags |= found
+        if self._raw_ac is not None:
+            self._raw_state, found = self._raw_ac.feed(self._raw_state, delta)
+            self._tags |= found
+
+    def checkpoint(self) -> set[FilterCategory]:
+        """현재 버퍼의 매칭 카테고리 (TextFilter.check(buffer)와 같은 Level 판정용).
+
+        사전 카테고리는 누적 플래그, 정규식 카테고리는 직전 검사 이후 꼬리에서만 찾는다.
+        """
+        categories = {category for tag, category in _TAG_CATEGORIES if self._tags & tag}
+        buffer = self._buffer
+        start = max(0, self._scanned_len - _REGEX_TAIL_LOOKBACK)
+        self._scanned_len = len(buffer)
+
+        # 공백뿐인 버퍼는 정규식이 매칭될 수 없다 (TextFilter.check의 빈 텍스트 조기 반환과 동일)
+        if self._check_ko_endings:
+            if _KO_INFORMAL_ENDINGS.search(buffer, start):
+                categories.add(FilterCategory.INFORMAL_ENDING)
+            for m in _KO_IMPERATIVE.finditer(buffer, start):
+                if not is_safe_imperative(buffer, m):
+                    categories.add(FilterCategory.IMPERATIVE)
+                    break
+        return categories
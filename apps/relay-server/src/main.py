@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -9,8 +10,12 @@ from fastapi.staticfiles import StaticFiles
 
 from src.call_manager import call_manager
 from src.config import settings
+from src.guardrail.correction_worker import correction_worker
 from src.logging_config import setup_logging
 from src.middleware.rate_limit import RateLimitMiddleware
+from src.openai_client import close_openai_client, init_openai_client
+from src.realtime.filler_audio import filler_audio_cache
+from src.realtime.sessions.session_pool import session_pool
 from src.routes.calls import router as calls_router
 from src.routes.health import router as health_router
 from src.routes.stream import router as stream_router
@@ -34,9 +39,21 @@ async def lifespan(app: FastAPI):
         settings.relay_server_host,
         settings.relay_server_port,
     )
+    # Realtime 세션 풀: 첫 통화부터 WebSocket 핸드셰이크 생략
+    if settings.realtime_session_pool_enabled:
+        session_pool.start()
+    # 공유 OpenAI HTTP 클라이언트: keep-alive 풀 생성 + 워밍업 (첫 Chat 번역 cold 연결 방지)
+    await init_openai_client()
+    # 필러 오디오 캐시: 이전 실행에서 캡처한 정형 문구 클립 로드 (첫 통화부터 Realtime 생성 생략)
+    if settings.filler_audio_cache_enabled:
+        await asyncio.to_thread(filler_audio_cache.load)
     yield
     # Graceful shutdown: 모든 활성 통화 정리
     await call_manager.shutdown_all()
+    await session_pool.stop()
+    await correction_worker.stop()
+    await filler_audio_cache.flush()
+    await close_openai_client()
 
 
 app = FastAPI(
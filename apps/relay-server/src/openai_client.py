@@ -0,0 +1,184 @@
+"""공유 OpenAI HTTP 클라이언트 — 프로세스 전역 커넥션 풀.
+
+ChatTranslator, FallbackLLM, SessionRecoveryManager가 각자 AsyncOpenAI를
+생성하여 통화(파이프라인)마다 별도 커넥션 풀 + TLS 핸드셰이크가 발생했고,
+통화의 첫 Chat 번역이 cold 연결 비용(수백 ms)을 떠안았다.
+
+  - 단일 AsyncOpenAI + httpx 풀을 lifespan에서 생성 (get_openai_client()로 공유)
+  - HTTP/2 멀티플렉싱 (h2 미설치 시 HTTP/1.1) + 긴 keep-alive
+  - 워밍업: 서버 시작 시 + 통화 시작 시 keep-alive 안에 응답이 없었으면 미리 연결
+  - 지표: 요청 수, 새 연결 수, cold 요청(새 연결을 연 요청) 수, 마지막 응답 이후 경과
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: AsyncOpenAI | None = None
+_http_client: httpx.AsyncClient | None = None
+_warmup_task: asyncio.Task | None = None
+_http2 = False
+
+# 워밍업 요청 표시 헤더 (cold 요청 지표에서 제외)
+_WARMUP_HEADER = "X-Relay-Warmup"
+
+
+@dataclass
+class _ClientStats:
+    requests: int = 0
+    cold_requests: int = 0
+    connections_opened: int = 0
+    warmups: int = 0
+    last_warmup_ms: float = 0.0
+    last_response_at: float = 0.0  # monotonic, 0이면 응답 없음
+
+
+_stats = _ClientStats()
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+async def _on_request(request: httpx.Request) -> None:
+    """요청마다 httpcore trace를 연결하여 새 연결 생성 여부를 기록한다."""
+    is_warmup = _WARMUP_HEADER in request.headers
+    if not is_warmup:
+        _stats.requests += 1
+    opened = False
+
+    async def trace(event_name: str, info: dict[str, Any]) -> None:
+        nonlocal opened
+        if event_name == "connection.connect_tcp.complete":
+            _stats.connections_opened += 1
+            if not opened and not is_warmup:
+                opened = True
+                _stats.cold_requests += 1
+
+    request.extensions["trace"] = trace
+
+
+async def _on_response(response: httpx.Response) -> None:
+    """응답 시각 기록 — keep-alive 만료 전이면 풀에 재사용 가능한 연결이 남아 있다."""
+    _stats.last_response_at = time.monotonic()
+
+
+def _build_client() -> tuple[AsyncOpenAI, httpx.AsyncClient, bool]:
+    http2 = settings.openai_http2_enabled and _http2_available()
+    if settings.openai_http2_enabled and not http2:
+        logger.warning("h2 package not installed — OpenAI HTTP client falls back to HTTP/1.1")
+    http_client = DefaultAsyncHttpxClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.openai_http_max_connections,
+            max_keepalive_connections=settings.openai_http_max_keepalive,
+            keepalive_expiry=settings.openai_http_keepalive_expiry_s,
+        ),
+        event_hooks={"request": [_on_request], "response": [_on_response]},
+    )
+    client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=http_client)
+    return client, http_client, http2
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """공유 AsyncOpenAI 싱글톤 (lifespan 이전 호출 시 지연 생성)."""
+    global _client, _http_client, _http2
+    if _client is None:
+        _client, _http_client, _http2 = _build_client()
+    return _client
+
+
+def has_warm_connection() -> bool:
+    """마지막 응답 이후 keep-alive 만료 전인지 (재사용 가능한 연결이 남아 있을 가능성).
+
+    httpx 풀 내부 구조에 의존하지 않도록 공개 event hook으로 기록한 응답 시각으로 판단한다.
+    """
+    if not _stats.last_response_at:
+        return False
+    return time.monotonic() - _stats.last_response_at < settings.openai_http_keepalive_expiry_s
+
+
+async def warmup_openai_client(connections: int | None = None) -> None:
+    """가벼운 요청(models.list)으로 keep-alive 연결을 미리 연다."""
+    client = get_openai_client()
+    count = max(1, connections or settings.openai_http_warmup_requests)
+    started = time.monotonic()
+    results = await asyncio.gather(
+        *(client.models.list(extra_headers={_WARMUP_HEADER: "1"}) for _ in range(count)),
+        return_exceptions=True,
+    )
+    _stats.warmups += 1
+    _stats.last_warmup_ms = (time.monotonic() - started) * 1000
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures:
+        logger.warning(
+            "OpenAI client warmup: %d/%d request(s) failed (%s)",
+            len(failures), count, failures[0],
+        )
+    else:
+        logger.debug("OpenAI client warmed up in %.0fms (%d conn)", _stats.last_warmup_ms, count)
+
+
+def ensure_warm() -> None:
+    """재사용 가능한 연결이 없으면 백그라운드 워밍업을 시작한다 (통화 시작 시 호출).
+
+    수신자 벨이 울리는 동안 연결을 열어 두어 첫 Chat 번역이 cold 연결을 피한다.
+    """
+    global _warmup_task
+    if _warmup_task is not None and not _warmup_task.done():
+        return
+    if has_warm_connection():
+        return
+    _warmup_task = asyncio.create_task(warmup_openai_client())
+
+
+async def init_openai_client() -> None:
+    """lifespan 시작 시 클라이언트 생성 + 백그라운드 워밍업."""
+    get_openai_client()
+    ensure_warm()
+
+
+async def close_openai_client() -> None:
+    """lifespan 종료 시 커넥션 풀을 닫는다."""
+    global _client, _http_client, _warmup_task
+    if _warmup_task is not None and not _warmup_task.done():
+        _warmup_task.cancel()
+    _warmup_task = None
+    if _client is not None:
+        try:
+            await _client.close()
+        except Exception as e:
+            logger.warning("Failed to close OpenAI client: %s", e)
+    _client = None
+    _http_client = None
+
+
+def openai_client_stats() -> dict[str, Any]:
+    """공유 클라이언트 풀 지표 스냅샷 (health 엔드포인트용)."""
+    return {
+        "http2": _http2,
+        "warm": has_warm_connection(),
+        "last_response_age_s": (
+            round(time.monotonic() - _stats.last_response_at, 1) if _stats.last_response_at else None
+        ),
+        "requests": _stats.requests,
+        "cold_requests": _stats.cold_requests,
+        "connections_opened": _stats.connections_opened,
+        "warm_hit_rate": (
+            round(1 - _stats.cold_requests / _stats.requests, 3) if _stats.requests else 0.0
+        ),
+        "warmups": _stats.warmups,
+        "last_warmup_ms": round(_stats.last_warmup_ms, 1),
+    }
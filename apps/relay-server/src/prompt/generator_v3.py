@@ -1,16 +1,24 @@
 """v3 System Prompt 생성기 — Relay/Agent 모드별, 양방향 언어.
 
 PRD 8.1 기반. 수집된 데이터와 언어 설정으로 동적 프롬프트를 생성한다.
+
+프롬프트 = 언어쌍별 고정 prefix + 통화별 suffix.
+OpenAI prompt caching은 입력 앞부분이 byte 단위로 같을 때만 적중하므로,
+통화마다 달라지는 값(상대 이름, 수집 데이터 등)은 모두 prefix 뒤로 보낸다.
+prefix는 (종류, 언어쌍)별로 한 번만 렌더링해 재사용한다.
 """
 
 import json
 import logging
+from functools import lru_cache
 from typing import Any
 
 from src.prompt.templates import (
     CULTURAL_ADAPTATION_RULES,
     POLITENESS_RULES,
+    SESSION_A_AGENT_TASK_TEMPLATE,
     SESSION_A_AGENT_TEMPLATE,
+    SESSION_A_RELAY_CONTEXT_TEMPLATE,
     SESSION_A_RELAY_TEMPLATE,
     SESSION_B_TEMPLATE,
     TERM_EXPLANATION_RULES,
@@ -19,6 +27,37 @@ from src.types import CallMode
 
 logger = logging.getLogger(__name__)
 
+# 고정 prefix 템플릿 레지스트리 (언어쌍만으로 렌더링 가능한 템플릿)
+PREFIX_TEMPLATES: dict[str, str] = {
+    "session_a_relay": SESSION_A_RELAY_TEMPLATE,
+    "session_a_agent": SESSION_A_AGENT_TEMPLATE,
+    "session_b": SESSION_B_TEMPLATE,
+}
+
+
+@lru_cache(maxsize=64)
+def stable_prefix(kind: str, source_language: str, target_language: str) -> str:
+    """언어쌍별 고정 prefix를 렌더링한다 (메모이즈 — 같은 언어쌍 통화는 동일 문자열 공유).
+
+    Args:
+        kind: PREFIX_TEMPLATES 키
+        source_language: User 언어 코드
+        target_language: 수신자 언어 코드
+    """
+    return PREFIX_TEMPLATES[kind].format(
+        source_language=_lang_name(source_language),
+        target_language=_lang_name(target_language),
+        politeness_rules=POLITENESS_RULES.get(
+            (source_language, target_language), "Use polite speech."
+        ),
+        cultural_adaptation_rules=CULTURAL_ADAPTATION_RULES.get(
+            (source_language, target_language), "Adapt naturally."
+        ),
+        term_explanation_rules=TERM_EXPLANATION_RULES.get(
+            (target_language, source_language), "Add brief context for culture-specific terms."
+        ),
+    )
+
 
 def generate_session_a_prompt(
     mode: CallMode,
@@ -27,37 +66,32 @@ def generate_session_a_prompt(
     collected_data: dict[str, Any] | None = None,
 ) -> str:
     """Session A (User→수신자) 프롬프트를 생성한다."""
-    lang_pair = (source_language, target_language)
-
     if mode == CallMode.RELAY:
-        prompt = SESSION_A_RELAY_TEMPLATE.format(
-            source_language=_lang_name(source_language),
-            target_language=_lang_name(target_language),
-            politeness_rules=POLITENESS_RULES.get(lang_pair, "Use polite speech."),
-            cultural_adaptation_rules=CULTURAL_ADAPTATION_RULES.get(
-                lang_pair, "Adapt naturally."
-            ),
+        prefix = stable_prefix("session_a_relay", source_language, target_language)
+        suffix = SESSION_A_RELAY_CONTEXT_TEMPLATE.format(
             target_name=_get(collected_data, "target_name", "the recipient"),
             scenario_type=_get(collected_data, "scenario_type", "general inquiry"),
             service=_get(collected_data, "service", ""),
             customer_name=_get(collected_data, "customer_name", "the customer"),
         )
     else:
-        prompt = SESSION_A_AGENT_TEMPLATE.format(
-            target_language=_lang_name(target_language),
+        prefix = stable_prefix("session_a_agent", source_language, target_language)
+        suffix = SESSION_A_AGENT_TASK_TEMPLATE.format(
             collected_data=json.dumps(collected_data or {}, ensure_ascii=False, indent=2),
             scenario_type=_get(collected_data, "scenario_type", "general inquiry"),
             service=_get(collected_data, "service", ""),
             target_name=_get(collected_data, "target_name", "the recipient"),
             target_phone=_get(collected_data, "target_phone", ""),
         )
+    prompt = f"{prefix}\n\n{suffix}"
 
     logger.info(
-        "Generated Session A prompt (mode=%s, %s→%s, %d chars)",
+        "Generated Session A prompt (mode=%s, %s→%s, %d chars, stable prefix %d chars)",
         mode.value,
         source_language,
         target_language,
         len(prompt),
+        len(prefix),
     )
     return prompt
 
@@ -66,16 +100,8 @@ def generate_session_b_prompt(
     source_language: str,
     target_language: str,
 ) -> str:
-    """Session B (수신자→User) 프롬프트를 생성한다."""
-    lang_pair = (target_language, source_language)
-
-    prompt = SESSION_B_TEMPLATE.format(
-        source_language=_lang_name(source_language),
-        target_language=_lang_name(target_language),
-        term_explanation_rules=TERM_EXPLANATION_RULES.get(
-            lang_pair, "Add brief context for culture-specific terms."
-        ),
-    )
+    """Session B (수신자→User) 프롬프트를 생성한다 (통화별 값 없음 — 전체가 고정 prefix)."""
+    prompt = stable_prefix("session_b", source_language, target_language)
 
     logger.info(
         "Generated Session B prompt (%s→%s, %d chars)",
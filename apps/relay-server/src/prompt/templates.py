@@ -1,6 +1,9 @@
 """언어별 프롬프트 템플릿 및 동적 변수.
 
 PRD 8.1 기반 — Session A/B System Prompt 템플릿.
+
+SESSION_*_TEMPLATE은 언어쌍만으로 결정되는 고정 prefix,
+*_CONTEXT/*_TASK_TEMPLATE은 통화별 값이 들어가는 suffix (prefix 뒤에 붙는다).
 """
 
 # --- 언어별 동적 변수 ---
@@ -109,11 +112,6 @@ You translate the user's speech from {source_language} to {target_language}.
 - If the user pauses mid-sentence, wait briefly for them to continue.
 - If you hear only silence or background noise, produce no output.
 
-## Context
-You are making a phone call to {target_name} on behalf of the user.
-Purpose: {scenario_type} - {service}
-Customer Name: {customer_name}
-
 ## First Message
 The first text you receive will be a greeting to introduce the AI translation service.
 Translate it naturally into {target_language} as a phone opening.
@@ -126,6 +124,14 @@ Translate it naturally into {target_language} as a phone opening.
 - NEVER speak unless you are translating the user's words.\
 """
 
+# 통화별 suffix — 언어쌍 고정 prefix 뒤에 붙인다 (prompt caching은 앞부분 일치 기준)
+SESSION_A_RELAY_CONTEXT_TEMPLATE = """\
+## Context
+You are making a phone call to {target_name} on behalf of the user.
+Purpose: {scenario_type} - {service}
+Customer Name: {customer_name}\
+"""
+
 # --- Session A: Agent Mode 프롬프트 ---
 
 SESSION_A_AGENT_TEMPLATE = """\
@@ -138,13 +144,6 @@ You are an AI phone assistant making a call on behalf of a user who cannot speak
    say "잠시만요, 확인하고 말씀드릴게요" and wait for the user's text input.
 4. Keep responses concise and natural, like a real phone conversation.
 
-## Collected Information
-{collected_data}
-
-## Task
-{scenario_type}: {service}
-Target: {target_name} ({target_phone})
-
 ## Conversation Strategy
 1. Greet and state the purpose.
 2. Provide collected information as needed.
@@ -157,6 +156,15 @@ Target: {target_name} ({target_phone})
 - Relay the user's text response naturally in speech.\
 """
 
+SESSION_A_AGENT_TASK_TEMPLATE = """\
+## Collected Information
+{collected_data}
+
+## Task
+{scenario_type}: {service}
+Target: {target_name} ({target_phone})\
+"""
+
 # --- Session B 프롬프트 ---
 
 SESSION_B_TEMPLATE = """\
@@ -15,6 +15,7 @@ Mode → Pipeline 매핑:
 import logging
 from typing import Any, Callable, Coroutine
 
+from src.realtime.first_message import GreetingPrefetch
 from src.realtime.pipeline.base import BasePipeline
 from src.realtime.pipeline.full_agent import FullAgentPipeline
 from src.realtime.pipeline.text_to_voice import TextToVoicePipeline
@@ -44,6 +45,7 @@ class AudioRouter:
         app_ws_send: Callable[[WsMessage], Coroutine[Any, Any, None]],
         prompt_a: str = "",
         prompt_b: str = "",
+        greeting_prefetch: GreetingPrefetch | None = None,
     ):
         object.__setattr__(self, "call", call)
         object.__setattr__(
@@ -56,6 +58,7 @@ class AudioRouter:
                 app_ws_send=app_ws_send,
                 prompt_a=prompt_a,
                 prompt_b=prompt_b,
+                greeting_prefetch=greeting_prefetch,
             ),
         )
         logger.info(
@@ -73,6 +76,7 @@ class AudioRouter:
         app_ws_send: Callable[[WsMessage], Coroutine[Any, Any, None]],
         prompt_a: str,
         prompt_b: str,
+        greeting_prefetch: GreetingPrefetch | None = None,
     ) -> BasePipeline:
         """CommunicationMode에 따라 Pipeline 구현체를 생성한다."""
         match call.communication_mode:
@@ -84,6 +88,7 @@ class AudioRouter:
                     app_ws_send=app_ws_send,
                     prompt_a=prompt_a,
                     prompt_b=prompt_b,
+                    greeting_prefetch=greeting_prefetch,
                 )
             case CommunicationMode.TEXT_TO_VOICE:
                 return TextToVoicePipeline(
@@ -93,6 +98,7 @@ class AudioRouter:
                     app_ws_send=app_ws_send,
                     prompt_a=prompt_a,
                     prompt_b=prompt_b,
+                    greeting_prefetch=greeting_prefetch,
                 )
             case CommunicationMode.FULL_AGENT:
                 return FullAgentPipeline(
@@ -102,6 +108,7 @@ class AudioRouter:
                     app_ws_send=app_ws_send,
                     prompt_a=prompt_a,
                     prompt_b=prompt_b,
+                    greeting_prefetch=greeting_prefetch,
                 )
             case _:
                 raise ValueError(f"Unknown communication mode: {call.communication_mode}")
@@ -5,6 +5,21 @@ Realtime API의 E2E 번역(오디오→번역)을 분리하여 할루시네이
   2. Chat API: GPT-4o-mini (텍스트→번역 텍스트)
 
 T2V/Agent 모드 한정 사용 (V2V는 오디오 출력이 필요하므로 기존 경로 유지).
+
+스트리밍 모드 (translate_stream): 토큰 도착 즉시 on_delta로 자막을 전달하고
+TTFT(첫 토큰까지 시간)를 완료 시간과 별도로 기록한다. 호출 task를 취소하면
+스트림도 함께 닫힌다 (새 발화가 번역을 대체하는 경우).
+
+Hedged 요청: 첫 요청이 적응형 임계값(프로세스 전역 최근 지연 분포의 백분위) 안에
+응답(스트리밍은 첫 토큰)하지 않으면 두 번째 요청(선택적으로 다른 모델)을 보내고
+먼저 도착한 쪽을 사용한다. 나머지 요청은 취소한다. Chat API 긴 꼬리 지연이
+Session B p99를 결정하던 문제 대응.
+
+번역 메모 캐시 (translation_cache): 짧은 반복 발화는 네트워크 없이 캐시된
+번역을 즉시 반환한다.
+
+이어 번역 (prefix): 발화 앞부분(speculative STT Part 1)을 먼저 번역해 둔 경우,
+나머지 부분만 앞부분 원문/번역을 컨텍스트로 주고 이어서 번역한다.
 """
 
 from __future__ import annotations
@@ -12,18 +27,21 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-from openai import AsyncOpenAI
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Coroutine, TypeVar
 
 from src.config import settings
+from src.openai_client import get_openai_client
+from src.realtime.translation_cache import translation_cache
 
 if TYPE_CHECKING:
     from src.realtime.context_manager import ConversationContextManager
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class ChatTranslationResult:
@@ -33,6 +51,105 @@ class ChatTranslationResult:
     input_tokens: int
     output_tokens: int
     latency_ms: float
+    ttft_ms: float = 0.0  # 스트리밍: 첫 토큰까지 시간 (비스트리밍은 0)
+    hedged: bool = False  # hedge 요청을 보냈는지
+    hedge_won: bool = False  # hedge 요청이 먼저 응답했는지
+    cached: bool = False  # 번역 메모 캐시 hit (Chat API 호출 없음)
+    cached_input_tokens: int = 0  # prompt cache hit 입력 토큰 (usage.prompt_tokens_details.cached_tokens)
+
+
+def _cached_prompt_tokens(usage: Any) -> int:
+    """Chat API usage의 prompt cache hit 토큰 수 (필드가 없으면 0)."""
+    details = getattr(usage, "prompt_tokens_details", None)
+    cached = getattr(details, "cached_tokens", 0)
+    return cached if isinstance(cached, int) else 0
+
+
+class HedgePolicy:
+    """최근 지연 분포에서 hedge 임계값을 학습한다 (프로세스 전역).
+
+    임계값 = 최근 window개 지연의 percentile, [min_ms, max_ms] clamp.
+    샘플이 min_samples 미만이면 initial_ms를 사용한다.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.9,
+        window: int = 200,
+        min_samples: int = 20,
+        initial_ms: float = 1200.0,
+        min_ms: float = 300.0,
+        max_ms: float = 2500.0,
+    ):
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._initial_ms = initial_ms
+        self._min_ms = min_ms
+        self._max_ms = max_ms
+        self._latencies_ms: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    @property
+    def threshold_ms(self) -> float:
+        if len(self._latencies_ms) < self._min_samples:
+            return self._initial_ms
+        ordered = sorted(self._latencies_ms)
+        value = ordered[min(len(ordered) - 1, int(len(ordered) * self._percentile))]
+        return max(self._min_ms, min(self._max_ms, value))
+
+    def record(self, latency_ms: float, hedged: bool, hedge_won: bool) -> None:
+        self.requests += 1
+        self._latencies_ms.append(latency_ms)
+        if hedged:
+            self.hedged += 1
+        if hedge_won:
+            self.hedge_wins += 1
+
+    def reset(self) -> None:
+        self._latencies_ms.clear()
+        self.requests = self.hedged = self.hedge_wins = 0
+
+    def stats(self) -> dict[str, float | int]:
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": round(self.hedged / self.requests, 3) if self.requests else 0.0,
+            "win_rate": round(self.hedge_wins / self.hedged, 3) if self.hedged else 0.0,
+            "threshold_ms": round(self.threshold_ms, 1),
+        }
+
+
+def _make_policy() -> HedgePolicy:
+    return HedgePolicy(
+        percentile=settings.session_b_chat_hedge_percentile,
+        min_samples=settings.session_b_chat_hedge_min_samples,
+        initial_ms=settings.session_b_chat_hedge_initial_ms,
+        min_ms=settings.session_b_chat_hedge_min_ms,
+        max_ms=settings.session_b_chat_hedge_max_ms,
+    )
+
+
+# 프로세스 전역 hedge 정책: 전체 응답 지연 / 스트리밍 첫 토큰 지연 분포는 서로 다르므로 분리
+response_hedge_policy = _make_policy()
+ttft_hedge_policy = _make_policy()
+
+
+def hedge_stats() -> dict[str, dict[str, float | int]]:
+    """hedge 지표 스냅샷 (health 엔드포인트용)."""
+    return {"response": response_hedge_policy.stats(), "ttft": ttft_hedge_policy.stats()}
+
+
+@dataclass
+class _StreamHead:
+    """첫 토큰까지 읽은 스트림 (hedge 경쟁의 결과 단위)."""
+
+    stream: Any
+    chunks: Any
+    first_delta: str
+    usage: Any
 
 
 class ChatTranslator:
@@ -51,6 +168,8 @@ class ChatTranslator:
         context_manager: ConversationContextManager | None = None,
         model: str | None = None,
         timeout_ms: int | None = None,
+        hedge_enabled: bool | None = None,
+        hedge_model: str | None = None,
     ):
         """
         Args:
@@ -59,10 +178,18 @@ class ChatTranslator:
             context_manager: 대화 컨텍스트 매니저 (번역 일관성)
             model: Chat API 모델 (기본: settings.session_b_chat_translation_model)
             timeout_ms: 요청 타임아웃 (기본: settings.session_b_chat_translation_timeout_ms)
+            hedge_enabled: hedge 요청 사용 여부 (기본: settings.session_b_chat_hedge_enabled)
+            hedge_model: hedge 요청 모델 (기본: settings.session_b_chat_hedge_model, 빈 값이면 model)
         """
-        self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        self._client = get_openai_client()
         self._model = model or settings.session_b_chat_translation_model
         self._timeout_s = (timeout_ms or settings.session_b_chat_translation_timeout_ms) / 1000
+        self._hedge_enabled = (
+            settings.session_b_chat_hedge_enabled if hedge_enabled is None else hedge_enabled
+        )
+        self._hedge_model = hedge_model or settings.session_b_chat_hedge_model or self._model
+        self._source_language = source_language
+        self._target_language = target_language
         self._context_manager = context_manager
         self._system_prompt = (
             f"You are a professional translator. "
@@ -72,37 +199,44 @@ class ChatTranslator:
             f"If the input is garbled, completely meaningless, or clearly not {source_language}, output [unclear]."
         )
 
-    async def translate(self, stt_text: str) -> ChatTranslationResult | None:
+    @property
+    def target_language(self) -> str:
+        """번역 대상 언어 (User 언어)."""
+        return self._target_language
+
+    async def translate(
+        self,
+        stt_text: str,
+        prefix: tuple[str, str] | None = None,
+    ) -> ChatTranslationResult | None:
         """STT 텍스트를 Chat API로 번역한다.
 
         Args:
             stt_text: Whisper STT 결과 텍스트
+            prefix: (앞부분 원문, 앞부분 번역) — 주어지면 stt_text를 이어지는 부분으로 번역
 
         Returns:
             ChatTranslationResult or None on error.
         """
-        messages: list[dict[str, str]] = [
-            {"role": "system", "content": self._system_prompt},
-        ]
-        if self._context_manager:
-            context = self._context_manager.format_context()
-            if context:
-                messages.append({
-                    "role": "system",
-                    "content": f"[Previous conversation for reference]\n{context}",
-                })
-        messages.append({"role": "user", "content": stt_text})
+        cache_key = self._cache_key(stt_text) if prefix is None else None
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        messages = self._build_messages(stt_text, prefix)
+
+        async def attempt(model: str) -> Any:
+            return await self._client.chat.completions.create(
+                model=model,
+                temperature=0,
+                max_tokens=300,
+                messages=messages,
+            )
 
         start = time.monotonic()
         try:
-            response = await asyncio.wait_for(
-                self._client.chat.completions.create(
-                    model=self._model,
-                    temperature=0,
-                    max_tokens=300,
-                    messages=messages,
-                ),
-                timeout=self._timeout_s,
+            response, hedged, hedge_won = await self._race(
+                attempt, response_hedge_policy, discard=None
             )
 
             translated = (response.choices[0].message.content or "").strip()
@@ -113,11 +247,15 @@ class ChatTranslator:
                 logger.warning("ChatTranslator: empty response (%.0fms)", elapsed_ms)
                 return None
 
+            self._cache_store(cache_key, translated)
             return ChatTranslationResult(
                 translated_text=translated,
                 input_tokens=usage.prompt_tokens if usage else 0,
                 output_tokens=usage.completion_tokens if usage else 0,
+                cached_input_tokens=_cached_prompt_tokens(usage),
                 latency_ms=elapsed_ms,
+                hedged=hedged,
+                hedge_won=hedge_won,
             )
 
         except asyncio.TimeoutError:
@@ -132,3 +270,272 @@ class ChatTranslator:
         except Exception:
             logger.exception("ChatTranslator error")
             return None
+
+    async def translate_stream(
+        self,
+        stt_text: str,
+        on_delta: Callable[[str], Coroutine],
+        prefix: tuple[str, str] | None = None,
+    ) -> ChatTranslationResult | None:
+        """STT 텍스트를 스트리밍으로 번역하며 델타를 즉시 전달한다.
+
+        timeout은 첫 토큰까지, 그리고 이후 청크 간 정체(stall)에 각각 적용된다
+        (전체 완료 시간에는 적용하지 않음 — 긴 번역도 첫 토큰이 빠르면 진행).
+        hedge는 첫 토큰 기준으로 경쟁하며, 첫 토큰 이후에는 승자 스트림만 읽는다.
+        호출 task 취소 시 CancelledError가 전파되며 스트림은 닫힌다.
+
+        Args:
+            stt_text: Whisper STT 결과 텍스트
+            on_delta: 번역 텍스트 델타 콜백
+            prefix: (앞부분 원문, 앞부분 번역) — 주어지면 stt_text를 이어지는 부분으로 번역
+
+        Returns:
+            ChatTranslationResult (ttft_ms 포함) or None on error.
+        """
+        cache_key = self._cache_key(stt_text) if prefix is None else None
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            await on_delta(cached.translated_text)
+            return cached
+
+        messages = self._build_messages(stt_text, prefix)
+
+        async def attempt(model: str) -> _StreamHead:
+            stream = await self._client.chat.completions.create(
+                model=model,
+                temperature=0,
+                max_tokens=300,
+                messages=messages,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            try:
+                chunks = stream.__aiter__()
+                usage = None
+                while True:
+                    try:
+                        chunk = await chunks.__anext__()
+                    except StopAsyncIteration:
+                        return _StreamHead(stream, None, "", usage)
+                    if getattr(chunk, "usage", None):
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    # 선행 공백 제거 (비스트리밍 strip()과 동일한 결과)
+                    delta = (chunk.choices[0].delta.content or "").lstrip()
+                    if delta:
+                        return _StreamHead(stream, chunks, delta, usage)
+            except BaseException:
+                await self._close_stream(stream)
+                raise
+
+        start = time.monotonic()
+        ttft_ms = 0.0
+        parts: list[str] = []
+        head: _StreamHead | None = None
+        try:
+            head, hedged, hedge_won = await self._race(
+                attempt, ttft_hedge_policy, discard=lambda h: self._close_stream(h.stream)
+            )
+            usage = head.usage
+            if head.first_delta:
+                ttft_ms = (time.monotonic() - start) * 1000
+                parts.append(head.first_delta)
+                await on_delta(head.first_delta)
+
+            while head.chunks is not None:
+                try:
+                    chunk = await asyncio.wait_for(head.chunks.__anext__(), timeout=self._timeout_s)
+                except StopAsyncIteration:
+                    break
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content or ""
+                if not delta:
+                    continue
+                parts.append(delta)
+                await on_delta(delta)
+
+            translated = "".join(parts).strip()
+            elapsed_ms = (time.monotonic() - start) * 1000
+            if not translated:
+                logger.warning("ChatTranslator: empty stream response (%.0fms)", elapsed_ms)
+                return None
+
+            self._cache_store(cache_key, translated)
+            return ChatTranslationResult(
+                translated_text=translated,
+                input_tokens=usage.prompt_tokens if usage else 0,
+                output_tokens=usage.completion_tokens if usage else 0,
+                cached_input_tokens=_cached_prompt_tokens(usage),
+                latency_ms=elapsed_ms,
+                ttft_ms=ttft_ms,
+                hedged=hedged,
+                hedge_won=hedge_won,
+            )
+
+        except asyncio.TimeoutError:
+            elapsed_ms = (time.monotonic() - start) * 1000
+            logger.warning(
+                "ChatTranslator stream timeout (%.0fms, %s, limit %.0fms)",
+                elapsed_ms,
+                "stalled" if parts else "no first token",
+                self._timeout_s * 1000,
+            )
+            return None
+
+        except asyncio.CancelledError:
+            logger.debug("ChatTranslator stream cancelled (superseded)")
+            raise
+
+        except Exception:
+            logger.exception("ChatTranslator stream error")
+            return None
+
+        finally:
+            if head is not None:
+                await self._close_stream(head.stream)
+
+    async def _race(
+        self,
+        attempt: Callable[[str], Awaitable[_T]],
+        policy: HedgePolicy,
+        discard: Callable[[_T], Awaitable[None]] | None,
+    ) -> tuple[_T, bool, bool]:
+        """primary 요청이 hedge 임계값 안에 끝나지 않으면 hedge 요청을 추가해 먼저 끝난 쪽을 사용한다.
+
+        전체 한도는 self._timeout_s (초과 시 asyncio.TimeoutError).
+        한쪽이 실패하면 다른 쪽 결과를 기다린다. 패자 요청은 취소하고,
+        이미 완료된 패자 결과는 discard로 정리한다 (스트림 닫기).
+
+        Returns:
+            (결과, hedge 요청 여부, hedge 승리 여부)
+        """
+        start = time.monotonic()
+        deadline = start + self._timeout_s
+        primary: asyncio.Task = asyncio.create_task(attempt(self._model))
+        hedge: asyncio.Task | None = None
+        winner: asyncio.Task | None = None
+        try:
+            threshold_s = policy.threshold_ms / 1000
+            if self._hedge_enabled and threshold_s < self._timeout_s:
+                done, _ = await asyncio.wait({primary}, timeout=threshold_s)
+                if not done:
+                    hedge = asyncio.create_task(attempt(self._hedge_model))
+                    logger.info(
+                        "ChatTranslator: hedging after %.0fms (model=%s)",
+                        threshold_s * 1000, self._hedge_model,
+                    )
+
+            pending = {t for t in (primary, hedge) if t is not None}
+            error: BaseException | None = None
+            while winner is None:
+                if not pending:
+                    assert error is not None
+                    raise error
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    raise asyncio.TimeoutError()
+                # 동시 완료 시 primary 우선
+                for task in sorted(done, key=lambda t: t is not primary):
+                    if task.exception() is None:
+                        winner = task
+                        break
+                    error = task.exception()
+
+            hedge_won = winner is hedge
+            policy.record((time.monotonic() - start) * 1000, hedge is not None, hedge_won)
+            return winner.result(), hedge is not None, hedge_won
+        finally:
+            for task in (primary, hedge):
+                if task is None or task is winner:
+                    continue
+                if not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except BaseException:
+                        pass
+                elif discard and not task.cancelled() and task.exception() is None:
+                    await discard(task.result())
+
+    def _cache_key(self, stt_text: str) -> tuple[str, str, str, str] | None:
+        if not settings.translation_cache_enabled:
+            return None
+        context = ""
+        if settings.translation_cache_context_aware and self._context_manager:
+            context = self._context_manager.format_context()
+        return translation_cache.make_key(
+            self._source_language, self._target_language, stt_text, context
+        )
+
+    def _cache_lookup(self, key: tuple[str, str, str, str] | None) -> ChatTranslationResult | None:
+        if key is None:
+            return None
+        start = time.monotonic()
+        translated = translation_cache.get(key)
+        if translated is None:
+            return None
+        elapsed_ms = (time.monotonic() - start) * 1000
+        logger.debug("ChatTranslator: cache hit (%.2fms): %s", elapsed_ms, translated[:40])
+        return ChatTranslationResult(
+            translated_text=translated,
+            input_tokens=0,
+            output_tokens=0,
+            latency_ms=elapsed_ms,
+            ttft_ms=elapsed_ms,
+            cached=True,
+        )
+
+    @staticmethod
+    def _cache_store(key: tuple[str, str, str, str] | None, translated: str) -> None:
+        # 실패 마커([unclear])는 캐시하지 않음 — 같은 원문도 다음엔 명확히 들릴 수 있음
+        if key is None or "[unclear]" in translated.lower():
+            return
+        translation_cache.put(key, translated)
+
+    @staticmethod
+    async def _close_stream(stream: Any) -> None:
+        try:
+            await stream.close()
+        except Exception:
+            pass
+
+    def _build_messages(
+        self,
+        stt_text: str,
+        prefix: tuple[str, str] | None = None,
+    ) -> list[dict[str, str]]:
+        """시스템 프롬프트 + 대화 컨텍스트 (+ 이어 번역 앞부분) + STT 텍스트 메시지 구성."""
+        messages: list[dict[str, str]] = [
+            {"role": "system", "content": self._system_prompt},
+        ]
+        if self._context_manager:
+            context = self._context_manager.format_context()
+            if context:
+                messages.append({
+                    "role": "system",
+                    "content": f"[Previous conversation for reference]\n{context}",
+                })
+        if prefix:
+            prefix_source, prefix_translation = prefix
+            messages.append({
+                "role": "system",
+                "content": (
+                    "[Earlier part of the same utterance — already translated]\n"
+                    f"Original: {prefix_source}\n"
+                    f"Translation: {prefix_translation}\n"
+                    "The user message continues this utterance. Translate ONLY the continuation "
+                    "so that it follows the earlier translation naturally. "
+                    "Do NOT repeat the earlier translation."
+                ),
+            })
+        messages.append({"role": "user", "content": stt_text})
+        return messages
@@ -1,34 +1,95 @@
-"""대화 컨텍스트 매니저 — 최근 턴을 슬라이딩 윈도우로 관리.
+"""대화 컨텍스트 매니저 — 토큰 예산 기반 최근 턴 + 롤링 요약.
 
 번역 일관성을 위해 OpenAI Realtime 세션에 최근 대화 맥락을 주입한다.
 session.update가 아닌 conversation.item.create를 사용하여 세션 상태 리셋을 방지한다.
+
+  - 최근 턴은 원문 그대로, 예산(context_token_budget)을 넘기면 오래된 턴부터 요약으로 접는다
+  - 요약: 접힌 턴의 앞부분만 남긴 추출식 요약 (요약 예산 초과 시 가장 오래된 것부터 폐기)
+  - 포맷 결과는 턴이 바뀔 때만 다시 만든다 (ChatTranslator/번역 캐시 키도 같은 문자열 사용)
+  - 세션에 주입한 컨텍스트 아이템이 그대로 남아 있고 내용이 같으면 재주입 생략
 """
 
 from __future__ import annotations
 
 import logging
+import math
+from collections import deque
 from typing import TYPE_CHECKING
 
+from src.config import settings
+
 if TYPE_CHECKING:
     from src.realtime.sessions.session_manager import RealtimeSession
+    from src.types import ActiveCall
 
 logger = logging.getLogger(__name__)
 
 MAX_TURNS = 6
-MAX_CHARS_PER_TURN = 100
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (tokenizer 의존성 없이). ASCII ~4자/토큰, 한글 등 비ASCII ~1.5자/토큰."""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for c in text if c.isascii())
+    return max(1, math.ceil(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5))
+
+
+def _clip_to_tokens(text: str, max_tokens: int) -> str:
+    """토큰 근사치가 max_tokens 이하가 되도록 텍스트 끝을 자른다."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if estimate_tokens(text[:mid]) + 1 <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo].rstrip() + "…"
+
+
+def _label(role: str) -> str:
+    return "User" if role == "user" else "Recipient"
 
 
 class ConversationContextManager:
-    """슬라이딩 윈도우 기반 대화 컨텍스트 매니저.
+    """토큰 예산 기반 대화 컨텍스트 매니저.
 
-    최근 N턴의 대화를 유지하고, OpenAI 세션에 컨텍스트로 주입한다.
-    ~200 토큰 (6턴 x 100자) 으로 오디오 대비 무시 가능한 비용.
+    최근 턴(최대 max_turns)을 원문으로 유지하고, 예산을 넘는 오래된 턴은 롤링 요약으로 접어
+    OpenAI 세션에 컨텍스트로 주입한다.
     """
 
-    def __init__(self, max_turns: int = MAX_TURNS, max_chars: int = MAX_CHARS_PER_TURN):
-        self._turns: list[dict[str, str]] = []
+    def __init__(
+        self,
+        max_turns: int = MAX_TURNS,
+        token_budget: int | None = None,
+        summary_token_budget: int | None = None,
+        call: ActiveCall | None = None,
+    ):
+        """
+        Args:
+            max_turns: 원문으로 유지할 최근 턴 수 상한
+            token_budget: 포맷된 컨텍스트 전체 토큰 예산 (요약 포함)
+            summary_token_budget: 롤링 요약 토큰 예산
+            call: 주입 지표 기록용 (없으면 기록 안 함)
+        """
+        self._turns: list[dict[str, str | int]] = []
         self._max_turns = max_turns
-        self._max_chars = max_chars
+        self._token_budget = token_budget if token_budget is not None else settings.context_token_budget
+        self._summary_budget = (
+            summary_token_budget if summary_token_budget is not None else settings.context_summary_token_budget
+        )
+        self._call = call
+
+        self._summary: deque[tuple[str, int]] = deque()  # (요약 항목, 토큰)
+        self._summary_tokens = 0
+        self._turn_tokens = 0
+
+        # 포맷 캐시 + 세션별 주입 상태 (id(session) → (version, 컨텍스트 아이템 ID))
+        self._version = 0
+        self._formatted: str | None = None
+        self._injected: dict[int, tuple[int, str]] = {}
 
     def add_turn(self, role: str, text: str) -> None:
         """완료된 턴을 추가한다.
@@ -40,23 +101,40 @@ class ConversationContextManager:
         text = text.strip()
         if not text:
             return
-        self._turns.append({
-            "role": role,
-            "text": text[:self._max_chars],
-        })
-        if len(self._turns) > self._max_turns:
-            self._turns = self._turns[-self._max_turns:]
-        logger.debug("Context: added %s turn (%d total)", role, len(self._turns))
+        tokens = estimate_tokens(f"{_label(role)}: {text}")
+        self._turns.append({"role": role, "text": text, "tokens": tokens})
+        self._turn_tokens += tokens
+
+        # 턴 수/예산 초과 → 오래된 턴부터 요약으로 접기 (최신 턴은 항상 원문 유지)
+        while len(self._turns) > 1 and (
+            len(self._turns) > self._max_turns or self._turn_tokens + self._summary_tokens > self._token_budget
+        ):
+            self._fold(self._turns.pop(0))
+
+        # 최신 턴 1개만으로도 예산 초과 → 원문을 예산에 맞게 자름
+        if self._turn_tokens + self._summary_tokens > self._token_budget:
+            self._clip_latest(self._token_budget - self._summary_tokens)
+
+        self._version += 1
+        self._formatted = None
+        logger.debug(
+            "Context: added %s turn (%d turns, %d summarized, ~%d tokens)",
+            role,
+            len(self._turns),
+            len(self._summary),
+            self.token_count,
+        )
 
     def format_context(self) -> str:
-        """컨텍스트를 읽기 쉬운 포맷으로 반환한다."""
-        if not self._turns:
-            return ""
-        lines = []
-        for turn in self._turns:
-            label = "User" if turn["role"] == "user" else "Recipient"
-            lines.append(f"{label}: {turn['text']}")
-        return "\n".join(lines)
+        """컨텍스트를 읽기 쉬운 포맷으로 반환한다 (턴 변경 시에만 재생성)."""
+        if self._formatted is None:
+            lines = []
+            if self._summary:
+                lines.append("Earlier (summary): " + " | ".join(entry for entry, _ in self._summary))
+            for turn in self._turns:
+                lines.append(f"{_label(str(turn['role']))}: {turn['text']}")
+            self._formatted = "\n".join(lines)
+        return self._formatted
 
     async def inject_context(
         self, session: RealtimeSession, input_mode: str = "audio"
@@ -66,6 +144,9 @@ class ConversationContextManager:
         session.update를 사용하지 않는 이유: 세션 전체 설정을 리셋하기 때문.
         conversation.item.create는 기존 세션 상태를 유지하면서 아이템만 추가한다.
 
+        마지막으로 주입한 컨텍스트가 바뀌지 않았고 그 아이템이 세션에 남아 있으면
+        (프루닝/재연결로 삭제되지 않았으면) 다시 보내지 않는다.
+
         Args:
             session: OpenAI Realtime 세션
             input_mode: 입력 모드 ("audio" 또는 "text")
@@ -74,20 +155,69 @@ class ConversationContextManager:
         if not context:
             return
 
+        injected = self._injected.get(id(session))
+        if injected and injected[0] == self._version and injected[1] == getattr(session, "context_item_id", ""):
+            if self._call:
+                self._call.call_metrics.context_injections_skipped += 1
+            logger.debug("Context unchanged — injection skipped (input_mode=%s)", input_mode)
+            return
+
         input_label = "audio you hear" if input_mode == "audio" else "text you receive"
-        await session.send_context_item(
+        item_id = await session.send_context_item(
             f"[Previous conversation for reference ONLY]\n{context}\n"
             f"[WARNING: Translate ONLY the actual {input_label} next. "
             f"If the {input_mode} is unclear, noisy, or silent, you MUST output [unclear]. "
             f"Generating a contextually logical response when {input_mode} is unclear is STRICTLY FORBIDDEN. "
             f"Do NOT guess or infer what was probably said.]"
         )
-        logger.debug("Context injected: %d turns (input_mode=%s)", len(self._turns), input_mode)
+        if isinstance(item_id, str) and item_id:
+            self._injected[id(session)] = (self._version, item_id)
+        if self._call:
+            self._call.call_metrics.context_tokens_per_turn.append(self.token_count)
+        logger.debug(
+            "Context injected: %d turns, ~%d tokens (input_mode=%s)", len(self._turns), self.token_count, input_mode
+        )
 
     @property
     def turn_count(self) -> int:
+        """원문으로 유지 중인 턴 수 (요약으로 접힌 턴 제외)."""
         return len(self._turns)
 
+    @property
+    def token_count(self) -> int:
+        """현재 컨텍스트 토큰 근사치 (요약 포함)."""
+        return self._turn_tokens + self._summary_tokens
+
     def clear(self) -> None:
         """컨텍스트를 초기화한다."""
         self._turns.clear()
+        self._summary.clear()
+        self._summary_tokens = 0
+        self._turn_tokens = 0
+        self._version += 1
+        self._formatted = None
+
+    # --- Internal ---
+
+    def _fold(self, turn: dict[str, str | int]) -> None:
+        """원문 턴을 롤링 요약 항목으로 접는다."""
+        self._turn_tokens -= int(turn["tokens"])
+        if self._summary_budget <= 0:
+            return
+        entry = f"{_label(str(turn['role']))}: " + _clip_to_tokens(
+            str(turn["text"]), settings.context_summary_turn_tokens
+        )
+        tokens = estimate_tokens(entry)
+        self._summary.append((entry, tokens))
+        self._summary_tokens += tokens
+        while self._summary and self._summary_tokens > self._summary_budget:
+            _, dropped = self._summary.popleft()
+            self._summary_tokens -= dropped
+
+    def _clip_latest(self, max_tokens: int) -> None:
+        turn = self._turns[-1]
+        label = f"{_label(str(turn['role']))}: "
+        text = _clip_to_tokens(str(turn["text"]), max(1, max_tokens - estimate_tokens(label)))
+        tokens = estimate_tokens(label + text)
+        self._turn_tokens += tokens - int(turn["tokens"])
+        turn["text"], turn["tokens"] = text, tokens
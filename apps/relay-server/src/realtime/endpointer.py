@@ -0,0 +1,416 @@
+"""Turn Endpointer — 운율/의미 기반 조기 발화 종료 판정.
+
+LocalVAD는 min_silence_frames(25 × 32ms = 800ms) 연속 무음 후에만 발화 종료를
+선언한다. 이 800ms는 모든 수신자 턴에서 STT commit 전에 지불된다.
+Endpointer는 SPEAKING 중 Silero 프레임별 특징을 누적하고, 짧은 무음(기본 256ms)
+이후 턴이 "명백히 끝났을 때"만 조기 종료를 허용한다. 애매하면 기존 800ms로 폴백.
+
+판정 신호 (가중 평균, 사용 가능한 신호만):
+  - silence: 무음 구간 Silero 확률이 silence_threshold보다 얼마나 낮은지 (깊은 무음)
+  - energy:  발화 꼬리(마지막 ~320ms) 에너지(dB) 하강 기울기 (문장 끝 감쇠)
+  - pitch:   발화 꼬리 유성음 F0(semitone) 하강 기울기 (평서문 종결 억양)
+  - text:    부분 STT가 한국어 종결 어미/문장 부호로 끝남 (선택, 최근 텍스트만)
+
+오프라인 평가:
+  shadow 모드(조기 종료 없이 판정만)로 턴별 프레임 trace를 JSONL로 수집한 뒤
+  evaluate_endpointing()으로 재생 → 절감 레이턴시 vs 오절단(false cut-off) 비율.
+    uv run python -m src.realtime.endpointer traces.jsonl --threshold 0.7
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import re
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Silero 프레임 길이 (16kHz × 512 samples)
+FRAME_MS = 32.0
+
+# 문장 종결: 한국어 종결 어미 (부호 선택) 또는 문장 부호
+_SENTENCE_FINAL_RE = re.compile(
+    r'(?:(?:요|다|까|죠|니다|습니다|습니까|네요|데요|세요|래요|게요)[.?!]?'
+    r'|[.?!。？！])\s*$'
+)
+
+# 신호별 가중치 (사용 불가 신호는 제외 후 재정규화)
+_WEIGHTS = {"silence": 0.3, "energy": 0.25, "pitch": 0.2, "text": 0.25}
+
+
+def estimate_f0(
+    frame: np.ndarray,
+    sample_rate: int = 16000,
+    fmin: float = 70.0,
+    fmax: float = 400.0,
+    voicing_threshold: float = 0.45,
+) -> float:
+    """자기상관 기반 F0 추정 (Hz). 무성/무음이면 0.0.
+
+    32ms 프레임 한 개로 충분한 해상도 (70Hz 주기 = 14ms).
+    """
+    frame = frame - frame.mean()
+    n = len(frame)
+    if n < 2 or float(np.dot(frame, frame)) < 1e-6:
+        return 0.0
+    spectrum = np.fft.rfft(frame, 2 * n)
+    ac = np.fft.irfft(spectrum * np.conj(spectrum))[:n]
+    lo = max(1, int(sample_rate / fmax))
+    hi = min(int(sample_rate / fmin), n - 1)
+    if hi <= lo:
+        return 0.0
+    # 지연이 길수록 겹치는 샘플이 줄어드므로 unbiased 정규화
+    normalized = ac[lo:hi + 1] / ac[0] * (n / (n - np.arange(lo, hi + 1)))
+    peak = float(normalized.max())
+    if peak < voicing_threshold:
+        return 0.0
+    # 옥타브 오류 방지: 최대값의 90% 이상인 첫 봉우리 (2배 주기 선택 방지)
+    idx = int(np.argmax(normalized >= 0.9 * peak))
+    while idx + 1 < len(normalized) and normalized[idx + 1] > normalized[idx]:
+        idx += 1
+    return sample_rate / (lo + idx)
+
+
+def frame_energy_db(frame: np.ndarray) -> float:
+    """float32 프레임 RMS 에너지 (dBFS)."""
+    if len(frame) == 0:
+        return -100.0
+    rms = float(np.sqrt(np.mean(np.square(frame, dtype=np.float64))))
+    return 20.0 * math.log10(rms + 1e-5)
+
+
+def _slope(values: list[float]) -> float:
+    """프레임당 선형 회귀 기울기."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    x = np.arange(n, dtype=np.float64)
+    return float(np.polyfit(x, np.asarray(values, dtype=np.float64), 1)[0])
+
+
+@dataclass
+class EndpointFrame:
+    """SPEAKING 중 Silero 프레임 1개(32ms)의 특징."""
+
+    prob: float
+    energy_db: float
+    f0: float = 0.0  # 0 = 무성
+
+
+@dataclass
+class EndpointTrace:
+    """턴 1개의 프레임 trace (오프라인 평가 입력)."""
+
+    frames: list[EndpointFrame] = field(default_factory=list)
+    # (관측 시점 프레임 인덱스, 부분 STT 텍스트)
+    texts: list[tuple[int, str]] = field(default_factory=list)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "frames": [[round(f.prob, 3), round(f.energy_db, 1), round(f.f0, 1)] for f in self.frames],
+                "texts": self.texts,
+            },
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> EndpointTrace:
+        data = json.loads(line)
+        return cls(
+            frames=[EndpointFrame(prob=p, energy_db=e, f0=f) for p, e, f in data["frames"]],
+            texts=[(int(i), str(t)) for i, t in data.get("texts", [])],
+        )
+
+
+class TurnEndpointer:
+    """턴별 운율/의미 특징 누적 + 조기 종료 판정 (LocalVAD 소유).
+
+    LocalVAD가 SPEAKING 중 Silero 프레임마다 observe()를 호출하고, 무음 프레임에서
+    should_end()가 True면 min_silence_frames를 기다리지 않고 종료한다.
+    """
+
+    def __init__(
+        self,
+        silence_threshold: float = 0.35,
+        min_silence_frames: int = 8,
+        score_threshold: float = 0.7,
+        tail_frames: int = 10,
+        text_max_lag_frames: int = 15,
+        shadow: bool = False,
+        trace_path: str = "",
+    ):
+        """
+        Args:
+            silence_threshold: LocalVAD와 동일한 Silero silence 확률 임계값
+            min_silence_frames: 조기 종료 전 최소 연속 무음 프레임 수
+            score_threshold: 조기 종료 점수 임계값 (0~1)
+            tail_frames: 에너지/피치 기울기를 볼 발화 꼬리 프레임 수
+            text_max_lag_frames: 부분 STT 관측 후 이만큼 발화가 더 이어지면 텍스트 신호 무시
+            shadow: True면 판정만 기록하고 조기 종료하지 않음 (trace 수집용)
+            trace_path: 턴별 trace를 JSONL로 추가할 파일 (빈 값이면 비활성)
+        """
+        self._silence_threshold = silence_threshold
+        self._min_silence_frames = min_silence_frames
+        self._score_threshold = score_threshold
+        self._tail_frames = tail_frames
+        self._text_max_lag_frames = text_max_lag_frames
+        self._shadow = shadow
+        self._trace_path = trace_path
+        self._trace = EndpointTrace()
+        # 현재 턴에서 판정이 처음 True가 된 무음 프레임 수 (shadow 로그용)
+        self._would_end_at: int | None = None
+
+    @property
+    def trace(self) -> EndpointTrace:
+        return self._trace
+
+    def start_turn(self) -> None:
+        """새 발화 시작 (LocalVAD SILENCE→SPEAKING)."""
+        self._trace = EndpointTrace()
+        self._would_end_at = None
+
+    def observe(self, frame: np.ndarray, prob: float) -> None:
+        """16kHz Silero 프레임 + 확률을 누적한다."""
+        # 무음 프레임은 F0 추정 생략 (판정에 발화 꼬리만 사용)
+        f0 = estimate_f0(frame) if prob >= self._silence_threshold else 0.0
+        self.observe_features(EndpointFrame(prob=prob, energy_db=frame_energy_db(frame), f0=f0))
+
+    def observe_features(self, frame: EndpointFrame) -> None:
+        self._trace.frames.append(frame)
+
+    def note_transcript(self, text: str) -> None:
+        """발화 중 도착한 부분 STT (speculative Part 1 / delta 누적)."""
+        if text:
+            self._trace.texts.append((len(self._trace.frames), text))
+
+    def should_end(self) -> bool:
+        """현재 무음 구간에서 턴을 조기 종료할지 판정한다."""
+        pause = self._trailing_silence()
+        if pause < self._min_silence_frames:
+            return False
+        score = self.completion_score()
+        if score is None or score < self._score_threshold:
+            return False
+        if self._would_end_at is None:
+            self._would_end_at = pause
+            logger.debug(
+                "[Endpointer] Turn complete (score=%.2f, silence=%.0fms%s)",
+                score, pause * FRAME_MS, ", shadow" if self._shadow else "",
+            )
+        return not self._shadow
+
+    async def finish_turn(self) -> None:
+        """발화 종료 (LocalVAD SPEAKING→SILENCE). trace_path가 있으면 기록.
+
+        파일 쓰기는 스레드에서 수행한다 (VAD 프레임 처리 = 이벤트 루프 블로킹 방지).
+        """
+        if not self._trace_path or not self._trace.frames:
+            return
+        line = self._trace.to_json() + "\n"
+        try:
+            await asyncio.to_thread(self._append_trace, line)
+        except OSError:
+            logger.warning("[Endpointer] Failed to write trace to %s", self._trace_path)
+
+    def completion_score(self) -> float | None:
+        """턴 완료 점수 (0~1). 발화 꼬리가 너무 짧으면 None."""
+        return completion_score(
+            self._trace,
+            len(self._trace.frames),
+            silence_threshold=self._silence_threshold,
+            tail_frames=self._tail_frames,
+            text_max_lag_frames=self._text_max_lag_frames,
+        )
+
+    # --- Internal ---
+
+    def _append_trace(self, line: str) -> None:
+        with open(self._trace_path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+    def _trailing_silence(self) -> int:
+        count = 0
+        for frame in reversed(self._trace.frames):
+            if frame.prob >= self._silence_threshold:
+                break
+            count += 1
+        return count
+
+
+def create_turn_endpointer() -> TurnEndpointer | None:
+    """설정 기반 TurnEndpointer 생성. 판정 결과를 쓸 곳이 없으면 None.
+
+    shadow 모드에 trace_path도 없으면 판정이 어디에도 반영·기록되지 않으므로,
+    프레임마다 F0/에너지를 분석하는 비용을 내지 않도록 생성하지 않는다.
+    """
+    if not settings.local_vad_endpointing_enabled:
+        return None
+    if settings.local_vad_endpoint_shadow and not settings.local_vad_endpoint_trace_path:
+        return None
+    return TurnEndpointer(
+        silence_threshold=settings.local_vad_silence_threshold,
+        min_silence_frames=settings.local_vad_endpoint_min_silence_frames,
+        score_threshold=settings.local_vad_endpoint_score_threshold,
+        shadow=settings.local_vad_endpoint_shadow,
+        trace_path=settings.local_vad_endpoint_trace_path,
+    )
+
+
+def completion_score(
+    trace: EndpointTrace,
+    end: int,
+    silence_threshold: float = 0.35,
+    tail_frames: int = 10,
+    text_max_lag_frames: int = 15,
+) -> float | None:
+    """trace.frames[:end] 시점의 턴 완료 점수 (실시간 판정과 오프라인 재생 공용)."""
+    frames = trace.frames[:end]
+    pause = 0
+    for frame in reversed(frames):
+        if frame.prob >= silence_threshold:
+            break
+        pause += 1
+    speech_end = len(frames) - pause
+    tail = [f for f in frames[max(0, speech_end - tail_frames):speech_end] if f.prob >= silence_threshold]
+    if len(tail) < 3:
+        return None
+
+    scores: dict[str, float] = {}
+    silence_probs = [f.prob for f in frames[speech_end:]]
+    if silence_probs and silence_threshold > 0:
+        scores["silence"] = min(1.0, max(0.0, 1.0 - float(np.mean(silence_probs)) / silence_threshold))
+
+    # 1.0 dB/프레임 하강 ≈ 꼬리 320ms 동안 10dB 감쇠 → 만점
+    scores["energy"] = min(1.0, max(0.0, -_slope([f.energy_db for f in tail]) / 1.0))
+
+    voiced = [f.f0 for f in tail if f.f0 > 0]
+    if len(voiced) >= 3:
+        semitones = [12.0 * math.log2(f0) for f0 in voiced]
+        # 0.3 semitone/프레임 하강 ≈ 꼬리 동안 3 semitone 하강 → 만점
+        scores["pitch"] = min(1.0, max(0.0, -_slope(semitones) / 0.3))
+
+    recent = [(i, t) for i, t in trace.texts if i <= end]
+    if recent:
+        noted_at, text = recent[-1]
+        spoken_since = sum(1 for f in trace.frames[noted_at:speech_end] if f.prob >= silence_threshold)
+        if spoken_since <= text_max_lag_frames:
+            scores["text"] = 1.0 if _SENTENCE_FINAL_RE.search(text) else 0.0
+
+    total_weight = sum(_WEIGHTS[k] for k in scores)
+    return sum(_WEIGHTS[k] * v for k, v in scores.items()) / total_weight
+
+
+# --- 오프라인 평가 ---
+
+
+@dataclass
+class EndpointEvaluation:
+    """오프라인 평가 결과."""
+
+    turns: int = 0
+    early_ends: int = 0
+    false_cutoffs: int = 0
+    saved_ms: list[float] = field(default_factory=list)
+
+    @property
+    def false_cutoff_rate(self) -> float:
+        return self.false_cutoffs / self.turns if self.turns else 0.0
+
+    @property
+    def mean_saved_ms(self) -> float:
+        """턴당 평균 절감 레이턴시 (조기 종료되지 않은 턴 = 0ms 포함)."""
+        return sum(self.saved_ms) / self.turns if self.turns else 0.0
+
+    def summary(self) -> dict[str, float | int]:
+        return {
+            "turns": self.turns,
+            "early_ends": self.early_ends,
+            "false_cutoffs": self.false_cutoffs,
+            "false_cutoff_rate": round(self.false_cutoff_rate, 3),
+            "mean_saved_ms": round(self.mean_saved_ms, 1),
+        }
+
+
+def evaluate_endpointing(
+    traces: list[EndpointTrace],
+    fallback_silence_frames: int = 25,
+    silence_threshold: float = 0.35,
+    min_silence_frames: int = 8,
+    score_threshold: float = 0.7,
+    tail_frames: int = 10,
+    text_max_lag_frames: int = 15,
+) -> EndpointEvaluation:
+    """shadow trace를 재생하여 절감 레이턴시 vs 오절단을 계산한다.
+
+    trace는 조기 종료 없이 기록된 SPEAKING 구간 전체이므로, 중간 무음(이후 발화 재개)은
+    발화 내 쉼, fallback_silence_frames에 도달한 마지막 무음은 진짜 턴 종료다.
+      - 중간 무음에서 판정 True → false cut-off (발화가 잘려 Part 2로 분리됨)
+      - 마지막 무음에서 판정 True → (fallback - 판정 시점 무음) × 32ms 절감
+    """
+    result = EndpointEvaluation()
+    for trace in traces:
+        result.turns += 1
+        pause = 0
+        for end, frame in enumerate(trace.frames, start=1):
+            if frame.prob >= silence_threshold:
+                pause = 0
+                continue
+            pause += 1
+            if pause >= fallback_silence_frames:
+                result.saved_ms.append(0.0)
+                break
+            if pause < min_silence_frames:
+                continue
+            score = completion_score(
+                trace, end,
+                silence_threshold=silence_threshold,
+                tail_frames=tail_frames,
+                text_max_lag_frames=text_max_lag_frames,
+            )
+            if score is None or score < score_threshold:
+                continue
+            result.early_ends += 1
+            resumed = any(f.prob >= silence_threshold for f in trace.frames[end:])
+            if resumed:
+                result.false_cutoffs += 1
+                result.saved_ms.append(0.0)
+            else:
+                result.saved_ms.append((fallback_silence_frames - pause) * FRAME_MS)
+            break
+        else:
+            result.saved_ms.append(0.0)
+    return result
+
+
+def _main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Endpointer 오프라인 평가 (shadow trace 재생)")
+    parser.add_argument("trace_file", help="JSONL trace (local_vad_endpoint_trace_path)")
+    parser.add_argument("--fallback", type=int, default=25, help="폴백 무음 프레임 수 (기본 25 = 800ms)")
+    parser.add_argument("--min-silence", type=int, default=8)
+    parser.add_argument("--threshold", type=float, nargs="+", default=[0.6, 0.7, 0.8])
+    args = parser.parse_args()
+
+    with open(args.trace_file, encoding="utf-8") as f:
+        traces = [EndpointTrace.from_json(line) for line in f if line.strip()]
+    for threshold in args.threshold:
+        evaluation = evaluate_endpointing(
+            traces,
+            fallback_silence_frames=args.fallback,
+            min_silence_frames=args.min_silence,
+            score_threshold=threshold,
+        )
+        print(f"threshold={threshold:.2f} {evaluation.summary()}")
+
+
+if __name__ == "__main__":
+    _main()
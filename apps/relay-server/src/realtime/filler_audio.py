@@ -0,0 +1,221 @@
+"""정형 문구 오디오 캐시 — 필러를 Realtime 왕복 없이 재생.
+
+타이핑 필러("잠시만 기다려주세요, 메시지를 작성 중입니다.")는 매번 같은 문장인데도
+Session A create_response로 생성되어 수 초의 지연과 audio output 토큰을 소모했고,
+Guardrail 필러("잠시만요.")는 생성 경로가 없어 Twilio 버퍼만 비우고 재생되지 않았다.
+
+이 캐시는 (음성, 언어, 문장) → g711_ulaw 클립을 보관한다:
+  - 채움: 첫 라이브 생성 응답의 오디오를 캡처 (transcript가 문장과 일치하고 응답이 완료된 경우만).
+    Guardrail 필러는 라이브 생성 경로가 없으므로 벨이 울리는 동안 GreetingPrefetch가 생성
+  - 영속화: cache_dir에 저장하고 서버 시작 시 load() — 재시작 후에도 첫 통화부터 hit.
+    파일 쓰기는 asyncio.to_thread로 수행해 이벤트 루프를 막지 않는다
+  - 재생: play_clip()으로 Twilio writer에 직접 전송, echo gate에 클립 길이 통보
+  - 프로세스 전역 (통화 간 공유), 항목 수 상한
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.config import settings
+from src.realtime.translation_cache import normalize_utterance
+
+if TYPE_CHECKING:
+    from src.realtime.pipeline.echo_gate import EchoGateManager
+    from src.twilio.media_stream import TwilioMediaStreamHandler
+
+logger = logging.getLogger(__name__)
+
+# Twilio 전송 단위 (g711_ulaw 8kHz, 400ms)
+_PLAY_CHUNK_BYTES = 3200
+# 클립 최소 길이 (200ms 미만은 잘린 응답으로 간주)
+_MIN_CLIP_BYTES = 1600
+_INDEX_FILE = "index.json"
+
+_Key = tuple[str, str, str]  # (음성, 언어, 정규화 문장)
+
+
+@dataclass
+class FillerCapture:
+    """라이브 생성 응답 1개의 오디오 캡처 (SessionAHandler가 채움)."""
+    language: str
+    text: str
+    chunks: list[bytes] = field(default_factory=list)
+    transcript: str = ""
+
+
+class FillerAudioCache:
+    """언어/음성별 정형 문구 g711_ulaw 클립 캐시 (프로세스 싱글톤)."""
+
+    def __init__(self, voice: str = "", max_entries: int = 64, cache_dir: str | Path | None = None):
+        self._voice = voice or "default"
+        self._max_entries = max_entries
+        self._dir = Path(cache_dir) if cache_dir else None
+        self._clips: OrderedDict[_Key, bytes] = OrderedDict()
+        self._texts: dict[_Key, str] = {}  # 원문 (index.json 기록용)
+        self._writes: set[asyncio.Task] = set()  # put()의 백그라운드 파일 쓰기
+        self._index_lock = threading.Lock()  # index.json read-modify-write 직렬화 (쓰기 스레드 간)
+        self._hits = 0
+        self._misses = 0
+
+    def _key(self, language: str, text: str) -> _Key:
+        return (self._voice, language, normalize_utterance(text))
+
+    def get(self, language: str, text: str) -> bytes | None:
+        clip = self._clips.get(self._key(language, text))
+        if clip is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return clip
+
+    def has(self, language: str, text: str) -> bool:
+        """클립 보유 여부 (hit/miss 지표에 반영하지 않음)."""
+        return self._key(language, text) in self._clips
+
+    def put(self, language: str, text: str, audio: bytes, persist: bool = True) -> None:
+        key = self._key(language, text)
+        self._clips[key] = audio
+        self._clips.move_to_end(key)
+        self._texts[key] = text
+        while len(self._clips) > self._max_entries:
+            old, _ = self._clips.popitem(last=False)
+            self._texts.pop(old, None)
+        if persist and self._dir:
+            try:
+                task = asyncio.get_running_loop().create_task(asyncio.to_thread(self._save, key, text, audio))
+            except RuntimeError:
+                # 이벤트 루프 밖 (스크립트 등)
+                self._save(key, text, audio)
+                return
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+    def capture(self, language: str, text: str) -> FillerCapture:
+        """라이브 생성 응답을 캐시에 넣기 위한 캡처를 시작한다."""
+        return FillerCapture(language=language, text=text)
+
+    def commit(self, capture: FillerCapture) -> bool:
+        """완료된 캡처를 검증 후 저장한다.
+
+        모델이 지시와 다른 문장을 말했거나 (transcript 불일치) 오디오가 잘렸으면 버린다.
+        """
+        audio = b"".join(capture.chunks)
+        if len(audio) < _MIN_CLIP_BYTES:
+            return False
+        if normalize_utterance(capture.transcript) != normalize_utterance(capture.text):
+            logger.debug(
+                "Filler capture discarded — transcript mismatch: '%s' != '%s'",
+                capture.transcript[:40],
+                capture.text[:40],
+            )
+            return False
+        self.put(capture.language, capture.text, audio)
+        logger.info(
+            "Filler audio cached (%s, %.1fs): '%s'", capture.language, len(audio) / 8000, capture.text[:40]
+        )
+        return True
+
+    def load(self) -> int:
+        """cache_dir의 클립을 불러온다 (lifespan 시작 시). 불러온 클립 수 반환."""
+        if not self._dir:
+            return 0
+        index_path = self._dir / _INDEX_FILE
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to read filler audio index %s: %s", index_path, e)
+            return 0
+
+        loaded = 0
+        for entry in index:
+            if entry.get("voice") != self._voice:
+                continue
+            try:
+                audio = (self._dir / entry["file"]).read_bytes()
+            except (OSError, KeyError):
+                continue
+            self.put(entry["language"], entry["text"], audio, persist=False)
+            loaded += 1
+        if loaded:
+            logger.info("Filler audio cache loaded %d clip(s) from %s", loaded, self._dir)
+        return loaded
+
+    async def flush(self) -> None:
+        """진행 중인 클립 파일 쓰기를 마저 끝낸다 (lifespan 종료 시)."""
+        await asyncio.gather(*self._writes, return_exceptions=True)
+
+    def clear(self) -> None:
+        self._clips.clear()
+        self._texts.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """캐시 상태/지표 스냅샷 (health 엔드포인트용)."""
+        return {
+            "size": len(self._clips),
+            "hits": self._hits,
+            "misses": self._misses,
+            "bytes": sum(len(clip) for clip in self._clips.values()),
+        }
+
+    # --- Internal ---
+
+    def _save(self, key: _Key, text: str, audio: bytes) -> None:
+        if not self._dir:
+            return
+        voice, language, normalized = key
+        filename = f"{voice}_{language}_{hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]}.ulaw"
+        index_path = self._dir / _INDEX_FILE
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            (self._dir / filename).write_bytes(audio)
+            with self._index_lock:
+                try:
+                    index = json.loads(index_path.read_text(encoding="utf-8"))
+                except (FileNotFoundError, ValueError):
+                    index = []
+                index = [e for e in index if e.get("file") != filename]
+                index.append({"voice": voice, "language": language, "text": text, "file": filename})
+                index_path.write_text(json.dumps(index, ensure_ascii=False, indent=1), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to persist filler audio %s: %s", filename, e)
+
+
+async def play_clip(
+    audio: bytes,
+    twilio_handler: TwilioMediaStreamHandler,
+    echo_gate: EchoGateManager | None = None,
+    finish: bool = True,
+) -> None:
+    """캐시 클립을 Twilio로 직접 전송한다 (Session A TTS 경로와 같은 echo gate 처리).
+
+    Args:
+        finish: 클립 종료 시 echo gate cooldown 시작. 진행 중인 Session A 응답이 있으면
+            (Guardrail 필러) False — 응답 완료 시 on_tts_done이 클립 길이를 포함해 cooldown 산정.
+    """
+    if echo_gate:
+        echo_gate.on_tts_chunk(len(audio))
+    for i in range(0, len(audio), _PLAY_CHUNK_BYTES):
+        await twilio_handler.send_audio(audio[i:i + _PLAY_CHUNK_BYTES])
+    if echo_gate and finish:
+        # 클립 전체 길이 기준 cooldown (남은 재생 시간 + margin)
+        echo_gate.on_tts_done()
+
+
+filler_audio_cache = FillerAudioCache(
+    voice=settings.realtime_voice,
+    max_entries=settings.filler_audio_cache_max_entries,
+    cache_dir=settings.filler_audio_cache_dir or None,
+)
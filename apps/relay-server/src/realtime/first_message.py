@@ -8,17 +8,272 @@ PRD 3.4:
   5. AI 고지 완료 후:
      - Relay Mode: User 앱에 "상대방이 응답했습니다" 알림
      - Agent Mode: AI가 바로 용건 시작
+
+Ring-time prefetch (Relay Mode):
+  고지 문장은 start_call 시점에 이미 정해지므로, 벨이 울리는 동안 Session A에
+  out-of-band 응답(conversation="none")으로 고지 오디오를 미리 생성해 둔다.
+  수신자 첫 발화가 끝나는 즉시 버퍼를 Twilio로 재생하고 (Realtime 생성 대기 없음),
+  prefetch가 없거나 실패/문맥이 달라졌으면 기존 라이브 생성으로 fallback한다.
+
+  같은 ring-time 구간에 Guardrail 필러("잠시만요.") 클립이 필러 오디오 캐시에 없으면
+  고지 다음으로 생성해 캐시에 넣는다. Level 3 필러는 응답 생성 도중에 필요해서
+  라이브 캡처 경로가 없으므로, 이렇게 미리 만들어 두지 않으면 재생되지 않는다.
 """
 
+import asyncio
+import base64
+import hashlib
+import json
 import logging
+import time
 from typing import Callable, Coroutine
 
+from src.config import settings
 from src.prompt.templates import FIRST_MESSAGE_TEMPLATES
+from src.realtime.filler_audio import filler_audio_cache
 from src.realtime.sessions.session_a import SessionAHandler
-from src.types import ActiveCall, CallMode, CallStatus, WsMessage, WsMessageType
+from src.realtime.sessions.session_manager import RealtimeSession
+from src.types import ActiveCall, CallMode, CallStatus, CostTokens, TranscriptEntry, WsMessage, WsMessageType
 
 logger = logging.getLogger(__name__)
 
+def _greeting_text(call: ActiveCall) -> str:
+    return FIRST_MESSAGE_TEMPLATES.get(call.target_language, FIRST_MESSAGE_TEMPLATES["en"])
+
+
+def _exact_utterance(text: str) -> str:
+    return f'Say exactly this sentence and nothing else: "{text}"'
+
+
+def _wrap_greeting(call: ActiveCall, greeting: str, use_exact_utterance: bool) -> str:
+    if use_exact_utterance:
+        # TextToVoice Relay: AI 확장 방지 — 정확히 이 문장만 발화 (hskim 이식)
+        return _exact_utterance(greeting)
+    # VoiceToVoice: 번역 지시 형식
+    return f"[User says in {call.source_language}]: {greeting}"
+
+
+def _greeting_context(call: ActiveCall, use_exact_utterance: bool) -> str:
+    """prefetch 당시 문맥 지문 — 재생 시점과 다르면 prefetch를 버리고 라이브 생성."""
+    raw = "\x1f".join((
+        call.mode.value,
+        call.source_language,
+        call.target_language,
+        _wrap_greeting(call, _greeting_text(call), use_exact_utterance),
+        call.prompt_a,
+    ))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class GreetingPrefetch:
+    """벨이 울리는 동안 Session A로 첫 고지 오디오를 미리 생성한다 (Relay Mode).
+
+    Session A 이벤트 수신 루프(listen_all)는 Media Stream 연결 후에 시작되므로,
+    그 전까지는 prefetch가 WebSocket을 직접 읽는다. Media Stream 핸들러는
+    listen_all 전에 handover()로 읽기를 넘겨받는다.
+    """
+
+    def __init__(
+        self,
+        call: ActiveCall,
+        session: RealtimeSession,
+        use_exact_utterance: bool = False,
+        filler_text: str = "",
+    ):
+        """
+        Args:
+            filler_text: 캐시에 없으면 고지 뒤에 생성해 둘 Guardrail 필러 문장 (빈 값이면 생략)
+        """
+        self._call = call
+        self._session = session
+        self._use_exact_utterance = use_exact_utterance
+        self._filler_text = filler_text
+        self._context = _greeting_context(call, use_exact_utterance)
+        self._task: asyncio.Task | None = None
+        self._response_id = ""
+        self._in_flight = False  # out-of-band 응답 요청 후 response.done 전
+        self._cancelling = False  # handover가 진행 중인 생성을 취소함
+        self._chunks: list[bytes] = []
+        self._transcript = ""
+        self.audio: bytes = b""
+        self.transcript: str = ""
+        self.generation_ms: float = 0.0
+
+    @property
+    def is_ready(self) -> bool:
+        return bool(self.audio)
+
+    def start(self, connect_task: asyncio.Task) -> None:
+        """세션 연결 완료 후 고지 생성을 시작한다 (start_call에서 호출)."""
+        self._task = asyncio.create_task(self._run(connect_task))
+
+    async def handover(self) -> None:
+        """Session A WebSocket 읽기를 수신 루프에 넘긴다 (listen_all 직전 호출).
+
+        생성이 끝나지 않았으면 잠시 기다리고, 그래도 진행 중이면 응답을 취소한 뒤
+        그 응답의 response.done까지 읽어 낸다. prefetch 응답 이벤트가 listen_all로 넘어가면
+        SessionAHandler가 일반 응답(User 턴 transcript, response.done 콜백)으로 처리한다.
+        """
+        task = self._task
+        if task is None or task.done():
+            return
+        if self.is_ready:
+            # 고지는 준비됨 — 남은 필러 생성 때문에 통화 시작을 늦추지 않는다
+            logger.info("Filler synthesis not finished at media stream start — cancelling (call=%s)", self._call.call_id)
+        else:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout=settings.greeting_prefetch_handover_timeout_s)
+                return
+            except asyncio.TimeoutError:
+                pass
+            logger.info("Greeting prefetch not ready at media stream start — cancelling (call=%s)", self._call.call_id)
+
+        self._cancelling = True
+        if self._in_flight:
+            # response.created 전이면 ID를 받는 즉시 _collect가 취소한다
+            try:
+                if self._response_id:
+                    await self._session.cancel_response(self._response_id)
+                await asyncio.wait_for(asyncio.shield(task), timeout=settings.greeting_prefetch_timeout_s)
+            except asyncio.TimeoutError:
+                logger.warning("Prefetch response not drained before handover (call=%s)", self._call.call_id)
+            except Exception:
+                pass
+        await self.cancel()
+
+    async def cancel(self) -> None:
+        task = self._task
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def take(self, call: ActiveCall) -> tuple[bytes, str] | None:
+        """재생할 고지 오디오를 꺼낸다. 없거나 문맥이 달라졌으면 None (라이브 생성)."""
+        if not self.audio:
+            return None
+        if _greeting_context(call, self._use_exact_utterance) != self._context:
+            logger.info("Greeting prefetch discarded — context changed (call=%s)", call.call_id)
+            self.audio = b""
+            return None
+        audio, self.audio = self.audio, b""
+        return audio, self.transcript
+
+    # --- Internal ---
+
+    async def _run(self, connect_task: asyncio.Task) -> None:
+        try:
+            await asyncio.shield(connect_task)
+        except (asyncio.CancelledError, Exception):
+            return
+        await self._prefetch_greeting()
+        if self._filler_text and not self._cancelling:
+            await self._synthesize_filler()
+
+    async def _prefetch_greeting(self) -> None:
+        greeting = _greeting_text(self._call)
+        started = time.monotonic()
+        if self._use_exact_utterance and settings.filler_audio_cache_enabled:
+            # 정확 발화 고지는 고정 문장 — 이전 통화에서 캡처한 클립 재사용
+            clip = filler_audio_cache.get(self._call.target_language, greeting)
+            if clip:
+                self.audio, self.transcript = clip, greeting
+                return
+
+        try:
+            generated = await self._generate(
+                _wrap_greeting(self._call, greeting, self._use_exact_utterance), "greeting_prefetch"
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Greeting prefetch timed out (call=%s)", self._call.call_id)
+            return
+        except Exception as e:
+            logger.warning("Greeting prefetch failed (call=%s): %s", self._call.call_id, e)
+            return
+
+        self.generation_ms = (time.monotonic() - started) * 1000
+        if generated:
+            self.audio, self.transcript = generated
+            logger.info(
+                "Greeting prefetched in %.0fms (%.1fs audio, call=%s)",
+                self.generation_ms,
+                len(self.audio) / 8000,
+                self._call.call_id,
+            )
+            if self._use_exact_utterance and settings.filler_audio_cache_enabled:
+                capture = filler_audio_cache.capture(self._call.target_language, greeting)
+                capture.chunks.append(self.audio)
+                capture.transcript = self.transcript
+                filler_audio_cache.commit(capture)
+
+    async def _synthesize_filler(self) -> None:
+        """Guardrail 필러 클립이 캐시에 없으면 생성해 캐시에 넣는다 (통화 간 공유, 영속화)."""
+        language = self._call.target_language
+        if not settings.filler_audio_cache_enabled or filler_audio_cache.has(language, self._filler_text):
+            return
+        try:
+            generated = await self._generate(_exact_utterance(self._filler_text), "guardrail_filler")
+        except asyncio.TimeoutError:
+            logger.warning("Guardrail filler synthesis timed out (call=%s)", self._call.call_id)
+            return
+        except Exception as e:
+            logger.warning("Guardrail filler synthesis failed (call=%s): %s", self._call.call_id, e)
+            return
+        if generated:
+            capture = filler_audio_cache.capture(language, self._filler_text)
+            capture.chunks.append(generated[0])
+            capture.transcript = generated[1]
+            filler_audio_cache.commit(capture)
+
+    async def _generate(self, text: str, purpose: str) -> tuple[bytes, str] | None:
+        """out-of-band 응답 1개를 생성해 (오디오, transcript)를 돌려준다 (완료 응답만, 아니면 None)."""
+        self._chunks, self._transcript, self._response_id = [], "", ""
+        self._in_flight = True
+        try:
+            await self._session.create_out_of_band_response(text, metadata={"purpose": purpose})
+            response = await asyncio.wait_for(self._collect(), timeout=settings.greeting_prefetch_timeout_s)
+        finally:
+            self._in_flight = False
+        if response is None:
+            return None
+        usage = response.get("usage", {})
+        if usage:
+            self._call.cost_tokens.add(CostTokens.from_realtime_usage(usage))
+        if response.get("status") == "completed" and self._chunks and self._transcript:
+            return b"".join(self._chunks), self._transcript
+        return None
+
+    async def _collect(self) -> dict | None:
+        """응답의 response.done까지 Session A 이벤트를 직접 읽는다 (오류면 None)."""
+        ws = self._session.ws
+        if ws is None:
+            return None
+        while True:
+            try:
+                event = json.loads(await ws.recv())
+            except json.JSONDecodeError:
+                continue
+            event_type = event.get("type", "")
+
+            if event_type == "session.created":
+                # 수신 루프 시작 전이므로 session_id를 여기서 기록
+                self._session.session_id = event.get("session", {}).get("id", "")
+            elif event_type == "error":
+                logger.error("[%s] Ring-time prefetch error: %s", self._session.label, event)
+                return None
+            elif event_type == "response.created":
+                self._response_id = event.get("response", {}).get("id", "")
+                if self._cancelling and self._response_id:
+                    await self._session.cancel_response(self._response_id)
+            elif event_type == "response.audio.delta":
+                self._chunks.append(base64.b64decode(event.get("delta", "")))
+            elif event_type == "response.audio_transcript.done":
+                self._transcript = event.get("transcript", "")
+            elif event_type == "response.done":
+                return event.get("response", {})
+
 
 class FirstMessageHandler:
     """수신자의 첫 발화를 감지하고 AI 고지를 트리거한다."""
@@ -29,51 +284,50 @@ class FirstMessageHandler:
         session_a: SessionAHandler,
         on_notify_app: Callable[[WsMessage], Coroutine],
         use_exact_utterance: bool = False,
+        greeting_prefetch: GreetingPrefetch | None = None,
+        on_play_greeting: Callable[[bytes], Coroutine] | None = None,
     ):
+        """
+        Args:
+            greeting_prefetch: 벨이 울리는 동안 생성한 고지 오디오 (없으면 라이브 생성)
+            on_play_greeting: prefetch 고지 오디오를 Twilio로 재생하는 콜백
+        """
         self.call = call
         self.session_a = session_a
         self._on_notify_app = on_notify_app
         self._use_exact_utterance = use_exact_utterance
+        self._greeting_prefetch = greeting_prefetch
+        self._on_play_greeting = on_play_greeting
+
+        # prefetch 고지: 수신자 첫 발화가 끝날 때까지 보류
+        self._held_greeting: tuple[bytes, str] | None = None
+        self._hold_timer: asyncio.Task | None = None
+        self._speech_ended_at: float = 0.0
 
     async def on_recipient_speech_detected(self) -> None:
-        """수신자의 첫 발화가 감지되면 AI 고지를 전송한다."""
+        """수신자의 첫 발화가 감지되면 AI 고지를 전송한다.
+
+        prefetch 고지가 있으면 발화 종료(on_recipient_speech_ended)까지 보류했다가 재생한다.
+        """
         if self.call.first_message_sent:
             return
 
         self.call.first_message_sent = True
         self.call.status = CallStatus.CONNECTED
 
-        logger.info("Recipient answered — sending AI greeting (call=%s)", self.call.call_id)
-
-        # Session A가 이미 응답 중이면 대기 (conversation_already_has_active_response 방지)
-        if self.session_a.is_generating:
-            logger.debug("Waiting for Session A to finish before sending greeting...")
-            await self.session_a.wait_for_done(timeout=3.0)
-
-        # 시스템 생성 메시지 플래그 — transcript에 role="assistant"로 저장
-        self.session_a._system_message_pending = True
+        prefetched = None
+        if self._greeting_prefetch and self._on_play_greeting and self.call.mode == CallMode.RELAY:
+            prefetched = self._greeting_prefetch.take(self.call)
 
-        if self.call.mode == CallMode.AGENT:
-            # Agent mode: AI가 자연스럽게 대화를 시작하도록 지시
-            instruction = (
-                "The recipient has answered the phone. "
-                "Begin the conversation by greeting them and stating the purpose of your call."
-            )
-            await self.session_a.send_user_text(instruction)
+        if prefetched:
+            logger.info("Recipient answered — holding prefetched greeting until speech ends (call=%s)", self.call.call_id)
+            self.call.call_metrics.first_message_source = "prefetch"
+            self._held_greeting = prefetched
+            self._hold_timer = asyncio.create_task(self._play_after_hold())
         else:
-            greeting = FIRST_MESSAGE_TEMPLATES.get(
-                self.call.target_language,
-                FIRST_MESSAGE_TEMPLATES["en"],
-            )
-
-            if self._use_exact_utterance:
-                # TextToVoice Relay: AI 확장 방지 — 정확히 이 문장만 발화 (hskim 이식)
-                wrapped = f'Say exactly this sentence and nothing else: "{greeting}"'
-            else:
-                # VoiceToVoice: 번역 지시 형식
-                wrapped = f"[User says in {self.call.source_language}]: {greeting}"
-
-            await self.session_a.send_user_text(wrapped)
+            logger.info("Recipient answered — sending AI greeting (call=%s)", self.call.call_id)
+            self.call.call_metrics.first_message_source = "live"
+            await self._send_live_greeting()
 
         # App에 통화 연결 알림
         if self.call.mode == CallMode.RELAY:
@@ -96,3 +350,76 @@ class FirstMessageHandler:
                     },
                 )
             )
+
+    async def on_recipient_speech_ended(self) -> None:
+        """수신자 발화 종료 — 첫 발화면 보류 중인 prefetch 고지를 즉시 재생한다."""
+        if not self.call.first_message_sent or self._speech_ended_at:
+            return
+        self._speech_ended_at = time.time()
+        if self._held_greeting:
+            if self._hold_timer and not self._hold_timer.done():
+                self._hold_timer.cancel()
+            await self._play_held_greeting()
+
+    def record_first_audio(self) -> None:
+        """첫 고지 오디오가 Twilio로 나가는 시점 — 수신자 첫 발화 종료 이후 무음 구간 기록."""
+        if self.call.call_metrics.first_message_gap_ms or not self._speech_ended_at:
+            return
+        self.call.call_metrics.first_message_gap_ms = round((time.time() - self._speech_ended_at) * 1000, 1)
+
+    def cancel(self) -> None:
+        if self._hold_timer and not self._hold_timer.done():
+            self._hold_timer.cancel()
+        self._held_greeting = None
+
+    # --- Internal ---
+
+    async def _send_live_greeting(self) -> None:
+        # Session A가 이미 응답 중이면 대기 (conversation_already_has_active_response 방지)
+        if self.session_a.is_generating:
+            logger.debug("Waiting for Session A to finish before sending greeting...")
+            await self.session_a.wait_for_done(timeout=3.0)
+
+        # 시스템 생성 메시지 플래그 — transcript에 role="assistant"로 저장
+        self.session_a._system_message_pending = True
+
+        if self.call.mode == CallMode.AGENT:
+            # Agent mode: AI가 자연스럽게 대화를 시작하도록 지시
+            instruction = (
+                "The recipient has answered the phone. "
+                "Begin the conversation by greeting them and stating the purpose of your call."
+            )
+            await self.session_a.send_user_text(instruction)
+        else:
+            wrapped = _wrap_greeting(self.call, _greeting_text(self.call), self._use_exact_utterance)
+            await self.session_a.send_user_text(wrapped)
+
+    async def _play_after_hold(self) -> None:
+        """발화 종료 이벤트가 오지 않으면 최대 보류 시간 후 재생한다."""
+        try:
+            await asyncio.sleep(settings.greeting_prefetch_max_hold_s)
+        except asyncio.CancelledError:
+            return
+        await self._play_held_greeting()
+
+    async def _play_held_greeting(self) -> None:
+        held, self._held_greeting = self._held_greeting, None
+        if not held or not self._on_play_greeting:
+            return
+        audio, transcript = held
+        self.call.transcript_bilingual.append(
+            TranscriptEntry(
+                role="assistant",
+                original_text=transcript,
+                translated_text=transcript,
+                language=self.call.target_language,
+                timestamp=time.time(),
+            )
+        )
+        await self._on_notify_app(
+            WsMessage(
+                type=WsMessageType.CAPTION,
+                data={"role": "assistant", "text": transcript, "direction": "outbound"},
+            )
+        )
+        await self._on_play_greeting(audio)
@@ -14,6 +14,10 @@ Frame Adapter: 20ms (160 samples @ 8kHz) → 16kHz 업샘플링 → 32ms (512 sa
   Twilio 오디오는 8kHz g711_ulaw. Silero VAD는 16kHz에서 최적 성능.
   8kHz → 16kHz zero-order hold 업샘플링 후 512 samples (32ms) 프레임으로 처리.
 
+조기 발화 종료 (TurnEndpointer, 선택):
+  SPEAKING 중 Silero 프레임별 확률/에너지/피치를 endpointer에 누적.
+  짧은 무음 후 턴이 명백히 끝났다고 판정되면 min_silence_frames(800ms)를 기다리지 않고 종료.
+
 RMS Gate 복귀 시 Silero 리셋:
   RMS gate로 Silero 처리를 건너뛸 때 내부 RNN 상태가 정체됨.
   RMS-silence → RMS-active 전환 시 Silero 모델을 리셋하여 깨끗한 상태에서 시작.
@@ -21,12 +25,14 @@ RMS Gate 복귀 시 Silero 리셋:
 
 import asyncio
 import logging
+import time
 from enum import Enum
 from typing import Callable, Coroutine
 
 import numpy as np
 
 from src.realtime.audio_utils import ulaw_rms, ulaw_to_float32
+from src.realtime.endpointer import TurnEndpointer
 
 logger = logging.getLogger(__name__)
 
@@ -47,10 +53,14 @@ class LocalVAD:
         min_silence_frames: silence 전환까지 필요한 연속 silence 프레임 수
         on_speech_start: speech 시작 콜백
         on_speech_end: speech 종료 콜백
+        endpointer: 운율/의미 기반 조기 종료 판정기 (None이면 min_silence_frames만 사용)
+        on_speech_pause: 발화 내 쉼 콜백 (SPEAKING 중 pause_frames 연속 무음 도달 시 1회)
+        pause_frames: 발화 내 쉼 판정 무음 프레임 수 (0이면 비활성)
     """
 
     # Silero VAD 프레임: 16kHz에서 512 samples = 32ms (8kHz 업샘플링)
     _SILERO_FRAME_SIZE = 512
+    _SILERO_FRAME_MS = 32.0
     _SILERO_SAMPLE_RATE = 16000  # Silero 모델 입력 sample rate
     _INPUT_SAMPLE_RATE = 8000    # Twilio 입력 sample rate
     # Silero 리셋 전 최소 연속 RMS silence 프레임 수 (음절 간 짧은 무음에서 리셋 방지)
@@ -65,6 +75,9 @@ class LocalVAD:
         min_silence_frames: int = 15,
         on_speech_start: Callable[[], Coroutine] | None = None,
         on_speech_end: Callable[[], Coroutine] | None = None,
+        endpointer: TurnEndpointer | None = None,
+        on_speech_pause: Callable[[], Coroutine] | None = None,
+        pause_frames: int = 0,
     ):
         self._rms_threshold = rms_threshold
         self._speech_threshold = speech_threshold
@@ -73,6 +86,9 @@ class LocalVAD:
         self._min_silence_frames = min_silence_frames
         self._on_speech_start = on_speech_start
         self._on_speech_end = on_speech_end
+        self._endpointer = endpointer
+        self._on_speech_pause = on_speech_pause
+        self._pause_frames = pause_frames
 
         # State machine
         self._state = _VadState.SILENCE
@@ -90,6 +106,13 @@ class LocalVAD:
         # Speech quality tracking: speech 중 최대 RMS (노이즈 vs 실제 발화 구분용)
         self._peak_rms: float = 0.0
 
+        # 조기 종료 추적: 마지막 speech 종료가 조기였는지 + 종료까지 대기한 무음(ms)
+        # 조기 종료 직후 발화가 재개되면 오절단(false cut-off) 후보
+        self._last_end_early = False
+        self._last_end_silence_ms = 0.0
+        self._early_end_at = 0.0
+        self._resumed_after_early_end = False
+
         # Silero VAD model (lazy init)
         self._model = None
         self._init_model()
@@ -116,6 +139,30 @@ class LocalVAD:
         """현재/마지막 speech 구간의 최대 RMS."""
         return self._peak_rms
 
+    @property
+    def endpointer(self) -> TurnEndpointer | None:
+        return self._endpointer
+
+    @property
+    def last_end_early(self) -> bool:
+        """마지막 speech 종료가 endpointer 조기 종료였는지."""
+        return self._last_end_early
+
+    @property
+    def last_end_silence_ms(self) -> float:
+        """마지막 speech 종료까지 대기한 무음 길이 (ms)."""
+        return self._last_end_silence_ms
+
+    @property
+    def resumed_after_early_end(self) -> bool:
+        """현재 speech가 조기 종료 직후(폴백 무음 이내) 재개되었는지 (오절단 후보)."""
+        return self._resumed_after_early_end
+
+    def note_transcript(self, text: str) -> None:
+        """발화 중 도착한 부분 STT를 endpointer에 전달한다 (SPEAKING 중에만)."""
+        if self._endpointer and self._state == _VadState.SPEAKING:
+            self._endpointer.note_transcript(text)
+
     async def process(self, audio: bytes) -> None:
         """20ms g711_ulaw 오디오 프레임을 처리한다.
 
@@ -188,6 +235,8 @@ class LocalVAD:
             frame_writable = frame.copy()
             prob = self._model.process(memoryview(frame_writable.data))
             logger.debug("[LocalVAD] silero prob=%.3f rms=%.0f state=%s", prob, rms, self._state.value)
+            if self._endpointer and self._state == _VadState.SPEAKING:
+                self._endpointer.observe(frame, prob)
             await self._update_state(prob)
 
     async def _update_state(self, prob: float) -> None:
@@ -208,6 +257,10 @@ class LocalVAD:
                 self._speech_count = 0
                 if self._silence_count >= self._min_silence_frames:
                     await self._transition_to_silence()
+                elif self._endpointer and self._endpointer.should_end():
+                    await self._transition_to_silence(early=True)
+                elif self._on_speech_pause and self._silence_count == self._pause_frames:
+                    await self._notify_pause()
             else:
                 self._silence_count = 0
 
@@ -216,6 +269,12 @@ class LocalVAD:
         self._state = _VadState.SPEAKING
         self._speech_count = 0
         self._silence_count = 0
+        self._resumed_after_early_end = self._last_end_early and (
+            (time.monotonic() - self._early_end_at) * 1000
+            < self._min_silence_frames * self._SILERO_FRAME_MS
+        )
+        if self._endpointer:
+            self._endpointer.start_turn()
         # peak_rms는 candidate 단계에서 이미 추적 중 — 여기서 리셋하면 pre-transition 값 손실
         logger.info("[LocalVAD] Speech started (peak_rms=%.0f)", self._peak_rms)
         if self._on_speech_start:
@@ -224,17 +283,35 @@ class LocalVAD:
             except Exception:
                 logger.exception("[LocalVAD] on_speech_start callback error")
 
-    async def _transition_to_silence(self) -> None:
-        """SPEAKING → SILENCE 전환."""
+    async def _notify_pause(self) -> None:
+        """발화 내 쉼 (SPEAKING 유지, speculative STT 트리거용)."""
+        logger.debug("[LocalVAD] Speech pause (%d frames)", self._silence_count)
+        try:
+            await self._on_speech_pause()
+        except Exception:
+            logger.exception("[LocalVAD] on_speech_pause callback error")
+
+    async def _transition_to_silence(self, early: bool = False) -> None:
+        """SPEAKING → SILENCE 전환 (early: endpointer 조기 종료)."""
+        self._last_end_early = early
+        self._last_end_silence_ms = self._silence_count * self._SILERO_FRAME_MS
+        if early:
+            self._early_end_at = time.monotonic()
         self._state = _VadState.SILENCE
         self._speech_count = 0
         self._silence_count = 0
-        logger.info("[LocalVAD] Speech ended")
+        logger.info(
+            "[LocalVAD] Speech ended (silence=%.0fms%s)",
+            self._last_end_silence_ms, ", early" if early else "",
+        )
         if self._on_speech_end:
             try:
                 await self._on_speech_end()
             except Exception:
                 logger.exception("[LocalVAD] on_speech_end callback error")
+        # trace 기록은 발화 종료 통지 뒤 (STT commit 지연 방지)
+        if self._endpointer:
+            await self._endpointer.finish_turn()
 
     def force_speaking_state(self) -> None:
         """VAD를 SPEAKING 상태로 강제 전환한다 (콜백 미호출).
@@ -249,6 +326,9 @@ class LocalVAD:
         self._peak_rms = 0.0
         self._frame_buffer = np.empty(0, dtype=np.float32)
         self._rms_silence_frames = 0
+        self._resumed_after_early_end = False
+        if self._endpointer:
+            self._endpointer.start_turn()
         if self._model is not None:
             try:
                 self._model.reset()
@@ -274,6 +354,8 @@ class LocalVAD:
         self._silence_count = 0
         self._frame_buffer = np.empty(0, dtype=np.float32)
         self._rms_silence_frames = 0
+        self._last_end_early = False
+        self._resumed_after_early_end = False
         if self._model is not None:
             try:
                 self._model.reset()
@@ -9,6 +9,8 @@ import time
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Coroutine
 
+from src.config import settings
+from src.realtime.filler_audio import filler_audio_cache, play_clip
 from src.types import ActiveCall, WsMessage, WsMessageType
 
 logger = logging.getLogger(__name__)
@@ -106,6 +108,20 @@ class BasePipeline(ABC):
             self._db_save_task.cancel()
             self._db_save_task = None
 
+    async def _play_cached_filler(self, filler_text: str) -> None:
+        """Guardrail 필러 클립이 캐시에 있으면 재생 (차단 중인 응답의 response.done이 cooldown 시작).
+
+        클립은 ring-time에 GreetingPrefetch가 생성해 둔다. twilio_handler/echo_gate는 구현체가 소유.
+        """
+        if not settings.filler_audio_cache_enabled:
+            return
+        clip = filler_audio_cache.get(self.call.target_language, filler_text)
+        if clip:
+            self.call.call_metrics.filler_audio_cache_hits += 1
+            await play_clip(clip, self.twilio_handler, self.echo_gate, finish=False)
+        else:
+            logger.info("Guardrail filler not cached yet (%s) — skipping filler audio", self.call.target_language)
+
     async def _send_pipeline_event(self, stage: str, event: str, **kwargs: Any) -> None:
         """3-Stage Filter 이벤트를 클라이언트에 전송."""
         if self._app_ws_send:
@@ -16,6 +16,7 @@ TextToVoicePipeline과의 차이:
 import logging
 from typing import Any, Callable, Coroutine
 
+from src.realtime.first_message import GreetingPrefetch
 from src.realtime.pipeline.text_to_voice import TextToVoicePipeline
 from src.realtime.sessions.session_manager import DualSessionManager
 from src.twilio.media_stream import TwilioMediaStreamHandler
@@ -35,6 +36,7 @@ class FullAgentPipeline(TextToVoicePipeline):
         app_ws_send: Callable[[WsMessage], Coroutine[Any, Any, None]],
         prompt_a: str = "",
         prompt_b: str = "",
+        greeting_prefetch: GreetingPrefetch | None = None,
     ):
         super().__init__(
             call=call,
@@ -43,6 +45,7 @@ class FullAgentPipeline(TextToVoicePipeline):
             app_ws_send=app_ws_send,
             prompt_a=prompt_a,
             prompt_b=prompt_b,
+            greeting_prefetch=greeting_prefetch,
         )
         logger.info("FullAgentPipeline created for call %s", call.call_id)
 
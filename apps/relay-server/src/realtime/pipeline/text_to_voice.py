@@ -19,6 +19,7 @@ hskim-wigvo-test 이식 포인트:
 import asyncio
 import base64
 import logging
+import re
 import time
 from collections import deque
 from typing import Any, Callable, Coroutine
@@ -29,7 +30,9 @@ from src.prompt.templates import TYPING_FILLER_TEMPLATES
 from src.realtime.chat_translator import ChatTranslator
 from src.realtime.audio_utils import ulaw_rms as _ulaw_rms
 from src.realtime.context_manager import ConversationContextManager
-from src.realtime.first_message import FirstMessageHandler
+from src.realtime.endpointer import create_turn_endpointer
+from src.realtime.filler_audio import filler_audio_cache, play_clip
+from src.realtime.first_message import FirstMessageHandler, GreetingPrefetch
 from src.realtime.interrupt_handler import InterruptHandler
 from src.realtime.local_vad import LocalVAD
 from src.realtime.pipeline.base import BasePipeline
@@ -44,12 +47,36 @@ from src.twilio.media_stream import TwilioMediaStreamHandler
 from src.types import (
     ActiveCall,
     CallMode,
+    CallStatus,
     WsMessage,
     WsMessageType,
 )
 
 logger = logging.getLogger(__name__)
 
+# 문장 경계: 종결 부호 뒤 공백 또는 줄바꿈
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?。！？…])\s+|\n+")
+
+
+def split_sentences(text: str, min_chars: int = 0) -> list[str]:
+    """텍스트를 문장 단위로 나눈다. min_chars보다 짧은 문장은 다음(마지막이면 앞) 문장과 합친다."""
+    segments: list[str] = []
+    pending = ""
+    for part in _SENTENCE_BOUNDARY_RE.split(text.strip()):
+        part = part.strip()
+        if not part:
+            continue
+        pending = f"{pending} {part}" if pending else part
+        if len(pending) >= min_chars:
+            segments.append(pending)
+            pending = ""
+    if pending:
+        if segments:
+            segments[-1] = f"{segments[-1]} {pending}"
+        else:
+            segments.append(pending)
+    return segments
+
 
 class TextToVoicePipeline(BasePipeline):
     """텍스트 입력 → 음성 출력 파이프라인 (per-response instruction override)."""
@@ -62,6 +89,7 @@ class TextToVoicePipeline(BasePipeline):
         app_ws_send: Callable[[WsMessage], Coroutine[Any, Any, None]],
         prompt_a: str = "",
         prompt_b: str = "",
+        greeting_prefetch: GreetingPrefetch | None = None,
     ):
         super().__init__(call)
         self.dual_session = dual_session
@@ -77,6 +105,10 @@ class TextToVoicePipeline(BasePipeline):
         # 타이핑 필러: 통화당 1회만 전송
         self._typing_filler_sent = False
 
+        # 입력 병합: Lock 대기/응답 진행 중 도착한 텍스트를 모아 한 번의 번역 요청으로 전송
+        self._pending_texts: list[str] = []
+        self._last_text_at: float = 0.0
+
         # 원본 텍스트 캐시 (컨텍스트 주입용)
         # 번역된 텍스트 대신 원본 언어 텍스트를 저장하여 Session A/B 언어 혼선 방지
         self._last_user_text: str = ""
@@ -102,7 +134,7 @@ class TextToVoicePipeline(BasePipeline):
 
         # 대화 컨텍스트 매니저 (번역 일관성)
         # T2V: 2턴으로 축소 — 컨텍스트 기반 추측 할루시네이션 방지
-        self.context_manager = ConversationContextManager(max_turns=2)
+        self.context_manager = ConversationContextManager(max_turns=2, call=call)
 
         # Session A 핸들러: User text → 번역 TTS → Twilio
         # Relay: context_prune_keep=0 — 매 턴 이전 아이템 전부 삭제 (첫 인사 리크 + 컨텍스트 할루시네이션 방지)
@@ -140,6 +172,10 @@ class TextToVoicePipeline(BasePipeline):
             on_translated_audio=self._on_session_b_audio,
             on_caption=self._on_session_b_caption,
             on_original_caption=self._on_session_b_original_caption,
+            on_original_caption_partial=(
+                self._on_session_b_original_caption_partial
+                if settings.stt_partial_captions_enabled else None
+            ),
             on_recipient_speech_started=self._on_recipient_started,
             on_recipient_speech_stopped=self._on_recipient_stopped,
             on_transcript_complete=self._on_recipient_turn_complete,
@@ -147,6 +183,8 @@ class TextToVoicePipeline(BasePipeline):
             use_local_vad=settings.local_vad_enabled,
             context_prune_keep=0,
             chat_translator=chat_translator,
+            stream_translation=settings.session_b_chat_translation_streaming,
+            on_caption_superseded=self._on_session_b_caption_superseded,
         )
 
         # Local VAD (Silero + RMS Energy Gate)
@@ -160,6 +198,12 @@ class TextToVoicePipeline(BasePipeline):
                 min_silence_frames=settings.local_vad_min_silence_frames,
                 on_speech_start=self._on_local_vad_speech_start,
                 on_speech_end=self._on_local_vad_speech_end,
+                endpointer=create_turn_endpointer(),
+                on_speech_pause=(
+                    self._on_local_vad_speech_pause
+                    if settings.speculative_stt_pause_trigger else None
+                ),
+                pause_frames=settings.speculative_stt_pause_frames,
             )
 
         # First Message: exact utterance 패턴 (AI 확장 방지)
@@ -168,6 +212,8 @@ class TextToVoicePipeline(BasePipeline):
             session_a=self.session_a,
             on_notify_app=self._notify_app,
             use_exact_utterance=True,
+            greeting_prefetch=greeting_prefetch,
+            on_play_greeting=self._play_prefetched_greeting,
         )
 
         # Interrupt 핸들러
@@ -230,6 +276,7 @@ class TextToVoicePipeline(BasePipeline):
         logger.info("TextToVoicePipeline started for call %s", self.call.call_id)
 
     async def stop(self) -> None:
+        self.first_message.cancel()
         if self._call_timer_task:
             self._call_timer_task.cancel()
             try:
@@ -244,6 +291,7 @@ class TextToVoicePipeline(BasePipeline):
         if self.local_vad:
             self.local_vad.reset()
 
+        self.session_a.stop()
         self.session_b.stop()
         await self.recovery_a.stop()
         await self.recovery_b.stop()
@@ -291,6 +339,14 @@ class TextToVoicePipeline(BasePipeline):
                     )
                     self._typing_filler_sent = False  # 재시도 허용
                     return
+            # 캐시된 클립이 있으면 Realtime 생성 없이 Twilio로 직접 재생
+            if settings.filler_audio_cache_enabled:
+                clip = filler_audio_cache.get(self.call.target_language, filler)
+                if clip:
+                    self.call.call_metrics.filler_audio_cache_hits += 1
+                    await play_clip(clip, self.twilio_handler, self.echo_gate)
+                    return
+                self.session_a.capture_next_response(self.call.target_language, filler)
             # send_text_item 없이 create_response만 사용 (이슈 1)
             # send_text_item은 대화 히스토리에 user 메시지로 추가되어
             # 번역기 system prompt가 이를 사용자 발화로 해석하는 문제 방지
@@ -309,18 +365,37 @@ class TextToVoicePipeline(BasePipeline):
 
         Lock으로 직렬화하여 여러 텍스트가 동시에 response.create를 호출하는
         race condition (conversation_already_has_active_response)을 방지한다.
+
+        Relay Mode의 긴 입력은 문장 단위로 나눠 첫 문장 응답을 즉시 요청하고,
+        나머지 문장은 같은 Lock 안에서 앞 응답 완료 후 순서대로 요청한다
+        (전체 번역 생성을 기다리지 않고 첫 문장부터 수신자에게 재생).
+
+        연달아 보낸 짧은 메시지는 병합한다: Lock 대기 중이거나 앞 응답이 진행 중일 때,
+        또는 병합 창(t2v_coalesce_window_ms) 안에 도착한 텍스트를 모아 한 번에 번역 요청한다.
+        앞 요청도 대기 텍스트도 없는 유휴 상태의 입력은 병합 창 없이 바로 보낸다.
+        이미 앞 요청에 병합된 호출은 아무것도 보내지 않고 반환한다.
         """
         self._typing_filler_sent = False
-        self._last_user_text = text  # 원본 캐시 (컨텍스트 주입용)
-        self.session_a.set_last_user_stt(text)  # T2V: 원본 텍스트를 transcript_bilingual에 보존
+        idle = (
+            not self._pending_texts
+            and not self._text_send_lock.locked()
+            and not self.session_a.is_generating
+        )
+        self._pending_texts.append(text)
+        self._last_text_at = time.monotonic()
         async with self._text_send_lock:
-            self.call.transcript_history.append({"role": "user", "text": text})
+            if not self._pending_texts:
+                return  # 앞 호출이 이 텍스트를 병합해 전송함
             self.session_a.mark_user_input()
 
             if self.session_a.is_generating:
                 logger.debug("Waiting for Session A to finish before sending text...")
                 await self.session_a.wait_for_done(timeout=5.0)
 
+            text = await self._drain_pending_texts(wait_window=not idle)
+            self._last_user_text = text  # 병합된 원본 캐시 (컨텍스트 주입용)
+            self.session_a.set_last_user_stt(text)  # T2V: 원본 텍스트를 transcript_bilingual에 보존
+
             await self._app_ws_send(
                 WsMessage(
                     type=WsMessageType.TRANSLATION_STATE,
@@ -328,23 +403,80 @@ class TextToVoicePipeline(BasePipeline):
                 )
             )
 
-            # 이전 턴의 대화 아이템 삭제 → 첫 인사 리크 + 컨텍스트 할루시네이션 방지
-            # Relay: keep=0 (전부 삭제), Agent: keep=1 (최신 1개 유지)
-            await self.session_a.prune_before_response()
-
-            await self.context_manager.inject_context(self.dual_session.session_a, input_mode="text")
+            # Agent mode에서는 입력 전체를 하나의 대화 턴으로 전달 (기본 instructions 사용)
+            if self.call.mode != CallMode.RELAY:
+                await self._prepare_text_response()
+                await self.session_a.send_user_text(text)
+                return
 
-            # Per-response instruction override (Relay mode)
-            # Agent mode에서는 기본 instructions 사용
-            if self.call.mode == CallMode.RELAY:
+            sentences = self._split_for_pipelining(text)
+            if len(sentences) > 1:
+                self.call.call_metrics.t2v_pipelined_inputs += 1
+                self.call.call_metrics.t2v_pipelined_sentences += len(sentences)
+                logger.info("T2V input pipelined into %d sentences (%d chars)", len(sentences), len(text))
+
+            cancel_generation = self.session_a.cancel_generation
+            for i, sentence in enumerate(sentences):
+                if i > 0:
+                    # 앞 문장 응답 생성 완료 후 다음 문장 요청 (active response 충돌 방지)
+                    await self.session_a.wait_for_done(timeout=5.0)
+                    if self.call.status == CallStatus.ENDED:
+                        return
+                    if self.session_a.cancel_generation != cancel_generation:
+                        # 수신자 Interrupt로 응답이 취소됨 → 남은 문장도 보내지 않음
+                        logger.info("T2V pipelined input interrupted — dropping %d sentences", len(sentences) - i)
+                        return
+                if len(sentences) > 1:
+                    self.session_a.set_last_user_stt(sentence)
+                await self._prepare_text_response()
+                # Per-response instruction override (Relay mode)
                 # mark_generating()을 create_response() 전에 호출하여 race condition 방지
                 self.session_a.mark_generating()
-                await self.dual_session.session_a.send_text_item(text)
+                await self.dual_session.session_a.send_text_item(sentence)
                 await self.dual_session.session_a.create_response(
                     instructions=self._strict_relay_instruction,
                 )
-            else:
-                await self.session_a.send_user_text(text)
+
+    async def _drain_pending_texts(self, wait_window: bool = True) -> str:
+        """대기 중인 텍스트를 하나로 합쳐 꺼낸다.
+
+        wait_window이면 병합 창이 끝날 때까지 기다린 뒤 꺼낸다 (유휴 입력은 대기 없이 즉시).
+        """
+        if settings.t2v_coalesce_enabled:
+            window_s = settings.t2v_coalesce_window_ms / 1000 if wait_window else 0.0
+            while (remaining := self._last_text_at + window_s - time.monotonic()) > 0:
+                await asyncio.sleep(remaining)
+            texts, self._pending_texts = self._pending_texts, []
+        else:
+            texts = [self._pending_texts.pop(0)]
+
+        for t in texts:
+            self.call.transcript_history.append({"role": "user", "text": t})
+        if len(texts) > 1:
+            metrics = self.call.call_metrics
+            metrics.t2v_coalesced_inputs += len(texts) - 1
+            # 병합된 메시지마다 생략된 개별 번역 왕복 (평균 Session A 지연 기준 추정)
+            latencies = metrics.session_a_latencies_ms
+            if latencies:
+                metrics.t2v_coalesce_saved_ms.append(
+                    round((len(texts) - 1) * sum(latencies) / len(latencies), 1)
+                )
+            logger.info("T2V coalesced %d text inputs into one request", len(texts))
+        return " ".join(texts)
+
+    def _split_for_pipelining(self, text: str) -> list[str]:
+        """긴 Relay 입력을 문장 단위로 나눈다 (짧은 입력은 그대로 1개)."""
+        if not settings.t2v_sentence_pipeline_enabled or len(text) < settings.t2v_sentence_pipeline_min_chars:
+            return [text]
+        return split_sentences(text, settings.t2v_sentence_min_chars) or [text]
+
+    async def _prepare_text_response(self) -> None:
+        """텍스트 응답 요청 전 대화 아이템 정리 + 컨텍스트 주입."""
+        # 이전 턴의 대화 아이템 삭제 → 첫 인사 리크 + 컨텍스트 할루시네이션 방지
+        # Relay: keep=0 (전부 삭제), Agent: keep=1 (최신 1개 유지)
+        await self.session_a.prune_before_response()
+
+        await self.context_manager.inject_context(self.dual_session.session_a, input_mode="text")
 
     # --- Twilio -> Session B ---
 
@@ -428,8 +560,16 @@ class TextToVoicePipeline(BasePipeline):
                 self.call.call_metrics.first_message_latency_ms = (
                     time.time() - self.call.started_at
                 ) * 1000
+                self.first_message.record_first_audio()
         await self.twilio_handler.send_audio(audio_bytes)
 
+    async def _play_prefetched_greeting(self, audio: bytes) -> None:
+        """벨이 울리는 동안 생성해 둔 첫 고지 오디오를 Twilio로 직접 재생한다."""
+        if self.call.call_metrics.first_message_latency_ms == 0.0 and self.call.started_at > 0:
+            self.call.call_metrics.first_message_latency_ms = (time.time() - self.call.started_at) * 1000
+        self.first_message.record_first_audio()
+        await play_clip(audio, self.twilio_handler, self.echo_gate)
+
     async def _on_session_a_caption(self, role: str, text: str) -> None:
         await self._app_ws_send(
             WsMessage(
@@ -476,7 +616,18 @@ class TextToVoicePipeline(BasePipeline):
             )
         )
 
+    async def _on_session_b_caption_superseded(self) -> None:
+        """스트리밍 번역이 새 발화로 대체됨 → 클라이언트 스트림 종료 + 부분 자막 폐기 표시."""
+        await self._app_ws_send(
+            WsMessage(
+                type=WsMessageType.TRANSLATION_STATE,
+                data={"state": "caption_done", "direction": "inbound", "superseded": True},
+            )
+        )
+
     async def _on_session_b_original_caption(self, role: str, text: str) -> None:
+        if self.local_vad:
+            self.local_vad.note_transcript(text)
         # 원본 STT 누적 (연속 발화 시 세그먼트별 STT를 결합하여 컨텍스트 주입)
         if self._last_recipient_stt:
             self._last_recipient_stt += " " + text
@@ -495,6 +646,24 @@ class TextToVoicePipeline(BasePipeline):
             )
         )
 
+    async def _on_session_b_original_caption_partial(self, role: str, text: str) -> None:
+        if self.local_vad:
+            self.local_vad.note_transcript(text)
+        # 잠정 원문 자막 (STT delta 누적 텍스트) — 컨텍스트에는 누적하지 않음 (확정 자막만)
+        await self._app_ws_send(
+            WsMessage(
+                type=WsMessageType.CAPTION_ORIGINAL,
+                data={
+                    "role": role,
+                    "text": text,
+                    "stage": 1,
+                    "language": self.call.target_language,
+                    "direction": "inbound",
+                    "provisional": True,
+                },
+            )
+        )
+
     # --- 수신자 발화 감지 ---
 
     async def _on_recipient_started(self) -> None:
@@ -508,6 +677,8 @@ class TextToVoicePipeline(BasePipeline):
             await self.interrupt.on_recipient_speech_started()
 
     async def _on_recipient_stopped(self) -> None:
+        # 첫 발화 종료 → 보류 중인 prefetch 고지 재생
+        await self.first_message.on_recipient_speech_ended()
         await self.context_manager.inject_context(self.dual_session.session_b)
         await self.interrupt.on_recipient_speech_stopped()
 
@@ -520,13 +691,29 @@ class TextToVoicePipeline(BasePipeline):
         if post_echo:
             self._pre_speech_buf.clear()  # settling 시에만 에코 오염 버퍼 폐기
         peak_rms = self.local_vad.peak_rms if self.local_vad else 0.0
+        if self.local_vad and self.local_vad.resumed_after_early_end:
+            # 조기 종료 직후 발화 재개 → 오절단 추정
+            self.call.call_metrics.session_b_early_endpoint_resumed += 1
         await self._send_pipeline_event("silero_vad", "speech_start", peak_rms=round(peak_rms))
         await self.session_b.notify_speech_started(post_echo=post_echo)
 
+    async def _on_local_vad_speech_pause(self) -> None:
+        """Local VAD가 발화 내 쉼을 감지 → speculative STT 선행 commit 기회."""
+        await self.session_b.notify_speech_paused()
+
     async def _on_local_vad_speech_end(self) -> None:
         """Local VAD가 수신자 발화 종료를 감지."""
         peak_rms = self.local_vad.peak_rms if self.local_vad else 0.0
-        await self._send_pipeline_event("silero_vad", "speech_end", peak_rms=round(peak_rms))
+        early = False
+        if self.local_vad:
+            early = self.local_vad.last_end_early
+            metrics = self.call.call_metrics
+            metrics.session_b_endpoint_silence_ms.append(self.local_vad.last_end_silence_ms)
+            if early:
+                metrics.session_b_early_endpoints += 1
+        await self._send_pipeline_event(
+            "silero_vad", "speech_end", peak_rms=round(peak_rms), early=bool(early),
+        )
         await self.session_b.notify_speech_stopped(peak_rms=peak_rms)
 
     # --- 대화 컨텍스트 ---
@@ -558,6 +745,7 @@ class TextToVoicePipeline(BasePipeline):
     async def _on_guardrail_filler(self, filler_text: str) -> None:
         logger.info("Guardrail: sending filler to Twilio: '%s'", filler_text)
         await self.twilio_handler.send_clear()
+        await self._play_cached_filler(filler_text)
 
     async def _on_guardrail_corrected_tts(self, corrected_text: str) -> None:
         logger.info("Guardrail: re-generating TTS with corrected text: '%s'", corrected_text[:60])
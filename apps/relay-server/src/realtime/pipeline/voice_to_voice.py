@@ -5,6 +5,7 @@ User 음성 → 번역 → Twilio TTS + 수신자 음성 → 번역 → App TTS
 핵심 컴포넌트:
   - Echo Gate + Silence Injection (TTS 에코 차단)
   - Audio Energy Gate
+  - User Audio Silence Gate (Session A 입력 무음 억제)
   - Interrupt Handler (3-level priority)
   - First Message Handler
   - Context Manager (6턴 슬라이딩)
@@ -23,7 +24,9 @@ from src.config import settings
 from src.guardrail.checker import GuardrailChecker
 from src.realtime.audio_utils import pcm16_rms as _pcm16_rms, ulaw_rms as _ulaw_rms
 from src.realtime.context_manager import ConversationContextManager
-from src.realtime.first_message import FirstMessageHandler
+from src.realtime.endpointer import create_turn_endpointer
+from src.realtime.filler_audio import play_clip
+from src.realtime.first_message import FirstMessageHandler, GreetingPrefetch
 from src.realtime.interrupt_handler import InterruptHandler
 from src.realtime.local_vad import LocalVAD
 from src.realtime.pipeline.base import BasePipeline
@@ -33,12 +36,14 @@ from src.realtime.ring_buffer import AudioRingBuffer
 from src.realtime.sessions.session_a import SessionAHandler
 from src.realtime.sessions.session_b import SessionBHandler
 from src.realtime.sessions.session_manager import DualSessionManager
+from src.realtime.user_audio_gate import UserAudioSilenceGate
 from src.tools.definitions import get_tools_for_mode
 from src.twilio.media_stream import TwilioMediaStreamHandler
 from src.types import (
     ActiveCall,
     CallMode,
     CommunicationMode,
+    VadMode,
     WsMessage,
     WsMessageType,
 )
@@ -57,6 +62,7 @@ class VoiceToVoicePipeline(BasePipeline):
         app_ws_send: Callable[[WsMessage], Coroutine[Any, Any, None]],
         prompt_a: str = "",
         prompt_b: str = "",
+        greeting_prefetch: GreetingPrefetch | None = None,
     ):
         super().__init__(call)
         self.dual_session = dual_session
@@ -75,7 +81,7 @@ class VoiceToVoicePipeline(BasePipeline):
             )
 
         # 대화 컨텍스트 매니저 (번역 일관성)
-        self.context_manager = ConversationContextManager()
+        self.context_manager = ConversationContextManager(call=call)
 
         # Session A 핸들러: User -> 수신자
         self.session_a = SessionAHandler(
@@ -100,6 +106,10 @@ class VoiceToVoicePipeline(BasePipeline):
             on_translated_audio=self._on_session_b_audio,
             on_caption=self._on_session_b_caption,
             on_original_caption=self._on_session_b_original_caption,
+            on_original_caption_partial=(
+                self._on_session_b_original_caption_partial
+                if settings.stt_partial_captions_enabled else None
+            ),
             on_recipient_speech_started=self._on_recipient_started,
             on_recipient_speech_stopped=self._on_recipient_stopped,
             on_transcript_complete=self._on_turn_complete,
@@ -119,6 +129,7 @@ class VoiceToVoicePipeline(BasePipeline):
                 min_silence_frames=settings.local_vad_min_silence_frames,
                 on_speech_start=self._on_local_vad_speech_start,
                 on_speech_end=self._on_local_vad_speech_end,
+                endpointer=create_turn_endpointer(),
             )
 
         # First Message 핸들러
@@ -126,6 +137,8 @@ class VoiceToVoicePipeline(BasePipeline):
             call=call,
             session_a=self.session_a,
             on_notify_app=self._notify_app,
+            greeting_prefetch=greeting_prefetch,
+            on_play_greeting=self._play_prefetched_greeting,
         )
 
         # Interrupt 핸들러
@@ -147,6 +160,17 @@ class VoiceToVoicePipeline(BasePipeline):
         # User audio RMS logging (주기적 샘플링)
         self._user_audio_chunk_count = 0
 
+        # User audio silence gate: 긴 무음을 Session A에 보내지 않음 (audio_input 토큰 절감)
+        # Client commit 모드에서만 사용 — Server VAD는 무음 구간으로 발화 종료를 판단하므로
+        # 무음을 잘라내면 end-of-speech 감지가 늦어지거나 단어 사이 쉼이 잘린다.
+        self.user_audio_gate: UserAudioSilenceGate | None = None
+        if settings.user_audio_silence_suppression_enabled and dual_session.vad_mode != VadMode.SERVER:
+            self.user_audio_gate = UserAudioSilenceGate(
+                rms_threshold=settings.user_audio_silence_rms_threshold,
+                hangover_ms=settings.user_audio_silence_hangover_ms,
+                preroll_ms=settings.user_audio_silence_preroll_ms,
+            )
+
         # Pre-speech buffer: SPEAKING 전환 전 오디오 프레임 보존 (200ms = 20ms × 10)
         self._pre_speech_buf: deque[bytes] = deque(maxlen=10)
 
@@ -169,7 +193,7 @@ class VoiceToVoicePipeline(BasePipeline):
         # Session B 출력 큐 (수신자 TTS 순차 스트리밍)
         # 현재 응답은 즉시 스트리밍, 다음 응답은 재생 완료 대기 후 시작
         _BOutputItem = tuple[
-            Literal["audio", "caption", "original_caption", "caption_done"],
+            Literal["audio", "caption", "original_caption", "original_caption_partial", "caption_done"],
             Any,
         ]
         self._b_output_queue: asyncio.Queue[_BOutputItem] = asyncio.Queue()
@@ -205,6 +229,7 @@ class VoiceToVoicePipeline(BasePipeline):
         logger.info("VoiceToVoicePipeline started for call %s", self.call.call_id)
 
     async def stop(self) -> None:
+        self.first_message.cancel()
         if self._call_timer_task:
             self._call_timer_task.cancel()
             try:
@@ -226,6 +251,7 @@ class VoiceToVoicePipeline(BasePipeline):
         if self.local_vad:
             self.local_vad.reset()
 
+        self.session_a.stop()
         self.session_b.stop()
         await self.recovery_a.stop()
         await self.recovery_b.stop()
@@ -262,12 +288,23 @@ class VoiceToVoicePipeline(BasePipeline):
                 await self._on_session_a_caption("user", f"[지연] {transcript}")
             return
 
-        await self.session_a.send_user_audio(audio_b64)
+        if self.user_audio_gate is None:
+            await self.session_a.send_user_audio(audio_b64)
+            self.ring_buffer_a.mark_sent(seq)
+            return
+
+        # Silence gate: 억제된 무음도 의도적 폐기이므로 sent로 마킹 (recovery 재전송 방지)
+        for chunk in self.user_audio_gate.process(audio_bytes):
+            if chunk is audio_bytes:
+                await self.session_a.send_user_audio(audio_b64)
+            else:
+                await self.session_a.send_user_audio(base64.b64encode(chunk).decode("ascii"))
         self.ring_buffer_a.mark_sent(seq)
 
     async def handle_user_audio_commit(self) -> None:
         if self.recovery_a.is_recovering or self.recovery_a.is_degraded:
             return
+        await self._annotate_user_audio_commit()
         # 선제적 Echo Gate 활성화: commit → TTS 생성(1-2s) 사이 에코 누출 방지
         # 첫 발화 시 수신자 전화기 AEC 미적응으로 에코가 Session B로 누출하는 문제 차단
         self.echo_gate.pre_activate()
@@ -280,6 +317,36 @@ class VoiceToVoicePipeline(BasePipeline):
         await self.context_manager.inject_context(self.dual_session.session_a)
         await self.session_a.commit_user_audio()
 
+    async def _annotate_user_audio_commit(self) -> None:
+        """Silence gate 세그먼트를 마감하고 발화 경계/잘린 무음을 기록한다.
+
+        발화가 한 번도 감지되지 않았으면 pre-roll을 flush하여
+        빈 입력 버퍼 commit(Realtime API 에러)을 방지한다.
+        """
+        if self.user_audio_gate is None:
+            return
+        if self.user_audio_gate.sent_ms == 0:
+            for chunk in self.user_audio_gate.flush_preroll():
+                await self.session_a.send_user_audio(base64.b64encode(chunk).decode("ascii"))
+        b = self.user_audio_gate.commit()
+        metrics = self.call.call_metrics
+        metrics.user_audio_suppressed_ms += b.trimmed_ms
+        metrics.session_a_trimmed_silence_ms.append(b.trimmed_ms)
+        logger.info(
+            "[SessionA] Commit speech=%.0f-%.0fms segment=%.0fms sent=%.0fms trimmed=%.0fms%s",
+            b.speech_start_ms, b.speech_end_ms, b.segment_ms, b.sent_ms, b.trimmed_ms,
+            "" if b.has_speech else " (no speech above threshold)",
+        )
+        await self._send_pipeline_event(
+            "user_audio_gate",
+            "commit",
+            speech_start_ms=b.speech_start_ms,
+            speech_end_ms=b.speech_end_ms,
+            segment_ms=b.segment_ms,
+            trimmed_ms=b.trimmed_ms,
+            has_speech=b.has_speech,
+        )
+
     async def handle_user_text(self, text: str) -> None:
         self.call.transcript_history.append({"role": "user", "text": text})
         self.session_a.mark_user_input()
@@ -376,8 +443,16 @@ class VoiceToVoicePipeline(BasePipeline):
                 self.call.call_metrics.first_message_latency_ms = (
                     time.time() - self.call.started_at
                 ) * 1000
+                self.first_message.record_first_audio()
         await self.twilio_handler.send_audio(audio_bytes)
 
+    async def _play_prefetched_greeting(self, audio: bytes) -> None:
+        """벨이 울리는 동안 생성해 둔 첫 고지 오디오를 Twilio로 직접 재생한다."""
+        if self.call.call_metrics.first_message_latency_ms == 0.0 and self.call.started_at > 0:
+            self.call.call_metrics.first_message_latency_ms = (time.time() - self.call.started_at) * 1000
+        self.first_message.record_first_audio()
+        await play_clip(audio, self.twilio_handler, self.echo_gate)
+
     async def _on_user_transcription(self, text: str) -> None:
         """사용자 원문 STT → App 채팅창에 표시."""
         await self._app_ws_send(
@@ -421,8 +496,15 @@ class VoiceToVoicePipeline(BasePipeline):
         await self._b_output_queue.put(("caption_done", None))
 
     async def _on_session_b_original_caption(self, role: str, text: str) -> None:
+        if self.local_vad:
+            self.local_vad.note_transcript(text)
         await self._b_output_queue.put(("original_caption", (role, text)))
 
+    async def _on_session_b_original_caption_partial(self, role: str, text: str) -> None:
+        if self.local_vad:
+            self.local_vad.note_transcript(text)
+        await self._b_output_queue.put(("original_caption_partial", (role, text)))
+
     async def _drain_b_output(self) -> None:
         """Session B 출력 큐 소비자 — 응답 단위로 순차 스트리밍.
 
@@ -464,19 +546,20 @@ class VoiceToVoicePipeline(BasePipeline):
                         )
                     )
 
-                elif item_type == "original_caption":
+                elif item_type in ("original_caption", "original_caption_partial"):
                     role, text = data
+                    caption_data = {
+                        "role": role,
+                        "text": text,
+                        "stage": 1,
+                        "language": self.call.target_language,
+                        "direction": "inbound",
+                    }
+                    if item_type == "original_caption_partial":
+                        # 잠정 원문 자막 (누적 텍스트, 다음 잠정/확정 자막이 교체)
+                        caption_data["provisional"] = True
                     await self._app_ws_send(
-                        WsMessage(
-                            type=WsMessageType.CAPTION_ORIGINAL,
-                            data={
-                                "role": role,
-                                "text": text,
-                                "stage": 1,
-                                "language": self.call.target_language,
-                                "direction": "inbound",
-                            },
-                        )
+                        WsMessage(type=WsMessageType.CAPTION_ORIGINAL, data=caption_data)
                     )
 
                 elif item_type == "caption_done":
@@ -512,13 +595,25 @@ class VoiceToVoicePipeline(BasePipeline):
         if post_echo:
             self._pre_speech_buf.clear()  # settling 시에만 에코 오염 버퍼 폐기
         peak_rms = self.local_vad.peak_rms if self.local_vad else 0.0
+        if self.local_vad and self.local_vad.resumed_after_early_end:
+            # 조기 종료 직후 발화 재개 → 오절단 추정
+            self.call.call_metrics.session_b_early_endpoint_resumed += 1
         await self._send_pipeline_event("silero_vad", "speech_start", peak_rms=round(peak_rms))
         await self.session_b.notify_speech_started(post_echo=post_echo)
 
     async def _on_local_vad_speech_end(self) -> None:
         """Local VAD가 수신자 발화 종료를 감지."""
         peak_rms = self.local_vad.peak_rms if self.local_vad else 0.0
-        await self._send_pipeline_event("silero_vad", "speech_end", peak_rms=round(peak_rms))
+        early = False
+        if self.local_vad:
+            early = self.local_vad.last_end_early
+            metrics = self.call.call_metrics
+            metrics.session_b_endpoint_silence_ms.append(self.local_vad.last_end_silence_ms)
+            if early:
+                metrics.session_b_early_endpoints += 1
+        await self._send_pipeline_event(
+            "silero_vad", "speech_end", peak_rms=round(peak_rms), early=bool(early),
+        )
         await self.session_b.notify_speech_stopped(peak_rms=peak_rms)
 
     # --- 수신자 발화 감지 ---
@@ -534,6 +629,8 @@ class VoiceToVoicePipeline(BasePipeline):
             await self.interrupt.on_recipient_speech_started()
 
     async def _on_recipient_stopped(self) -> None:
+        # 첫 발화 종료 → 보류 중인 prefetch 고지 재생
+        await self.first_message.on_recipient_speech_ended()
         await self.context_manager.inject_context(self.dual_session.session_b)
         await self.interrupt.on_recipient_speech_stopped()
 
@@ -558,6 +655,7 @@ class VoiceToVoicePipeline(BasePipeline):
     async def _on_guardrail_filler(self, filler_text: str) -> None:
         logger.info("Guardrail: sending filler to Twilio: '%s'", filler_text)
         await self.twilio_handler.send_clear()
+        await self._play_cached_filler(filler_text)
 
     async def _on_guardrail_corrected_tts(self, corrected_text: str) -> None:
         logger.info("Guardrail: re-generating TTS with corrected text: '%s'", corrected_text[:60])
@@ -24,6 +24,7 @@ from typing import Any, Callable, Coroutine
 import openai
 
 from src.config import settings
+from src.openai_client import get_openai_client
 from src.realtime.ring_buffer import AudioRingBuffer
 from src.realtime.sessions.session_manager import RealtimeSession
 from src.types import (
@@ -474,7 +475,7 @@ class SessionRecoveryManager:
             return None
 
         if self._openai_client is None:
-            self._openai_client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+            self._openai_client = get_openai_client()
 
         # PCM16 raw bytes를 WAV 형식으로 감싸서 전송
         wav_bytes = self._pcm16_to_wav(audio_bytes, sample_rate=8000)
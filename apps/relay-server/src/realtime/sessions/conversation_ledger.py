@@ -0,0 +1,181 @@
+"""세션별 대화 아이템 장부 — 아이템 ID/역할/토큰 근사치 추적 + 일괄 삭제.
+
+Session A/B 핸들러는 매 턴 이전 대화 아이템을 지우는데(할루시네이션 방지),
+아이템마다 conversation.item.delete를 순차 await하면 턴 시작 경로가 그만큼 늦어진다.
+
+  - conversation.item.created로 아이템을 기록하고, transcript가 도착하면 토큰 근사치 갱신
+  - 프루닝/예산 초과 삭제는 RealtimeSession.queue_item_deletes()로 넘긴다
+    (백그라운드에서 일괄 전송, 다음 이벤트 전송 전에 반드시 먼저 나감 → 순서 보장)
+  - 세션별 live 대화 크기(아이템 수/토큰)를 CallMetrics에 반영 (METRICS 스냅샷으로 App 노출)
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Collection
+
+from src.config import settings
+from src.realtime.context_manager import estimate_tokens
+
+if TYPE_CHECKING:
+    from src.realtime.sessions.session_manager import RealtimeSession
+    from src.types import ActiveCall
+
+logger = logging.getLogger(__name__)
+
+# 오디오 아이템 토큰 근사치: transcript 도착 전 기본값 / transcript 텍스트 토큰 대비 배수
+# (Realtime 오디오 ~10 tokens/s, 발화 텍스트 ~3 tokens/s)
+_AUDIO_ITEM_DEFAULT_TOKENS = 50
+_AUDIO_TOKENS_PER_TEXT_TOKEN = 3
+
+
+@dataclass
+class LedgerItem:
+    item_id: str
+    role: str
+    item_type: str
+    tokens: int
+    has_audio: bool = False
+
+
+def _estimate_item(item: dict[str, Any]) -> tuple[int, bool]:
+    """conversation.item의 토큰 근사치와 오디오 포함 여부."""
+    tokens = 0
+    has_audio = False
+    for part in item.get("content") or []:
+        part_type = part.get("type", "")
+        if part_type in ("input_audio", "audio"):
+            has_audio = True
+            transcript = part.get("transcript") or ""
+            tokens += (
+                estimate_tokens(transcript) * _AUDIO_TOKENS_PER_TEXT_TOKEN
+                if transcript else _AUDIO_ITEM_DEFAULT_TOKENS
+            )
+        else:
+            tokens += estimate_tokens(part.get("text") or "")
+    if item.get("type") == "function_call":
+        tokens += estimate_tokens(item.get("arguments") or "")
+    elif item.get("type") == "function_call_output":
+        tokens += estimate_tokens(item.get("output") or "")
+    return tokens, has_audio
+
+
+class ConversationLedger:
+    """Realtime 세션 1개의 대화 아이템 장부."""
+
+    def __init__(
+        self,
+        session: RealtimeSession,
+        label: str,
+        call: ActiveCall | None = None,
+        token_budget: int | None = None,
+    ):
+        """
+        Args:
+            label: 지표 키 ("session_a" / "session_b")
+            token_budget: 대화 토큰 예산 — 초과 시 오래된 아이템부터 삭제 (0이면 제한 없음)
+        """
+        self._session = session
+        self._label = label
+        self._call = call
+        self._token_budget = settings.conversation_token_budget if token_budget is None else token_budget
+        self._items: dict[str, LedgerItem] = {}  # 생성 순서 유지
+        self._tokens = 0
+
+    @property
+    def item_ids(self) -> list[str]:
+        return list(self._items)
+
+    @property
+    def tokens(self) -> int:
+        return self._tokens
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: dict[str, Any], protected: Collection[str] = ()) -> None:
+        """conversation.item.created의 아이템을 기록하고 예산을 적용한다."""
+        item_id = item.get("id", "")
+        if not item_id or item_id in self._items:
+            return
+        tokens, has_audio = _estimate_item(item)
+        self._items[item_id] = LedgerItem(
+            item_id=item_id,
+            role=item.get("role", ""),
+            item_type=item.get("type", ""),
+            tokens=tokens,
+            has_audio=has_audio,
+        )
+        self._tokens += tokens
+        self._enforce_budget(protected)
+        self._publish()
+
+    async def handle_transcript(self, event: dict[str, Any]) -> None:
+        """STT/응답 transcript 도착 → 오디오 아이템 토큰 근사치 갱신."""
+        entry = self._items.get(event.get("item_id", ""))
+        transcript = event.get("transcript") or ""
+        if not entry or not entry.has_audio or not transcript:
+            return
+        tokens = estimate_tokens(transcript) * _AUDIO_TOKENS_PER_TEXT_TOKEN
+        self._tokens += tokens - entry.tokens
+        entry.tokens = tokens
+        self._publish()
+
+    def prune(self, keep_last: int = 1, protected: Collection[str] = ()) -> int:
+        """최근 keep_last개(보호 아이템 제외)만 남기고 삭제 요청한다. 삭제 요청 수 반환.
+
+        Args:
+            protected: 삭제하지 않고 개수 계산에서도 제외할 아이템 ID (응답 대기 중 입력 등)
+        """
+        candidates = [i for i in self._items if i not in protected]
+        if len(candidates) <= keep_last:
+            return 0
+        to_delete = candidates[:-keep_last] if keep_last > 0 else candidates
+        self._delete(to_delete)
+        self._publish()
+        return len(to_delete)
+
+    def stats(self) -> dict[str, int]:
+        return {"items": len(self._items), "tokens": self._tokens}
+
+    # --- Internal ---
+
+    def _enforce_budget(self, protected: Collection[str]) -> None:
+        if self._token_budget <= 0 or self._tokens <= self._token_budget:
+            return
+        newest = next(reversed(self._items))
+        evict: list[str] = []
+        remaining = self._tokens
+        for item_id, entry in self._items.items():
+            if remaining <= self._token_budget:
+                break
+            if item_id == newest or item_id in protected:
+                continue
+            evict.append(item_id)
+            remaining -= entry.tokens
+        if evict:
+            logger.info(
+                "[%s] Conversation over token budget (~%d > %d) — deleting %d oldest items",
+                self._label,
+                self._tokens,
+                self._token_budget,
+                len(evict),
+            )
+            self._delete(evict)
+
+    def _delete(self, item_ids: list[str]) -> None:
+        for item_id in item_ids:
+            entry = self._items.pop(item_id, None)
+            if entry:
+                self._tokens -= entry.tokens
+        self._session.queue_item_deletes(item_ids)
+
+    def _publish(self) -> None:
+        if not self._call:
+            return
+        metrics = self._call.call_metrics
+        metrics.conversation_items[self._label] = len(self._items)
+        metrics.conversation_tokens[self._label] = self._tokens
+        if self._tokens > metrics.conversation_peak_tokens.get(self._label, 0):
+            metrics.conversation_peak_tokens[self._label] = self._tokens
@@ -0,0 +1,212 @@
+"""Realtime 이벤트 디스패처 — WebSocket 수신 루프와 핸들러 실행을 분리한다.
+
+기존 listen()은 수신 루프 안에서 핸들러를 순차 await하여, 느린 핸들러
+(_save_transcript_and_notify의 STT 대기, Guardrail 교정 등)가 다음
+response.audio.delta 수신까지 막았다.
+
+구조:
+  - 수신 루프는 JSON 파싱 후 submit()으로 lane 큐에 넣기만 한다 (블로킹 없음)
+  - lane별 worker가 FIFO로 핸들러를 실행한다
+      audio:   response.audio.delta
+      text:    그 외 *.delta (자막, function call 인자)
+      control: 나머지 (done, speech_started, item.created 등)
+  - lane 간 순서 보장: 각 이벤트는 의존 lane의 선행 이벤트가 처리된 후 실행
+      audio   ← text, control  (Guardrail: 텍스트 델타 판정이 오디오보다 먼저)
+      text    ← control        (자막은 느린 오디오 전송을 기다리지 않음)
+      control ← audio, text    (response.done 등 경계 이벤트는 선행 델타 처리 후)
+  - detached 핸들러: 블로킹 가능 핸들러는 별도 task로 실행 (lane을 막지 않음)
+  - 이벤트 타입별 dispatch lag (수신 → 핸들러 시작) 측정
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine
+
+logger = logging.getLogger(__name__)
+
+LANE_AUDIO = "audio"
+LANE_TEXT = "text"
+LANE_CONTROL = "control"
+
+_LANE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+    LANE_AUDIO: (LANE_TEXT, LANE_CONTROL),
+    LANE_TEXT: (LANE_CONTROL,),
+    LANE_CONTROL: (LANE_AUDIO, LANE_TEXT),
+}
+
+# 이 이상 지연된 dispatch는 로그로 남김 (ms)
+_SLOW_DISPATCH_MS = 500.0
+
+
+def lane_for(event_type: str) -> str:
+    """이벤트 타입 → lane 이름."""
+    if event_type == "response.audio.delta":
+        return LANE_AUDIO
+    if event_type.endswith(".delta"):
+        return LANE_TEXT
+    return LANE_CONTROL
+
+
+@dataclass
+class DispatchLagStats:
+    """이벤트 타입별 dispatch lag 통계 (수신 → 핸들러 시작)."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, lag_ms: float) -> None:
+        self.count += 1
+        self.total_ms += lag_ms
+        if lag_ms > self.max_ms:
+            self.max_ms = lag_ms
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class _Lane:
+    """단일 lane: FIFO 큐 + 처리 완료 시퀀스 추적."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.queue: asyncio.Queue[tuple[int, float, dict[str, Any], dict[str, int]] | None] = (
+            asyncio.Queue()
+        )
+        self.enqueued_seq = 0
+        self.done_seq = 0
+        self._cond = asyncio.Condition()
+
+    async def wait_done(self, seq: int) -> None:
+        """이 lane에서 seq 이하 이벤트가 모두 처리될 때까지 대기한다."""
+        if self.done_seq >= seq:
+            return
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.done_seq >= seq)
+
+    async def mark_done(self, seq: int) -> None:
+        async with self._cond:
+            self.done_seq = seq
+            self._cond.notify_all()
+
+
+class EventDispatcher:
+    """RealtimeSession 이벤트를 lane별 worker로 분배한다."""
+
+    def __init__(
+        self,
+        label: str,
+        handlers: dict[str, list[Callable[..., Coroutine]]],
+        detached: set[tuple[str, Callable[..., Coroutine]]],
+        lag_stats: dict[str, DispatchLagStats],
+    ):
+        self.label = label
+        self._handlers = handlers
+        self._detached = detached
+        self._lag_stats = lag_stats
+        self._lanes = {name: _Lane(name) for name in _LANE_DEPENDENCIES}
+        self._workers: list[asyncio.Task] = []
+        self._detached_tasks: set[asyncio.Task] = set()
+        self._seq = 0
+
+    def start(self) -> None:
+        """lane worker를 시작한다."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._run_lane(lane)) for lane in self._lanes.values()
+        ]
+
+    def submit(self, event: dict[str, Any]) -> None:
+        """수신 이벤트를 lane 큐에 넣는다 (수신 루프에서 호출, 블로킹 없음)."""
+        event_type = event.get("type", "")
+        lane = self._lanes[lane_for(event_type)]
+        self._seq += 1
+        watermarks = {
+            dep: self._lanes[dep].enqueued_seq
+            for dep in _LANE_DEPENDENCIES[lane.name]
+            if self._lanes[dep].enqueued_seq > self._lanes[dep].done_seq
+        }
+        lane.enqueued_seq = self._seq
+        lane.queue.put_nowait((self._seq, time.monotonic(), event, watermarks))
+
+    async def drain(self, timeout: float = 5.0) -> None:
+        """큐에 남은 이벤트를 모두 처리하고 worker를 종료한다."""
+        for lane in self._lanes.values():
+            lane.queue.put_nowait(None)
+        if not self._workers:
+            return
+        done, pending = await asyncio.wait(self._workers, timeout=timeout)
+        if pending:
+            logger.warning(
+                "[%s] Event dispatch drain timeout (%.1fs) — %d lane(s) still busy",
+                self.label, timeout, len(pending),
+            )
+
+    async def stop(self) -> None:
+        """lane worker를 취소한다 (detached task는 유지)."""
+        workers, self._workers = self._workers, []
+        for task in workers:
+            if not task.done():
+                task.cancel()
+        for task in workers:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def cancel_detached(self) -> None:
+        """실행 중인 detached 핸들러 task를 취소한다 (세션 종료 시)."""
+        for task in list(self._detached_tasks):
+            if not task.done():
+                task.cancel()
+        self._detached_tasks.clear()
+
+    # --- Internal ---
+
+    async def _run_lane(self, lane: _Lane) -> None:
+        while True:
+            item = await lane.queue.get()
+            if item is None:
+                return
+            seq, received_at, event, watermarks = item
+            for dep, mark in watermarks.items():
+                await self._lanes[dep].wait_done(mark)
+            await self._dispatch(event, received_at)
+            await lane.mark_done(seq)
+
+    async def _dispatch(self, event: dict[str, Any], received_at: float) -> None:
+        event_type = event.get("type", "")
+        lag_ms = (time.monotonic() - received_at) * 1000
+        self._lag_stats.setdefault(event_type, DispatchLagStats()).record(lag_ms)
+        if lag_ms > _SLOW_DISPATCH_MS:
+            logger.debug("[%s] Slow dispatch: %s lagged %.0fms", self.label, event_type, lag_ms)
+
+        for handler in list(self._handlers.get(event_type, [])):
+            if (event_type, handler) in self._detached:
+                task = asyncio.create_task(self._run_detached(event_type, handler, event))
+                self._detached_tasks.add(task)
+                task.add_done_callback(self._detached_tasks.discard)
+                continue
+            try:
+                await handler(event)
+            except Exception:
+                logger.exception("[%s] Handler error for %s", self.label, event_type)
+
+    async def _run_detached(
+        self,
+        event_type: str,
+        handler: Callable[..., Coroutine],
+        event: dict[str, Any],
+    ) -> None:
+        try:
+            await handler(event)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("[%s] Detached handler error for %s", self.label, event_type)
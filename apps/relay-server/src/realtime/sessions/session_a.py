@@ -14,7 +14,10 @@ import time
 from typing import Any, Callable, Coroutine
 
 from src.config import settings
-from src.guardrail.checker import GuardrailChecker, GuardrailLevel
+from src.guardrail.checker import GuardrailChecker, GuardrailLevel, GuardrailResult
+from src.guardrail.early_correction import EarlyCorrection
+from src.realtime.filler_audio import FillerCapture, filler_audio_cache
+from src.realtime.sessions.conversation_ledger import ConversationLedger
 from src.realtime.sessions.session_manager import RealtimeSession
 from src.tools.executor import FunctionExecutor
 from src.types import ActiveCall, CallMode, CostTokens, TranscriptEntry
@@ -71,9 +74,18 @@ class SessionAHandler:
         self._response_expected = False  # 명시적 create_response 호출 시만 True
         self._done_event = asyncio.Event()
         self._done_event.set()  # 초기 상태: 생성 중 아님
+        # cancel()마다 증가 — 여러 응답에 걸친 요청(문장 단위 전송)이 중단 여부를 확인
+        self._cancel_generation = 0
 
         # 현재 응답의 전체 transcript (Level 2/3 교정용)
         self._current_transcript: str = ""
+        # Level 3 조기 교정: 에스컬레이션 시점에 시작, transcript.done에서 마무리
+        self._early_correction: EarlyCorrection | None = None
+        self._level3_escalated_at: float = 0.0
+        # Level 2/3 교정 task (참조 유지 — GC 방지 + stop 시 취소)
+        self._correction_tasks: set[asyncio.Task] = set()
+        # 정형 문구 라이브 생성 응답의 오디오 캡처 (필러 오디오 캐시 채움용)
+        self._filler_capture: FillerCapture | None = None
 
         # Function Calling (Agent Mode only)
         self._function_executor: FunctionExecutor | None = None
@@ -99,7 +111,7 @@ class SessionAHandler:
         # Anti-Hallucination: 대화 아이템 트래킹 + 프루닝
         # 매 턴 시작 전 이전 턴의 아이템을 삭제하여 GPT-4o가 오디오에만 집중하도록 함
         self._context_prune_keep = context_prune_keep
-        self._conversation_item_ids: list[str] = []
+        self._ledger = ConversationLedger(session, "session_a", call)
 
         # Anti-Hallucination: 발화 길이 대비 번역 비율 검증 (chars/sec)
         self._audio_committed_at: float = 0.0
@@ -124,6 +136,8 @@ class SessionAHandler:
 
         # 대화 아이템 트래킹 (프루닝용)
         self.session.on("conversation.item.created", self._handle_item_created)
+        self.session.on("conversation.item.input_audio_transcription.completed", self._ledger.handle_transcript)
+        self.session.on("response.audio_transcript.done", self._ledger.handle_transcript)
 
         # Function Calling 이벤트 (Agent Mode)
         self.session.on(
@@ -139,6 +153,11 @@ class SessionAHandler:
     def is_generating(self) -> bool:
         return self._is_generating
 
+    @property
+    def cancel_generation(self) -> int:
+        """cancel() 호출 횟수. 값이 바뀌었으면 그 사이 응답이 중단(Interrupt)된 것이다."""
+        return self._cancel_generation
+
     def mark_generating(self) -> None:
         """create_response() 직후 호출하여 즉시 generating 상태로 전환.
 
@@ -198,14 +217,32 @@ class SessionAHandler:
 
     async def cancel(self) -> None:
         """진행 중인 TTS를 중단한다 (Interrupt)."""
+        self._cancel_generation += 1
         self._is_generating = False
         self._response_expected = False
         self._done_event.set()
         if self._guardrail:
             self._guardrail.reset()
+        self._discard_early_correction()
+        self._filler_capture = None
         self._current_transcript = ""
         await self.session.cancel_response()
 
+    def stop(self) -> None:
+        """진행 중인 교정 task를 정리한다 (파이프라인 stop 시 호출)."""
+        self._discard_early_correction()
+        for task in list(self._correction_tasks):
+            if not task.done():
+                task.cancel()
+        self._correction_tasks.clear()
+
+    def capture_next_response(self, language: str, text: str) -> None:
+        """다음 응답(정형 문구 라이브 생성)의 오디오를 필러 오디오 캐시에 캡처한다.
+
+        create_response 직전에 호출한다. 응답이 완료되고 transcript가 문구와 일치하면 저장된다.
+        """
+        self._filler_capture = filler_audio_cache.capture(language, text)
+
     # --- 이벤트 핸들러 ---
 
     async def _handle_audio_delta(self, event: dict[str, Any]) -> None:
@@ -243,6 +280,8 @@ class SessionAHandler:
             return
 
         audio_bytes = base64.b64decode(delta_b64)
+        if self._filler_capture:
+            self._filler_capture.chunks.append(audio_bytes)
         await self._on_tts_audio(audio_bytes)
 
     async def _handle_transcript_delta(self, event: dict[str, Any]) -> None:
@@ -262,14 +301,21 @@ class SessionAHandler:
             prev_level = self._guardrail.current_level
             level = self._guardrail.check_text_delta(delta)
 
-            # Level 3으로 에스컬레이션 시 필러 오디오 재생
+            # Level 3으로 에스컬레이션 시 필러 오디오 재생 + 조기 교정 시작
             if level == GuardrailLevel.LEVEL_3 and prev_level < GuardrailLevel.LEVEL_3:
                 logger.warning(
                     "[SessionA] Guardrail Level 3 triggered — blocking TTS audio"
                 )
+                self._level3_escalated_at = time.time()
+                if settings.guardrail_early_correction_enabled:
+                    self._early_correction = EarlyCorrection(self._guardrail)
+                    self._early_correction.start(self._current_transcript)
                 if self._on_guardrail_filler:
                     filler = self._guardrail.check_full_text(self._current_transcript).filler_text
                     await self._on_guardrail_filler(filler)
+            elif self._early_correction:
+                # 에스컬레이션 이후 완성된 문장을 이어서 교정
+                self._early_correction.extend(self._current_transcript)
 
         # 자막은 항상 전달 (Level 3에서도 App에는 자막 표시)
         if self._on_caption:
@@ -280,6 +326,8 @@ class SessionAHandler:
         transcript = event.get("transcript", "")
         if not transcript:
             return
+        if self._filler_capture:
+            self._filler_capture.transcript = transcript
 
         # Anti-Hallucination: 발화 길이 대비 번역 비율 검증 (chars/sec)
         if self._audio_committed_at > 0:
@@ -292,6 +340,7 @@ class SessionAHandler:
                 self._audio_committed_at = 0.0
                 if self._call:
                     self._call.call_metrics.hallucinations_blocked += 1
+                self._discard_early_correction()
                 return
             self._audio_committed_at = 0.0
 
@@ -334,12 +383,16 @@ class SessionAHandler:
         level = self._guardrail.current_level
 
         if level == GuardrailLevel.LEVEL_2:
-            # Level 2: 비동기 교정 (TTS는 이미 전달됨, 백그라운드에서 교정 로그)
-            asyncio.create_task(self._handle_level2_correction(transcript))
+            # Level 2: 백그라운드 교정 (TTS는 이미 전달됨, 교정 큐에서 로그 기록)
+            self._track_correction(self._handle_level2_correction(transcript))
 
         elif level == GuardrailLevel.LEVEL_3:
-            # Level 3: 동기 교정 (TTS는 차단됨, 교정 후 재전송)
-            await self._handle_level3_correction(transcript)
+            # Level 3: 교정 후 재전송 (TTS는 차단됨)
+            # 이벤트 lane을 막지 않도록 별도 task — 교정 TTS는 response.done 처리 이후 요청됨
+            early, self._early_correction = self._early_correction, None
+            self._track_correction(
+                self._handle_level3_correction(transcript, early, self._level3_escalated_at)
+            )
 
     async def _handle_response_done(self, event: dict[str, Any]) -> None:
         """Session A 응답 완료 + cost token 추적."""
@@ -352,26 +405,27 @@ class SessionAHandler:
             response = event.get("response", {})
             usage = response.get("usage", {})
             if usage:
-                input_details = usage.get("input_token_details", {})
-                output_details = usage.get("output_token_details", {})
-                tokens = CostTokens(
-                    audio_input=input_details.get("audio_tokens", 0),
-                    text_input=input_details.get("text_tokens", 0),
-                    audio_output=output_details.get("audio_tokens", 0),
-                    text_output=output_details.get("text_tokens", 0),
-                )
+                tokens = CostTokens.from_realtime_usage(usage)
                 self._call.cost_tokens.add(tokens)
                 logger.debug(
-                    "[SessionA] Tokens — audio_in=%d text_in=%d audio_out=%d text_out=%d (total=%d)",
+                    "[SessionA] Tokens — audio_in=%d text_in=%d audio_out=%d text_out=%d "
+                    "cached_in=%d (total=%d)",
                     tokens.audio_input, tokens.text_input,
                     tokens.audio_output, tokens.text_output,
+                    tokens.cached_audio_input + tokens.cached_text_input,
                     self._call.cost_tokens.total,
                 )
 
+        # 정형 문구 캡처: 끝까지 완료된 응답만 캐시 (취소/실패 응답은 잘린 오디오)
+        capture, self._filler_capture = self._filler_capture, None
+        if capture and event.get("response", {}).get("status", "completed") == "completed":
+            filler_audio_cache.commit(capture)
+
         # 다음 응답을 위해 상태 초기화
         self._first_audio_received = False
         if self._guardrail:
             self._guardrail.reset()
+        self._discard_early_correction()  # transcript.done 없이 끝난 응답
         self._current_transcript = ""
         if self._on_response_done:
             await self._on_response_done()
@@ -401,11 +455,8 @@ class SessionAHandler:
     # --- 대화 아이템 트래킹 + 프루닝 ---
 
     async def _handle_item_created(self, event: dict[str, Any]) -> None:
-        """대화 아이템 생성 이벤트 → ID 추적."""
-        item = event.get("item", {})
-        item_id = item.get("id", "")
-        if item_id:
-            self._conversation_item_ids.append(item_id)
+        """대화 아이템 생성 이벤트 → 장부 기록 (ID/역할/토큰 근사치)."""
+        self._ledger.add(event.get("item", {}))
 
     async def _prune_conversation_items(self, keep_last: int = 1) -> None:
         """이전 턴의 대화 아이템을 삭제하여 컨텍스트 기반 할루시네이션을 방지한다.
@@ -417,20 +468,15 @@ class SessionAHandler:
         Args:
             keep_last: 유지할 최근 아이템 수 (1 = 최신 컨텍스트 주입 아이템만 유지)
         """
-        if len(self._conversation_item_ids) <= keep_last:
-            return
-        if keep_last > 0:
-            to_delete = self._conversation_item_ids[:-keep_last]
-            self._conversation_item_ids = self._conversation_item_ids[-keep_last:]
-        else:
-            to_delete = self._conversation_item_ids[:]
-            self._conversation_item_ids = []
-        for item_id in to_delete:
-            try:
-                await self.session.delete_item(item_id)
-            except Exception:
-                logger.debug("[SessionA] Failed to delete item %s", item_id)
-        logger.info("[SessionA] Pruned %d old conversation items (kept %d)", len(to_delete), keep_last)
+        # 삭제 이벤트는 세션 전송 큐에서 일괄 전송 (다음 이벤트보다 먼저 나감)
+        deleted = self._ledger.prune(keep_last)
+        if deleted:
+            logger.info("[SessionA] Pruned %d old conversation items (kept %d)", deleted, keep_last)
+
+    @property
+    def conversation_size(self) -> dict[str, int]:
+        """Session A live 대화 크기 (아이템 수, 토큰 근사치)."""
+        return self._ledger.stats()
 
     async def prune_before_response(self) -> None:
         """T2V/Agent 파이프라인이 create_response 호출 전에 프루닝을 수행한다."""
@@ -497,14 +543,14 @@ class SessionAHandler:
     # --- Guardrail 교정 ---
 
     async def _handle_level2_correction(self, transcript: str) -> None:
-        """Level 2 비동기 교정 (백그라운드)."""
+        """Level 2 백그라운드 교정 (프로세스 전역 교정 큐에 위임)."""
         if not self._guardrail:
             return
 
         if self._call:
             self._call.call_metrics.guardrail_level2_count += 1
 
-        await self._guardrail.correct_async(transcript)
+        self._guardrail.submit_level2_correction(transcript, self._record_correction)
 
         # App에 guardrail 이벤트 알림 (디버그용)
         if self._on_guardrail_event:
@@ -513,15 +559,29 @@ class SessionAHandler:
                 "original": transcript,
             })
 
-    async def _handle_level3_correction(self, transcript: str) -> None:
-        """Level 3 동기 교정 (차단 후 교정된 텍스트로 재TTS)."""
+    async def _handle_level3_correction(
+        self,
+        transcript: str,
+        early: EarlyCorrection | None = None,
+        escalated_at: float = 0.0,
+    ) -> None:
+        """Level 3 동기 교정 (차단 후 교정된 텍스트로 재TTS).
+
+        Args:
+            early: 에스컬레이션 시점에 시작한 조기 교정 (없으면 전체 transcript 교정)
+            escalated_at: Level 3 상향 시각 (에스컬레이션 → 교정 TTS 지연 계측)
+        """
         if not self._guardrail:
             return
 
         if self._call:
             self._call.call_metrics.guardrail_level3_count += 1
 
-        result = await self._guardrail.correct_text(transcript)
+        if early:
+            result = await early.finish(transcript)
+        else:
+            result = await self._guardrail.correct_text(transcript)
+        self._record_correction(result)
 
         # App에 guardrail 이벤트 알림
         if self._on_guardrail_event:
@@ -530,8 +590,38 @@ class SessionAHandler:
                 "original": transcript,
                 "corrected": result.corrected_text,
                 "correction_time_ms": result.correction_time_ms,
+                "correction_source": result.correction_source,
             })
 
         # 교정된 텍스트로 새 TTS 생성 요청
         if result.corrected_text and self._on_guardrail_corrected_tts:
+            if self._call and escalated_at > 0:
+                self._call.call_metrics.guardrail_escalation_to_tts_ms.append(
+                    round((time.time() - escalated_at) * 1000, 1)
+                )
             await self._on_guardrail_corrected_tts(result.corrected_text)
+
+    def _track_correction(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._correction_tasks.add(task)
+        task.add_done_callback(self._correction_tasks.discard)
+
+    def _discard_early_correction(self) -> None:
+        """응답 취소/차단 시 진행 중인 조기 교정을 폐기한다."""
+        if self._early_correction:
+            self._early_correction.cancel()
+            self._early_correction = None
+
+    def _record_correction(self, result: GuardrailResult) -> None:
+        """교정 경로(규칙/LLM)와 소요 시간을 통화 메트릭에 기록한다."""
+        if not self._call or not result.correction_source:
+            return
+        metrics = self._call.call_metrics
+        if result.correction_source == "llm_failed":
+            metrics.guardrail_llm_failures += 1
+            return
+        if result.correction_source == "llm":
+            metrics.guardrail_llm_calls += 1
+        else:
+            metrics.guardrail_rule_rewrites += 1
+        metrics.guardrail_correction_ms.append(round(result.correction_time_ms, 1))
@@ -11,224 +11,82 @@ import asyncio
 import base64
 import itertools
 import logging
-import re
 import time
+import unicodedata
 from collections import deque
 from typing import Any, Callable, Coroutine
 
 from src.config import settings
-from src.realtime.chat_translator import ChatTranslator
+from src.realtime.chat_translator import ChatTranslationResult, ChatTranslator
+from src.realtime.sessions.conversation_ledger import ConversationLedger
 from src.realtime.sessions.session_manager import RealtimeSession
+from src.realtime.sessions.speculative_trigger import SpeculativeSttTrigger
+from src.realtime.sessions.turn_scheduler import PendingTurn, TurnScheduler
+from src.realtime.stt_filter import get_stt_matcher
 from src.types import ActiveCall, CostTokens, TranscriptEntry
 
 logger = logging.getLogger(__name__)
 
-# Whisper 한국어 할루시네이션 블랙리스트
-# 학습 데이터(방송 뉴스 자막) 편향으로 무음/저에너지 구간에서 반복 생성되는 패턴
-_STT_HALLUCINATION_BLOCKLIST = frozenset({
-    "MBC 뉴스 이덕영입니다",
-    "MBC 뉴스 이덕영입니다.",
-    "MBC뉴스 이덕영입니다",
-    "시청해주셔서 감사합니다",
-    "시청해주셔서 감사합니다.",
-    "시청해 주셔서 감사합니다",
-    "시청해 주셔서 감사합니다.",
-    "영상을 시청해주셔서 감사합니다",
-    "끝까지 시청해주셔서 감사합니다",
-    "끝까지 시청해주셔서 감사합니다.",
-    "끝까지 시청해 주셔서 감사합니다",
-    "끝까지 시청해 주셔서 감사합니다.",
-    "구독과 좋아요 부탁드립니다",
-    "구독과 좋아요 부탁드립니다.",
-    "밝혔습니다",
-    "밝혔습니다.",
-    "전해드립니다",
-    "전해드립니다.",
-    "플러스포어 픽업",
-    # 짧은 한국어 공손/인사 표현 (무음/저에너지 구간에서 Whisper가 단독 생성)
-    # NOTE: "네"/"예" 등 정상 응답과 구분 불가능한 단어는 의도적으로 제외 — false-positive 위험
-    "감사합니다",
-    "감사합니다.",
-    "고맙습니다",
-    "고맙습니다.",
-    "수고하셨습니다",
-    "수고하셨습니다.",
-    "수고 하셨습니다",
-    "수고하십니다",
-    "안녕하세요",
-    "안녕하세요.",
-})
-
-# 동일 토큰 3회 이상 연속 반복 감지 (whisper/gpt-4o 공통 할루시네이션)
-_REPETITION_RE = re.compile(r'(\b\S+\b)(\s+\1){2,}', re.IGNORECASE)
-
-# 블록리스트 비교 전 제거할 구두점 (Whisper가 한국어 전사 끝에 추가)
-# ! ? (ASCII), 。！？ (CJK 전각), … (말줄임), · (가운데점 — 한국어 합성어 구분자)
-_PUNCT_STRIP = str.maketrans("", "", "!?。！？…·")
-
-
-def _normalize_for_blocklist(text: str) -> str:
-    """블록리스트 비교용 정규화: strip + 구두점 제거."""
-    return text.strip().translate(_PUNCT_STRIP)
-
-
-# Whisper 영어 할루시네이션 블록리스트
-# YouTube/팟캐스트 아웃트로 + 단일 단어 필러
-# Stage 1 (STT 필터): target_language≠en일 때 적용 (수신자가 비영어권이면 영어 STT=할루시네이션)
-# Stage 2 (번역 출력 필터): target_language=en일 때 적용 (번역이 한국어여야 하는데 영어=할루시네이션)
-_STT_HALLUCINATION_BLOCKLIST_EN = frozenset({
-    # YouTube / podcast outros
-    "Thank you.",
-    "Thank you",
-    "Thanks for watching.",
-    "Thanks for watching",
-    "Thanks for listening.",
-    "Thanks for listening",
-    "Please subscribe.",
-    "Please subscribe",
-    "Like and subscribe.",
-    "Like and subscribe",
-    "See you next time.",
-    "See you next time",
-    "See you in the next video.",
-    "See you in the next video",
-    # Single-word fillers (무음에서 자주 생성)
-    "you",
-    "You",
-    "So.",
-    "So",
-    "Bye.",
-    "Bye",
-    "Bye-bye.",
-    "Bye-bye",
-})
-
-# "Hi, [Name]" 패턴 — Whisper가 무음에서 생성하는 인사+이름 할루시네이션
-_EN_HI_NAME_RE = re.compile(r'^Hi,?\s+[A-Z][a-z]+\.?$')
-
-# 짧은 영어 공손 표현/인사/필러 (≤3단어, 소문자 비교)
-_EN_SHORT_POLITE = frozenset({
-    "thank you", "thanks", "yes", "no", "okay", "ok",
-    "bye", "goodbye", "hello", "hi", "sure", "right",
-    "yeah", "yep", "nope", "alright", "great",
-    "oh", "hmm", "uh", "um", "ah", "wow", "well",
-    "you too", "me too", "i see", "got it", "of course",
-})
-
-
-def _is_english_short_hallucination(text: str) -> bool:
-    """짧은 영어 할루시네이션 감지 (≤3단어 공손 표현/인사/필러 + Hi [Name] 패턴).
-
-    Whisper가 무음/저에너지 구간에서 자주 생성하는 짧은 영어 표현을 차단.
-    Stage 1: 수신자가 비영어권(target_language≠en)일 때 적용.
-    Stage 2: 번역 출력이 영어가 아니어야 할 때(target_language=en) 적용.
-    """
-    stripped = text.strip()
-    if not stripped:
-        return False
-
-    # Remove trailing period for comparison
-    core = stripped.rstrip(".")
-    words = core.split()
-
-    if len(words) > 3:
-        return False
-
-    # "Hi, [Name]" pattern
-    if _EN_HI_NAME_RE.match(stripped):
-        return True
-
-    # Short polite/filler expressions
-    if core.lower() in _EN_SHORT_POLITE:
-        return True
-
-    return False
-
+# Whisper 할루시네이션 규칙: src/realtime/stt_filter/data/*.json (언어별 컴파일 매처)
 
-def _is_noise_stt(text: str) -> bool:
-    """STT 결과가 구조적 노이즈(자음 스팸, 반복 패턴, 단일 문자)인지 판별한다."""
-    stripped = text.strip()
-    if not stripped:
-        return True
+# Stage 1 (STT) 차단 사유: 정확 매칭 블록리스트 / 구조적 노이즈 / 짧은 외국어 필러
+_STT_BLOCK_REASONS = frozenset({"blocklist", "noise", "short_phrase", "hi_name"})
+# Stage 2 (번역 출력) 차단 사유 — 우선순위 순
+_OUTPUT_BLOCK_REASONS = ("unclear", "blocklist", "short_phrase", "hi_name", "repetition")
 
-    non_space = stripped.replace(" ", "")
-
-    # 1. 자음만 (Korean Jamo consonants U+3131~U+314E)
-    if non_space and all("\u3131" <= c <= "\u314E" for c in non_space):
-        return True
-
-    # 2. 짧은 패턴 반복 (패턴 길이 1~6자, 3회 이상)
-    for plen in range(1, min(7, len(non_space) // 2 + 1)):
-        pat = non_space[:plen]
-        reps = len(non_space) // plen
-        if reps >= 3 and pat * reps == non_space[:plen * reps]:
-            return True
+# 최소 E2E 임계값 (ms): 네트워크 RTT + STT + 번역 처리 최소 시간
+# debounce(300ms) + speech(250ms) + 처리 → 이보다 빠른 응답은 할루시네이션
+_MIN_E2E_MS = 500
 
-    # 3. 단일 문자
-    if len(non_space) <= 1:
-        return True
+# 단어 사이를 띄어 쓰지 않는 언어 — 번역 조각을 구분자 없이 잇는다
+_NO_SPACE_LANGUAGES = frozenset({"ja", "zh"})
 
-    return False
+# 띄어쓰기 없는 언어의 잠정 자막 최소 글자 수 (단어 경계 대신 글자 수로 안정성 판정)
+_NO_SPACE_MIN_CHARS = 4
 
 
-# 최소 E2E 임계값 (ms): 네트워크 RTT + STT + 번역 처리 최소 시간
-# debounce(300ms) + speech(250ms) + 처리 → 이보다 빠른 응답은 할루시네이션
-_MIN_E2E_MS = 500
+def _provisional_stt_text(text: str, target_language: str, post_echo: bool = False) -> str:
+    """누적 STT delta 중 잠정 자막으로 표시해도 되는 부분을 반환한다 (없으면 "").
 
-# [unclear] 변형 패턴 — 모델이 지시를 따르지 않고 다른 표현을 사용하는 경우
-_UNCLEAR_PHRASES = (
-    "[unclear]",
-    "unclear",
-    "inaudible",
-    "cannot hear",
-    "can't hear",
-    "couldn't hear",
-    "not clear",
-    "unintelligible",
-    "알아들을 수 없",
-    "들리지 않",
-    "불분명",
-    "잘 안 들",
-    "잘 들리지",
-)
-
-
-# --- Fix 2: Korean Whisper Append-Hallucination Patterns ---
-# YouTube/방송 콘텐츠 잔재 — STT 결과에 부분 매칭
-_KO_WHISPER_APPEND_SUBSTRINGS = frozenset({
-    # 유튜브/방송 크리에이터 크레딧
-    "영상편집", "영상 편집",
-    "자막 제공", "자막 편집", "자막제공",
-    "촬영 편집", "촬영편집",
-    # 유튜브/방송 프로그램명 패턴
-    "재택 플러스", "재택플러스",
-    "플러스포어",
-    # 방송 클로징
-    "제작지원", "제작 지원",
-    "방송통신위원회",
-    # YouTube 아웃트로/CTA (실제 발화 뒤에 append되는 패턴)
-    "시청해주셔서", "시청해 주셔서",
-    "구독 해주세요", "구독해주세요", "구독해 주세요",
-    "구독과 좋아요", "좋아요와 구독", "좋아요 구독",
-    # 방송/전화 종료 인사 (실제 발화 뒤에 append)
-    # NOTE: _STT_HALLUCINATION_BLOCKLIST에도 등록됨 — standalone은 정확 매칭 차단,
-    #        여기서는 "실제발화 수고하셨습니다" 같은 append 패턴을 trim 처리
-    "수고하셨습니다", "수고 하셨습니다",
-    "수고하십니다", "수고 하십니다",
-})
-
-# 문장 종결(?.!) 후 한국어 동사 어미 없이 끝나는 짧은 꼬리 감지
-# "왜 바꾸고 싶으시죠? 영상편집 배혜지" → "영상편집 배혜지" 감지
-_KO_TRAILING_FRAGMENT_RE = re.compile(
-    r'[.?!]\s*'           # 문장 종결 부호
-    r'([가-힣\s]{2,15})'  # 한국어 2-15자 꼬리
-    r'$'                   # 문자열 끝
-)
-
-# 한국어 문장 종결 어미 (이것이 있으면 정상 문장)
-_KO_SENTENCE_ENDINGS = re.compile(
-    r'(?:요|다|까|죠|세요|니다|습니다|됩니다|겠습니다|드립니다|합니다|입니다|습니까|네요|데요|ㅂ니다)\.?$'
-)
+    completed 시점의 전체 필터를 점진적으로 적용한다:
+      - 아직 완성되지 않은 마지막 단어는 보류 (delta가 단어 중간에서 끊김)
+        ja/zh는 공백이 없으므로 _NO_SPACE_MIN_CHARS 글자 미만일 때만 보류
+      - 한국어 append 할루시네이션 문구 이후는 잘라냄
+      - 블록리스트 문구(또는 그 접두사)/구조적 노이즈/짧은 영어 할루시네이션이면 보류
+    최종 판정은 completed 핸들러가 하며, 여기서 표시한 자막이 차단되면 철회된다.
+    """
+    no_space = target_language in _NO_SPACE_LANGUAGES
+    if not text or text[-1].isspace() or text[-1] in ".,?!。！？…":
+        stable = text.strip()
+    elif no_space:
+        stable = text.strip() if len(text.strip()) >= _NO_SPACE_MIN_CHARS else ""
+    else:
+        stable = text.rsplit(None, 1)[0] if " " in text.strip() else ""
+    matcher = get_stt_matcher(target_language)
+    hits = matcher.match(stable)
+    append = next((h for h in hits if h.reason == "append"), None)
+    if append:
+        stable = stable[:append.start].rstrip()
+        hits = matcher.match(stable)
+    if not stable:
+        return ""
+    if matcher.is_blocklist_prefix(stable) or any(h.reason in _STT_BLOCK_REASONS for h in hits):
+        return ""
+    if post_echo and (len(stable) < _NO_SPACE_MIN_CHARS if no_space else len(stable.split()) <= 1):
+        return ""
+    return stable
+
+
+def _translation_separator(head: str, tail: str, language: str) -> str:
+    """선행 번역(head)과 이어 번역(tail) 사이 구분자.
+
+    이미 공백이 있거나, tail이 닫는 문장부호로 시작하거나, 띄어쓰기 없는 언어면 빈 문자열.
+    """
+    if not head or not tail or head[-1].isspace() or tail[0].isspace():
+        return ""
+    if language in _NO_SPACE_LANGUAGES or unicodedata.category(tail[0]) in ("Pe", "Pf", "Po"):
+        return ""
+    return " "
 
 
 class SessionBHandler:
@@ -248,6 +106,9 @@ class SessionBHandler:
         use_local_vad: bool = False,
         context_prune_keep: int = 1,
         chat_translator: ChatTranslator | None = None,
+        stream_translation: bool = False,
+        on_caption_superseded: Callable[[], Coroutine] | None = None,
+        on_original_caption_partial: Callable[[str, str], Coroutine] | None = None,
     ):
         """
         Args:
@@ -260,12 +121,22 @@ class SessionBHandler:
             on_recipient_speech_stopped: 수신자 발화 종료 콜백
             on_transcript_complete: 번역 완료 콜백 (role, text → 대화 컨텍스트 추적)
             use_local_vad: True면 Server VAD 이벤트 미등록 (LocalVAD가 대신 제어)
+            stream_translation: Chat API 번역을 스트리밍하여 델타 단위로 자막 전송
+            on_caption_superseded: 스트리밍 중 번역이 대체/실패되어 부분 자막을 폐기할 때 콜백
+            on_original_caption_partial: 잠정 원문 자막 콜백 (role, 누적 텍스트) — STT delta 기반,
+                completed 시 on_original_caption으로 확정 (빈 텍스트 = 잠정 자막 철회)
         """
         self.session = session
         self._call = call
         self._on_translated_audio = on_translated_audio
         self._on_caption = on_caption
         self._on_original_caption = on_original_caption
+        self._on_original_caption_partial = on_original_caption_partial
+        # STT delta 누적 (item_id → 누적 텍스트 / 마지막으로 표시한 잠정 자막)
+        self._stt_partials: dict[str, str] = {}
+        self._stt_partial_shown: dict[str, str] = {}
+        # 발화 시작 → 첫 원문 자막 지표 (발화 시작마다 1회 기록)
+        self._first_caption_pending: bool = False
         self._on_recipient_speech_started = on_recipient_speech_started
         self._on_recipient_speech_stopped = on_recipient_speech_stopped
         self._on_transcript_complete = on_transcript_complete
@@ -298,6 +169,18 @@ class SessionBHandler:
         self._is_response_active = False
         self._response_done_event = asyncio.Event()
         self._response_done_event.set()  # 초기 상태: 응답 없음
+        # Realtime 응답 턴 스케줄러: 발화는 즉시 commit(STT 선행), 응답 생성만 직렬화
+        self._turn_scheduler = TurnScheduler(
+            self._dispatch_realtime_turns,
+            on_queue_delay=self._record_turn_queue_delay,
+        )
+        # 아직 응답이 생성되지 않은 사용자 입력 아이템 (큐 대기 턴의 오디오 — 프루닝 제외)
+        self._unanswered_item_ids: set[str] = set()
+        # 턴별 입력 아이템 귀속 (늦은 STT를 해당 대기 턴에 보관하기 위함)
+        #   Server VAD: speech_stopped의 item_id를 모아 다음 턴에 부여
+        #   Local VAD: commit 후 input_audio_buffer.committed로 도착하는 item_id를 순서대로 부여
+        self._turn_item_ids: list[str] = []
+        self._turns_awaiting_commit: deque[PendingTurn] = deque()
 
         # 번역 품질 평가용: Recipient STT 원문 임시 저장
         self._last_recipient_stt: str = ""
@@ -307,6 +190,8 @@ class SessionBHandler:
         # _save_transcript_and_notify()가 _stt_blocked 체크 전 이 이벤트를 대기
         self._stt_check_done = asyncio.Event()
         self._stt_check_done.set()  # 초기 상태: 대기 불필요
+        # _stt_check_done을 대기 중인 detached 번역 저장 수 (대기 중엔 response.done이 게이트를 풀지 않음)
+        self._stt_gate_waiters: int = 0
         # STT latency 임시 저장: E2E와 동시에 기록하여 리스트 정합성 보장
         self._pending_stt_ms: float = 0.0
 
@@ -331,13 +216,35 @@ class SessionBHandler:
         # Speculative STT: 발화 중 선행 commit (Chat API 경로 전용)
         self._speculative_stt_task: asyncio.Task | None = None
         self._speculative_committed: bool = False
-
-        # 대화 아이템 트래킹: 컨텍스트 누적에 의한 할루시네이션 방지
+        # 통화별 발화 길이 분포 기반 commit 지연 (적응 비활성 시 고정 지연 유지)
+        self._speculative_trigger = SpeculativeSttTrigger(
+            default_delay_s=settings.speculative_stt_delay_s,
+            min_delay_s=(
+                settings.speculative_stt_min_delay_s
+                if settings.speculative_stt_adaptive else settings.speculative_stt_delay_s
+            ),
+            max_delay_s=(
+                settings.speculative_stt_max_delay_s
+                if settings.speculative_stt_adaptive else settings.speculative_stt_delay_s
+            ),
+            min_gain_s=settings.speculative_stt_min_gain_s,
+        )
+        # Speculative 번역: 발화 중 도착한 Part 1 STT의 선행 번역 (_stt_texts 앞 N개 기준)
+        self._prefix_translation_task: asyncio.Task | None = None
+        self._prefix_stt_text: str = ""
+        self._prefix_stt_count: int = 0
+        self._prefix_started_at: float = 0.0  # 선행 번역 요청 시각 (monotonic, 결합 결과 지연 기준)
+        self._prefix_streamed: bool = False  # 이어 번역 중 캡션을 전송했는지 (취소 시 폐기 알림용)
+        self._prefix_reused: bool = False  # 선행 번역을 최종 번역에 사용했는지 (이어 번역 실패 시 False)
+
+        # 대화 아이템 장부: 컨텍스트 누적에 의한 할루시네이션 방지
         # 매 턴 시작 전 이전 턴의 아이템을 삭제하여 GPT-4o가 오디오에만 집중하도록 함
-        self._conversation_item_ids: list[str] = []
+        self._ledger = ConversationLedger(session, "session_b", call)
 
         # Chat API 번역 (T2V/Agent 모드 한정)
         self._chat_translator = chat_translator
+        self._stream_translation = stream_translation
+        self._on_caption_superseded = on_caption_superseded
         self._stt_ready_event = asyncio.Event()
         # STT 누적 버퍼: 연속 발화 시 세그먼트별 STT를 누적하여 완전한 문장으로 번역
         self._stt_texts: list[str] = []
@@ -359,13 +266,20 @@ class SessionBHandler:
     def _register_handlers(self) -> None:
         self.session.on("response.audio.delta", self._handle_audio_delta)
         self.session.on("response.audio_transcript.delta", self._handle_transcript_delta)
-        self.session.on("response.audio_transcript.done", self._handle_transcript_done)
+        # transcript/text done → _save_transcript_and_notify가 STT 판정을 최대 2s 대기하므로 detached
+        # (인라인 실행 시 STT completed 이벤트 dispatch까지 막혀 항상 timeout까지 대기)
+        self.session.on(
+            "response.audio_transcript.done", self._handle_transcript_done, detached=True
+        )
         # modalities=['text'] 전용: response.text.delta/done 핸들러
         self.session.on("response.text.delta", self._handle_text_delta)
-        self.session.on("response.text.done", self._handle_text_done)
+        self.session.on("response.text.done", self._handle_text_done, detached=True)
+        self.session.on("response.created", self._handle_response_created)
         self.session.on("response.done", self._handle_response_done)
         # 대화 아이템 트래킹 (프루닝용)
         self.session.on("conversation.item.created", self._handle_item_created)
+        self.session.on("conversation.item.input_audio_transcription.completed", self._ledger.handle_transcript)
+        self.session.on("response.audio_transcript.done", self._ledger.handle_transcript)
         # Local VAD 모드에서는 Server VAD 이벤트를 등록하지 않음
         # (turn_detection=null이므로 이 이벤트가 발생하지 않지만, 명시적 비등록)
         if not self._use_local_vad:
@@ -375,7 +289,14 @@ class SessionBHandler:
             self.session.on(
                 "input_audio_buffer.speech_stopped", self._handle_speech_stopped
             )
+        else:
+            self.session.on("input_audio_buffer.committed", self._handle_audio_committed)
+            self.session.on("error", self._handle_commit_error)
         # 2단계 자막 Stage 1: 수신자 원문 STT (PRD 5.4)
+        self.session.on(
+            "conversation.item.input_audio_transcription.delta",
+            self._handle_input_transcription_delta,
+        )
         self.session.on(
             "conversation.item.input_audio_transcription.completed",
             self._handle_input_transcription_completed,
@@ -388,6 +309,8 @@ class SessionBHandler:
             self._response_debounce_task = None
         self._cancel_silence_timeout()
         self._cancel_speculative_stt()
+        self._reset_prefix_translation()
+        self._turn_scheduler.stop()
         if self._max_speech_timer and not self._max_speech_timer.done():
             self._max_speech_timer.cancel()
             self._max_speech_timer = None
@@ -419,9 +342,30 @@ class SessionBHandler:
         item = event.get("item", {})
         item_id = item.get("id", "")
         if item_id:
-            self._conversation_item_ids.append(item_id)
+            if item.get("type") == "message" and item.get("role") == "user":
+                self._unanswered_item_ids.add(item_id)
+            self._ledger.add(item, protected=self._unanswered_item_ids)
+
+    async def _handle_audio_committed(self, event: dict[str, Any]) -> None:
+        """Local VAD commit 완료 → 생성된 입력 아이템을 commit한 턴에 귀속 (commit 순서대로 도착)."""
+        item_id = event.get("item_id", "")
+        if item_id and self._turns_awaiting_commit:
+            self._turns_awaiting_commit.popleft().item_ids.add(item_id)
+
+    async def _handle_commit_error(self, event: dict[str, Any]) -> None:
+        """빈 버퍼 commit 실패 → 아이템이 생기지 않으므로 대기 중인 귀속 슬롯을 버린다."""
+        if event.get("error", {}).get("code") == "input_audio_buffer_commit_empty" and self._turns_awaiting_commit:
+            self._turns_awaiting_commit.popleft()
+
+    async def _handle_response_created(self, event: dict[str, Any]) -> None:
+        """응답 생성 시작 → 그 전에 생성된 사용자 입력 아이템은 응답에 포함됨.
+
+        서버는 이벤트를 순서대로 처리하므로 response.create 이전에 commit된 입력의
+        conversation.item.created는 항상 response.created보다 먼저 도착한다.
+        """
+        self._unanswered_item_ids.clear()
 
-    async def _prune_conversation_items(self, keep_last: int = 1) -> None:
+    async def _prune_conversation_items(self, keep_last: int = 1, keep_unanswered: bool = False) -> None:
         """이전 턴의 대화 아이템을 삭제하여 컨텍스트 기반 할루시네이션을 방지한다.
 
         GPT-4o Realtime은 세션 내 대화 아이템이 누적되면 오디오 대신
@@ -431,21 +375,17 @@ class SessionBHandler:
 
         Args:
             keep_last: 유지할 최근 아이템 수 (1 = 최신 컨텍스트 주입 아이템만 유지)
+            keep_unanswered: True면 아직 응답하지 않은 사용자 입력(큐 대기 턴의 오디오)을 보존
         """
-        if len(self._conversation_item_ids) <= keep_last:
-            return
-        if keep_last > 0:
-            to_delete = self._conversation_item_ids[:-keep_last]
-            self._conversation_item_ids = self._conversation_item_ids[-keep_last:]
-        else:
-            to_delete = self._conversation_item_ids[:]
-            self._conversation_item_ids = []
-        for item_id in to_delete:
-            try:
-                await self.session.delete_item(item_id)
-            except Exception:
-                logger.debug("[SessionB] Failed to delete item %s", item_id)
-        logger.info("[SessionB] Pruned %d old conversation items (kept %d)", len(to_delete), keep_last)
+        # 삭제 이벤트는 세션 전송 큐에서 일괄 전송 (다음 이벤트보다 먼저 나감)
+        deleted = self._ledger.prune(keep_last, protected=self._unanswered_item_ids if keep_unanswered else ())
+        if deleted:
+            logger.info("[SessionB] Pruned %d old conversation items (kept %d)", deleted, keep_last)
+
+    @property
+    def conversation_size(self) -> dict[str, int]:
+        """Session B live 대화 크기 (아이템 수, 토큰 근사치)."""
+        return self._ledger.stats()
 
     # --- 수신자 오디오 입력 (Twilio → Session B) ---
 
@@ -532,6 +472,7 @@ class SessionBHandler:
         self._speech_started_count += 1
         self._is_recipient_speaking = True
         self._speech_started_at = time.time()
+        self._first_caption_pending = True
         self._timeout_forced = False
 
         # 로컬 버퍼 타임스탬프 보정 (drift 방지)
@@ -605,6 +546,7 @@ class SessionBHandler:
         # speech_duration 기록 (노이즈 필터 통과 후)
         if self._call and self._speech_started_at > 0:
             self._call.call_metrics.session_b_speech_durations_ms.append(speech_duration * 1000)
+        self._observe_speculative_outcome(speech_duration)
 
         logger.info("[SessionB] Local VAD speech stopped (%.0fms, peak RMS=%.0f)", speech_duration * 1000, peak_rms)
 
@@ -706,14 +648,24 @@ class SessionBHandler:
             return
         await self._save_transcript_and_notify(text)
 
-    async def _save_transcript_and_notify(self, transcript: str) -> None:
-        """번역 완료 텍스트를 저장하고 컨텍스트 콜백을 호출한다."""
+    async def _save_transcript_and_notify(self, transcript: str, speculative: bool = False) -> None:
+        """번역 완료 텍스트를 저장하고 컨텍스트 콜백을 호출한다.
+
+        detached 핸들러로 실행되므로(STT 대기 중 다음 턴이 시작될 수 있음)
+        커밋 타임스탬프를 진입 시점에 스냅샷하여 해당 턴 기준으로 메트릭을 기록한다.
+        speculative=True면 Part 1 선행 번역을 사용한 턴 (처리 지연을 별도 리스트에도 기록).
+        """
+        committed_started_at = self._committed_speech_started_at
+        committed_stopped_at = self._committed_speech_stopped_at
         # STT↔번역 순서 경쟁 방지: STT 블록리스트 판정 완료까지 대기
         # (번역이 STT보다 먼저 도착하면 _stt_blocked가 아직 설정되지 않아 우회됨)
+        self._stt_gate_waiters += 1
         try:
             await asyncio.wait_for(self._stt_check_done.wait(), timeout=2.0)
         except asyncio.TimeoutError:
             logger.warning("[SessionB] STT check wait timeout (2s) — proceeding without blocklist gate")
+        finally:
+            self._stt_gate_waiters -= 1
         # STT 블록리스트/노이즈 매칭 시 대응하는 번역도 차단
         if self._stt_blocked:
             self._stt_blocked = False
@@ -725,50 +677,31 @@ class SessionBHandler:
 
         # --- Stage 2 Anti-Hallucination 필터 ---
 
-        # 1) [unclear] 변형 패턴 필터링 (모델이 다양한 표현으로 "못 알아들었다"를 출력)
-        transcript_lower = transcript.lower()
-        if any(phrase in transcript_lower for phrase in _UNCLEAR_PHRASES):
-            logger.info("[SessionB] Unclear marker filtered: %s", transcript[:80])
-            self._pending_stt_ms = 0.0
-            if self._call:
-                self._call.call_metrics.hallucinations_blocked += 1
-            return
-
+        # 1) [unclear] 변형 (모델이 다양한 표현으로 "못 알아들었다"를 출력)
         # 2) STT 블록리스트 재적용 (구두점 정규화: "감사합니다!" → "감사합니다")
-        if _normalize_for_blocklist(transcript) in _STT_HALLUCINATION_BLOCKLIST:
-            logger.warning("[SessionB] Translation hallucination blocked: %s", transcript[:80])
-            self._pending_stt_ms = 0.0
-            if self._call:
-                self._call.call_metrics.hallucinations_blocked += 1
-            return
-
-        # 2b) 영어 번역 할루시네이션 필터 (target_language=en)
-        if self._call and self._call.target_language.startswith("en"):
-            normalized = _normalize_for_blocklist(transcript)
-            if normalized in _STT_HALLUCINATION_BLOCKLIST_EN:
-                logger.warning("[SessionB] EN translation hallucination blocked: %s", transcript[:80])
-                self._pending_stt_ms = 0.0
-                if self._call:
-                    self._call.call_metrics.hallucinations_blocked += 1
-                return
-            if _is_english_short_hallucination(transcript):
-                logger.warning("[SessionB] EN short translation blocked: %s", transcript[:80])
-                self._pending_stt_ms = 0.0
-                if self._call:
-                    self._call.call_metrics.hallucinations_blocked += 1
-                return
-
-        # 3) 반복 패턴 감지 (동일 토큰 3회 이상 연속 반복)
-        if _REPETITION_RE.search(transcript):
-            logger.warning("[SessionB] Repetition hallucination blocked: %s", transcript[:80])
+        # 2b) 영어 번역 할루시네이션 (target_language=en일 때 — 번역이 한국어여야 하는데 영어=할루시네이션)
+        # 3) 반복 패턴 (동일 토큰 3회 이상 연속 반복)
+        # 번역 출력은 User 언어(source_language) 텍스트 — 영어 수신자일 때만 그 언어로 매칭해
+        # 영어 필러 규칙(foreign)을 적용하고, 아니면 always 규칙만 적용
+        english_recipient = bool(self._call and self._call.target_language.startswith("en"))
+        matcher = get_stt_matcher(self._call.source_language if english_recipient else "")
+        hits = matcher.match(transcript)
+        blocked = next(
+            (h for reason in _OUTPUT_BLOCK_REASONS for h in hits if h.reason == reason), None
+        )
+        if blocked:
+            logger.warning(
+                "[SessionB] Translation hallucination blocked (%s%s): %s",
+                blocked.reason, f"/{blocked.language}" if blocked.language else "", transcript[:80],
+            )
             self._pending_stt_ms = 0.0
             if self._call:
                 self._call.call_metrics.hallucinations_blocked += 1
             return
 
         # 4) 발화 길이 대비 번역 비율 검증 (짧은 입력 + 긴 번역 = 추측)
-        if self._committed_speech_started_at > 0 and self._committed_speech_stopped_at > 0:
-            speech_s = self._committed_speech_stopped_at - self._committed_speech_started_at
+        if committed_started_at > 0 and committed_stopped_at > 0:
+            speech_s = committed_stopped_at - committed_started_at
             if speech_s > 0 and len(transcript) / speech_s > settings.hallucination_max_chars_per_sec:
                 logger.warning(
                     "[SessionB] Suspicious translation rate (%.1f chars/%.1fs = %.1f c/s): %s",
@@ -783,8 +716,8 @@ class SessionBHandler:
         if self._call:
             self._call.call_metrics.vad_false_triggers = max(0, self._speech_started_count - self._transcript_completed_count)
 
-        if self._committed_speech_started_at > 0:
-            e2e_ms = (time.time() - self._committed_speech_started_at) * 1000
+        if committed_started_at > 0:
+            e2e_ms = (time.time() - committed_started_at) * 1000
             # 5) 최소 e2e 필터: 물리적으로 불가능한 속도의 응답 → 할루시네이션
             if e2e_ms < _MIN_E2E_MS:
                 logger.warning(
@@ -809,9 +742,11 @@ class SessionBHandler:
                 self._pending_stt_ms = 0.0
                 self._call.call_metrics.turn_count += 1
                 # processing latency: speech_stopped → 번역 완료 (STT와 독립적)
-                if self._committed_speech_stopped_at > 0:
-                    proc_ms = (time.time() - self._committed_speech_stopped_at) * 1000
+                if committed_stopped_at > 0:
+                    proc_ms = (time.time() - committed_stopped_at) * 1000
                     self._call.call_metrics.session_b_processing_latencies_ms.append(proc_ms)
+                    if speculative:
+                        self._call.call_metrics.session_b_speculative_processing_ms.append(proc_ms)
         else:
             logger.info("[SessionB] Translation complete: %s", transcript[:80])
 
@@ -838,34 +773,35 @@ class SessionBHandler:
             await self._on_caption_done()
 
         # 커밋 타임스탬프 리셋 (live timestamps는 speech 이벤트가 관리)
-        self._committed_speech_started_at = 0.0
-        self._committed_speech_stopped_at = 0.0
+        # 대기 중 다음 턴이 스냅샷을 갱신했으면 덮어쓰지 않음
+        if self._committed_speech_started_at == committed_started_at:
+            self._committed_speech_started_at = 0.0
+            self._committed_speech_stopped_at = 0.0
         self._pending_stt_ms = 0.0
 
     async def _handle_response_done(self, event: dict[str, Any]) -> None:
         """Session B 응답 완료 + cost token 추적."""
         self._is_response_active = False
         self._response_done_event.set()
-        self._stt_blocked = False  # 안전 리셋
-        self._stt_check_done.set()  # 안전 리셋 (STT 이벤트 누락 시 대비)
+        self._turn_scheduler.response_done()
+        # 안전 리셋 (STT 이벤트 누락 시 대비) — 번역 저장이 STT 판정을 대기 중이면
+        # 게이트를 유지하여 뒤늦은 STT completed가 블록리스트 판정을 할 수 있게 함 (2s timeout이 안전망)
+        if not self._stt_gate_waiters:
+            self._stt_blocked = False
+            self._stt_check_done.set()
 
         if self._call:
             response = event.get("response", {})
             usage = response.get("usage", {})
             if usage:
-                input_details = usage.get("input_token_details", {})
-                output_details = usage.get("output_token_details", {})
-                tokens = CostTokens(
-                    audio_input=input_details.get("audio_tokens", 0),
-                    text_input=input_details.get("text_tokens", 0),
-                    audio_output=output_details.get("audio_tokens", 0),
-                    text_output=output_details.get("text_tokens", 0),
-                )
+                tokens = CostTokens.from_realtime_usage(usage)
                 self._call.cost_tokens.add(tokens)
                 logger.debug(
-                    "[SessionB] Tokens — audio_in=%d text_in=%d audio_out=%d text_out=%d (total=%d)",
+                    "[SessionB] Tokens — audio_in=%d text_in=%d audio_out=%d text_out=%d "
+                    "cached_in=%d (total=%d)",
                     tokens.audio_input, tokens.text_input,
                     tokens.audio_output, tokens.text_output,
+                    tokens.cached_audio_input + tokens.cached_text_input,
                     self._call.cost_tokens.total,
                 )
 
@@ -881,6 +817,7 @@ class SessionBHandler:
         self._is_recipient_speaking = True
         self._speech_started_count += 1
         self._speech_started_at = time.time()
+        self._first_caption_pending = True
         self._timeout_forced = False  # 새 발화 시작 → timeout 플래그 초기화
 
         # 로컬 버퍼 타임스탬프 보정 (drift 방지)
@@ -920,6 +857,9 @@ class SessionBHandler:
         self._speech_stopped_at = time.time()
         self._cancel_silence_timeout()
         self._cancel_speculative_stt()
+        # Server VAD auto-commit으로 생성될 입력 아이템 → 다음 Realtime 턴에 귀속
+        if not self._chat_translator and event.get("item_id"):
+            self._turn_item_ids.append(event["item_id"])
 
         # Speculative STT: Server VAD auto-commit의 STT를 즉시 추적
         # debounce(300ms) 중 STT가 먼저 도착하는 race condition 방지
@@ -940,6 +880,7 @@ class SessionBHandler:
         # speech_duration 기록 (노이즈 필터 통과 후)
         if self._call and self._speech_started_at > 0:
             self._call.call_metrics.session_b_speech_durations_ms.append(speech_duration * 1000)
+        self._observe_speculative_outcome(speech_duration)
 
         logger.info("[SessionB] Recipient speech stopped (%.0fms)", speech_duration * 1000)
 
@@ -969,86 +910,137 @@ class SessionBHandler:
         commit_audio_only() 후 STT 완료 대기 → Chat API 번역 → 캡션 전송.
         Realtime API의 response.create는 호출하지 않는다.
 
-        conversation_already_has_active_response 방지:
-        이전 응답이 아직 생성 중이면 완료 대기 후 새 응답을 생성한다.
+        Realtime 응답 모드: commit 후 턴을 _turn_scheduler에 제출한다.
+        이전 응답이 생성 중이면 STT는 바로 진행되고 response.create만 완료 후로 미뤄진다
+        (conversation_already_has_active_response 방지).
         """
         try:
             await asyncio.sleep(self._response_debounce_s)
 
-            # 이전 응답 생성 중이면 완료 대기 (최대 5초)
-            if self._is_response_active:
-                logger.info("[SessionB] Waiting for previous response to complete before new create_response...")
-                try:
-                    await asyncio.wait_for(self._response_done_event.wait(), timeout=5.0)
-                except asyncio.TimeoutError:
-                    logger.warning("[SessionB] Previous response wait timeout (5s) — proceeding anyway")
-
-            # 이전 턴의 대화 아이템 삭제 → GPT-4o가 현재 오디오에만 집중
-            # T2V: keep_last=0 (컨텍스트 기반 추측 방지), V2V: keep_last=1
-            await self._prune_conversation_items(keep_last=self._context_prune_keep)
-
-            # 메트릭용 타임스탬프 스냅샷 (새 speech_started 덮어쓰기 전 고정)
-            self._committed_speech_started_at = self._speech_started_at
-            self._committed_speech_stopped_at = self._speech_stopped_at
-
-            if self._chat_translator:
-                # --- Chat API 번역 경로 (T2V/Agent) ---
-                if self._speculative_committed:
-                    # Part 1은 speculative commit이 이미 처리 중
-                    if self._use_local_vad:
-                        # Local VAD: Part 2 수동 commit + STT 추적 (speech-only)
-                        await self._commit_speech_only_audio()
-                        self._pending_stt_count += 1
-                        self._stt_ready_event.clear()
-                    # Server VAD: speech_stopped에서 이미 auto-commit + count 증가됨
-                    logger.info(
-                        "[SessionB] Speculative STT: final commit for remaining audio (pending=%d)",
-                        self._pending_stt_count,
-                    )
-                elif self._use_local_vad:
-                    # 기존 Local VAD 경로 (speculative 미발동 — 짧은 발화)
-                    logger.info(
-                        "[SessionB] Debounce complete (%.0fms) — committing audio for STT (Chat API path, local VAD)",
-                        self._response_debounce_s * 1000,
-                    )
-                    await self._commit_speech_only_audio()
-                    self._pending_stt_count += 1
-                    self._stt_ready_event.clear()
-                else:
-                    # Server VAD + no speculative → 기존 동작 유지
-                    logger.info(
-                        "[SessionB] Debounce complete (%.0fms) — waiting for STT (Chat API path)",
-                        self._response_debounce_s * 1000,
-                    )
-                await self._translate_via_chat_api()
-            else:
+            if not self._chat_translator:
                 # --- 기존 Realtime API 경로 (V2V) ---
                 if self._use_local_vad:
                     logger.info(
-                        "[SessionB] Debounce complete (%.0fms) — committing audio + creating response (local VAD)",
+                        "[SessionB] Debounce complete (%.0fms) — committing audio + scheduling response (local VAD)",
                         self._response_debounce_s * 1000,
                     )
                     await self.session.commit_audio_only()
                 else:
                     logger.info(
-                        "[SessionB] Debounce complete (%.0fms) — creating response",
+                        "[SessionB] Debounce complete (%.0fms) — scheduling response",
                         self._response_debounce_s * 1000,
                     )
+                await self._turn_scheduler.submit(self._new_turn())
+                return
+
+            # --- Chat API 번역 경로 (T2V/Agent) ---
+            # 이전 턴의 대화 아이템 삭제 (T2V: keep_last=0 — 컨텍스트 기반 추측 방지)
+            await self._prune_conversation_items(keep_last=self._context_prune_keep)
+
+            # 메트릭용 타임스탬프 스냅샷 (새 speech_started 덮어쓰기 전 고정)
+            self._committed_speech_started_at = self._speech_started_at
+            self._committed_speech_stopped_at = self._speech_stopped_at
 
-                self._stt_check_done.clear()  # STT 블록리스트 판정 완료까지 번역 대기
-                self._is_response_active = True
-                self._response_done_event.clear()
-                await self.session.create_response(instructions=self._translation_instruction)
+            if self._speculative_committed:
+                # Part 1은 speculative commit이 이미 처리 중
+                if self._use_local_vad:
+                    # Local VAD: Part 2 수동 commit + STT 추적 (speech-only)
+                    await self._commit_speech_only_audio()
+                    self._pending_stt_count += 1
+                    self._stt_ready_event.clear()
+                # Server VAD: speech_stopped에서 이미 auto-commit + count 증가됨
+                logger.info(
+                    "[SessionB] Speculative STT: final commit for remaining audio (pending=%d)",
+                    self._pending_stt_count,
+                )
+            elif self._use_local_vad:
+                # 기존 Local VAD 경로 (speculative 미발동 — 짧은 발화)
+                logger.info(
+                    "[SessionB] Debounce complete (%.0fms) — committing audio for STT (Chat API path, local VAD)",
+                    self._response_debounce_s * 1000,
+                )
+                await self._commit_speech_only_audio()
+                self._pending_stt_count += 1
+                self._stt_ready_event.clear()
+            else:
+                # Server VAD + no speculative → 기존 동작 유지
+                logger.info(
+                    "[SessionB] Debounce complete (%.0fms) — waiting for STT (Chat API path)",
+                    self._response_debounce_s * 1000,
+                )
+            await self._translate_via_chat_api()
         except asyncio.CancelledError:
             logger.debug("[SessionB] Debounced response creation cancelled")
         except Exception:
             logger.exception("[SessionB] Error in debounced response creation")
 
+    async def _dispatch_realtime_turns(self, turns: list[PendingTurn]) -> None:
+        """스케줄러 디스패치: 대기 턴(들)에 대한 Realtime 응답 생성을 요청한다.
+
+        여러 턴이 쌓였으면 하나의 응답으로 병합한다 (모두 같은 대화에 commit되어 있음).
+        대기 중 도착한 STT 판정(원문/차단)은 턴에 보관되어 있다가 여기서 적용된다.
+        """
+        # 이전 턴의 대화 아이템 삭제 → GPT-4o가 현재 오디오에만 집중 (대기 턴의 입력은 보존)
+        await self._prune_conversation_items(
+            keep_last=self._context_prune_keep, keep_unanswered=True
+        )
+
+        # 메트릭용 타임스탬프 스냅샷 (병합 시 첫 턴 시작 ~ 마지막 턴 종료)
+        self._committed_speech_started_at = turns[0].speech_started_at
+        self._committed_speech_stopped_at = turns[-1].speech_stopped_at
+
+        received = [t for t in turns if t.stt_received]
+        if received:
+            stt = " ".join(t.recipient_stt for t in received if t.recipient_stt)
+            if stt:
+                self._last_recipient_stt = stt
+            self._stt_blocked = all(t.stt_blocked for t in received)
+        if len(received) < len(turns):
+            self._stt_check_done.clear()  # STT 블록리스트 판정 완료까지 번역 대기
+        self._is_response_active = True
+        self._response_done_event.clear()
+        await self.session.create_response(instructions=self._translation_instruction)
+
+    def _record_turn_queue_delay(self, delay_ms: float) -> None:
+        if self._call:
+            self._call.call_metrics.session_b_turn_queue_delay_ms.append(delay_ms)
+
+    def _new_turn(self) -> PendingTurn:
+        """Realtime 응답 턴 생성 + 입력 아이템 귀속.
+
+        Server VAD 턴은 speech_stopped에서 모은 item_id를 바로 가진다.
+        Local VAD 턴은 방금 수동 commit했으므로 committed 이벤트의 item_id를 기다린다.
+        """
+        turn = PendingTurn(
+            self._speech_started_at, self._speech_stopped_at, item_ids=set(self._turn_item_ids)
+        )
+        self._turn_item_ids.clear()
+        if self._use_local_vad:
+            self._turns_awaiting_commit.append(turn)
+        return turn
+
+    def _queued_turn(self, item_id: str) -> PendingTurn | None:
+        """STT 아이템이 속한 대기 턴 (Realtime 경로에서 이전 응답 생성 중 commit된 입력).
+
+        아이템이 큐의 어느 턴에도 없으면(진행 중인 턴의 늦은 STT 등) None.
+        """
+        if self._chat_translator or not item_id:
+            return None
+        return self._turn_scheduler.find_pending(item_id)
+
+    def _mark_stt_blocked(self, queued: PendingTurn | None) -> None:
+        """STT 차단 → 대응하는 번역도 차단 (대기 턴이면 디스패치 시 적용)."""
+        if queued is not None:
+            queued.stt_blocked = True
+        else:
+            self._stt_blocked = True
+
     async def _translate_via_chat_api(self) -> None:
         """Chat API를 통해 누적 STT→번역을 수행하고 캡션/transcript를 전송한다.
 
         Flow: _stt_ready_event 대기 → 누적 STT 텍스트 결합 → ChatTranslator.translate() → 캡션 + transcript 저장.
         연속 발화 시 여러 세그먼트의 STT가 _stt_texts에 누적되어 완전한 문장으로 번역된다.
+        Part 1 선행 번역이 있으면 나머지 STT만 이어 번역하여 결합한다 (_translate_with_prefix).
 
         _debounced_create_response()와 _silence_timeout_handler()에서 호출된다.
         실패 시 에러 로그만 남기고 해당 턴을 skip한다 (Realtime API fallback 없음).
@@ -1060,6 +1052,7 @@ class SessionBHandler:
             logger.warning("[SessionB] Chat API: STT wait timeout (10s) — skipping turn")
             self._stt_texts.clear()
             self._pending_stt_count = 0
+            self._reset_prefix_translation()
             return
 
         # 누적된 STT 텍스트를 결합하여 완전한 문장으로 번역
@@ -1069,45 +1062,265 @@ class SessionBHandler:
         if not stt_text:
             self._stt_texts.clear()
             self._pending_stt_count = 0
+            self._reset_prefix_translation()
             logger.info("[SessionB] Chat API: empty STT (all filtered) — skipping turn")
             return
 
         # 누적 원본 텍스트를 bilingual transcript용으로 저장
         self._last_recipient_stt = stt_text
 
+        # Part 1 선행 번역 (발화 중 시작) — 유효하면 나머지만 이어 번역
+        prefix = await self._take_prefix_translation()
+
         # Chat API 번역 — clear는 translate 완료 후 (취소 시 데이터 보존)
-        result = await self._chat_translator.translate(stt_text)
+        streamed = False
+        if prefix is not None:
+            try:
+                result = await self._translate_with_prefix(*prefix, full_text=stt_text)
+            except asyncio.CancelledError:
+                if self._prefix_streamed:
+                    await self._supersede_streamed_caption()
+                raise
+            streamed = self._prefix_streamed
+        elif self._stream_translation:
+
+            async def on_delta(delta: str) -> None:
+                nonlocal streamed
+                # 번역 캡션 델타 전송 (output 억제 중이 아닌 경우)
+                if not self._output_suppressed and self._on_caption:
+                    streamed = True
+                    await self._on_caption("recipient", delta)
+
+            try:
+                result = await self._chat_translator.translate_stream(stt_text, on_delta)
+            except asyncio.CancelledError:
+                # 새 발화가 번역을 대체 — 누적 STT는 보존, 이미 보낸 부분 자막은 폐기
+                if streamed:
+                    await self._supersede_streamed_caption()
+                raise
+        else:
+            result = await self._chat_translator.translate(stt_text)
         self._stt_texts.clear()
         self._pending_stt_count = 0
+        self._reset_prefix_translation()
 
         if result is None:
             logger.error("[SessionB] Chat API translation failed — skipping turn")
+            if streamed:
+                await self._supersede_streamed_caption()
             return
 
         logger.info(
-            "[SessionB] Chat API translation (%.0fms, in=%d, out=%d): %s → %s",
-            result.latency_ms, result.input_tokens, result.output_tokens,
+            "[SessionB] Chat API translation (%.0fms, ttft=%.0fms, in=%d, cached=%d, out=%d): %s → %s",
+            result.latency_ms, result.ttft_ms, result.input_tokens, result.cached_input_tokens,
+            result.output_tokens,
             stt_text[:40], result.translated_text[:40],
         )
 
-        # 토큰 비용 기록
+        # 토큰 비용 + 지연 기록
         if self._call:
             self._call.cost_tokens.chat_input += result.input_tokens
             self._call.cost_tokens.chat_output += result.output_tokens
-
-        # 번역 캡션 전송 (output 억제 중이 아닌 경우)
-        if not self._output_suppressed and self._on_caption:
+            self._call.cost_tokens.chat_cached_input += result.cached_input_tokens
+            self._call.call_metrics.session_b_chat_completion_ms.append(result.latency_ms)
+            if result.cached_input_tokens:
+                self._call.call_metrics.session_b_chat_cached_completion_ms.append(result.latency_ms)
+            if result.ttft_ms > 0:
+                self._call.call_metrics.session_b_chat_ttft_ms.append(result.ttft_ms)
+            if result.hedged:
+                self._call.call_metrics.chat_translation_hedged += 1
+            if result.hedge_won:
+                self._call.call_metrics.chat_translation_hedge_wins += 1
+            if result.cached:
+                self._call.call_metrics.chat_translation_cache_hits += 1
+
+        # 번역 캡션 전송 (스트리밍 시 델타로 이미 전송됨, output 억제 중이 아닌 경우)
+        if not streamed and not self._output_suppressed and self._on_caption:
             await self._on_caption("recipient", result.translated_text)
 
         # 번역 완료 처리 (transcript 저장 + 메트릭 + caption_done)
-        await self._save_transcript_and_notify(result.translated_text)
+        await self._save_transcript_and_notify(
+            result.translated_text, speculative=prefix is not None and self._prefix_reused
+        )
+
+    # --- Speculative 번역 (Part 1 STT 선행 번역) ---
+
+    def _maybe_start_prefix_translation(self) -> None:
+        """발화 중 Part 1 STT가 모두 도착하면 선행 번역을 시작한다.
+
+        speculative commit의 STT가 발화 종료 전에 도착한 경우에만 발동한다
+        (발화가 이미 끝났으면 최종 번역이 바로 이어지므로 이득이 없음).
+        턴당 1회 — 결과는 _translate_via_chat_api()가 _stt_texts 앞부분과 일치할 때 사용한다.
+        """
+        if not settings.speculative_translation_enabled or not self._chat_translator:
+            return
+        if self._prefix_translation_task is not None:
+            return
+        if not (self._speculative_committed and self._is_recipient_speaking):
+            return
+        if self._pending_stt_count > 0 or not self._stt_texts:
+            return
+        prefix_text = " ".join(self._stt_texts).strip()
+        if not prefix_text:
+            return
+        self._prefix_stt_text = prefix_text
+        self._prefix_stt_count = len(self._stt_texts)
+        self._prefix_started_at = time.monotonic()
+        self._prefix_translation_task = asyncio.create_task(
+            self._chat_translator.translate(prefix_text)
+        )
+        logger.info("[SessionB] Speculative translation started (Part 1): %s", prefix_text[:60])
+
+    async def _take_prefix_translation(self) -> tuple[str, str, ChatTranslationResult] | None:
+        """선행 번역 결과를 (앞부분 원문, 나머지 원문, 선행 결과)로 반환한다.
+
+        _stt_texts 앞부분이 선행 번역 원문과 다르거나 번역이 실패하면 폐기(None)한다.
+        미완료 task는 shield로 대기 — 이 턴이 새 발화로 취소되어도 선행 번역은 유지된다.
+        """
+        task = self._prefix_translation_task
+        if task is None:
+            return None
+        head = " ".join(self._stt_texts[:self._prefix_stt_count]).strip()
+        result: ChatTranslationResult | None = None
+        if head == self._prefix_stt_text:
+            try:
+                result = await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if task.cancelled():
+                    result = None
+                else:
+                    raise
+        if result is None or "[unclear]" in result.translated_text.lower():
+            logger.info("[SessionB] Speculative translation discarded")
+            if self._call:
+                self._call.call_metrics.speculative_translation_misses += 1
+            self._reset_prefix_translation()
+            return None
+        rest = " ".join(self._stt_texts[self._prefix_stt_count:]).strip()
+        return self._prefix_stt_text, rest, result
+
+    async def _translate_with_prefix(
+        self,
+        prefix_text: str,
+        rest_text: str,
+        prefix_result: ChatTranslationResult,
+        full_text: str,
+    ) -> ChatTranslationResult | None:
+        """선행 번역 + 나머지 이어 번역을 결합한 결과를 만든다.
+
+        스트리밍 모드: 선행 번역을 즉시 캡션으로 보낸 뒤 이어 번역 델타를 전송한다.
+        나머지가 없으면(Part 2가 필터링/무음) 선행 번역을 그대로 사용한다.
+        이어 번역이 실패하면 전체 발화(full_text)를 다시 번역한다 (턴 유실 방지).
+        """
+        self._prefix_streamed = False
+        self._prefix_reused = False
+        language = self._chat_translator.target_language
+
+        async def on_delta(delta: str) -> None:
+            if not self._output_suppressed and self._on_caption:
+                self._prefix_streamed = True
+                await self._on_caption("recipient", delta)
+
+        prefix_translation = prefix_result.translated_text
+        if not rest_text:
+            logger.info("[SessionB] Speculative translation reused (no Part 2)")
+            self._record_prefix_reused()
+            if self._stream_translation:
+                await on_delta(prefix_translation)
+            return prefix_result
+
+        if self._stream_translation:
+            await on_delta(prefix_translation)
+            first = True
+
+            async def on_rest_delta(delta: str) -> None:
+                nonlocal first
+                if first:
+                    first = False
+                    delta = _translation_separator(prefix_translation, delta, language) + delta
+                await on_delta(delta)
+
+            rest = await self._chat_translator.translate_stream(
+                rest_text, on_rest_delta, prefix=(prefix_text, prefix_translation)
+            )
+        else:
+            rest = await self._chat_translator.translate(
+                rest_text, prefix=(prefix_text, prefix_translation)
+            )
+        if rest is None:
+            logger.warning("[SessionB] Continuation translation failed — retranslating full utterance")
+            if self._call:
+                self._call.call_metrics.speculative_translation_misses += 1
+            if self._prefix_streamed:
+                await self._supersede_streamed_caption()
+                self._prefix_streamed = False
+            if self._stream_translation:
+                return await self._chat_translator.translate_stream(full_text, on_delta)
+            return await self._chat_translator.translate(full_text)
+
+        self._record_prefix_reused()
+        if prefix_result.cached and self._call:
+            # 결합 결과는 이어 번역이 Chat API를 호출했으므로 cached=False — 선행 번역의 캐시 hit은 여기서 집계
+            self._call.call_metrics.chat_translation_cache_hits += 1
+        separator = _translation_separator(prefix_translation, rest.translated_text, language)
+        return ChatTranslationResult(
+            translated_text=f"{prefix_translation}{separator}{rest.translated_text}",
+            input_tokens=prefix_result.input_tokens + rest.input_tokens,
+            output_tokens=prefix_result.output_tokens + rest.output_tokens,
+            # 선행 번역 요청부터 이어 번역 완료까지 (end-to-end)
+            latency_ms=(time.monotonic() - self._prefix_started_at) * 1000,
+            ttft_ms=rest.ttft_ms,
+            hedged=rest.hedged,
+            hedge_won=rest.hedge_won,
+            cached_input_tokens=prefix_result.cached_input_tokens + rest.cached_input_tokens,
+        )
+
+    def _record_prefix_reused(self) -> None:
+        self._prefix_reused = True
+        if self._call:
+            self._call.call_metrics.speculative_translation_hits += 1
+
+    def _reset_prefix_translation(self) -> None:
+        """선행 번역 상태를 초기화한다 (미완료 task는 취소)."""
+        if self._prefix_translation_task and not self._prefix_translation_task.done():
+            self._prefix_translation_task.cancel()
+        self._prefix_translation_task = None
+        self._prefix_stt_text = ""
+        self._prefix_stt_count = 0
+
+    async def _supersede_streamed_caption(self) -> None:
+        """스트리밍으로 전송한 부분 번역 자막을 폐기 알림한다."""
+        if self._call:
+            self._call.call_metrics.chat_translations_superseded += 1
+        logger.info("[SessionB] Streamed partial translation superseded")
+        if self._on_caption_superseded:
+            try:
+                await self._on_caption_superseded()
+            except Exception:
+                logger.warning("[SessionB] caption superseded callback failed", exc_info=True)
 
     # --- Speculative STT (발화 중 선행 commit) ---
 
+    async def notify_speech_paused(self) -> None:
+        """Local VAD가 발화 내 쉼을 감지했을 때 호출한다 (SPEAKING 유지).
+
+        단어 경계에서 Part 1을 자르면 STT 정확도가 좋고 타이머보다 일찍 겹칠 수 있으므로,
+        최소 지연이 지났고 아직 speculative commit 전이면 즉시 commit한다.
+        """
+        if not (self._chat_translator and settings.speculative_stt_enabled):
+            return
+        if not self._is_recipient_speaking or self._speculative_committed:
+            return
+        elapsed = time.time() - self._speech_started_at
+        if elapsed < self._speculative_trigger.min_delay_s:
+            return
+        self._cancel_speculative_stt()
+        await self._speculative_commit(reason="pause")
+
     async def _speculative_stt_handler(self) -> None:
         """발화 중간에 오디오를 commit하여 Whisper STT를 선행 시작한다.
 
-        speech_started 후 N초 뒤 발동. 아직 발화 중이면:
+        speech_started 후 N초 뒤 발동 (N은 통화별 발화 길이 분포로 적응). 아직 발화 중이면:
         1. commit_audio_only()로 누적 오디오를 Whisper STT에 전달
         2. _pending_stt_count 증가 → _translate_via_chat_api가 모든 STT 도착까지 대기
         3. OpenAI Realtime API가 commit 시 입력 버퍼를 자동 리셋
@@ -1115,25 +1328,60 @@ class SessionBHandler:
         speech_stopped 시 나머지 오디오가 자동(Server VAD) 또는 수동(Local VAD) commit됨.
         """
         try:
-            await asyncio.sleep(settings.speculative_stt_delay_s)
-            if not self._is_recipient_speaking:
+            # 통화 초기(표본 부족) 또는 적응 비활성: 고정 지연
+            if settings.speculative_stt_adaptive and self._speculative_trigger.adapted:
+                delay_s = self._speculative_trigger.delay_s()
+            else:
+                delay_s = settings.speculative_stt_delay_s
+            if self._call:
+                self._call.call_metrics.speculative_stt_delay_ms.append(delay_s * 1000)
+            await asyncio.sleep(delay_s)
+            if not self._is_recipient_speaking or self._speculative_committed:
                 return
             if not self._chat_translator:
                 return
-
-            await self.session.commit_audio_only()
-            self._pending_stt_count += 1
-            self._stt_ready_event.clear()
-            self._speculative_committed = True
-            self._speculative_commit_time = time.time()
-            if self._call:
-                self._call.call_metrics.speculative_stt_count += 1
-            logger.info("[SessionB] Speculative STT: mid-speech commit (pending=%d)", self._pending_stt_count)
+            await self._speculative_commit(reason="timer")
         except asyncio.CancelledError:
             pass
         except Exception:
             logger.exception("[SessionB] Speculative STT handler error")
 
+    async def _speculative_commit(self, reason: str) -> None:
+        """Part 1 오디오를 commit하고 STT 도착을 추적한다."""
+        # 상태를 먼저 갱신 (commit await 중 pause/timer 중복 발동 방지)
+        self._speculative_committed = True
+        self._speculative_commit_time = time.time()
+        await self.session.commit_audio_only()
+        self._pending_stt_count += 1
+        self._stt_ready_event.clear()
+        if self._call:
+            self._call.call_metrics.speculative_stt_count += 1
+            if reason == "pause":
+                self._call.call_metrics.speculative_stt_pause_triggers += 1
+        logger.info(
+            "[SessionB] Speculative STT: mid-speech commit (%s, %.0fms, pending=%d)",
+            reason, (self._speculative_commit_time - self._speech_started_at) * 1000,
+            self._pending_stt_count,
+        )
+
+    def _observe_speculative_outcome(self, speech_duration: float) -> None:
+        """발화 종료 시 commit 지연 분포를 갱신하고 hit/waste를 기록한다.
+
+        hit: commit 후 남은 발화 ≥ min_gain (Part 1 STT가 발화와 겹침)
+        waste: commit 직후 발화 종료 (추가 STT 호출만 발생)
+        """
+        if not (self._chat_translator and settings.speculative_stt_enabled):
+            return
+        if settings.speculative_stt_adaptive:
+            self._speculative_trigger.observe(speech_duration)
+        if not (self._speculative_committed and self._call):
+            return
+        remaining = self._speech_stopped_at - self._speculative_commit_time
+        if self._speculative_trigger.is_hit(remaining):
+            self._call.call_metrics.speculative_stt_hits += 1
+        else:
+            self._call.call_metrics.speculative_stt_wasted += 1
+
     def _cancel_speculative_stt(self) -> None:
         """실행 중인 speculative STT 타이머를 취소한다."""
         if self._speculative_stt_task and not self._speculative_stt_task.done():
@@ -1166,23 +1414,15 @@ class SessionBHandler:
             self._speech_stopped_at = time.time()  # chars/sec 필터가 작동하도록 설정
             self._timeout_forced = True
 
-            # 이전 응답 생성 중이면 완료 대기 (최대 5초)
-            if self._is_response_active:
-                logger.info("[SessionB] Timeout: waiting for previous response to complete...")
-                try:
-                    await asyncio.wait_for(self._response_done_event.wait(), timeout=5.0)
-                except asyncio.TimeoutError:
-                    logger.warning("[SessionB] Timeout: previous response wait timeout (5s) — proceeding anyway")
-
-            # 이전 턴 아이템 삭제 (debounced_create_response와 동일)
-            await self._prune_conversation_items(keep_last=self._context_prune_keep)
-
-            # 메트릭용 타임스탬프 스냅샷
-            self._committed_speech_started_at = self._speech_started_at
-            self._committed_speech_stopped_at = self._speech_stopped_at
-
             if self._chat_translator:
                 # --- Chat API 번역 경로 ---
+                # 이전 턴 아이템 삭제 (debounced_create_response와 동일)
+                await self._prune_conversation_items(keep_last=self._context_prune_keep)
+
+                # 메트릭용 타임스탬프 스냅샷
+                self._committed_speech_started_at = self._speech_started_at
+                self._committed_speech_stopped_at = self._speech_stopped_at
+
                 if self._use_local_vad:
                     if not self._speculative_committed:
                         # 15초 축적된 노이즈 제거 후 commit (할루시네이션 방지)
@@ -1205,10 +1445,8 @@ class SessionBHandler:
                     await self.session.clear_input_buffer()
                     await self.session.commit_audio_only()
 
-                self._stt_check_done.clear()  # STT 블록리스트 판정 완료까지 번역 대기
-                self._is_response_active = True
-                self._response_done_event.clear()
-                await self.session.create_response(instructions=self._translation_instruction)
+                # 이전 응답 생성 중이면 스케줄러가 완료 후 디스패치
+                await self._turn_scheduler.submit(self._new_turn())
 
             if self._on_recipient_speech_stopped:
                 await self._on_recipient_speech_stopped()
@@ -1219,6 +1457,43 @@ class SessionBHandler:
 
     # --- 2단계 자막 Stage 1: 원문 STT (PRD 5.4) ---
 
+    async def _handle_input_transcription_delta(self, event: dict[str, Any]) -> None:
+        """수신자 원문 STT delta → 잠정 원문 자막 (발화 중 스트리밍).
+
+        delta를 item별로 누적하고, 할루시네이션 필터를 점진 적용한 안정 구간만
+        누적 텍스트로 전달한다 (클라이언트는 잠정 자막을 교체). completed에서 확정/철회.
+        (delta를 스트리밍하는 STT 모델에서만 의미가 있음 — whisper-1은 completed 직전 1회)
+        """
+        item_id = event.get("item_id", "")
+        delta = event.get("delta", "")
+        if not item_id or not delta:
+            return
+        text = self._stt_partials.get(item_id, "") + delta
+        self._stt_partials[item_id] = text
+        if not self._on_original_caption_partial or self._output_suppressed:
+            return
+        target_language = self._call.target_language if self._call else ""
+        visible = _provisional_stt_text(text, target_language, post_echo=self._post_echo)
+        shown = self._stt_partial_shown.get(item_id, "")
+        if visible == shown:
+            return
+        if visible:
+            self._stt_partial_shown[item_id] = visible
+            self._record_first_caption()
+        else:
+            self._stt_partial_shown.pop(item_id, None)
+        await self._on_original_caption_partial("recipient", visible)
+
+    def _record_first_caption(self) -> None:
+        """발화 시작 → 첫 원문 자막(잠정 포함) 지연을 기록한다 (발화당 1회)."""
+        if not self._first_caption_pending or self._speech_started_at <= 0:
+            return
+        self._first_caption_pending = False
+        if self._call:
+            self._call.call_metrics.session_b_first_caption_ms.append(
+                (time.time() - self._speech_started_at) * 1000
+            )
+
     async def _handle_input_transcription_completed(self, event: dict[str, Any]) -> None:
         """수신자 원문 STT 완료 → 즉시 원문 자막 전송 (2단계 자막 Stage 1).
 
@@ -1232,51 +1507,40 @@ class SessionBHandler:
 
         V2V 모드: _stt_check_done을 set하여 _save_transcript_and_notify()의 대기를 해제.
         번역(response.audio_transcript.done)이 STT보다 먼저 도착해도 블록리스트 판정을 보장.
+        STT의 item_id가 큐에 대기 중인 턴의 입력이면 원문/차단 판정을 그 턴에 보관한다
+        (진행 중인 응답의 transcript와 섞이지 않도록).
         """
+        item_id = event.get("item_id", "")
+        # 이전 응답 생성 중 commit된 대기 턴의 STT면 판정을 턴에 보관 (Realtime 경로)
+        queued = self._queued_turn(item_id)
+        # 잠정 자막(STT delta)을 표시했으면 확정 자막으로 교체, 차단/억제 시 철회
+        self._stt_partials.pop(item_id, None)
+        partial_shown = self._stt_partial_shown.pop(item_id, "")
+        finalized = False
         try:
             transcript = event.get("transcript", "")
             if not transcript:
                 if self._chat_translator:
                     self._decrement_pending_stt()
                 return
-            # Whisper STT 할루시네이션 필터링 (구두점 정규화: "감사합니다!" → "감사합니다")
-            if _normalize_for_blocklist(transcript) in _STT_HALLUCINATION_BLOCKLIST:
-                logger.warning("[SessionB] STT hallucination blocked: %s", transcript[:80])
-                self._stt_blocked = True  # 대응하는 번역도 차단 (V2V용)
+            # Whisper STT 할루시네이션 필터 (언어별 컴파일 매처, 모든 규칙 1회 평가)
+            #   - 블록리스트 정확 매칭 (구두점 정규화: "감사합니다!" → "감사합니다")
+            #   - 구조적 노이즈 (자음 스팸, 반복 패턴, 단일 문자)
+            #   - 영어 블록리스트/짧은 필러: 수신자가 영어가 아닐 때만 (target_language=en이면 정상 발화)
+            matcher = get_stt_matcher(self._call.target_language if self._call else "")
+            hits = matcher.match(transcript)
+            blocked = next((h for h in hits if h.reason in _STT_BLOCK_REASONS), None)
+            if blocked:
+                logger.warning(
+                    "[SessionB] STT hallucination blocked (%s%s): %s",
+                    blocked.reason, f"/{blocked.language}" if blocked.language else "", transcript[:80],
+                )
+                self._mark_stt_blocked(queued)  # 대응하는 번역도 차단 (V2V용)
                 if self._call:
                     self._call.call_metrics.hallucinations_blocked += 1
                 if self._chat_translator:
                     self._decrement_pending_stt()  # blocked STT는 누적하지 않되, 카운터는 감소
                 return
-            # 구조적 노이즈 필터 (자음 스팸, 반복 패턴, 단일 문자)
-            if _is_noise_stt(transcript):
-                logger.warning("[SessionB] Noise STT filtered: %s", transcript[:80])
-                self._stt_blocked = True  # 대응하는 번역도 차단 (V2V용)
-                if self._call:
-                    self._call.call_metrics.hallucinations_blocked += 1
-                if self._chat_translator:
-                    self._decrement_pending_stt()
-                return
-            # 영어 할루시네이션 필터 (수신자가 영어가 아닐 때만 적용)
-            # target_language=en이면 수신자가 영어를 말하므로 영어 STT는 정상 → 필터 스킵
-            # target_language=ko/ja/zh 등이면 영어 STT는 Whisper 할루시네이션 → 차단
-            if self._call and not self._call.target_language.startswith("en"):
-                if _normalize_for_blocklist(transcript) in _STT_HALLUCINATION_BLOCKLIST_EN:
-                    logger.warning("[SessionB] EN STT hallucination blocked: %s", transcript[:80])
-                    self._stt_blocked = True
-                    if self._call:
-                        self._call.call_metrics.hallucinations_blocked += 1
-                    if self._chat_translator:
-                        self._decrement_pending_stt()
-                    return
-                if _is_english_short_hallucination(transcript):
-                    logger.warning("[SessionB] EN short hallucination blocked: %s", transcript[:80])
-                    self._stt_blocked = True
-                    if self._call:
-                        self._call.call_metrics.hallucinations_blocked += 1
-                    if self._chat_translator:
-                        self._decrement_pending_stt()
-                    return
             # Post-echo settling 보호: settling 직후 ≤1단어 STT → 노이즈 할루시네이션
             if self._post_echo:
                 # 3초 후 자동 해제: VAD 파편화로 영구 차단 방지
@@ -1285,7 +1549,7 @@ class SessionBHandler:
                     self._post_echo = False
                 elif len(transcript.strip().split()) <= 1:
                     logger.warning("[SessionB] Post-echo STT filtered (<=1 word): %s", transcript[:80])
-                    self._stt_blocked = True
+                    self._mark_stt_blocked(queued)
                     if self._call:
                         self._call.call_metrics.hallucinations_blocked += 1
                     if self._chat_translator:
@@ -1294,40 +1558,38 @@ class SessionBHandler:
                 else:
                     # 유효한 STT (>1단어) 통과 → post_echo 리셋
                     self._post_echo = False
-            # Korean Whisper append-hallucination 감지
-            if self._call and self._call.target_language.startswith("ko"):
-                # 부분 문자열 매칭: 가장 빠른 위치의 매칭을 찾아 trim
-                earliest_idx = len(transcript)
-                earliest_sub = ""
-                for sub in _KO_WHISPER_APPEND_SUBSTRINGS:
-                    idx = transcript.find(sub)
-                    if 0 <= idx < earliest_idx:
-                        earliest_idx = idx
-                        earliest_sub = sub
-                if earliest_sub:
-                    trimmed = transcript[:earliest_idx].rstrip()
-                    if trimmed:
-                        logger.warning("[SessionB] Whisper append trimmed at '%s': ...%s", earliest_sub, trimmed[-30:])
-                        transcript = trimmed
-                    else:
-                        # 전체가 할루시네이션
-                        logger.warning("[SessionB] Whisper append blocked: %s", transcript[:80])
-                        self._stt_blocked = True
-                        if self._call:
-                            self._call.call_metrics.hallucinations_blocked += 1
-                        if self._chat_translator:
-                            self._decrement_pending_stt()
-                        return
-
-                # Trailing fragment 감지: 문장 종결 후 동사 어미 없는 짧은 꼬리
-                m = _KO_TRAILING_FRAGMENT_RE.search(transcript)
-                if m and not _KO_SENTENCE_ENDINGS.search(m.group(1).strip()):
-                    trimmed = transcript[:m.start() + 1].rstrip()
-                    if trimmed:
-                        logger.warning("[SessionB] Trailing fragment removed: '%s'", m.group(1).strip())
-                        transcript = trimmed
-
-            self._last_recipient_stt = transcript  # 번역 품질 평가용 원문 저장 (필터 통과 후)
+            # Whisper append-hallucination 감지 (한국어: native 규칙)
+            # 가장 빠른 위치의 부분 문자열 매칭에서 trim
+            append = next((h for h in hits if h.reason == "append"), None)
+            trailing = next((h for h in hits if h.reason == "trailing_fragment"), None)
+            if append:
+                trimmed = transcript[:append.start].rstrip()
+                if trimmed:
+                    logger.warning("[SessionB] Whisper append trimmed at '%s': ...%s", append.pattern, trimmed[-30:])
+                    transcript = trimmed
+                    trailing = matcher.trailing_fragment(transcript)
+                else:
+                    # 전체가 할루시네이션
+                    logger.warning("[SessionB] Whisper append blocked: %s", transcript[:80])
+                    self._mark_stt_blocked(queued)
+                    if self._call:
+                        self._call.call_metrics.hallucinations_blocked += 1
+                    if self._chat_translator:
+                        self._decrement_pending_stt()
+                    return
+
+            # Trailing fragment 감지: 문장 종결 후 동사 어미 없는 짧은 꼬리
+            if trailing:
+                trimmed = transcript[:trailing.start + 1].rstrip()
+                if trimmed:
+                    logger.warning("[SessionB] Trailing fragment removed: '%s'", trailing.pattern)
+                    transcript = trimmed
+
+            # 번역 품질 평가용 원문 저장 (필터 통과 후)
+            if queued is not None:
+                queued.recipient_stt = f"{queued.recipient_stt} {transcript}".strip()
+            else:
+                self._last_recipient_stt = transcript
 
             # Chat API: STT 텍스트 누적 + 모든 pending commit의 STT 수신 시 대기 해제
             if self._chat_translator:
@@ -1337,11 +1599,12 @@ class SessionBHandler:
                     "[SessionB] STT accumulated (%d texts, %d pending): %s",
                     len(self._stt_texts), self._pending_stt_count, transcript[:60],
                 )
+                self._maybe_start_prefix_translation()
 
             if self._output_suppressed:
                 self._pending_output.append(("original_caption", ("recipient", transcript)))
                 return
-            if self._committed_speech_started_at > 0:
+            if self._committed_speech_started_at > 0 and queued is None:
                 stt_ms = (time.time() - self._committed_speech_started_at) * 1000
                 logger.info("[SessionB] Original STT (Stage 1, stt=%.0fms): %s", stt_ms, transcript[:80])
                 # STT latency를 임시 저장 — E2E 기록 시 함께 append하여 리스트 정합성 보장
@@ -1353,6 +1616,12 @@ class SessionBHandler:
             else:
                 logger.info("[SessionB] Original STT (Stage 1): %s", transcript[:80])
             if self._on_original_caption:
+                finalized = True
+                self._record_first_caption()
                 await self._on_original_caption("recipient", transcript)
         finally:
+            if queued is not None:
+                queued.stt_received = True
             self._stt_check_done.set()
+            if partial_shown and not finalized and self._on_original_caption_partial:
+                await self._on_original_caption_partial("recipient", "")
@@ -10,12 +10,15 @@ PRD 3.2:
 import asyncio
 import json
 import logging
+import time
+import uuid
 from typing import Any, Callable, Coroutine
 
 import websockets
 from websockets.asyncio.client import ClientConnection
 
 from src.config import settings
+from src.realtime.sessions.event_dispatcher import DispatchLagStats, EventDispatcher
 from src.types import CallMode, CommunicationMode, SessionConfig, VadMode
 
 logger = logging.getLogger(__name__)
@@ -23,6 +26,37 @@ logger = logging.getLogger(__name__)
 OPENAI_REALTIME_URL = "wss://api.openai.com/v1/realtime"
 
 
+async def open_realtime_ws(label: str) -> ClientConnection:
+    """OpenAI Realtime API WebSocket을 연결한다 (재시도 포함, 세션 설정 전)."""
+    url = f"{OPENAI_REALTIME_URL}?model={settings.openai_realtime_model}"
+    headers = {
+        "Authorization": f"Bearer {settings.openai_api_key}",
+        "OpenAI-Beta": "realtime=v1",
+    }
+
+    logger.info("[%s] Connecting to OpenAI Realtime API...", label)
+    max_attempts = settings.openai_ws_connect_retries + 1
+    attempt = 1
+    while True:
+        try:
+            ws = await websockets.connect(
+                url,
+                additional_headers=headers,
+                open_timeout=settings.openai_ws_connect_timeout_s,
+            )
+            logger.info("[%s] Connected", label)
+            return ws
+        except Exception as e:
+            if attempt >= max_attempts:
+                raise
+            logger.warning(
+                "[%s] Connect attempt %d/%d failed: %s — retrying...",
+                label, attempt, max_attempts, e,
+            )
+            attempt += 1
+            await asyncio.sleep(1)
+
+
 class RealtimeSession:
     """단일 OpenAI Realtime API WebSocket 세션."""
 
@@ -32,14 +66,36 @@ class RealtimeSession:
         self.ws: ClientConnection | None = None
         self.session_id: str = ""
         self._closed = False
+        # 마지막으로 추가한 컨텍스트 아이템 ID (삭제/재연결 시 비움 → 컨텍스트 재주입 판단)
+        self.context_item_id: str = ""
+        # 대화 아이템 일괄 삭제 큐: 백그라운드 전송, 다음 이벤트 전송 전 반드시 먼저 flush
+        self._pending_deletes: list[str] = []
+        self._delete_lock = asyncio.Lock()
+        self._delete_flush_task: asyncio.Task | None = None
         self._handlers: dict[str, list[Callable[..., Coroutine]]] = {}
         self._on_connection_lost: Callable[[], Coroutine] | None = None
+        # 이벤트 디스패치: lane별 worker + detached 핸들러 + 타입별 lag 통계
+        self._detached_handlers: set[tuple[str, Callable[..., Coroutine]]] = set()
+        self._dispatcher: EventDispatcher | None = None
+        self.dispatch_lag: dict[str, DispatchLagStats] = {}
 
-    def on(self, event_type: str, handler: Callable[..., Coroutine]) -> None:
-        """이벤트 핸들러 등록 (중복 방지)."""
+    def on(
+        self,
+        event_type: str,
+        handler: Callable[..., Coroutine],
+        detached: bool = False,
+    ) -> None:
+        """이벤트 핸들러 등록 (중복 방지).
+
+        Args:
+            detached: True이면 별도 task로 실행한다 (수초 대기할 수 있는 핸들러용).
+                      lane 순서 보장 대상에서 제외되므로 핸들러가 상태를 직접 스냅샷해야 한다.
+        """
         handlers = self._handlers.setdefault(event_type, [])
         if handler not in handlers:
             handlers.append(handler)
+        if detached:
+            self._detached_handlers.add((event_type, handler))
 
     def set_on_connection_lost(self, handler: Callable[[], Coroutine]) -> None:
         """연결 종료 콜백 등록 (Recovery에서 사용)."""
@@ -49,43 +105,31 @@ class RealtimeSession:
         self,
         system_prompt: str,
         tools: list[dict[str, Any]] | None = None,
+        ws: ClientConnection | None = None,
     ) -> None:
         """OpenAI Realtime API에 WebSocket 연결하고 세션을 설정한다.
 
         Args:
             system_prompt: 시스템 프롬프트
             tools: Function Calling 도구 목록 (Agent Mode에서만 사용)
+            ws: 세션 풀에서 가져온 연결 (있으면 핸드셰이크 생략, session.update만 전송)
         """
         self._closed = False
-        url = f"{OPENAI_REALTIME_URL}?model={settings.openai_realtime_model}"
-        headers = {
-            "Authorization": f"Bearer {settings.openai_api_key}",
-            "OpenAI-Beta": "realtime=v1",
-        }
-
-        logger.info("[%s] Connecting to OpenAI Realtime API...", self.label)
-        last_err: Exception | None = None
-        for attempt in range(1, settings.openai_ws_connect_retries + 2):  # 1 + retries
-            try:
-                self.ws = await websockets.connect(
-                    url,
-                    additional_headers=headers,
-                    open_timeout=settings.openai_ws_connect_timeout_s,
-                )
-                break
-            except Exception as e:
-                last_err = e
-                max_attempts = settings.openai_ws_connect_retries + 1
-                if attempt < max_attempts:
-                    logger.warning(
-                        "[%s] Connect attempt %d/%d failed: %s — retrying...",
-                        self.label, attempt, max_attempts, e,
-                    )
-                    await asyncio.sleep(1)
-                else:
-                    raise last_err
-        logger.info("[%s] Connected", self.label)
+        self.context_item_id = ""
+        self._pending_deletes.clear()  # 새 연결에는 이전 대화 아이템이 없음
+        if ws is not None:
+            self.ws = ws
+            logger.info("[%s] Using pre-warmed connection from session pool", self.label)
+        else:
+            self.ws = await open_realtime_ws(self.label)
+        await self.configure(system_prompt, tools)
 
+    async def configure(
+        self,
+        system_prompt: str,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """session.update로 프롬프트/포맷/VAD/도구를 설정한다."""
         # 세션 설정
         session_config: dict[str, Any] = {
             "modalities": self.config.modalities,
@@ -105,6 +149,10 @@ class RealtimeSession:
             ),
         }
 
+        # TTS 음성 고정 (필러 오디오 캐시 키와 일치해야 함)
+        if settings.realtime_voice and "audio" in self.config.modalities:
+            session_config["voice"] = settings.realtime_voice
+
         # 2단계 자막: input_audio_transcription 활성화 (PRD 5.4)
         if self.config.input_audio_transcription:
             session_config["input_audio_transcription"] = self.config.input_audio_transcription
@@ -195,28 +243,77 @@ class RealtimeSession:
         """입력 오디오 버퍼를 비운다 (에코 잔여물 제거)."""
         await self._send({"type": "input_audio_buffer.clear"})
 
-    async def cancel_response(self) -> None:
-        """현재 진행 중인 응답을 취소한다 (Interrupt 처리)."""
-        await self._send({"type": "response.cancel"})
+    async def create_out_of_band_response(self, text: str, metadata: dict[str, str] | None = None) -> None:
+        """대화 상태에 남지 않는 out-of-band 응답을 요청한다 (conversation="none").
+
+        입력은 text 1개만 사용하므로 기존 대화 아이템의 영향을 받지 않는다.
+        """
+        response: dict[str, Any] = {
+            "conversation": "none",
+            "input": [
+                {
+                    "type": "message",
+                    "role": "user",
+                    "content": [{"type": "input_text", "text": text}],
+                }
+            ],
+        }
+        if metadata:
+            response["metadata"] = metadata
+        await self._send({"type": "response.create", "response": response})
+
+    async def cancel_response(self, response_id: str = "") -> None:
+        """현재 진행 중인 응답을 취소한다 (Interrupt 처리).
+
+        Args:
+            response_id: out-of-band 응답 취소 시 지정 (없으면 기본 대화의 진행 중 응답)
+        """
+        payload: dict[str, Any] = {"type": "response.cancel"}
+        if response_id:
+            payload["response_id"] = response_id
+        await self._send(payload)
         logger.info("[%s] Response cancelled (interrupt)", self.label)
 
+    def queue_item_deletes(self, item_ids: list[str]) -> None:
+        """대화 아이템 삭제를 큐에 넣고 즉시 반환한다 (턴 시작 경로에서 await 없음).
+
+        삭제 이벤트는 백그라운드 task가 한꺼번에 전송하며, 그 전에 다른 이벤트를
+        보내면 _send()가 먼저 flush한다 — 이후 response.create가 삭제 전 아이템을 보지 않음.
+        """
+        if not item_ids:
+            return
+        if self.context_item_id in item_ids:
+            self.context_item_id = ""
+        self._pending_deletes.extend(item_ids)
+        if self._delete_flush_task is None or self._delete_flush_task.done():
+            self._delete_flush_task = asyncio.create_task(self._flush_deletes())
+
     async def delete_item(self, item_id: str) -> None:
         """대화 아이템을 삭제한다 (컨텍스트 누적 방지)."""
+        if item_id == self.context_item_id:
+            self.context_item_id = ""
         await self._send({
             "type": "conversation.item.delete",
             "item_id": item_id,
         })
 
-    async def send_context_item(self, text: str) -> None:
-        """대화 컨텍스트 아이템을 세션에 추가한다."""
+    async def send_context_item(self, text: str) -> str:
+        """대화 컨텍스트 아이템을 세션에 추가하고 아이템 ID를 반환한다.
+
+        ID를 클라이언트에서 지정해 프루닝으로 삭제됐는지 추적한다 (context_item_id).
+        """
+        item_id = f"ctx_{uuid.uuid4().hex[:24]}"
+        self.context_item_id = item_id
         await self._send({
             "type": "conversation.item.create",
             "item": {
+                "id": item_id,
                 "type": "message",
                 "role": "user",
                 "content": [{"type": "input_text", "text": text}],
             },
         })
+        return item_id
 
     async def send_function_call_output(self, call_id: str, output: str) -> None:
         """Function Call의 결과를 OpenAI에 전송한다.
@@ -240,41 +337,51 @@ class RealtimeSession:
         logger.info("[%s] Function call output sent for call_id=%s", self.label, call_id)
 
     async def listen(self) -> None:
-        """WebSocket 메시지를 수신하고 등록된 핸들러를 호출한다."""
+        """WebSocket 메시지를 수신하고 EventDispatcher로 핸들러에 분배한다.
+
+        수신 루프는 파싱 + lane 큐 투입만 수행하므로 느린 핸들러가
+        다음 이벤트 수신을 막지 않는다. 연결 종료 시 큐에 남은 이벤트는 마저 처리한다.
+        """
         if not self.ws:
             return
 
+        dispatcher = EventDispatcher(
+            label=self.label,
+            handlers=self._handlers,
+            detached=self._detached_handlers,
+            lag_stats=self.dispatch_lag,
+        )
+        self._dispatcher = dispatcher
+        dispatcher.start()
+
         try:
-            async for raw in self.ws:
-                if self._closed:
-                    break
+            try:
+                async for raw in self.ws:
+                    if self._closed:
+                        break
 
-                try:
-                    event = json.loads(raw)
-                except json.JSONDecodeError:
-                    continue
+                    try:
+                        event = json.loads(raw)
+                    except json.JSONDecodeError:
+                        continue
 
-                event_type = event.get("type", "")
+                    event_type = event.get("type", "")
 
-                if event_type == "session.created":
-                    self.session_id = event.get("session", {}).get("id", "")
-                    logger.info("[%s] Session created: %s", self.label, self.session_id)
+                    if event_type == "session.created":
+                        self.session_id = event.get("session", {}).get("id", "")
+                        logger.info("[%s] Session created: %s", self.label, self.session_id)
 
-                if event_type == "error":
-                    logger.error("[%s] Error: %s", self.label, event)
+                    if event_type == "error":
+                        logger.error("[%s] Error: %s", self.label, event)
 
-                # 등록된 핸들러 호출
-                for handler in self._handlers.get(event_type, []):
-                    try:
-                        await handler(event)
-                    except Exception:
-                        logger.exception(
-                            "[%s] Handler error for %s", self.label, event_type
-                        )
+                    dispatcher.submit(event)
 
-        except websockets.exceptions.ConnectionClosed:
-            logger.info("[%s] Connection closed", self.label)
+            except websockets.exceptions.ConnectionClosed:
+                logger.info("[%s] Connection closed", self.label)
+            # 이미 수신한 이벤트 처리 (response.done 등 누락 방지)
+            await dispatcher.drain()
         finally:
+            await dispatcher.stop()
             self._closed = True
             if self._on_connection_lost:
                 try:
@@ -282,9 +389,22 @@ class RealtimeSession:
                 except Exception:
                     logger.exception("[%s] on_connection_lost handler error", self.label)
 
+    def dispatch_lag_summary(self) -> dict[str, dict[str, float]]:
+        """이벤트 타입별 dispatch lag 요약 (count, avg_ms, max_ms)."""
+        return {
+            event_type: {
+                "count": stats.count,
+                "avg_ms": round(stats.avg_ms, 1),
+                "max_ms": round(stats.max_ms, 1),
+            }
+            for event_type, stats in self.dispatch_lag.items()
+        }
+
     async def close(self) -> None:
         """세션을 종료한다."""
         self._closed = True
+        if self._dispatcher:
+            self._dispatcher.cancel_detached()
         if self.ws:
             try:
                 await self.ws.close()
@@ -294,9 +414,25 @@ class RealtimeSession:
             logger.info("[%s] Session closed", self.label)
 
     async def _send(self, data: dict[str, Any]) -> None:
+        if self._pending_deletes or self._delete_lock.locked():
+            await self._flush_deletes()
+        await self._write(data)
+
+    async def _write(self, data: dict[str, Any]) -> None:
         if self.ws and not self._closed:
             await self.ws.send(json.dumps(data))
 
+    async def _flush_deletes(self) -> None:
+        """대기 중인 conversation.item.delete를 순서대로 전송한다."""
+        async with self._delete_lock:
+            while self._pending_deletes:
+                item_ids, self._pending_deletes = self._pending_deletes, []
+                for item_id in item_ids:
+                    try:
+                        await self._write({"type": "conversation.item.delete", "item_id": item_id})
+                    except Exception:
+                        logger.debug("[%s] Failed to delete item %s", self.label, item_id)
+
     @property
     def is_closed(self) -> bool:
         return self._closed
@@ -318,6 +454,11 @@ class DualSessionManager:
         self.target_language = target_language
         self.vad_mode = vad_mode
         self.communication_mode = communication_mode
+        # 통화 시작 계측: 연결 소요 시간 + 세션 풀 hit 수
+        self.connect_ms: float = 0.0
+        self.pool_hits: int = 0
+        # start_connect()로 시작한 백그라운드 연결 (Twilio 발신과 병렬)
+        self._connect_task: asyncio.Task | None = None
 
         # Local VAD 활성 시 Session B의 VAD 모드를 LOCAL로 설정
         session_b_vad_mode: VadMode
@@ -338,8 +479,9 @@ class DualSessionManager:
         else:
             session_b_modalities = ["text", "audio"]
 
-        # STT 모델: 전 모드 whisper-1 통일 (할루시네이션 블록리스트 호환 + 레이턴시 최저)
-        stt_model = "whisper-1"
+        # STT 모델: 기본 whisper-1 (할루시네이션 블록리스트 호환 + 레이턴시 최저)
+        # gpt-4o-transcribe 계열로 바꾸면 transcription delta가 스트리밍되어 잠정 원문 자막이 빨라짐
+        stt_model = settings.stt_model
 
         # Session A: User → 수신자 (PRD 3.2 / M-4)
         # Client VAD 시 turn_detection=null (서버가 아닌 클라이언트가 발화 종료 판단)
@@ -387,23 +529,101 @@ class DualSessionManager:
             tools_a: Session A Function Calling 도구 (Agent Mode)
             tools_b: Session B Function Calling 도구 (Agent Mode)
         """
+        started = time.monotonic()
         try:
             await asyncio.gather(
-                self.session_a.connect(prompt_a, tools=tools_a),
-                self.session_b.connect(prompt_b, tools=tools_b),
+                self._connect_session(self.session_a, prompt_a, tools_a),
+                self._connect_session(self.session_b, prompt_b, tools_b),
             )
         except Exception:
             await self.close()
             raise
+        self.connect_ms = (time.monotonic() - started) * 1000
+        logger.info(
+            "Dual session ready in %.0fms (pool hits=%d/2)", self.connect_ms, self.pool_hits
+        )
+
+    def start_connect(
+        self,
+        prompt_a: str,
+        prompt_b: str,
+        tools_a: list[dict[str, Any]] | None = None,
+        tools_b: list[dict[str, Any]] | None = None,
+    ) -> asyncio.Task:
+        """connect()를 백그라운드 task로 시작한다 (Twilio 발신과 병렬 진행).
+
+        Media Stream 핸들러는 wait_until_ready()로 연결 완료를 기다린다.
+        """
+        self._connect_task = asyncio.create_task(
+            self.connect(prompt_a, prompt_b, tools_a=tools_a, tools_b=tools_b)
+        )
+        return self._connect_task
+
+    async def wait_until_ready(self, timeout: float) -> bool:
+        """start_connect()로 시작한 연결이 완료될 때까지 대기한다.
+
+        Returns:
+            연결 성공 시 True, 실패/타임아웃/취소 시 False
+        """
+        task = self._connect_task
+        if task is None:
+            return True
+        try:
+            # shield: 대기 측 타임아웃이 연결 task 자체를 취소하지 않도록
+            await asyncio.wait_for(asyncio.shield(task), timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError, Exception):
+            return False
+        return True
+
+    async def _connect_session(
+        self,
+        session: RealtimeSession,
+        prompt: str,
+        tools: list[dict[str, Any]] | None,
+    ) -> None:
+        """세션 풀에서 사전 연결을 claim하고, 없으면 직접 연결한다."""
+        if not settings.realtime_session_pool_enabled:
+            await session.connect(prompt, tools=tools)
+            return
+
+        from src.realtime.sessions.session_pool import session_pool
+
+        if not session_pool.is_running:
+            await session.connect(prompt, tools=tools)
+            return
+
+        ws = session_pool.claim()
+        if ws is not None:
+            self.pool_hits += 1
+            await session.connect(prompt, tools=tools, ws=ws)
+            return
+        started = time.monotonic()
+        await session.connect(prompt, tools=tools)
+        session_pool.record_miss_latency((time.monotonic() - started) * 1000)
 
     async def close(self) -> None:
         """양쪽 세션을 종료한다."""
+        task = self._connect_task
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
         await asyncio.gather(
             self.session_a.close(),
             self.session_b.close(),
             return_exceptions=True,
         )
 
+    def dispatch_lag_summary(self) -> dict[str, dict[str, float]]:
+        """양쪽 세션의 dispatch lag 요약 ("SessionA/response.done" 형식 키)."""
+        summary: dict[str, dict[str, float]] = {}
+        for session in (self.session_a, self.session_b):
+            for event_type, stats in session.dispatch_lag_summary().items():
+                summary[f"{session.label}/{event_type}"] = stats
+        return summary
+
     async def listen_all(self) -> None:
         """양쪽 세션의 이벤트를 동시에 수신한다."""
         await asyncio.gather(
@@ -0,0 +1,205 @@
+"""Realtime 세션 풀 — 사전 연결된 유휴 WebSocket으로 통화 시작 지연 제거.
+
+start_call은 Session A/B WebSocket 핸드셰이크(TLS + 업그레이드, 수백 ms~수 초)를
+통화마다 수행했다. 풀은 백그라운드에서 연결해 둔 유휴 연결을 보관하고,
+통화 시작 시 claim()으로 꺼내 session.update만 보내 즉시 사용한다.
+
+  - 유지: websockets 자동 ping으로 keep-alive, 끊긴 연결은 정리 루프에서 폐기
+  - 갱신: max_age_s 초과 연결은 교체 (Realtime 세션 최대 수명 + 통화 길이 고려)
+  - 크기: 최근 claim 도착률 × lookahead_s로 목표 유휴 수 산정, [min_idle, max_idle] clamp
+  - 지표: hit/miss, hit rate, claim latency (미스 시 fresh 연결 포함)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+
+from websockets.asyncio.client import ClientConnection
+from websockets.protocol import State
+
+from src.config import settings
+from src.realtime.sessions.session_manager import open_realtime_ws
+
+logger = logging.getLogger(__name__)
+
+# 정리/보충 루프 주기 (초)
+_MAINTAIN_INTERVAL_S = 5.0
+# claim 도착률 산정 윈도우 (초)
+_ARRIVAL_WINDOW_S = 600.0
+
+
+@dataclass
+class _PooledConnection:
+    ws: ClientConnection
+    opened_at: float
+
+
+class RealtimeSessionPool:
+    """사전 연결된 Realtime WebSocket 풀 (프로세스 싱글톤)."""
+
+    def __init__(
+        self,
+        min_idle: int = 2,
+        max_idle: int = 10,
+        max_age_s: float = 900.0,
+        lookahead_s: float = 60.0,
+    ):
+        self._min_idle = min_idle
+        self._max_idle = max_idle
+        self._max_age_s = max_age_s
+        self._lookahead_s = lookahead_s
+
+        self._idle: deque[_PooledConnection] = deque()
+        self._opening = 0
+        self._arrivals: deque[float] = deque()
+        self._maintain_task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+
+        self._hits = 0
+        self._misses = 0
+        self._claim_latencies_ms: deque[float] = deque(maxlen=200)
+
+    @property
+    def is_running(self) -> bool:
+        return self._maintain_task is not None and not self._maintain_task.done()
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    @property
+    def target_idle(self) -> int:
+        """최근 도착률 기반 목표 유휴 연결 수."""
+        self._trim_arrivals(time.monotonic())
+        rate_per_s = len(self._arrivals) / _ARRIVAL_WINDOW_S
+        demand = math.ceil(rate_per_s * self._lookahead_s)
+        return max(self._min_idle, min(self._max_idle, demand))
+
+    def start(self) -> None:
+        """백그라운드 정리/보충 루프를 시작한다 (lifespan에서 호출)."""
+        if self.is_running:
+            return
+        self._maintain_task = asyncio.create_task(self._maintain_loop())
+        logger.info(
+            "Realtime session pool started (min=%d, max=%d, max_age=%.0fs)",
+            self._min_idle, self._max_idle, self._max_age_s,
+        )
+
+    async def stop(self) -> None:
+        """루프를 중지하고 유휴 연결을 모두 닫는다."""
+        if self._maintain_task and not self._maintain_task.done():
+            self._maintain_task.cancel()
+            try:
+                await self._maintain_task
+            except asyncio.CancelledError:
+                pass
+        self._maintain_task = None
+        idle = list(self._idle)
+        self._idle.clear()
+        await asyncio.gather(*(self._close(c.ws) for c in idle), return_exceptions=True)
+        logger.info("Realtime session pool stopped (%d idle closed)", len(idle))
+
+    def claim(self) -> ClientConnection | None:
+        """유휴 연결을 하나 꺼낸다. 없으면 None (호출자가 직접 연결 — miss)."""
+        started = time.monotonic()
+        self._arrivals.append(started)
+        while self._idle:
+            conn = self._idle.popleft()
+            if self._is_usable(conn, started):
+                self._hits += 1
+                self._claim_latencies_ms.append((time.monotonic() - started) * 1000)
+                self._wake.set()
+                return conn.ws
+            asyncio.create_task(self._close(conn.ws))
+        self._misses += 1
+        self._wake.set()
+        return None
+
+    def record_miss_latency(self, latency_ms: float) -> None:
+        """miss 시 fresh 연결에 걸린 시간을 claim latency에 반영한다."""
+        self._claim_latencies_ms.append(latency_ms)
+
+    def stats(self) -> dict[str, float | int]:
+        """풀 상태/지표 스냅샷 (health 엔드포인트용)."""
+        total = self._hits + self._misses
+        latencies = sorted(self._claim_latencies_ms)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0
+        return {
+            "idle": len(self._idle),
+            "opening": self._opening,
+            "target_idle": self.target_idle,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 3) if total else 0.0,
+            "claim_latency_avg_ms": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+            "claim_latency_p95_ms": round(p95, 1),
+        }
+
+    # --- Internal ---
+
+    def _trim_arrivals(self, now: float) -> None:
+        while self._arrivals and now - self._arrivals[0] > _ARRIVAL_WINDOW_S:
+            self._arrivals.popleft()
+
+    def _is_usable(self, conn: _PooledConnection, now: float) -> bool:
+        return conn.ws.state is State.OPEN and now - conn.opened_at < self._max_age_s
+
+    async def _maintain_loop(self) -> None:
+        while True:
+            try:
+                await self._maintain_once()
+            except Exception:
+                logger.exception("Realtime session pool maintenance error")
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=_MAINTAIN_INTERVAL_S)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _maintain_once(self) -> None:
+        """끊긴/만료 연결 폐기 + 목표 수까지 보충 + 초과분 정리."""
+        now = time.monotonic()
+        stale = [c for c in self._idle if not self._is_usable(c, now)]
+        if stale:
+            self._idle = deque(c for c in self._idle if c not in stale)
+            logger.info("Session pool: refreshing %d stale/closed connection(s)", len(stale))
+            await asyncio.gather(*(self._close(c.ws) for c in stale), return_exceptions=True)
+
+        target = self.target_idle
+        while len(self._idle) > target:
+            # 오래된 연결부터 정리 (도착률 감소 시 축소)
+            await self._close(self._idle.popleft().ws)
+
+        missing = target - len(self._idle) - self._opening
+        if missing > 0:
+            await asyncio.gather(*(self._open_one() for _ in range(missing)))
+
+    async def _open_one(self) -> None:
+        self._opening += 1
+        try:
+            ws = await open_realtime_ws("SessionPool")
+            self._idle.append(_PooledConnection(ws=ws, opened_at=time.monotonic()))
+        except Exception as e:
+            logger.warning("Session pool: failed to open connection: %s", e)
+        finally:
+            self._opening -= 1
+
+    @staticmethod
+    async def _close(ws: ClientConnection) -> None:
+        try:
+            await ws.close()
+        except Exception:
+            pass
+
+
+session_pool = RealtimeSessionPool(
+    min_idle=settings.realtime_session_pool_min_idle,
+    max_idle=settings.realtime_session_pool_max_idle,
+    max_age_s=settings.realtime_session_pool_max_age_s,
+    lookahead_s=settings.realtime_session_pool_lookahead_s,
+)
@@ -0,0 +1,111 @@
+"""Speculative STT 트리거 — 통화별 발화 길이 분포 기반 선행 commit 시점.
+
+고정 speculative_stt_delay_s(1.0s)는 전역 P50 발화 길이로 튜닝되었다.
+통화마다 수신자의 말투(짧은 응답 위주 vs 긴 설명)가 달라서,
+  - 짧은 발화가 많은 통화: commit 직후 발화가 끝나 STT 호출만 늘고 겹침 이득 없음 (waste)
+  - 긴 발화가 많은 통화: 1초보다 일찍 commit해도 충분히 겹침 (이득 손실)
+
+이 트리거는 통화 중 관측된 발화 길이(session_b_speech_durations_ms)의 최근 창에서
+기대 이득을 최대화하는 commit 지연을 고른다.
+  이득(d) = Σ_{D ≥ d + min_gain} (min(D - d, overlap_cap) − commit_cost)
+          − waste_penalty × |{d < D < d + min_gain}|
+최대 이득 구간(plateau)이 넓으면 그 중앙을 골라 발화 길이 변동에 강건하게 한다.
+표본이 부족하면 기본 지연(settings.speculative_stt_delay_s)을 사용한다.
+발화 내 쉼(Local VAD pause)에서의 즉시 commit은 SessionBHandler가 담당한다.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+
+class SpeculativeSttTrigger:
+    """통화별 적응형 speculative commit 지연 (SessionBHandler 소유)."""
+
+    def __init__(
+        self,
+        default_delay_s: float = 1.0,
+        min_delay_s: float = 0.6,
+        max_delay_s: float = 2.5,
+        min_gain_s: float = 0.3,
+        overlap_cap_s: float = 1.0,
+        waste_penalty_s: float = 0.3,
+        commit_cost_s: float = 0.1,
+        window: int = 20,
+        min_samples: int = 5,
+        step_s: float = 0.1,
+    ):
+        """
+        Args:
+            default_delay_s: 표본 부족 시 지연 (기존 고정값)
+            min_delay_s: 최소 지연 (Part 1이 너무 짧으면 STT 정확도 저하)
+            max_delay_s: 최대 지연
+            min_gain_s: commit 후 남은 발화가 이보다 짧으면 낭비(waste)로 간주
+            overlap_cap_s: 발화당 겹침 이득 상한 (Part 1 STT 지연 이상은 이득 없음)
+            waste_penalty_s: 낭비 commit 1회의 비용 (추가 STT 호출 + 분할 정확도 손실)
+            commit_cost_s: 이득 commit에도 드는 고정 비용 (추가 STT 호출)
+            window: 분포 계산에 사용할 최근 발화 수
+            min_samples: 적응 시작 최소 발화 수
+            step_s: 후보 지연 탐색 간격
+        """
+        self._default_delay_s = default_delay_s
+        self._min_delay_s = min_delay_s
+        self._max_delay_s = max_delay_s
+        self._min_gain_s = min_gain_s
+        self._overlap_cap_s = overlap_cap_s
+        self._waste_penalty_s = waste_penalty_s
+        self._commit_cost_s = commit_cost_s
+        self._min_samples = min_samples
+        self._step_s = step_s
+        self._durations: deque[float] = deque(maxlen=window)
+        self._delay_s = default_delay_s
+
+    @property
+    def min_delay_s(self) -> float:
+        """pause 트리거도 이 시점 이전에는 commit하지 않는다."""
+        return self._min_delay_s
+
+    @property
+    def min_gain_s(self) -> float:
+        return self._min_gain_s
+
+    @property
+    def adapted(self) -> bool:
+        """적응에 충분한 발화가 관측되었는지."""
+        return len(self._durations) >= self._min_samples
+
+    def delay_s(self) -> float:
+        """현재 발화에 적용할 commit 지연 (초)."""
+        return self._delay_s
+
+    def observe(self, duration_s: float) -> None:
+        """완료된 발화 길이를 기록하고 지연을 재계산한다."""
+        self._durations.append(duration_s)
+        if len(self._durations) >= self._min_samples:
+            self._delay_s = self._best_delay()
+
+    def is_hit(self, remaining_s: float) -> bool:
+        """commit 후 남은 발화 길이로 이득(hit)/낭비(waste)를 판정한다."""
+        return remaining_s >= self._min_gain_s
+
+    # --- Internal ---
+
+    def _gain(self, delay: float) -> float:
+        gain = 0.0
+        for duration in self._durations:
+            if duration >= delay + self._min_gain_s:
+                gain += min(duration - delay, self._overlap_cap_s) - self._commit_cost_s
+            elif duration > delay:
+                gain -= self._waste_penalty_s
+        return gain
+
+    def _best_delay(self) -> float:
+        steps = int(round((self._max_delay_s - self._min_delay_s) / self._step_s))
+        candidates = [self._min_delay_s + i * self._step_s for i in range(steps + 1)]
+        gains = [self._gain(delay) for delay in candidates]
+        best_gain = max(gains)
+        if best_gain <= 0:
+            # 어떤 지연에서도 이득이 없으면 (짧은 응답 위주) 최대 지연으로 낭비 최소화
+            return self._max_delay_s
+        plateau = [d for d, g in zip(candidates, gains) if g >= best_gain - 1e-9]
+        return round(plateau[len(plateau) // 2], 3)
@@ -0,0 +1,140 @@
+"""Session B 턴 스케줄러 — Realtime 응답 생성의 통화별 직렬화.
+
+Realtime API는 세션당 동시에 하나의 응답만 허용한다 (conversation_already_has_active_response).
+기존에는 debounce task가 이전 응답 완료를 최대 5초 대기한 뒤 commit + response.create를
+수행하여, 연속 발화 시 다음 발화의 STT까지 이전 번역 뒤에 줄을 섰다 (head-of-line).
+
+  - 발화 종료 시 오디오는 즉시 commit (STT는 이전 응답 생성과 겹쳐 진행)
+  - 응답 생성만 스케줄러 큐에 넣고, 이전 응답 완료(response.done) 즉시 디스패치
+  - 대기 중 쌓인 턴은 하나의 응답으로 병합 (같은 대화에 이미 commit되어 있으므로)
+  - 턴별 큐 대기 시간(enqueue → 디스패치)을 지표로 기록
+출력 순서는 파이프라인의 B 출력 큐가 보장한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Coroutine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingTurn:
+    """응답 생성을 기다리는 수신자 발화 턴."""
+
+    speech_started_at: float
+    speech_stopped_at: float
+    enqueued_at: float = field(default_factory=time.monotonic)
+    # 이 턴의 입력 오디오 아이템 ID (늦게 도착한 STT를 item_id로 턴에 귀속)
+    item_ids: set[str] = field(default_factory=set)
+    # 대기 중 도착한 STT 판정 (진행 중인 이전 응답과 섞이지 않도록 턴에 보관)
+    recipient_stt: str = ""
+    stt_blocked: bool = False
+    stt_received: bool = False
+
+
+class TurnScheduler:
+    """Realtime 응답 턴 큐 (통화별, SessionBHandler 소유).
+
+    dispatch 콜백은 응답 생성을 요청하고 반환한다. 응답 완료 시 소유자가
+    response_done()을 호출해야 다음 턴이 디스패치된다.
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[[list[PendingTurn]], Coroutine],
+        on_queue_delay: Callable[[float], None] | None = None,
+        response_timeout_s: float = 5.0,
+    ):
+        """
+        Args:
+            dispatch: 턴 묶음으로 응답 생성 요청 (병합된 턴 목록, 오래된 순)
+            on_queue_delay: 턴별 큐 대기 시간(ms) 기록 콜백
+            response_timeout_s: 이전 응답 완료 최대 대기 (초과 시 경고 후 디스패치)
+        """
+        self._dispatch = dispatch
+        self._on_queue_delay = on_queue_delay
+        self._response_timeout_s = response_timeout_s
+        self._queue: list[PendingTurn] = []
+        self._idle = asyncio.Event()
+        self._idle.set()  # 초기 상태: 진행 중인 응답 없음
+        self._worker: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """디스패치 대기 중인 턴 수."""
+        return len(self._queue)
+
+    def find_pending(self, item_id: str) -> PendingTurn | None:
+        """입력 아이템 ID가 속한 대기 턴 (이미 디스패치됐거나 모르는 아이템이면 None)."""
+        return next((t for t in self._queue if item_id in t.item_ids), None)
+
+    @property
+    def response_active(self) -> bool:
+        return not self._idle.is_set()
+
+    async def submit(self, turn: PendingTurn) -> None:
+        """턴을 제출한다. 진행 중인 응답이 없으면 즉시 디스패치한다."""
+        if not self._queue and self._idle.is_set() and not self._worker_running:
+            await self._run_batch([turn])
+            return
+        self._queue.append(turn)
+        logger.info(
+            "[TurnScheduler] Turn queued behind active response (pending=%d)", len(self._queue)
+        )
+        if not self._worker_running:
+            self._worker = asyncio.create_task(self._run())
+
+    def response_done(self) -> None:
+        """진행 중인 응답이 끝났다 (response.done)."""
+        self._idle.set()
+
+    def stop(self) -> None:
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+        self._worker = None
+        self._queue.clear()
+        self._idle.set()
+
+    # --- Internal ---
+
+    @property
+    def _worker_running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    async def _run(self) -> None:
+        try:
+            while self._queue:
+                try:
+                    await asyncio.wait_for(self._idle.wait(), timeout=self._response_timeout_s)
+                except asyncio.TimeoutError:
+                    logger.warning(
+                        "[TurnScheduler] Previous response wait timeout (%.0fs) — dispatching anyway",
+                        self._response_timeout_s,
+                    )
+                batch = self._queue[:]
+                self._queue.clear()
+                await self._run_batch(batch)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("[TurnScheduler] Worker error")
+
+    async def _run_batch(self, batch: list[PendingTurn]) -> None:
+        now = time.monotonic()
+        if self._on_queue_delay:
+            for turn in batch:
+                self._on_queue_delay((now - turn.enqueued_at) * 1000)
+        if len(batch) > 1:
+            logger.info("[TurnScheduler] Dispatching %d queued turns as one response", len(batch))
+        self._idle.clear()
+        try:
+            await self._dispatch(batch)
+        except BaseException:
+            # 응답 생성 요청 실패/취소 → response.done이 오지 않으므로 큐가 막히지 않게 해제
+            self._idle.set()
+            raise
@@ -0,0 +1,48 @@
+"""STT 할루시네이션 필터 — 언어별 컴파일된 다중 패턴 매처."""
+
+from pathlib import Path
+
+from src.config import settings
+from src.realtime.stt_filter.matcher import (
+    DEFAULT_DATA_DIR,
+    LanguageRules,
+    SttFilterMatcher,
+    SttHit,
+    load_language_rules,
+    normalize_for_blocklist,
+)
+
+_rules: dict[str, LanguageRules] | None = None
+_matchers: dict[str, SttFilterMatcher] = {}
+
+
+def get_language_rules() -> dict[str, LanguageRules]:
+    """내장 data/ + settings.stt_filter_extra_data_dir 규칙 (프로세스 싱글톤)."""
+    global _rules
+    if _rules is None:
+        dirs = [DEFAULT_DATA_DIR]
+        if settings.stt_filter_extra_data_dir:
+            dirs.append(Path(settings.stt_filter_extra_data_dir))
+        _rules = load_language_rules(dirs)
+    return _rules
+
+
+def get_stt_matcher(language: str) -> SttFilterMatcher:
+    """텍스트 언어별 매처 (최초 호출 시 컴파일 후 캐시)."""
+    matcher = _matchers.get(language)
+    if matcher is None:
+        matcher = SttFilterMatcher(language, get_language_rules())
+        _matchers[language] = matcher
+    return matcher
+
+
+__all__ = [
+    "DEFAULT_DATA_DIR",
+    "LanguageRules",
+    "SttFilterMatcher",
+    "SttHit",
+    "get_language_rules",
+    "get_stt_matcher",
+    "load_language_rules",
+    "normalize_for_blocklist",
+]
@@ -0,0 +1,265 @@
+"""STT 할루시네이션 다중 패턴 매처.
+
+기존 Session B 필터는 STT 결과마다 frozenset 조회, 부분 문자열 루프
+(_KO_WHISPER_APPEND_SUBSTRINGS, [unclear] 변형), 노이즈 판별 루프, 정규식을
+하나씩 Python으로 평가했다. 이 매처는 언어별로 규칙을 한 번 컴파일하여
+한 번의 호출로 모든 매칭(사유 포함)을 반환한다.
+
+  - 정확 매칭 (블록리스트, 짧은 필러): 정규화 텍스트 → dict 조회 1회
+  - 부분 문자열 (append 할루시네이션, [unclear] 변형): 종류별 alternation 정규식 1회 스캔
+    (C 레벨 다중 패턴 스캔 — 짧은 STT 문장에서는 순수 Python Aho-Corasick보다 빠름,
+    [unclear]는 소문자 텍스트에 대해 스캔하여 (?i) 분기 비용 회피)
+  - 앵커 패턴 (Hi [Name], 노이즈, 반복, 꼬리 파편): 사전 컴파일된 정규식
+
+규칙은 data/*.json (언어별)에서 로드하며, settings.stt_filter_extra_data_dir의
+JSON으로 코드 변경 없이 확장할 수 있다.
+
+적용 범위 (scope, 검사 대상 텍스트의 언어 기준):
+  - always:  항상 (예: 한국어 방송 자막 할루시네이션 — 어느 통화에서든 차단)
+  - native:  텍스트 언어가 규칙 언어와 같을 때 (예: 한국어 append 패턴)
+  - foreign: 텍스트 언어가 규칙 언어와 다를 때 (예: 비영어 통화의 "Thank you.")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# 내장 규칙 데이터 (언어별 JSON)
+DEFAULT_DATA_DIR = Path(__file__).parent / "data"
+
+# 블록리스트 비교 전 제거할 구두점 (Whisper가 한국어 전사 끝에 추가)
+# ! ? (ASCII), 。！？ (CJK 전각), … (말줄임), · (가운데점 — 한국어 합성어 구분자)
+# 문자 클래스 정규식: 비ASCII 텍스트에서 str.translate(dict)보다 수 배 빠름
+_PUNCT_STRIP_RE = re.compile(r'[!?。！？…·]')
+
+# 동일 토큰 3회 이상 연속 반복 감지 (whisper/gpt-4o 공통 할루시네이션)
+_REPETITION_RE = re.compile(r'(\b\S+\b)(\s+\1){2,}', re.IGNORECASE)
+
+# 구조적 노이즈 (공백 제거 텍스트 기준, 언어 무관):
+#   자음만 / 1~6자 패턴 3회 이상 반복(나머지 < 패턴 길이) / 단일 문자
+_NOISE_RE = re.compile(
+    r'^(?:'
+    r'[ㄱ-ㅎ]+'
+    + "".join(f'|(.{{{n}}})\\{n}{{2,}}.{{0,{n - 1}}}' for n in range(1, 7))
+    + r'|.?'
+    r')$',
+    re.DOTALL,
+)
+
+# 섹션별 기본 scope (데이터 파일에 scope가 없을 때)
+_DEFAULT_SCOPES = {
+    "blocklist": "always",
+    "append_substrings": "native",
+    "unclear_substrings": "always",
+    "short_phrases": "foreign",
+    "trailing_fragment": "native",
+}
+
+
+def normalize_for_blocklist(text: str) -> str:
+    """블록리스트 비교용 정규화: strip + 구두점 제거."""
+    return _PUNCT_STRIP_RE.sub("", text.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class SttHit:
+    """매칭 1건."""
+
+    reason: str  # blocklist / short_phrase / <anchored reason> / noise / append / unclear / trailing_fragment / repetition
+    pattern: str
+    start: int = 0
+    end: int = 0
+    language: str = ""  # 규칙이 정의된 언어 ("" = 언어 무관 구조 규칙)
+
+
+@dataclass
+class _Section:
+    scope: str
+    phrases: list[str] = field(default_factory=list)
+
+
+@dataclass
+class LanguageRules:
+    """언어 1개의 데이터 파일 규칙 (여러 파일 병합)."""
+
+    language: str
+    sections: dict[str, _Section] = field(default_factory=dict)
+    short_max_words: int = 3
+    # (사유, 정규식, scope)
+    anchored: list[tuple[str, re.Pattern[str], str]] = field(default_factory=list)
+    trailing_fragment: re.Pattern[str] | None = None
+    trailing_unless: re.Pattern[str] | None = None
+
+    def phrases(self, section: str) -> frozenset[str]:
+        sec = self.sections.get(section)
+        return frozenset(sec.phrases) if sec else frozenset()
+
+    def scope(self, section: str) -> str:
+        sec = self.sections.get(section)
+        return sec.scope if sec else _DEFAULT_SCOPES.get(section, "always")
+
+    def merge(self, data: dict) -> None:
+        for name in ("blocklist", "append_substrings", "unclear_substrings", "short_phrases"):
+            spec = data.get(name)
+            if not spec:
+                continue
+            sec = self.sections.setdefault(name, _Section(spec.get("scope") or self.scope(name)))
+            sec.phrases.extend(p for p in spec.get("phrases", []) if p not in sec.phrases)
+            if name == "short_phrases" and "max_words" in spec:
+                self.short_max_words = int(spec["max_words"])
+        for spec in data.get("anchored_patterns", []):
+            self.anchored.append(
+                (spec["reason"], re.compile(spec["pattern"]), spec.get("scope", "always"))
+            )
+        spec = data.get("trailing_fragment")
+        if spec:
+            self.sections.setdefault(
+                "trailing_fragment", _Section(spec.get("scope") or self.scope("trailing_fragment"))
+            )
+            self.trailing_fragment = re.compile(spec["pattern"])
+            self.trailing_unless = re.compile(spec["unless"]) if spec.get("unless") else None
+
+
+def _applies(scope: str, rules_language: str, language: str) -> bool:
+    if scope == "always":
+        return True
+    if not language:
+        return False
+    native = language.startswith(rules_language)
+    return native if scope == "native" else not native
+
+
+def load_language_rules(data_dirs: list[Path] | None = None) -> dict[str, LanguageRules]:
+    """데이터 디렉토리의 *.json을 언어별로 병합 로드한다 (뒤 디렉토리가 확장)."""
+    rules: dict[str, LanguageRules] = {}
+    for directory in data_dirs or [DEFAULT_DATA_DIR]:
+        if not directory.is_dir():
+            logger.warning("[SttFilter] Data dir not found: %s", directory)
+            continue
+        for path in sorted(directory.glob("*.json")):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            language = data.get("language") or path.stem
+            rules.setdefault(language, LanguageRules(language)).merge(data)
+    return rules
+
+
+class SttFilterMatcher:
+    """텍스트 언어 1개에 적용되는 컴파일된 할루시네이션 매처."""
+
+    def __init__(self, language: str, rules: dict[str, LanguageRules]):
+        """
+        Args:
+            language: 검사할 텍스트의 언어 (STT: target_language).
+                "" 이면 always 규칙만 적용.
+            rules: load_language_rules() 결과
+        """
+        self.language = language
+        # 정규화 텍스트 → 정확 매칭 hit
+        self._exact: dict[str, list[SttHit]] = {}
+        # 소문자 핵심어(끝 마침표 제거) → 짧은 필러 hit
+        # max_words보다 긴 문구는 등록하지 않으므로 조회 시 단어 수 검사가 필요 없다
+        self._short: dict[str, SttHit] = {}
+        self._anchored: list[tuple[str, re.Pattern[str], str]] = []
+        self._trailing: list[tuple[re.Pattern[str], re.Pattern[str] | None, str]] = []
+        prefixes: set[str] = set()
+        append: dict[str, str] = {}
+        unclear: dict[str, str] = {}
+
+        for lang, rule in rules.items():
+            if _applies(rule.scope("blocklist"), lang, language):
+                for phrase in rule.phrases("blocklist"):
+                    self._exact.setdefault(phrase, []).append(SttHit("blocklist", phrase, language=lang))
+                    lowered = normalize_for_blocklist(phrase).lower()
+                    prefixes.update(lowered[:i] for i in range(1, len(lowered) + 1))
+            if _applies(rule.scope("short_phrases"), lang, language):
+                for phrase in rule.phrases("short_phrases"):
+                    if len(phrase.split()) <= rule.short_max_words:
+                        self._short[phrase.lower()] = SttHit("short_phrase", phrase, language=lang)
+            for reason, pattern, scope in rule.anchored:
+                if _applies(scope, lang, language):
+                    self._anchored.append((reason, pattern, lang))
+            if _applies(rule.scope("append_substrings"), lang, language):
+                append.update((p, lang) for p in rule.phrases("append_substrings"))
+            if _applies(rule.scope("unclear_substrings"), lang, language):
+                unclear.update((p.lower(), lang) for p in rule.phrases("unclear_substrings"))
+            if rule.trailing_fragment and _applies(rule.scope("trailing_fragment"), lang, language):
+                self._trailing.append((rule.trailing_fragment, rule.trailing_unless, lang))
+
+        self._blocklist_prefixes = frozenset(prefixes)
+        self._append_languages = append
+        self._unclear_languages = unclear
+        self.append_substrings = frozenset(append)
+        self._append_re = self._compile_alternation(append)
+        # [unclear] 변형은 대소문자 무시 (소문자 텍스트에 대해 스캔 — (?i) alternation보다 빠름)
+        self._unclear_re = self._compile_alternation(unclear)
+
+    # --- 매칭 ---
+
+    def match(self, text: str) -> list[SttHit]:
+        """모든 규칙을 한 번에 평가하여 매칭 목록을 반환한다 (매칭 없으면 [])."""
+        hits: list[SttHit] = []
+        stripped = text.strip()
+
+        exact = self._exact.get(normalize_for_blocklist(text))
+        if exact:
+            hits.extend(exact)
+
+        if not stripped or _NOISE_RE.match(stripped.replace(" ", "")):
+            hits.append(SttHit("noise", stripped, 0, len(text)))
+
+        for reason, pattern, lang in self._anchored:
+            if pattern.match(stripped):
+                hits.append(SttHit(reason, pattern.pattern, 0, len(text), lang))
+
+        short = self._short.get(stripped.rstrip(".").lower()) if stripped else None
+        if short:
+            hits.append(short)
+
+        if self._append_re is not None:
+            for m in self._append_re.finditer(text):
+                found = m.group()
+                hits.append(SttHit("append", found, m.start(), m.end(), self._append_languages[found]))
+        if self._unclear_re is not None:
+            for m in self._unclear_re.finditer(text.lower()):
+                found = m.group()
+                hits.append(SttHit("unclear", found, m.start(), m.end(), self._unclear_languages[found]))
+
+        hit = self.trailing_fragment(text)
+        if hit:
+            hits.append(hit)
+
+        m = _REPETITION_RE.search(text)
+        if m:
+            hits.append(SttHit("repetition", m.group(1), m.start(), m.end()))
+        return hits
+
+    def trailing_fragment(self, text: str) -> SttHit | None:
+        """문장 종결 후 동사 어미 없는 짧은 꼬리 ("...죠? 영상편집 배혜지").
+
+        start는 종결 부호 위치 — text[:start + 1]이 꼬리를 제거한 문장.
+        """
+        for pattern, unless, lang in self._trailing:
+            m = pattern.search(text)
+            if m and not (unless and unless.search(m.group(1).strip())):
+                return SttHit("trailing_fragment", m.group(1).strip(), m.start(), m.end(), lang)
+        return None
+
+    def is_blocklist_prefix(self, text: str) -> bool:
+        """정규화 텍스트가 블록리스트 문구의 접두사인지 (잠정 자막 보류 판단용)."""
+        return normalize_for_blocklist(text).lower() in self._blocklist_prefixes
+
+    # --- Internal ---
+
+    @staticmethod
+    def _compile_alternation(phrases: dict[str, str]) -> re.Pattern[str] | None:
+        if not phrases:
+            return None
+        # 같은 위치에서 긴 문구 우선 (leftmost-longest)
+        return re.compile("|".join(re.escape(p) for p in sorted(phrases, key=len, reverse=True)))
@@ -0,0 +1,157 @@
+"""번역 메모 캐시 — 반복되는 짧은 발화의 Chat API 번역 재사용.
+
+전화 통화에는 "네", "잠시만요", "예약하셨나요?", "감사합니다" 같은 짧은 정형
+발화가 반복된다. 매번 Chat API 라운드트립(수백 ms)을 지불하지 않도록
+ChatTranslator 앞단에서 번역 결과를 메모한다.
+
+  - 키: (원문 언어, 번역 언어, 정규화 STT 텍스트, 컨텍스트 지문[선택])
+  - LRU + TTL, 프로세스 전역 (통화 간 공유)
+  - hot set: 반복 hit된 항목은 LRU 축출 대상에서 제외 (TTL은 적용)
+  - 짧은 발화(max_chars 이하)만 캐시 — 긴 문장은 문맥 의존성이 커서 재사용 위험
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.config import settings
+
+# 비교 전 제거할 문장 끝 구두점 (의문문 구분을 위해 ?는 유지)
+_TRAILING_PUNCT_RE = re.compile(r"[.!。！…~·\s]+$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_utterance(text: str) -> str:
+    """캐시 키용 정규화: 공백 정리 + 끝 구두점 제거 + 소문자.
+
+    "감사합니다!" / " 감사합니다. " → "감사합니다", "예약하셨나요?"는 ? 유지.
+    """
+    text = _WHITESPACE_RE.sub(" ", text.strip())
+    text = _TRAILING_PUNCT_RE.sub("", text)
+    return text.lower()
+
+
+def context_fingerprint(context: str) -> str:
+    """대화 컨텍스트의 짧은 지문 (마지막 턴 기준)."""
+    if not context:
+        return ""
+    last_turn = context.rsplit("\n", 1)[-1]
+    return hashlib.sha1(last_turn.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass
+class _Entry:
+    translated_text: str
+    stored_at: float
+    hits: int = 0
+
+
+_Key = tuple[str, str, str, str]
+
+
+class TranslationCache:
+    """언어쌍별 LRU/TTL 번역 캐시 + hot set (프로세스 싱글톤)."""
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        ttl_s: float = 3600.0,
+        max_chars: int = 24,
+        hot_set_size: int = 200,
+        hot_min_hits: int = 3,
+    ):
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._max_chars = max_chars
+        self._hot_set_size = hot_set_size
+        self._hot_min_hits = hot_min_hits
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._hot: dict[_Key, _Entry] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def make_key(
+        self,
+        source_language: str,
+        target_language: str,
+        text: str,
+        context: str = "",
+    ) -> _Key | None:
+        """캐시 키를 만든다. 캐시 대상이 아니면(빈/긴 발화) None."""
+        normalized = normalize_utterance(text)
+        if not normalized or len(normalized) > self._max_chars:
+            return None
+        return (source_language, target_language, normalized, context_fingerprint(context))
+
+    def get(self, key: _Key) -> str | None:
+        """번역을 조회한다 (hit 시 LRU 갱신 + hot set 승격)."""
+        self.lookups += 1
+        now = time.monotonic()
+        entry = self._hot.get(key)
+        if entry is None:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            return None
+        if now - entry.stored_at > self._ttl_s:
+            self._hot.pop(key, None)
+            self._entries.pop(key, None)
+            return None
+        entry.hits += 1
+        self.hits += 1
+        if key not in self._hot and entry.hits >= self._hot_min_hits:
+            self._promote(key, entry)
+        return entry.translated_text
+
+    def put(self, key: _Key, translated_text: str) -> None:
+        """번역을 저장한다 ([unclear] 등 실패 마커는 호출자가 거른다)."""
+        if key in self._hot:
+            self._hot[key].translated_text = translated_text
+            self._hot[key].stored_at = time.monotonic()
+            return
+        self._entries[key] = _Entry(translated_text=translated_text, stored_at=time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hot.clear()
+        self.lookups = 0
+        self.hits = 0
+
+    def stats(self) -> dict[str, float | int]:
+        """캐시 지표 스냅샷 (health 엔드포인트용)."""
+        return {
+            "size": len(self._entries) + len(self._hot),
+            "hot_size": len(self._hot),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+        }
+
+    # --- Internal ---
+
+    def _promote(self, key: _Key, entry: _Entry) -> None:
+        """반복 hit 항목을 hot set으로 이동 (가득 차면 hit 수가 가장 적은 항목을 LRU로 강등)."""
+        self._entries.pop(key, None)
+        if len(self._hot) >= self._hot_set_size:
+            coldest = min(self._hot, key=lambda k: self._hot[k].hits)
+            if self._hot[coldest].hits >= entry.hits:
+                self._entries[key] = entry
+                return
+            self._entries[coldest] = self._hot.pop(coldest)
+        self._hot[key] = entry
+
+
+translation_cache = TranslationCache(
+    max_entries=settings.translation_cache_max_entries,
+    ttl_s=settings.translation_cache_ttl_s,
+    max_chars=settings.translation_cache_max_chars,
+    hot_set_size=settings.translation_cache_hot_set_size,
+)
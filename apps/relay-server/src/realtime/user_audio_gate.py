@@ -0,0 +1,151 @@
+"""UserAudioSilenceGate — Session A 입력 오디오 무음 억제.
+
+App(Client VAD)이 보내는 pcm16 오디오에는 발화 앞뒤와 문장 사이의 긴 무음이
+그대로 포함된다. Session A(Realtime API)는 수신한 오디오 길이만큼 audio_input
+토큰을 과금하므로, 서버에서 에너지 기반으로 긴 무음 구간을 잘라낸다.
+Client commit 모드(turn_detection=null)에서만 사용한다 — Server VAD는 무음으로
+발화 종료를 판단하므로 무음을 잘라내면 end-of-speech 감지를 방해한다.
+
+동작:
+  - RMS > threshold → 발화 프레임: pre-roll 버퍼 flush 후 그대로 전달
+  - 발화 직후 hangover_ms 동안은 무음이라도 전달 (단어 사이 쉼 보존)
+  - hangover 이후 무음 → 전달하지 않고 pre-roll 버퍼(preroll_ms)에만 보관
+  - commit 시 현재 세그먼트의 발화 경계(첫/마지막 발화 시점)와 잘린 길이를 반환
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+
+from src.realtime.audio_utils import pcm16_rms
+
+logger = logging.getLogger(__name__)
+
+# App 녹음 포맷: pcm16 mono 16kHz (web/mobile 공통)
+USER_AUDIO_SAMPLE_RATE = 16000
+_BYTES_PER_MS = USER_AUDIO_SAMPLE_RATE * 2 / 1000
+
+
+@dataclass
+class SpeechBoundaries:
+    """commit 단위 발화 경계 (세그먼트 시작 기준 ms)."""
+
+    speech_start_ms: float = 0.0
+    speech_end_ms: float = 0.0
+    segment_ms: float = 0.0
+    sent_ms: float = 0.0
+    trimmed_ms: float = 0.0
+    has_speech: bool = False
+
+
+class UserAudioSilenceGate:
+    """pcm16 User 오디오의 긴 무음을 억제하는 에너지 게이트."""
+
+    def __init__(
+        self,
+        rms_threshold: float = 200.0,
+        hangover_ms: float = 500.0,
+        preroll_ms: float = 300.0,
+    ):
+        self._rms_threshold = rms_threshold
+        self._hangover_ms = hangover_ms
+        self._preroll_ms = preroll_ms
+
+        self._preroll: deque[tuple[bytes, float]] = deque()
+        self._preroll_total_ms: float = 0.0
+        self._silence_run_ms: float = 0.0
+        self._in_speech = False
+
+        # 현재 세그먼트 (commit 간) 상태
+        self._segment_ms: float = 0.0
+        self._sent_ms: float = 0.0
+        self._speech_start_ms: float = -1.0
+        self._speech_end_ms: float = 0.0
+
+    @property
+    def in_speech(self) -> bool:
+        """발화 또는 hangover 구간인지."""
+        return self._in_speech
+
+    @property
+    def sent_ms(self) -> float:
+        """현재 세그먼트에서 Session A로 전달된 오디오 길이 (ms)."""
+        return self._sent_ms
+
+    def process(self, audio: bytes) -> list[bytes]:
+        """오디오 청크를 판정하고 Session A로 전달할 청크 목록을 반환한다.
+
+        Returns:
+            전달할 청크 목록 (억제 시 빈 리스트, 발화 시작 시 pre-roll 포함)
+        """
+        duration_ms = len(audio) / _BYTES_PER_MS
+        chunk_start_ms = self._segment_ms
+        self._segment_ms += duration_ms
+
+        if pcm16_rms(audio) > self._rms_threshold:
+            if self._speech_start_ms < 0:
+                self._speech_start_ms = chunk_start_ms
+            self._speech_end_ms = self._segment_ms
+            self._in_speech = True
+            self._silence_run_ms = 0.0
+            out = self._drain_preroll()
+            out.append(audio)
+            self._sent_ms += duration_ms
+            return out
+
+        if self._in_speech:
+            self._silence_run_ms += duration_ms
+            if self._silence_run_ms <= self._hangover_ms:
+                self._sent_ms += duration_ms
+                return [audio]
+            self._in_speech = False
+
+        self._push_preroll(audio, duration_ms)
+        return []
+
+    def flush_preroll(self) -> list[bytes]:
+        """보관 중인 pre-roll 청크를 꺼낸다 (발화 없이 commit될 때 빈 버퍼 방지)."""
+        return self._drain_preroll()
+
+    def commit(self) -> SpeechBoundaries:
+        """현재 세그먼트의 발화 경계를 반환하고 세그먼트를 리셋한다."""
+        has_speech = self._speech_start_ms >= 0
+        boundaries = SpeechBoundaries(
+            speech_start_ms=round(max(self._speech_start_ms, 0.0), 1),
+            speech_end_ms=round(self._speech_end_ms, 1),
+            segment_ms=round(self._segment_ms, 1),
+            sent_ms=round(self._sent_ms, 1),
+            trimmed_ms=round(max(self._segment_ms - self._sent_ms, 0.0), 1),
+            has_speech=has_speech,
+        )
+        self.reset()
+        return boundaries
+
+    def reset(self) -> None:
+        """게이트 상태를 초기화한다."""
+        self._preroll.clear()
+        self._preroll_total_ms = 0.0
+        self._silence_run_ms = 0.0
+        self._in_speech = False
+        self._segment_ms = 0.0
+        self._sent_ms = 0.0
+        self._speech_start_ms = -1.0
+        self._speech_end_ms = 0.0
+
+    # --- Internal ---
+
+    def _push_preroll(self, audio: bytes, duration_ms: float) -> None:
+        self._preroll.append((audio, duration_ms))
+        self._preroll_total_ms += duration_ms
+        while self._preroll and self._preroll_total_ms - self._preroll[0][1] >= self._preroll_ms:
+            _, dropped_ms = self._preroll.popleft()
+            self._preroll_total_ms -= dropped_ms
+
+    def _drain_preroll(self) -> list[bytes]:
+        out = [chunk for chunk, _ in self._preroll]
+        self._sent_ms += self._preroll_total_ms
+        self._preroll.clear()
+        self._preroll_total_ms = 0.0
+        return out
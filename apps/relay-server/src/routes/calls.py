@@ -6,29 +6,36 @@ PRD 8.2:
 
 통화 시작 시퀀스 (PRD 3.1):
   1. App → Relay Server: POST /relay/calls/start
-  2. Relay Server: Twilio 발신 + OpenAI Dual Session 생성
+  2. Relay Server: Twilio 발신 + OpenAI Dual Session 생성 (병렬 — Media Stream이 세션 준비를 대기)
   3. Relay Server → Supabase: call 상태를 CALLING으로 업데이트
   4. Relay Server → App: { relayWsUrl, callSid, sessionIds }
   5. App → Relay Server: WebSocket 연결
 """
 
+import asyncio
 import logging
+import time
 
 from fastapi import APIRouter, HTTPException
 
 from src.call_manager import call_manager
 from src.config import settings
+from src.guardrail.dictionary import get_filler_text
 from src.logging_config import call_id_var, call_mode_var
+from src.openai_client import ensure_warm
 from src.prompt.generator_v3 import generate_session_a_prompt, generate_session_b_prompt
+from src.realtime.first_message import GreetingPrefetch
 from src.realtime.sessions.session_manager import DualSessionManager
 from src.tools.definitions import get_tools_for_mode
 from src.twilio.outbound import make_call_async
 from src.types import (
     ActiveCall,
     CallEndRequest,
+    CallMode,
     CallStartRequest,
     CallStartResponse,
     CallStatus,
+    CommunicationMode,
 )
 
 router = APIRouter(tags=["calls"])
@@ -53,6 +60,8 @@ async def start_call(req: CallStartRequest):
         req.target_language,
     )
 
+    setup_started = time.monotonic()
+
     # 1. ActiveCall 생성
     call = ActiveCall(
         call_id=req.call_id,
@@ -82,6 +91,7 @@ async def start_call(req: CallStartRequest):
     # Prompt를 ActiveCall에 저장 (AudioRouter에서 사용)
     call.prompt_a = prompt_a
     call.prompt_b = prompt_b
+    call.call_metrics.call_setup_ms["prompt"] = (time.monotonic() - setup_started) * 1000
 
     # 3. OpenAI Dual Session 생성 (vad_mode + communication_mode 전달 — PRD 4.2)
     dual_session = DualSessionManager(
@@ -95,19 +105,28 @@ async def start_call(req: CallStartRequest):
     # Agent Mode: Function Calling 도구 설정
     tools_a = get_tools_for_mode(req.mode.value)
 
-    try:
-        await dual_session.connect(prompt_a, prompt_b, tools_a=tools_a)
-    except Exception as e:
-        logger.error("Failed to create OpenAI sessions: %s", e)
-        raise HTTPException(status_code=502, detail="Failed to create AI sessions")
+    # Chat 번역/교정용 HTTP 연결 워밍업 (유휴 연결이 없을 때만, 벨 울리는 동안 진행)
+    ensure_warm()
 
-    # 즉시 session 등록 (Twilio 실패 시 cleanup_call로 정리)
+    # 4. 세션 연결과 Twilio 발신을 병렬 시작
+    # 수신자 벨이 울리는 수 초 동안 세션 연결을 끝내고, Media Stream 핸들러가 준비 완료를 대기한다.
+    connect_task = dual_session.start_connect(prompt_a, prompt_b, tools_a=tools_a)
+    # 즉시 session 등록 (실패 시 cleanup_call로 정리)
     call_manager.register_session(req.call_id, dual_session)
 
-    call.session_a_id = dual_session.session_a.session_id
-    call.session_b_id = dual_session.session_b.session_id
+    # Relay Mode 첫 고지: 고지 문장이 이미 정해져 있으므로 벨이 울리는 동안 오디오 미리 생성
+    # (Guardrail 필러 클립이 아직 캐시에 없으면 이어서 생성)
+    if settings.greeting_prefetch_enabled and req.mode == CallMode.RELAY:
+        prefetch = GreetingPrefetch(
+            call,
+            dual_session.session_a,
+            use_exact_utterance=req.communication_mode != CommunicationMode.VOICE_TO_VOICE,
+            filler_text=get_filler_text(req.target_language) if settings.guardrail_enabled else "",
+        )
+        prefetch.start(connect_task)
+        call_manager.register_greeting_prefetch(req.call_id, prefetch)
 
-    # 4. Twilio 발신 (async)
+    dial_started = time.monotonic()
     try:
         call_sid = await make_call_async(
             phone_number=req.phone_number,
@@ -118,10 +137,23 @@ async def start_call(req: CallStartRequest):
         logger.error("Failed to make Twilio call: %s", e)
         await call_manager.cleanup_call(req.call_id, reason="twilio_failed")
         raise HTTPException(status_code=502, detail="Failed to initiate phone call")
+    call.call_metrics.call_setup_ms["twilio_dial"] = (time.monotonic() - dial_started) * 1000
 
     # 5. Active call 등록
     call_manager.register_call(req.call_id, call)
 
+    # 발신 중 세션 연결이 끝났으면 결과를 즉시 반영 (실패 시 Twilio 통화 종료 포함 정리)
+    if connect_task.done():
+        if connect_task.cancelled() or connect_task.exception():
+            logger.error("Failed to create OpenAI sessions: %s", _task_error(connect_task))
+            await call_manager.cleanup_call(req.call_id, reason="session_failed")
+            raise HTTPException(status_code=502, detail="Failed to create AI sessions")
+        _record_session_connect(call, dual_session)
+    else:
+        asyncio.create_task(
+            _watch_session_connect(req.call_id, call, dual_session, connect_task)
+        )
+
     # WebSocket URL 생성
     ws_base = settings.relay_server_url.replace("http", "ws")
     relay_ws_url = f"{ws_base}/relay/calls/{req.call_id}/stream"
@@ -144,6 +176,38 @@ async def start_call(req: CallStartRequest):
     )
 
 
+def _task_error(task: asyncio.Task) -> str:
+    return "cancelled" if task.cancelled() else repr(task.exception())
+
+
+def _record_session_connect(call: ActiveCall, dual_session: DualSessionManager) -> None:
+    call.call_metrics.session_connect_ms = dual_session.connect_ms
+    call.call_metrics.session_pool_hits = dual_session.pool_hits
+    call.call_metrics.call_setup_ms["session_connect"] = dual_session.connect_ms
+    call.session_a_id = dual_session.session_a.session_id
+    call.session_b_id = dual_session.session_b.session_id
+
+
+async def _watch_session_connect(
+    call_id: str,
+    call: ActiveCall,
+    dual_session: DualSessionManager,
+    connect_task: asyncio.Task,
+) -> None:
+    """백그라운드 세션 연결 결과를 기록하고, 실패 시 통화를 정리한다."""
+    try:
+        await asyncio.shield(connect_task)
+    except asyncio.CancelledError:
+        return
+    except Exception as e:
+        if call_manager.get_session(call_id) is not dual_session:
+            return  # 이미 정리됨 (통화 종료/취소)
+        logger.error("Failed to create OpenAI sessions: %s", e)
+        await call_manager.cleanup_call(call_id, reason="session_failed")
+        return
+    _record_session_connect(call, dual_session)
+
+
 @router.post("/calls/{call_id}/end")
 async def end_call(call_id: str, req: CallEndRequest | None = None):
     """통화를 종료한다."""
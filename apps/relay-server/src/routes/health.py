@@ -5,6 +5,12 @@ import time
 from fastapi import APIRouter
 
 from src.call_manager import call_manager
+from src.guardrail.correction_worker import correction_worker
+from src.openai_client import openai_client_stats
+from src.realtime.chat_translator import hedge_stats
+from src.realtime.filler_audio import filler_audio_cache
+from src.realtime.sessions.session_pool import session_pool
+from src.realtime.translation_cache import translation_cache
 
 router = APIRouter(tags=["health"])
 
@@ -17,4 +23,10 @@ async def health_check():
         "status": "ok",
         "active_sessions": call_manager.active_call_count,
         "uptime": round(time.time() - _start_time),
+        "session_pool": session_pool.stats(),
+        "openai_http": openai_client_stats(),
+        "chat_hedging": hedge_stats(),
+        "translation_cache": translation_cache.stats(),
+        "guardrail_corrections": correction_worker.stats(),
+        "filler_audio_cache": filler_audio_cache.stats(),
     }
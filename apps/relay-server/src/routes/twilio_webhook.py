@@ -3,6 +3,7 @@
 import asyncio
 import json
 import logging
+import time
 
 from fastapi import APIRouter, Form, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import Response
@@ -79,7 +80,8 @@ async def twilio_media_stream(ws: WebSocket, call_id: str):
     수신자 오디오 → Session B, Session A TTS → Twilio.
 
     DualSession은 calls.py start_call()에서 이미 생성되어 있으므로
-    call_manager에서 가져와 재사용한다.
+    call_manager에서 가져와 재사용한다. 세션 연결은 Twilio 발신과 병렬로
+    진행되므로, AudioRouter 생성 전에 연결 완료를 대기한다.
     """
     await ws.accept()
     logger.info("Twilio Media Stream connected (call=%s)", call_id)
@@ -101,6 +103,23 @@ async def twilio_media_stream(ws: WebSocket, call_id: str):
         await ws.close()
         return
 
+    # 세션 연결 완료 대기 (start_call에서 Twilio 발신과 병렬 시작)
+    wait_started = time.monotonic()
+    ready = await dual_session.wait_until_ready(settings.session_ready_timeout_s)
+    call.call_metrics.call_setup_ms["media_stream_session_wait"] = (
+        time.monotonic() - wait_started
+    ) * 1000
+    if not ready:
+        logger.error("Twilio Media Stream: sessions not ready for call %s", call_id)
+        await ws.close()
+        await call_manager.cleanup_call(call_id, reason="session_failed")
+        return
+
+    # 첫 고지 prefetch가 Session A를 직접 읽는 중이면 수신 루프 시작 전에 넘겨받는다
+    greeting_prefetch = call_manager.get_greeting_prefetch(call_id)
+    if greeting_prefetch:
+        await greeting_prefetch.handover()
+
     # Twilio handler 생성
     twilio_handler = TwilioMediaStreamHandler(ws=ws, call=call)
 
@@ -116,6 +135,7 @@ async def twilio_media_stream(ws: WebSocket, call_id: str):
         app_ws_send=send_to_app,
         prompt_a=call.prompt_a,
         prompt_b=call.prompt_b,
+        greeting_prefetch=greeting_prefetch,
     )
     call_manager.register_router(call_id, audio_router)
     await audio_router.start()
@@ -201,6 +201,28 @@ class CostTokens(BaseModel):
     # Chat API (Session B 번역용)
     chat_input: int = 0
     chat_output: int = 0
+    # Prompt cache hit 입력 토큰 (위 input 토큰에 포함된 부분집합 — total에 다시 더하지 않음)
+    cached_audio_input: int = 0
+    cached_text_input: int = 0
+    chat_cached_input: int = 0
+
+    @classmethod
+    def from_realtime_usage(cls, usage: dict[str, Any]) -> "CostTokens":
+        """Realtime response.done의 usage 필드를 변환한다 (input_token_details.cached_tokens 포함)."""
+        input_details = usage.get("input_token_details") or {}
+        output_details = usage.get("output_token_details") or {}
+        cached_details = input_details.get("cached_tokens_details") or {}
+        cached_total = input_details.get("cached_tokens", 0) or 0
+        cached_audio = cached_details.get("audio_tokens", 0) or 0
+        return cls(
+            audio_input=input_details.get("audio_tokens", 0),
+            text_input=input_details.get("text_tokens", 0),
+            audio_output=output_details.get("audio_tokens", 0),
+            text_output=output_details.get("text_tokens", 0),
+            cached_audio_input=cached_audio,
+            # 세부 내역이 없으면 cached_tokens 전체를 텍스트로 본다
+            cached_text_input=cached_details.get("text_tokens", cached_total - cached_audio) or 0,
+        )
 
     def add(self, other: "CostTokens") -> None:
         """다른 CostTokens를 더한다."""
@@ -210,6 +232,9 @@ class CostTokens(BaseModel):
         self.text_output += other.text_output
         self.chat_input += other.chat_input
         self.chat_output += other.chat_output
+        self.cached_audio_input += other.cached_audio_input
+        self.cached_text_input += other.cached_text_input
+        self.chat_cached_input += other.chat_cached_input
 
     @property
     def total(self) -> int:
@@ -219,24 +244,50 @@ class CostTokens(BaseModel):
             + self.chat_input + self.chat_output
         )
 
+    @property
+    def realtime_cache_hit_rate(self) -> float:
+        """Realtime 입력 토큰 중 prompt cache hit 비율 (0~1)."""
+        total_input = self.audio_input + self.text_input
+        if not total_input:
+            return 0.0
+        return (self.cached_audio_input + self.cached_text_input) / total_input
+
+    @property
+    def chat_cache_hit_rate(self) -> float:
+        """Chat API 입력 토큰 중 prompt cache hit 비율 (0~1)."""
+        return self.chat_cached_input / self.chat_input if self.chat_input else 0.0
+
     @property
     def cost_usd(self) -> float:
         """OpenAI Realtime API + Chat API 가격 기준 USD 비용 계산.
 
         Pricing (per 1K tokens):
           Realtime: audio_input $0.06, audio_output $0.24,
-                    text_input $0.005, text_output $0.02
-          Chat (gpt-4o-mini): input $0.00015, output $0.0006
+                    text_input $0.005, text_output $0.02,
+                    cached audio/text input $0.0025
+          Chat (gpt-4o-mini): input $0.00015, output $0.0006, cached input $0.000075
         """
         return (
-            self.audio_input * 0.06 / 1000
+            (self.audio_input - self.cached_audio_input) * 0.06 / 1000
+            + self.cached_audio_input * 0.0025 / 1000
             + self.audio_output * 0.24 / 1000
-            + self.text_input * 0.005 / 1000
+            + (self.text_input - self.cached_text_input) * 0.005 / 1000
+            + self.cached_text_input * 0.0025 / 1000
             + self.text_output * 0.02 / 1000
-            + self.chat_input * 0.00015 / 1000
+            + (self.chat_input - self.chat_cached_input) * 0.00015 / 1000
+            + self.chat_cached_input * 0.000075 / 1000
             + self.chat_output * 0.0006 / 1000
         )
 
+    @property
+    def cache_savings_usd(self) -> float:
+        """Prompt cache hit으로 절약한 USD (캐시 없이 정가로 냈을 때와의 차이)."""
+        return (
+            self.cached_audio_input * (0.06 - 0.0025) / 1000
+            + self.cached_text_input * (0.005 - 0.0025) / 1000
+            + self.chat_cached_input * (0.00015 - 0.000075) / 1000
+        )
+
 
 class CallMetrics(BaseModel):
     """통화 성능 지표 (통화 종료 시 로그 출력 + call_result_data에 저장)."""
@@ -249,6 +300,10 @@ class CallMetrics(BaseModel):
     session_b_stt_latencies_ms: list[float] = Field(default_factory=list)
     # 첫 메시지 지연 (pipeline start → first TTS to Twilio)
     first_message_latency_ms: float = 0.0
+    # 첫 고지 오디오 출처: "prefetch" (벨 울리는 동안 생성) / "live" (수신자 발화 후 생성)
+    first_message_source: str = ""
+    # 수신자 첫 발화 종료 → 첫 고지 오디오 Twilio 전송 (수신자가 듣는 무음 구간, 발화 중 시작 시 0)
+    first_message_gap_ms: float = 0.0
     # 번역 턴 수 (Session A + Session B 각 번역 완료 시 +1)
     turn_count: int = 0
     # 에코 윈도우 활성화 횟수
@@ -265,18 +320,92 @@ class CallMetrics(BaseModel):
     settling_breakthroughs: int = 0
     # Speculative STT 발동 횟수
     speculative_stt_count: int = 0
+    # Speculative STT: commit 후 남은 발화 ≥ min_gain (STT 겹침 성공)
+    speculative_stt_hits: int = 0
+    # Speculative STT: commit 직후 발화 종료 (추가 STT 호출만 발생)
+    speculative_stt_wasted: int = 0
+    # Speculative STT: 발화 내 쉼에서 발동한 횟수
+    speculative_stt_pause_triggers: int = 0
+    # Speculative STT: 발화별 적용된 commit 지연 (적응형)
+    speculative_stt_delay_ms: list[float] = Field(default_factory=list)
     # callee가 Session A TTS를 중단한 횟수
     interrupt_count: int = 0
     # Guardrail 비동기 교정 횟수 (Level 2)
     guardrail_level2_count: int = 0
     # Guardrail 동기 차단 횟수 (Level 3)
     guardrail_level3_count: int = 0
+    # Guardrail 교정: 규칙 재작성으로 처리 (LLM 생략) / Fallback LLM 교정 횟수 / LLM 타임아웃·에러 횟수
+    guardrail_rule_rewrites: int = 0
+    guardrail_llm_calls: int = 0
+    guardrail_llm_failures: int = 0
+    # Guardrail 교정 소요 시간 (규칙 재작성 또는 LLM 포함)
+    guardrail_correction_ms: list[float] = Field(default_factory=list)
+    # Guardrail Level 3 상향 → 교정 TTS 요청까지 지연
+    guardrail_escalation_to_tts_ms: list[float] = Field(default_factory=list)
     # Session B: 수신자 발화 구간 (speech_started → speech_stopped)
     session_b_speech_durations_ms: list[float] = Field(default_factory=list)
     # Session B: 처리 지연 (speech_stopped → 번역 완료), STT와 독립적
     session_b_processing_latencies_ms: list[float] = Field(default_factory=list)
     # Session B: STT 완료가 speech_stopped 이후에 발생한 지연
     session_b_stt_after_stop_ms: list[float] = Field(default_factory=list)
+    # Session A: 서버 무음 억제로 전송하지 않은 User 오디오 누적 길이 (ms)
+    user_audio_suppressed_ms: float = 0.0
+    # Session A: commit별 잘린 무음 길이 (세그먼트 길이 - 실제 전송 길이)
+    session_a_trimmed_silence_ms: list[float] = Field(default_factory=list)
+    # Realtime 이벤트 dispatch lag (수신 → 핸들러 시작), "SessionA/response.done" → {count, avg_ms, max_ms}
+    dispatch_lag_ms: dict[str, dict[str, float]] = Field(default_factory=dict)
+    # 통화 시작 시 Realtime 세션 연결 시간 (claim/connect + session.update)
+    session_connect_ms: float = 0.0
+    # 세션 풀에서 사전 연결을 가져온 세션 수 (0~2)
+    session_pool_hits: int = 0
+    # 통화 시작 단계별 소요 시간 (prompt, twilio_dial, session_connect, media_stream_session_wait)
+    call_setup_ms: dict[str, float] = Field(default_factory=dict)
+    # Session B Chat API 번역: 요청 → 첫 토큰 (스트리밍 모드)
+    session_b_chat_ttft_ms: list[float] = Field(default_factory=list)
+    # Session B Chat API 번역: 요청 → 완료
+    session_b_chat_completion_ms: list[float] = Field(default_factory=list)
+    # Session B Chat API 번역 중 prompt cache hit 요청의 완료 지연 (session_b_chat_completion_ms의 부분집합)
+    session_b_chat_cached_completion_ms: list[float] = Field(default_factory=list)
+    # 스트리밍 번역 도중 새 발화로 대체(취소)되어 부분 자막을 폐기한 횟수
+    chat_translations_superseded: int = 0
+    # Chat API 번역 hedge 요청 발송 횟수 / hedge 요청이 먼저 응답한 횟수
+    chat_translation_hedged: int = 0
+    chat_translation_hedge_wins: int = 0
+    # 번역 메모 캐시 hit으로 Chat API 호출을 생략한 횟수
+    chat_translation_cache_hits: int = 0
+    # 필러 오디오 캐시 hit으로 Realtime 생성 없이 재생한 정형 문구 횟수 (타이핑/Guardrail 필러)
+    filler_audio_cache_hits: int = 0
+    # 세션별 live 대화 아이템 수 / 토큰 근사치 (대화 장부 기준, "session_a" / "session_b")
+    conversation_items: dict[str, int] = Field(default_factory=dict)
+    conversation_tokens: dict[str, int] = Field(default_factory=dict)
+    # 세션별 대화 토큰 근사치 최대값
+    conversation_peak_tokens: dict[str, int] = Field(default_factory=dict)
+    # 컨텍스트 주입 시점별 컨텍스트 토큰 근사치 (요약 포함)
+    context_tokens_per_turn: list[int] = Field(default_factory=list)
+    # 컨텍스트가 바뀌지 않았고 세션에 남아 있어 재주입을 생략한 횟수
+    context_injections_skipped: int = 0
+    # 앞 입력에 병합되어 별도 번역 요청을 생략한 T2V 텍스트 입력 수
+    t2v_coalesced_inputs: int = 0
+    # 병합 요청별 절약 시간 추정 (병합된 입력 수 × 평균 Session A 번역 지연)
+    t2v_coalesce_saved_ms: list[float] = Field(default_factory=list)
+    # 문장 단위로 나눠 파이프라이닝한 T2V 텍스트 입력 수 / 나뉜 문장 응답 수
+    t2v_pipelined_inputs: int = 0
+    t2v_pipelined_sentences: int = 0
+    # Speculative 번역: Part 1 선행 번역을 최종 번역에 사용한 횟수 / 폐기한 횟수
+    speculative_translation_hits: int = 0
+    speculative_translation_misses: int = 0
+    # Session B: 선행 번역을 사용한 턴의 처리 지연 (session_b_processing_latencies_ms의 부분집합)
+    session_b_speculative_processing_ms: list[float] = Field(default_factory=list)
+    # Session B: 턴별 응답 큐 대기 (발화 commit → 이전 응답 완료 후 response.create), Realtime 경로
+    session_b_turn_queue_delay_ms: list[float] = Field(default_factory=list)
+    # Session B: 발화 시작 → 첫 원문 자막 (STT delta 잠정 자막 포함)
+    session_b_first_caption_ms: list[float] = Field(default_factory=list)
+    # Session B: 발화 종료 판정까지 대기한 무음 (Local VAD, 조기 종료 시 800ms 미만)
+    session_b_endpoint_silence_ms: list[float] = Field(default_factory=list)
+    # Session B: endpointer 조기 종료 횟수
+    session_b_early_endpoints: int = 0
+    # Session B: 조기 종료 직후 발화 재개 (오절단 추정)
+    session_b_early_endpoint_resumed: int = 0
 
 
 class ActiveCall(BaseModel):
@@ -127,8 +127,13 @@ class FakeRealtimeSession:
 
     # --- RealtimeSession 인터페이스 ---
 
-    def on(self, event_type: str, handler: Callable[..., Coroutine]) -> None:
-        """이벤트 핸들러 등록 (중복 방지)."""
+    def on(
+        self,
+        event_type: str,
+        handler: Callable[..., Coroutine],
+        detached: bool = False,
+    ) -> None:
+        """이벤트 핸들러 등록 (중복 방지). detached는 무시 — 스크립트 이벤트는 순차 실행."""
         handlers = self._handlers.setdefault(event_type, [])
         if handler not in handlers:
             handlers.append(handler)
@@ -170,14 +175,18 @@ class FakeRealtimeSession:
         """응답 취소 (no-op)."""
         pass
 
-    async def send_context_item(self, text: str) -> None:
-        """컨텍스트 아이템 추가 (no-op)."""
-        pass
+    async def send_context_item(self, text: str) -> str:
+        """컨텍스트 아이템 추가 (no-op, 아이템 ID 없음 → 매번 재주입)."""
+        return ""
 
     async def delete_item(self, item_id: str) -> None:
         """대화 아이템 삭제 (no-op)."""
         pass
 
+    def queue_item_deletes(self, item_ids: list[str]) -> None:
+        """대화 아이템 일괄 삭제 (no-op)."""
+        pass
+
     async def send_function_call_output(self, call_id: str, output: str) -> None:
         """Function call 결과 전송 (no-op)."""
         pass
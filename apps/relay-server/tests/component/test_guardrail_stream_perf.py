@@ -0,0 +1,106 @@
+"""Guardrail 텍스트 델타 검사 성능 벤치마크. 서버 불필요 — 모듈 직접 import.
+
+기존 방식(검사 시점마다 누적 버퍼 전체에 TextFilter.check 재실행)과
+StreamingTextFilter(오토마톤 상태 유지 + 정규식 꼬리 스캔)의 레벨 판정 일치 여부와
+응답 길이별 처리 시간을 비교한다.
+"""
+
+import time
+
+from src.guardrail.checker import GuardrailChecker, GuardrailLevel
+from src.guardrail.filter import TextFilter
+from tests.helpers import fail, header, ok
+
+_ITERATIONS = 20
+_DELTA_CHARS = 3  # Realtime response.text.delta 평균 크기 근사
+
+_SENTENCES = [
+    "안녕하세요, 내일 저녁 7시에 두 명 예약하고 싶습니다.",
+    "창가 자리가 있으면 그쪽으로 부탁드리겠습니다.",
+    "혹시 주차가 가능한지도 여쭤봐도 될까요?",
+    "알레르기가 있어서 견과류는 빼주실 수 있을까요?",
+    "결제는 카드로 하려고 하는데 괜찮으신가요?",
+]
+
+
+class _LegacyChecker:
+    """기존 check_text_delta: 검사 시점마다 버퍼 전체 재검사."""
+
+    def __init__(self, target_language: str = "ko"):
+        self._text_filter = TextFilter(target_language=target_language)
+        self._text_buffer = ""
+        self._current_level = GuardrailLevel.LEVEL_1
+
+    def reset(self) -> None:
+        self._text_buffer = ""
+        self._current_level = GuardrailLevel.LEVEL_1
+
+    def check_text_delta(self, delta: str) -> GuardrailLevel:
+        self._text_buffer += delta
+        if len(self._text_buffer) >= 100 or delta.rstrip().endswith((".", "!", "?", "요", "다")):
+            result = self._text_filter.check(self._text_buffer)
+            if result.has_profanity or result.has_threat:
+                level = GuardrailLevel.LEVEL_3
+            elif result.has_informal:
+                level = GuardrailLevel.LEVEL_2
+            else:
+                level = GuardrailLevel.LEVEL_1
+            if level > self._current_level:
+                self._current_level = level
+        return self._current_level
+
+
+def _deltas(text: str) -> list[str]:
+    return [text[i:i + _DELTA_CHARS] for i in range(0, len(text), _DELTA_CHARS)]
+
+
+def _response(chars: int) -> str:
+    text = ""
+    i = 0
+    while len(text) < chars:
+        text += _SENTENCES[i % len(_SENTENCES)] + " "
+        i += 1
+    return text[:chars]
+
+
+def _bench(checker, deltas: list[str]) -> float:
+    """응답 1개 처리 시간 (ms, 생성 비용 제외 — 응답마다 reset)."""
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        checker.reset()
+        for delta in deltas:
+            checker.check_text_delta(delta)
+    return (time.perf_counter() - start) * 1000 / _ITERATIONS
+
+
+async def run() -> bool:
+    header("Guardrail 스트리밍 필터 성능 테스트")
+    passed = True
+
+    cases = [
+        ("clean", _response(400)),
+        ("casual", _response(200) + " 그거 몰라 " + _response(200)),
+        ("profanity", _response(300) + " 씨발 " + _response(100)),
+        ("threat", _response(150) + " 경찰 신고하겠습니다. " + _response(150)),
+    ]
+    for name, text in cases:
+        deltas = _deltas(text)
+        legacy, streaming = _LegacyChecker(), GuardrailChecker(target_language="ko")
+        old = [legacy.check_text_delta(d) for d in deltas]
+        new = [streaming.check_text_delta(d) for d in deltas]
+        if old != new:
+            fail(f"판정 불일치: {name}")
+            passed = False
+    if passed:
+        ok(f"델타별 레벨 판정 일치: {len(cases)}개 응답")
+
+    for chars in (100, 300, 1000, 3000):
+        deltas = _deltas(_response(chars))
+        old_ms = _bench(_LegacyChecker(), deltas)
+        new_ms = _bench(GuardrailChecker(target_language="ko"), deltas)
+        ok(
+            f"{chars:>5}자 응답 ({len(deltas)} deltas): "
+            f"전체 재검사 {old_ms:.2f}ms → 증분 {new_ms:.2f}ms (×{old_ms / new_ms:.1f})"
+        )
+
+    return passed
@@ -0,0 +1,196 @@
+"""STT 할루시네이션 필터 성능 벤치마크. 서버 불필요 — 모듈 직접 import.
+
+기존 순차 필터(frozenset 조회 → 노이즈 루프 → 영어 필터 → [unclear] 루프 →
+append 부분 문자열 루프 → 반복 정규식)와 컴파일된 매처의 판정 일치 여부와
+처리량을 같은 코퍼스에서 비교한다.
+"""
+
+import re
+import time
+
+from src.realtime.stt_filter import get_language_rules, get_stt_matcher
+from tests.helpers import fail, header, ok
+
+_ITERATIONS = 100
+# Stage 2는 영어 수신자 통화의 번역 출력 (User 언어 텍스트)
+_OUTPUT_LANGUAGE = "ko"
+
+# 기존 구두점 정규화 (str.translate)
+_PUNCT_STRIP = str.maketrans("", "", "!?。！？…·")
+
+# 통화 STT 코퍼스: 정상 발화
+_CLEAN = [
+    "내일 저녁 7시에 두 명 예약 가능할까요?",
+    "네 잠시만 기다려 주세요. 확인해 보겠습니다.",
+    "그 시간은 이미 예약이 다 찼습니다. 8시는 어떠세요?",
+    "창가 자리로 부탁드려요",
+    "성함과 연락처를 말씀해 주시겠어요?",
+    "주차는 건물 뒤편에 하시면 됩니다",
+    "알겠습니다. 예약 도와드리겠습니다",
+    "혹시 알레르기 있으신 분 계신가요?",
+    "카드 결제도 가능합니다",
+    "예약 변경은 하루 전까지만 가능해요",
+]
+# 할루시네이션 (차단/trim 대상)
+_HALLUCINATIONS = [
+    "감사합니다.",
+    "시청해주셔서 감사합니다!",
+    "ㅋㅋㅋ",
+    "Thank you.",
+    "Hi, John.",
+    "네 알겠습니다 수고하셨습니다",
+    "왜 바꾸고 싶으시죠? 영상편집 배혜지",
+    "잘 안 들려요",
+    "네 네 네 네",
+    "okay",
+]
+_CORPUS = _CLEAN + _HALLUCINATIONS
+# 실제 통화 트래픽 비율 근사 (할루시네이션 ~10%)
+_TRAFFIC = _CLEAN * 9 + _HALLUCINATIONS
+_OUTPUTS = [
+    "I'd like to book a table for two at seven tomorrow evening.",
+    "Please hold on, let me check.",
+    "That time is fully booked. How about eight?",
+    "[unclear]",
+    "Thank you.",
+    "yes yes yes",
+    "Could you tell me your name and phone number?",
+    "We accept card payments.",
+]
+
+
+class _LegacyFilter:
+    """기존 session_b 모듈 수준 필터의 순차 구현 (규칙 데이터는 동일)."""
+
+    def __init__(self):
+        rules = get_language_rules()
+        self.ko_blocklist = rules["ko"].phrases("blocklist")
+        self.en_blocklist = rules["en"].phrases("blocklist")
+        self.en_short = rules["en"].phrases("short_phrases")
+        self.hi_name = rules["en"].anchored[0][1]
+        self.append = rules["ko"].phrases("append_substrings")
+        self.unclear = tuple(
+            sorted(rules["ko"].phrases("unclear_substrings") | rules["en"].phrases("unclear_substrings"))
+        )
+        self.trailing = rules["ko"].trailing_fragment
+        self.endings = rules["ko"].trailing_unless
+        self.repetition = re.compile(r'(\b\S+\b)(\s+\1){2,}', re.IGNORECASE)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return text.strip().translate(_PUNCT_STRIP)
+
+    def is_noise(self, text: str) -> bool:
+        stripped = text.strip()
+        if not stripped:
+            return True
+        non_space = stripped.replace(" ", "")
+        if non_space and all("ㄱ" <= c <= "ㅎ" for c in non_space):
+            return True
+        for plen in range(1, min(7, len(non_space) // 2 + 1)):
+            pat = non_space[:plen]
+            reps = len(non_space) // plen
+            if reps >= 3 and pat * reps == non_space[:plen * reps]:
+                return True
+        return len(non_space) <= 1
+
+    def is_en_short(self, text: str) -> bool:
+        stripped = text.strip()
+        if not stripped:
+            return False
+        core = stripped.rstrip(".")
+        if len(core.split()) > 3:
+            return False
+        return bool(self.hi_name.match(stripped)) or core.lower() in self.en_short
+
+    def stage1(self, text: str) -> str | None:
+        """STT 필터 (target=ko): 차단이면 None, 아니면 trim된 텍스트."""
+        normalized = self.normalize(text)
+        if normalized in self.ko_blocklist or self.is_noise(text):
+            return None
+        if normalized in self.en_blocklist or self.is_en_short(text):
+            return None
+        for sub in self.append:
+            idx = text.find(sub)
+            if idx >= 0:
+                text = text[:idx].rstrip()
+                if not text:
+                    return None
+        m = self.trailing.search(text)
+        if m and not self.endings.search(m.group(1).strip()):
+            text = text[:m.start() + 1].rstrip() or text
+        return text
+
+    def stage2(self, text: str) -> bool:
+        """번역 출력 필터 (target=en): 차단 여부."""
+        lowered = text.lower()
+        if any(p.lower() in lowered for p in self.unclear):
+            return True
+        normalized = self.normalize(text)
+        if normalized in self.ko_blocklist:
+            return True
+        if normalized in self.en_blocklist or self.is_en_short(text):
+            return True
+        return bool(self.repetition.search(text))
+
+
+def _matcher_stage1(text: str) -> str | None:
+    matcher = get_stt_matcher("ko")
+    hits = matcher.match(text)
+    if any(h.reason in ("blocklist", "noise", "short_phrase", "hi_name") for h in hits):
+        return None
+    append = next((h for h in hits if h.reason == "append"), None)
+    trailing = next((h for h in hits if h.reason == "trailing_fragment"), None)
+    if append:
+        text = text[:append.start].rstrip()
+        if not text:
+            return None
+        trailing = matcher.trailing_fragment(text)
+    if trailing:
+        text = text[:trailing.start + 1].rstrip() or text
+    return text
+
+
+def _matcher_stage2(text: str) -> bool:
+    return any(
+        h.reason in ("unclear", "blocklist", "short_phrase", "hi_name", "repetition")
+        for h in get_stt_matcher(_OUTPUT_LANGUAGE).match(text)
+    )
+
+
+def _bench(fn, corpus: list[str]) -> float:
+    """초당 처리 문장 수."""
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        for text in corpus:
+            fn(text)
+    return _ITERATIONS * len(corpus) / (time.perf_counter() - start)
+
+
+async def run() -> bool:
+    header("STT 할루시네이션 필터 성능 테스트")
+    legacy = _LegacyFilter()
+    passed = True
+
+    for text in _CORPUS:
+        if legacy.stage1(text) != _matcher_stage1(text):
+            fail(f"Stage 1 판정 불일치: {text!r}")
+            passed = False
+    for text in _OUTPUTS + _CORPUS:
+        if legacy.stage2(text) != _matcher_stage2(text):
+            fail(f"Stage 2 판정 불일치: {text!r}")
+            passed = False
+    if passed:
+        ok(f"판정 일치: Stage 1 {len(_CORPUS)}건, Stage 2 {len(_OUTPUTS) + len(_CORPUS)}건")
+
+    get_stt_matcher("ko")  # 컴파일 비용 제외
+    for name, old_fn, new_fn, corpus in (
+        ("Stage 1 (STT, 트래픽 비율)", legacy.stage1, _matcher_stage1, _TRAFFIC),
+        ("Stage 1 (STT, 할루시네이션만)", legacy.stage1, _matcher_stage1, _HALLUCINATIONS),
+        ("Stage 2 (번역 출력)", legacy.stage2, _matcher_stage2, _OUTPUTS + _CLEAN),
+    ):
+        old_rate = _bench(old_fn, corpus)
+        new_rate = _bench(new_fn, corpus)
+        ok(f"{name}: 순차 {old_rate:,.0f}/s → 매처 {new_rate:,.0f}/s (×{new_rate / old_rate:.1f})")
+
+    return passed
@@ -41,6 +41,8 @@ INTEGRATION_TESTS = {
 COMPONENT_TESTS = {
     "ringbuffer": "tests.component.test_ring_buffer_perf",
     "cost": "tests.component.test_cost_tracking",
+    "sttfilter": "tests.component.test_stt_filter_perf",
+    "guardrail": "tests.component.test_guardrail_stream_perf",
 }
 
 ALL_TESTS = {**INTEGRATION_TESTS, **COMPONENT_TESTS}
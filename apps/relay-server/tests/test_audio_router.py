@@ -75,6 +75,7 @@ def _make_router(
         mock_settings.audio_energy_min_rms = 150.0
         mock_settings.echo_energy_threshold_rms = 400.0
         mock_settings.local_vad_enabled = False
+        mock_settings.user_audio_silence_suppression_enabled = False
         mock_settings.echo_post_settling_s = 2.0
         router = AudioRouter(
             call=call,
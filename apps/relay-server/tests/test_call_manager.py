@@ -31,6 +31,7 @@ def sample_call() -> ActiveCall:
 def mock_dual_session() -> AsyncMock:
     session = AsyncMock()
     session.close = AsyncMock()
+    session.dispatch_lag_summary = MagicMock(return_value={})
     return session
 
 
@@ -0,0 +1,174 @@
+"""통화 시작 오케스트레이션 테스트 (Twilio 발신 ∥ 세션 연결).
+
+핵심 검증 사항:
+  - start_call: 세션 연결을 기다리지 않고 Twilio 발신 (병렬)
+  - Twilio 발신 실패 → cleanup_call(twilio_failed) + 502
+  - 세션 연결 실패 (발신 중/발신 후) → cleanup_call(session_failed)
+  - 단계별 call_setup_ms 기록
+  - DualSessionManager.wait_until_ready: 성공/실패/타임아웃
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from src.call_manager import CallManager
+from src.realtime.sessions.session_manager import DualSessionManager
+from src.routes import calls
+from src.types import CallMode, CallStartRequest
+
+
+def _request() -> CallStartRequest:
+    return CallStartRequest(
+        call_id="setup-001",
+        phone_number="+14155552671",
+        mode=CallMode.RELAY,
+        source_language="en",
+        target_language="ko",
+        system_prompt_override="prompt",
+    )
+
+
+def _dual() -> DualSessionManager:
+    return DualSessionManager(mode=CallMode.RELAY, source_language="en", target_language="ko")
+
+
+@pytest.fixture
+def cm() -> CallManager:
+    manager = CallManager()
+    with patch.object(calls, "call_manager", manager), patch.object(calls, "ensure_warm"):
+        yield manager
+
+
+class TestStartCall:
+    @pytest.mark.asyncio
+    async def test_dial_not_blocked_by_session_connect(self, cm: CallManager):
+        """세션 연결이 끝나기 전에 Twilio 발신이 시작된다."""
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def slow_connect(*args, **kwargs):
+            await release.wait()
+            order.append("connect")
+
+        async def dial(**kwargs):
+            order.append("dial")
+            return "CA_setup"
+
+        with (
+            patch.object(DualSessionManager, "connect", slow_connect),
+            patch.object(calls, "make_call_async", dial),
+        ):
+            resp = await calls.start_call(_request())
+            assert resp.call_sid == "CA_setup"
+            assert order == ["dial"]
+            release.set()
+            await asyncio.sleep(0.01)
+
+        assert order == ["dial", "connect"]
+        call = cm.get_call("setup-001")
+        assert call is not None
+        assert {"prompt", "twilio_dial", "session_connect"} <= call.call_metrics.call_setup_ms.keys()
+
+    @pytest.mark.asyncio
+    async def test_twilio_failure_cleans_up_session(self, cm: CallManager):
+        with (
+            patch.object(DualSessionManager, "connect", AsyncMock()),
+            patch.object(calls, "make_call_async", AsyncMock(side_effect=RuntimeError("twilio"))),
+        ):
+            with pytest.raises(HTTPException) as exc:
+                await calls.start_call(_request())
+
+        assert exc.value.status_code == 502
+        assert cm.get_session("setup-001") is None
+        assert cm.get_call("setup-001") is None
+
+    @pytest.mark.asyncio
+    async def test_session_failure_during_dial(self, cm: CallManager):
+        """발신 중 세션 연결이 실패하면 session_failed로 정리 + 502."""
+
+        async def dial(**kwargs):
+            await asyncio.sleep(0.01)
+            return "CA_setup"
+
+        with (
+            patch.object(DualSessionManager, "connect", AsyncMock(side_effect=OSError("ws"))),
+            patch.object(calls, "make_call_async", dial),
+            patch.object(cm, "cleanup_call", AsyncMock()) as cleanup,
+        ):
+            with pytest.raises(HTTPException) as exc:
+                await calls.start_call(_request())
+
+        assert exc.value.status_code == 502
+        cleanup.assert_awaited_once_with("setup-001", reason="session_failed")
+
+    @pytest.mark.asyncio
+    async def test_session_failure_after_dial(self, cm: CallManager):
+        """발신 후 세션 연결이 실패하면 백그라운드에서 session_failed로 정리."""
+        release = asyncio.Event()
+
+        async def failing_connect(*args, **kwargs):
+            await release.wait()
+            raise OSError("ws")
+
+        with (
+            patch.object(DualSessionManager, "connect", failing_connect),
+            patch.object(calls, "make_call_async", AsyncMock(return_value="CA_setup")),
+            patch.object(cm, "cleanup_call", AsyncMock()) as cleanup,
+        ):
+            await calls.start_call(_request())
+            release.set()
+            await asyncio.sleep(0.01)
+
+        cleanup.assert_awaited_once_with("setup-001", reason="session_failed")
+
+
+class TestWaitUntilReady:
+    @pytest.mark.asyncio
+    async def test_no_pending_connect(self):
+        assert await _dual().wait_until_ready(timeout=0.1) is True
+
+    @pytest.mark.asyncio
+    async def test_ready_after_connect(self):
+        dual = _dual()
+        with patch.object(DualSessionManager, "connect", AsyncMock()):
+            dual.start_connect("a", "b")
+            assert await dual.wait_until_ready(timeout=1.0) is True
+
+    @pytest.mark.asyncio
+    async def test_failed_connect(self):
+        dual = _dual()
+        with patch.object(DualSessionManager, "connect", AsyncMock(side_effect=OSError("ws"))):
+            dual.start_connect("a", "b")
+            assert await dual.wait_until_ready(timeout=1.0) is False
+
+    @pytest.mark.asyncio
+    async def test_timeout_does_not_cancel_connect(self):
+        """대기 측 타임아웃이 연결 task를 취소하지 않는다."""
+        dual = _dual()
+        release = asyncio.Event()
+
+        async def slow_connect(*args, **kwargs):
+            await release.wait()
+
+        with patch.object(DualSessionManager, "connect", slow_connect):
+            task = dual.start_connect("a", "b")
+            assert await dual.wait_until_ready(timeout=0.01) is False
+            assert not task.cancelled()
+            release.set()
+            assert await dual.wait_until_ready(timeout=1.0) is True
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_pending_connect(self):
+        dual = _dual()
+
+        async def slow_connect(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        with patch.object(DualSessionManager, "connect", slow_connect):
+            task = dual.start_connect("a", "b")
+            await asyncio.sleep(0)
+            await dual.close()
+        assert task.cancelled()
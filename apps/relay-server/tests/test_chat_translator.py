@@ -10,14 +10,33 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.realtime.chat_translator import ChatTranslationResult, ChatTranslator
+from src.realtime.chat_translator import (
+    ChatTranslationResult,
+    ChatTranslator,
+    HedgePolicy,
+    response_hedge_policy,
+    ttft_hedge_policy,
+)
 from src.realtime.sessions.session_b import SessionBHandler
+from src.realtime.translation_cache import translation_cache
 from src.types import ActiveCall, CallMode, CommunicationMode
 
 
 # ───────────────────────── helpers ─────────────────────────
 
 
+@pytest.fixture(autouse=True)
+def _reset_process_state():
+    """프로세스 전역 hedge 정책 / 번역 캐시를 테스트 간 격리."""
+    response_hedge_policy.reset()
+    ttft_hedge_policy.reset()
+    translation_cache.clear()
+    yield
+    response_hedge_policy.reset()
+    ttft_hedge_policy.reset()
+    translation_cache.clear()
+
+
 def _make_call(**overrides) -> ActiveCall:
     defaults = dict(
         call_id="test-call",
@@ -111,7 +130,7 @@ class TestChatTranslatorTranslate:
         mock_client = AsyncMock()
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-        with patch("src.realtime.chat_translator.AsyncOpenAI", return_value=mock_client):
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
             translator = ChatTranslator(
                 source_language="en",
                 target_language="ko",
@@ -124,6 +143,25 @@ class TestChatTranslatorTranslate:
         assert result.output_tokens == 8
         assert result.latency_ms > 0
 
+    @pytest.mark.asyncio
+    async def test_reports_cached_prompt_tokens(self):
+        """usage.prompt_tokens_details.cached_tokens를 cached_input_tokens로 반환한다."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "안녕하세요"
+        mock_response.usage = MagicMock(prompt_tokens=1200, completion_tokens=8)
+        mock_response.usage.prompt_tokens_details.cached_tokens = 1024
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
+            translator = ChatTranslator(source_language="en", target_language="ko")
+
+        result = await translator.translate("Hello")
+        assert result is not None
+        assert result.cached_input_tokens == 1024
+
     @pytest.mark.asyncio
     async def test_returns_none_on_timeout(self):
         """translate()가 타임아웃 시 None을 반환한다."""
@@ -132,7 +170,7 @@ class TestChatTranslatorTranslate:
             side_effect=asyncio.TimeoutError()
         )
 
-        with patch("src.realtime.chat_translator.AsyncOpenAI", return_value=mock_client):
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
             translator = ChatTranslator(
                 source_language="en",
                 target_language="ko",
@@ -152,7 +190,7 @@ class TestChatTranslatorTranslate:
             side_effect=RuntimeError("API Error")
         )
 
-        with patch("src.realtime.chat_translator.AsyncOpenAI", return_value=mock_client):
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
             translator = ChatTranslator(
                 source_language="en",
                 target_language="ko",
@@ -174,7 +212,7 @@ class TestChatTranslatorTranslate:
         mock_client = AsyncMock()
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-        with patch("src.realtime.chat_translator.AsyncOpenAI", return_value=mock_client):
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
             translator = ChatTranslator(
                 source_language="en",
                 target_language="ko",
@@ -199,7 +237,7 @@ class TestChatTranslatorTranslate:
         mock_context_manager = MagicMock()
         mock_context_manager.format_context.return_value = "User: Hello\nRecipient: 안녕"
 
-        with patch("src.realtime.chat_translator.AsyncOpenAI", return_value=mock_client):
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
             translator = ChatTranslator(
                 source_language="en",
                 target_language="ko",
@@ -228,7 +266,7 @@ class TestChatTranslatorTranslate:
         mock_client = AsyncMock()
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-        with patch("src.realtime.chat_translator.AsyncOpenAI", return_value=mock_client):
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
             translator = ChatTranslator(
                 source_language="en",
                 target_language="ko",
@@ -261,7 +299,7 @@ class TestChatTranslatorTranslate:
         mock_context_manager = MagicMock()
         mock_context_manager.format_context.return_value = ""
 
-        with patch("src.realtime.chat_translator.AsyncOpenAI", return_value=mock_client):
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
             translator = ChatTranslator(
                 source_language="en",
                 target_language="ko",
@@ -371,6 +409,22 @@ class TestTranslateViaChatApi:
         assert call.cost_tokens.chat_input == 25
         assert call.cost_tokens.chat_output == 12
 
+    @pytest.mark.asyncio
+    async def test_records_cached_chat_tokens(self):
+        """prompt cache hit 토큰과 해당 요청 지연이 기록된다."""
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock(input_tokens=1200, latency_ms=90.0)
+        chat_mock.translate.return_value.cached_input_tokens = 1024
+        handler = _make_handler(call=call, chat_translator=chat_mock)
+
+        handler._stt_texts = ["원문 텍스트"]
+        handler._stt_ready_event.set()
+
+        await handler._translate_via_chat_api()
+
+        assert call.cost_tokens.chat_cached_input == 1024
+        assert call.call_metrics.session_b_chat_cached_completion_ms == [90.0]
+
 
 class TestHandleInputTranscriptionForChatApi:
     """Chat API 모드에서 _handle_input_transcription_completed 동작 검증."""
@@ -836,12 +890,15 @@ class TestEnglishShortHallucination:
 
 
 class TestEnglishStage2Filter:
-    """Stage 2 (번역 출력)에서 EN 필터 검증."""
+    """Stage 2 (번역 출력)에서 EN 필터 검증.
+
+    영어 수신자 통화의 번역 출력은 User 언어(ko) 텍스트 — 영어 필러가 나오면 할루시네이션.
+    """
 
     @pytest.mark.asyncio
     async def test_en_blocklist_blocks_in_stage2(self):
         """번역 출력이 EN 블록리스트에 의해 Stage 2에서 차단된다."""
-        call = _make_call(target_language="en")
+        call = _make_call(source_language="ko", target_language="en")
         handler = _make_handler(call=call)
         handler._committed_speech_started_at = time.time() - 2.0
         handler._committed_speech_stopped_at = time.time() - 0.5
@@ -854,7 +911,7 @@ class TestEnglishStage2Filter:
     @pytest.mark.asyncio
     async def test_en_short_hallucination_blocks_in_stage2(self):
         """번역 출력이 EN short hallucination으로 Stage 2에서 차단된다."""
-        call = _make_call(target_language="en")
+        call = _make_call(source_language="ko", target_language="en")
         handler = _make_handler(call=call)
         handler._committed_speech_started_at = time.time() - 2.0
         handler._committed_speech_stopped_at = time.time() - 0.5
@@ -867,7 +924,7 @@ class TestEnglishStage2Filter:
     @pytest.mark.asyncio
     async def test_normal_translation_passes_stage2(self):
         """정상 번역 출력은 Stage 2를 통과한다."""
-        call = _make_call(target_language="en")
+        call = _make_call(source_language="ko", target_language="en")
         handler = _make_handler(call=call)
         handler._committed_speech_started_at = time.time() - 2.0
         handler._committed_speech_stopped_at = time.time() - 0.5
@@ -875,3 +932,608 @@ class TestEnglishStage2Filter:
         await handler._save_transcript_and_notify("I would like a table for two please")
 
         assert len(call.transcript_bilingual) == 1
+
+
+# ═══════════════════════════════════════════════════════════
+#  Part 5: 스트리밍 번역 (첫 토큰 자막 + 대체 시 취소)
+# ═══════════════════════════════════════════════════════════
+
+
+def _chunk(content: str | None = None, usage=None):
+    chunk = MagicMock()
+    chunk.usage = usage
+    if content is None:
+        chunk.choices = []
+    else:
+        choice = MagicMock()
+        choice.delta.content = content
+        chunk.choices = [choice]
+    return chunk
+
+
+class _FakeStream:
+    """chat.completions.create(stream=True) 결과 mock."""
+
+    def __init__(self, chunks, gate: asyncio.Event | None = None):
+        self._chunks = chunks
+        self._gate = gate
+        self.close = AsyncMock()
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for i, c in enumerate(self._chunks):
+            if i > 0 and self._gate is not None:
+                await self._gate.wait()
+            yield c
+
+
+def _stream_translator(stream: _FakeStream, timeout_ms: int = 3000) -> ChatTranslator:
+    mock_client = AsyncMock()
+    mock_client.chat.completions.create = AsyncMock(return_value=stream)
+    with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
+        return ChatTranslator(source_language="ko", target_language="en", timeout_ms=timeout_ms)
+
+
+class TestChatTranslatorStream:
+    @pytest.mark.asyncio
+    async def test_streams_deltas_and_records_ttft(self):
+        usage = MagicMock(prompt_tokens=20, completion_tokens=3)
+        stream = _FakeStream([_chunk(" Hello"), _chunk(" there"), _chunk(None, usage=usage)])
+        translator = _stream_translator(stream)
+        deltas: list[str] = []
+
+        async def on_delta(d):
+            deltas.append(d)
+
+        result = await translator.translate_stream("안녕하세요", on_delta)
+
+        assert deltas == ["Hello", " there"]
+        assert result.translated_text == "Hello there"
+        assert result.input_tokens == 20
+        assert result.output_tokens == 3
+        assert 0 < result.ttft_ms <= result.latency_ms
+        kwargs = translator._client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        stream.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stall_timeout_returns_none(self):
+        """첫 토큰 이후 청크가 정체되면 None (부분 결과는 호출자가 폐기)."""
+        stream = _FakeStream([_chunk("Hel"), _chunk("lo")], gate=asyncio.Event())
+        translator = _stream_translator(stream, timeout_ms=20)
+
+        result = await translator.translate_stream("안녕", AsyncMock())
+
+        assert result is None
+        stream.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancel_propagates_and_closes_stream(self):
+        gate = asyncio.Event()
+        stream = _FakeStream([_chunk("Hel"), _chunk("lo")], gate=gate)
+        translator = _stream_translator(stream)
+        first = asyncio.Event()
+
+        async def on_delta(d):
+            first.set()
+
+        task = asyncio.create_task(translator.translate_stream("안녕", on_delta))
+        await first.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        stream.close.assert_awaited_once()
+
+
+class TestSessionBStreamingTranslation:
+    def _streaming_handler(self, call, translate_stream):
+        chat_mock = _make_chat_translator_mock()
+        chat_mock.translate_stream = translate_stream
+        handler = _make_handler(
+            call=call,
+            chat_translator=chat_mock,
+            stream_translation=True,
+            on_caption_superseded=AsyncMock(),
+        )
+        handler._stt_texts = ["안녕하세요"]
+        handler._stt_ready_event.set()
+        handler._committed_speech_started_at = time.time() - 2.0
+        handler._committed_speech_stopped_at = time.time() - 0.5
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_deltas_sent_without_duplicate_full_caption(self):
+        call = _make_call()
+
+        async def translate_stream(text, on_delta):
+            await on_delta("Hello")
+            await on_delta(" there")
+            return ChatTranslationResult("Hello there", 10, 2, latency_ms=300.0, ttft_ms=80.0)
+
+        handler = self._streaming_handler(call, translate_stream)
+        await handler._translate_via_chat_api()
+
+        assert [c.args for c in handler._on_caption.await_args_list] == [
+            ("recipient", "Hello"),
+            ("recipient", " there"),
+        ]
+        assert call.transcript_bilingual[0].translated_text == "Hello there"
+        assert call.call_metrics.session_b_chat_ttft_ms == [80.0]
+        assert call.call_metrics.session_b_chat_completion_ms == [300.0]
+        handler._on_caption_superseded.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_superseded_by_new_speech(self):
+        """스트리밍 중 취소되면 부분 자막 폐기 알림 + 누적 STT 보존."""
+        call = _make_call()
+        started = asyncio.Event()
+
+        async def translate_stream(text, on_delta):
+            await on_delta("Hel")
+            started.set()
+            await asyncio.Event().wait()
+
+        handler = self._streaming_handler(call, translate_stream)
+        task = asyncio.create_task(handler._translate_via_chat_api())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        handler._on_caption_superseded.assert_awaited_once()
+        assert call.call_metrics.chat_translations_superseded == 1
+        assert handler._stt_texts == ["안녕하세요"]
+        assert call.transcript_bilingual == []
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_retracts_partial(self):
+        call = _make_call()
+
+        async def translate_stream(text, on_delta):
+            await on_delta("Hel")
+            return None
+
+        handler = self._streaming_handler(call, translate_stream)
+        await handler._translate_via_chat_api()
+
+        handler._on_caption_superseded.assert_awaited_once()
+        assert call.transcript_bilingual == []
+
+
+# ═══════════════════════════════════════════════════════════
+#  Part 6: Hedged 요청 (적응형 임계값 + 먼저 도착한 응답 사용)
+# ═══════════════════════════════════════════════════════════
+
+
+def _response(text: str):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = text
+    response.usage = MagicMock(prompt_tokens=10, completion_tokens=3)
+    return response
+
+
+class TestHedgePolicy:
+    def test_initial_threshold_until_min_samples(self):
+        policy = HedgePolicy(min_samples=5, initial_ms=1000, min_ms=100, max_ms=3000)
+        for _ in range(4):
+            policy.record(200, hedged=False, hedge_won=False)
+        assert policy.threshold_ms == 1000
+
+    def test_percentile_and_clamp(self):
+        policy = HedgePolicy(percentile=0.9, min_samples=10, min_ms=100, max_ms=3000)
+        for ms in range(100, 1100, 100):  # 100..1000
+            policy.record(ms, hedged=False, hedge_won=False)
+        assert policy.threshold_ms == 1000
+        low = HedgePolicy(min_samples=1, min_ms=300)
+        low.record(50, hedged=False, hedge_won=False)
+        assert low.threshold_ms == 300
+
+    def test_rates(self):
+        policy = HedgePolicy()
+        policy.record(100, hedged=True, hedge_won=True)
+        policy.record(100, hedged=True, hedge_won=False)
+        policy.record(100, hedged=False, hedge_won=False)
+        stats = policy.stats()
+        assert stats["hedge_rate"] == pytest.approx(0.667, abs=1e-3)
+        assert stats["win_rate"] == 0.5
+
+
+class TestHedgedTranslate:
+    def _translator(self, create) -> ChatTranslator:
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = create
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=mock_client):
+            return ChatTranslator(
+                source_language="ko",
+                target_language="en",
+                timeout_ms=1000,
+                hedge_enabled=True,
+                hedge_model="hedge-model",
+            )
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_when_primary_slow(self):
+        primary_cancelled = asyncio.Event()
+
+        async def create(**kwargs):
+            if kwargs["model"] == "hedge-model":
+                return _response("Fast")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+
+        translator = self._translator(create)
+        with patch.object(response_hedge_policy, "_initial_ms", 20.0):
+            result = await translator.translate("안녕")
+
+        assert result.translated_text == "Fast"
+        assert result.hedged and result.hedge_won
+        assert primary_cancelled.is_set()
+        assert response_hedge_policy.stats()["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_primary_fast(self):
+        create = AsyncMock(return_value=_response("Hi"))
+        translator = self._translator(create)
+
+        result = await translator.translate("안녕")
+
+        assert result.translated_text == "Hi"
+        assert not result.hedged
+        assert create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_primary_failure_after_hedge_uses_hedge(self):
+        async def create(**kwargs):
+            if kwargs["model"] == "hedge-model":
+                await asyncio.sleep(0.05)
+                return _response("From hedge")
+            await asyncio.sleep(0.03)
+            raise RuntimeError("primary 500")
+
+        translator = self._translator(create)
+        with patch.object(response_hedge_policy, "_initial_ms", 20.0):
+            result = await translator.translate("안녕")
+
+        assert result.translated_text == "From hedge"
+        assert result.hedge_won
+
+    @pytest.mark.asyncio
+    async def test_stream_hedge_closes_loser(self):
+        fast = _FakeStream([_chunk("Fast"), _chunk(None, usage=MagicMock(prompt_tokens=1, completion_tokens=1))])
+        slow = _FakeStream([_chunk("Slow")])
+
+        async def create(**kwargs):
+            if kwargs["model"] == "hedge-model":
+                return fast
+            await asyncio.sleep(10)
+            return slow
+
+        translator = self._translator(create)
+        deltas: list[str] = []
+
+        async def on_delta(d):
+            deltas.append(d)
+
+        with patch.object(ttft_hedge_policy, "_initial_ms", 20.0):
+            result = await translator.translate_stream("안녕", on_delta)
+
+        assert deltas == ["Fast"]
+        assert result.hedge_won
+        fast.close.assert_awaited()
+        slow.close.assert_not_awaited()  # 생성 전 취소됨
+        assert ttft_hedge_policy.stats()["hedged"] == 1
+
+
+# ═══════════════════════════════════════════════════════════
+#  Part 7: Speculative 번역 (Part 1 STT 선행 번역 + 이어 번역)
+# ═══════════════════════════════════════════════════════════
+
+
+class TestSpeculativeTranslation:
+    def _speculative_handler(self, call, chat_mock, **kwargs) -> SessionBHandler:
+        handler = _make_handler(call=call, chat_translator=chat_mock, **kwargs)
+        handler._is_recipient_speaking = True
+        handler._speculative_committed = True
+        handler._pending_stt_count = 1
+        handler._stt_ready_event.clear()
+        return handler
+
+    async def _finish_turn(self, handler, part2: str | None):
+        """발화 종료 → Part 2 STT 도착 → 최종 번역."""
+        handler._is_recipient_speaking = False
+        handler._committed_speech_started_at = time.time() - 3.0
+        handler._committed_speech_stopped_at = time.time() - 0.5
+        if part2 is not None:
+            handler._pending_stt_count = 1
+            handler._stt_ready_event.clear()
+            await handler._handle_input_transcription_completed({"transcript": part2})
+        await handler._translate_via_chat_api()
+
+    @pytest.mark.asyncio
+    async def test_part1_translated_during_speech(self):
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock(translated_text="I'd like to book")
+        handler = self._speculative_handler(call, chat_mock)
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        await asyncio.sleep(0)
+
+        chat_mock.translate.assert_awaited_once_with("예약을 하고 싶은데요")
+        assert handler._prefix_translation_task is not None
+
+    @pytest.mark.asyncio
+    async def test_not_started_after_speech_stopped(self):
+        chat_mock = _make_chat_translator_mock()
+        handler = self._speculative_handler(_make_call(), chat_mock)
+        handler._is_recipient_speaking = False
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+
+        assert handler._prefix_translation_task is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_setting(self):
+        chat_mock = _make_chat_translator_mock()
+        handler = self._speculative_handler(_make_call(), chat_mock)
+
+        with patch("src.realtime.sessions.session_b.settings") as mock_settings:
+            mock_settings.speculative_translation_enabled = False
+            handler._maybe_start_prefix_translation()
+            handler._stt_texts = ["예약을 하고 싶은데요"]
+            handler._pending_stt_count = 0
+            handler._maybe_start_prefix_translation()
+
+        assert handler._prefix_translation_task is None
+
+    @pytest.mark.asyncio
+    async def test_part2_translated_as_continuation(self):
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock()
+        chat_mock.translate.side_effect = [
+            ChatTranslationResult("I'd like to book", 10, 4, latency_ms=400.0),
+            ChatTranslationResult("for two people tomorrow.", 20, 5, latency_ms=150.0),
+        ]
+        handler = self._speculative_handler(call, chat_mock)
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        handler._prefix_started_at = time.monotonic() - 0.7  # 선행 번역을 0.7초 전에 요청
+        await self._finish_turn(handler, "내일 두 명이요")
+
+        assert chat_mock.translate.await_args_list[1].args == ("내일 두 명이요",)
+        assert chat_mock.translate.await_args_list[1].kwargs == {
+            "prefix": ("예약을 하고 싶은데요", "I'd like to book"),
+        }
+        entry = call.transcript_bilingual[0]
+        assert entry.original_text == "예약을 하고 싶은데요 내일 두 명이요"
+        assert entry.translated_text == "I'd like to book for two people tomorrow."
+        assert call.cost_tokens.chat_input == 30
+        # 결합 결과 지연은 이어 번역(150ms)이 아닌 선행 번역 요청부터의 end-to-end
+        (latency_ms,) = call.call_metrics.session_b_chat_completion_ms
+        assert 700.0 <= latency_ms < 1000.0
+        assert call.call_metrics.speculative_translation_hits == 1
+        assert len(call.call_metrics.session_b_speculative_processing_ms) == 1
+        assert handler._prefix_translation_task is None
+
+    @pytest.mark.asyncio
+    async def test_cached_prefix_counted_as_cache_hit(self):
+        """선행 번역이 번역 메모 캐시 hit이면 이어 번역과 결합해도 캐시 hit으로 집계한다."""
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock()
+        chat_mock.translate.side_effect = [
+            ChatTranslationResult("I'd like to book", 0, 0, latency_ms=0.0, cached=True),
+            ChatTranslationResult("for two people tomorrow.", 20, 5, latency_ms=150.0),
+        ]
+        handler = self._speculative_handler(call, chat_mock)
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        await self._finish_turn(handler, "내일 두 명이요")
+
+        assert call.transcript_bilingual[0].translated_text == "I'd like to book for two people tomorrow."
+        assert call.call_metrics.chat_translation_cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_prefix_reused_when_no_part2(self):
+        """Part 2가 필터링되면 선행 번역을 그대로 사용 (추가 요청 없음)."""
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock(translated_text="I'd like to book")
+        handler = self._speculative_handler(call, chat_mock)
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        await self._finish_turn(handler, "")
+
+        assert chat_mock.translate.await_count == 1
+        assert call.transcript_bilingual[0].translated_text == "I'd like to book"
+        handler._on_caption.assert_awaited_once_with("recipient", "I'd like to book")
+
+    @pytest.mark.asyncio
+    async def test_failed_prefix_falls_back_to_full_translation(self):
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock()
+        chat_mock.translate.side_effect = [
+            None,
+            ChatTranslationResult("I'd like to book for two.", 10, 5, latency_ms=300.0),
+        ]
+        handler = self._speculative_handler(call, chat_mock)
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        await self._finish_turn(handler, "두 명이요")
+
+        assert chat_mock.translate.await_args_list[1].args == ("예약을 하고 싶은데요 두 명이요",)
+        assert call.call_metrics.speculative_translation_misses == 1
+        assert call.call_metrics.session_b_speculative_processing_ms == []
+
+    @pytest.mark.asyncio
+    async def test_failed_continuation_retranslates_full_utterance(self):
+        """이어 번역이 실패해도 턴을 버리지 않고 전체 발화를 다시 번역한다."""
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock()
+        chat_mock.translate.side_effect = [
+            ChatTranslationResult("I'd like to book", 10, 4, latency_ms=400.0),
+            None,
+            ChatTranslationResult("I'd like to book for two.", 12, 6, latency_ms=300.0),
+        ]
+        handler = self._speculative_handler(call, chat_mock)
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        await self._finish_turn(handler, "두 명이요")
+
+        assert chat_mock.translate.await_args_list[2].args == ("예약을 하고 싶은데요 두 명이요",)
+        assert call.transcript_bilingual[0].translated_text == "I'd like to book for two."
+        assert call.call_metrics.speculative_translation_misses == 1
+        assert call.call_metrics.speculative_translation_hits == 0
+        assert call.call_metrics.session_b_speculative_processing_ms == []
+
+    @pytest.mark.asyncio
+    async def test_failed_streamed_continuation_retracts_prefix_caption(self):
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock(translated_text="I'd like to book")
+        streams: list[str] = []
+
+        async def translate_stream(text, on_delta, prefix=None):
+            streams.append(text)
+            if prefix is not None:
+                return None
+            await on_delta("I'd like to book for two.")
+            return ChatTranslationResult("I'd like to book for two.", 12, 6, latency_ms=300.0)
+
+        chat_mock.translate_stream = translate_stream
+        handler = self._speculative_handler(
+            call, chat_mock, stream_translation=True, on_caption_superseded=AsyncMock()
+        )
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        await self._finish_turn(handler, "두 명이요")
+
+        assert streams == ["두 명이요", "예약을 하고 싶은데요 두 명이요"]
+        handler._on_caption_superseded.assert_awaited_once()
+        assert call.transcript_bilingual[0].translated_text == "I'd like to book for two."
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("user_language,expected", [
+        ("ja", "予約したいのですが、明日二人です。"),
+        ("zh", "予約したいのですが、明日二人です。"),
+        ("en", "予約したいのですが、 明日二人です。"),
+    ])
+    async def test_no_space_language_joined_without_separator(self, user_language, expected):
+        """번역 출력 언어(User 언어)가 띄어쓰기 없는 언어면 선행/이어 번역을 구분자 없이 잇는다."""
+        call = _make_call(source_language=user_language, target_language="ko")
+        chat_mock = _make_chat_translator_mock()
+        # 운영과 같은 연결: Session B 번역 대상 = User 언어 (text_to_voice: target_language=call.source_language)
+        chat_mock.target_language = call.source_language
+        chat_mock.translate.side_effect = [
+            ChatTranslationResult("予約したいのですが、", 10, 4, latency_ms=400.0),
+            ChatTranslationResult("明日二人です。", 20, 5, latency_ms=150.0),
+        ]
+        handler = self._speculative_handler(call, chat_mock)
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        await self._finish_turn(handler, "내일 두 명이요")
+
+        assert call.transcript_bilingual[0].translated_text == expected
+
+    @pytest.mark.asyncio
+    async def test_stale_prefix_discarded(self):
+        """_stt_texts 앞부분이 선행 번역 원문과 다르면 폐기한다."""
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock(translated_text="Full")
+        handler = self._speculative_handler(call, chat_mock)
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        handler._stt_texts = ["다른 발화"]
+        await self._finish_turn(handler, None)
+
+        assert chat_mock.translate.await_args_list[-1].args == ("다른 발화",)
+        assert call.call_metrics.speculative_translation_misses == 1
+
+    @pytest.mark.asyncio
+    async def test_streaming_sends_prefix_then_continuation(self):
+        call = _make_call()
+        chat_mock = _make_chat_translator_mock(translated_text="I'd like to book")
+
+        async def translate_stream(text, on_delta, prefix=None):
+            assert prefix == ("예약을 하고 싶은데요", "I'd like to book")
+            await on_delta("for two")
+            return ChatTranslationResult("for two", 5, 2, latency_ms=120.0, ttft_ms=60.0)
+
+        chat_mock.translate_stream = translate_stream
+        handler = self._speculative_handler(call, chat_mock, stream_translation=True)
+
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        handler._on_caption.reset_mock()
+        await self._finish_turn(handler, "두 명이요")
+
+        assert [c.args for c in handler._on_caption.await_args_list] == [
+            ("recipient", "I'd like to book"),
+            ("recipient", " for two"),
+        ]
+        assert call.transcript_bilingual[0].translated_text == "I'd like to book for two"
+        assert call.call_metrics.session_b_chat_ttft_ms == [60.0]
+
+    @pytest.mark.asyncio
+    async def test_cancel_keeps_prefix_for_next_attempt(self):
+        """최종 번역이 새 발화로 취소되어도 선행 번역 task는 유지된다."""
+        call = _make_call()
+        release = asyncio.Event()
+        chat_mock = _make_chat_translator_mock()
+
+        async def slow_translate(text, prefix=None):
+            await release.wait()
+            return ChatTranslationResult("I'd like to book", 10, 4, latency_ms=400.0)
+
+        chat_mock.translate.side_effect = slow_translate
+        handler = self._speculative_handler(call, chat_mock)
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        prefix_task = handler._prefix_translation_task
+
+        handler._is_recipient_speaking = False
+        task = asyncio.create_task(handler._translate_via_chat_api())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert handler._prefix_translation_task is prefix_task
+        assert not prefix_task.cancelled()
+        release.set()
+        await prefix_task
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_prefix_task(self):
+        chat_mock = _make_chat_translator_mock()
+
+        async def hang(text, prefix=None):
+            await asyncio.Event().wait()
+
+        chat_mock.translate.side_effect = hang
+        handler = self._speculative_handler(_make_call(), chat_mock)
+        await handler._handle_input_transcription_completed({"transcript": "예약을 하고 싶은데요"})
+        task = handler._prefix_translation_task
+
+        handler.stop()
+        await asyncio.sleep(0)
+
+        assert task.cancelled()
+        assert handler._prefix_translation_task is None
+
+
+class TestChatTranslatorContinuation:
+    @pytest.mark.asyncio
+    async def test_prefix_added_to_messages_and_cache_skipped(self):
+        translator = ChatTranslator(source_language="ko", target_language="en")
+        translator._client = MagicMock()
+        translator._client.chat.completions.create = AsyncMock(return_value=_response("two people"))
+
+        result = await translator.translate("두 명이요", prefix=("예약이요", "A booking"))
+
+        assert result.translated_text == "two people"
+        messages = translator._client.chat.completions.create.await_args.kwargs["messages"]
+        assert "Original: 예약이요" in messages[-2]["content"]
+        assert "Translation: A booking" in messages[-2]["content"]
+        assert messages[-1] == {"role": "user", "content": "두 명이요"}
+        assert translation_cache.stats()["size"] == 0
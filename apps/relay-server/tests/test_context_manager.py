@@ -1,10 +1,11 @@
-"""ConversationContextManager 테스트 — 슬라이딩 윈도우 대화 컨텍스트."""
+"""ConversationContextManager 테스트 — 토큰 예산 대화 컨텍스트 + 롤링 요약."""
 
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.realtime.context_manager import ConversationContextManager
+from src.realtime.context_manager import ConversationContextManager, estimate_tokens
+from src.types import ActiveCall, CallMode
 
 
 class TestConversationContextManager:
@@ -24,22 +25,57 @@ class TestConversationContextManager:
             ctx.add_turn("user" if i % 2 == 0 else "recipient", f"Turn {i}")
 
         assert ctx.turn_count == 3
+        summary, *recent = ctx.format_context().split("\n")
+        assert recent == ["User: Turn 2", "Recipient: Turn 3", "User: Turn 4"]
+        # 윈도우 밖 턴은 롤링 요약으로 접힘
+        assert summary == "Earlier (summary): User: Turn 0 | Recipient: Turn 1"
+
+    def test_token_budget_folds_old_turns(self):
+        """토큰 예산 초과 시 오래된 턴이 턴 수 상한 전이라도 요약으로 접힘."""
+        ctx = ConversationContextManager(max_turns=6, token_budget=40, summary_token_budget=15)
+        for i in range(4):
+            ctx.add_turn("user", f"Sentence number {i} is long enough to use tokens")
+
+        assert ctx.token_count <= 40
+        assert ctx.turn_count < 4
         context = ctx.format_context()
-        assert "Turn 2" in context
-        assert "Turn 3" in context
-        assert "Turn 4" in context
-        assert "Turn 0" not in context
-        assert "Turn 1" not in context
+        assert context.endswith("User: Sentence number 3 is long enough to use tokens")
+        assert context.startswith("Earlier (summary):")
 
-    def test_max_chars_per_turn(self):
-        """턴당 최대 문자 수 제한."""
-        ctx = ConversationContextManager(max_chars=10)
-        ctx.add_turn("user", "This is a very long sentence that exceeds the limit")
+    def test_summary_budget_drops_oldest(self):
+        """요약 예산 초과 시 가장 오래된 요약 항목부터 폐기."""
+        ctx = ConversationContextManager(max_turns=1, token_budget=200, summary_token_budget=7)
+        for i in range(4):
+            ctx.add_turn("user", f"Turn {i}")
+
+        summary = ctx.format_context().split("\n")[0]
+        assert "Turn 2" in summary
+        assert "Turn 0" not in summary
+
+    def test_long_single_turn_clipped_to_budget(self):
+        """최신 턴 하나가 예산을 넘으면 예산에 맞게 잘림."""
+        ctx = ConversationContextManager(token_budget=10)
+        ctx.add_turn("user", "This is a very long sentence that exceeds the limit by a wide margin")
 
         context = ctx.format_context()
-        # "User: " prefix + 10 chars max
-        assert "This is a " in context
-        assert "exceeds" not in context
+        assert context.startswith("User: This is a")
+        assert "margin" not in context
+        assert ctx.token_count <= 10
+
+    def test_estimate_tokens(self):
+        """ASCII는 ~4자/토큰, 한글은 더 촘촘하게 계산."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcdefgh") == 2
+        assert estimate_tokens("예약하고 싶습니다") > estimate_tokens("reservation")
+
+    def test_format_context_cached(self):
+        """턴이 바뀌지 않으면 같은 문자열 객체를 재사용."""
+        ctx = ConversationContextManager()
+        ctx.add_turn("user", "Hello")
+        first = ctx.format_context()
+        assert ctx.format_context() is first
+        ctx.add_turn("recipient", "Hi")
+        assert ctx.format_context() is not first
 
     def test_format_context(self):
         """포맷이 올바름."""
@@ -104,3 +140,35 @@ class TestConversationContextManager:
         await ctx.inject_context(session)
 
         session.send_context_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_context_not_reinjected(self):
+        """컨텍스트가 그대로이고 아이템이 세션에 남아 있으면 재주입 생략."""
+        call = ActiveCall(call_id="ctx", mode=CallMode.RELAY)
+        ctx = ConversationContextManager(call=call)
+        ctx.add_turn("user", "Hello")
+
+        session = MagicMock()
+        session.context_item_id = ""
+
+        async def _send(text: str) -> str:
+            session.context_item_id = "ctx_1"
+            return "ctx_1"
+
+        session.send_context_item = AsyncMock(side_effect=_send)
+
+        await ctx.inject_context(session)
+        await ctx.inject_context(session)
+        assert session.send_context_item.await_count == 1
+        assert call.call_metrics.context_injections_skipped == 1
+        assert call.call_metrics.context_tokens_per_turn == [ctx.token_count]
+
+        # 프루닝으로 아이템 삭제 → 재주입
+        session.context_item_id = ""
+        await ctx.inject_context(session)
+        assert session.send_context_item.await_count == 2
+
+        # 새 턴 추가 → 재주입
+        ctx.add_turn("recipient", "안녕하세요")
+        await ctx.inject_context(session)
+        assert session.send_context_item.await_count == 3
@@ -0,0 +1,141 @@
+"""ConversationLedger + RealtimeSession 일괄 삭제 큐 테스트.
+
+핵심 검증 사항:
+  - 아이템 토큰 근사치: 텍스트 / 오디오 (transcript 도착 시 갱신)
+  - 프루닝: 보호 아이템 제외, 한 번의 queue_item_deletes 호출
+  - 토큰 예산 초과: 최신/보호 아이템을 제외한 오래된 아이템부터 삭제
+  - live 대화 크기를 CallMetrics에 반영
+  - 삭제 큐: 다음 이벤트 전송 전에 먼저 flush (순서 보장)
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.realtime.sessions.conversation_ledger import ConversationLedger
+from src.realtime.sessions.session_manager import RealtimeSession
+from src.types import ActiveCall, CallMode, SessionConfig
+
+
+def _text_item(item_id: str, text: str = "Hello there", role: str = "user") -> dict:
+    return {"id": item_id, "type": "message", "role": role, "content": [{"type": "input_text", "text": text}]}
+
+
+def _audio_item(item_id: str, role: str = "user") -> dict:
+    return {"id": item_id, "type": "message", "role": role, "content": [{"type": "input_audio", "transcript": None}]}
+
+
+class TestConversationLedger:
+    def test_prune_batches_deletes(self):
+        session = MagicMock()
+        ledger = ConversationLedger(session, "session_a")
+        for i in range(3):
+            ledger.add(_text_item(f"item_{i}"))
+
+        assert ledger.prune(keep_last=1) == 2
+
+        session.queue_item_deletes.assert_called_once_with(["item_0", "item_1"])
+        assert ledger.item_ids == ["item_2"]
+
+    def test_prune_skips_protected(self):
+        session = MagicMock()
+        ledger = ConversationLedger(session, "session_b")
+        for item_id in ["in_1", "out_1", "in_2"]:
+            ledger.add(_text_item(item_id))
+
+        ledger.prune(keep_last=0, protected={"in_2"})
+
+        session.queue_item_deletes.assert_called_once_with(["in_1", "out_1"])
+        assert ledger.item_ids == ["in_2"]
+
+    def test_prune_noop_within_keep(self):
+        session = MagicMock()
+        ledger = ConversationLedger(session, "session_a")
+        ledger.add(_text_item("item_0"))
+
+        assert ledger.prune(keep_last=1) == 0
+        session.queue_item_deletes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_audio_tokens_updated_from_transcript(self):
+        ledger = ConversationLedger(MagicMock(), "session_b")
+        ledger.add(_audio_item("in_1"))
+        default = ledger.tokens
+
+        await ledger.handle_transcript({"item_id": "in_1", "transcript": "a" * 400})
+
+        assert ledger.tokens == 300  # 100 텍스트 토큰 × 3
+        assert ledger.tokens != default
+
+    def test_budget_evicts_oldest_except_newest_and_protected(self):
+        session = MagicMock()
+        ledger = ConversationLedger(session, "session_b", token_budget=10)
+        protected = {"a"}  # 응답 대기 중 입력
+        for item_id in ["a", "b", "c"]:  # 각 4 tokens → 12 > 10
+            ledger.add(_text_item(item_id, "x" * 16), protected=protected)
+
+        session.queue_item_deletes.assert_called_once_with(["b"])
+        assert ledger.item_ids == ["a", "c"]
+        assert ledger.tokens == 8
+
+    def test_publishes_live_size(self):
+        call = ActiveCall(call_id="ledger", mode=CallMode.RELAY)
+        ledger = ConversationLedger(MagicMock(), "session_a", call=call)
+        ledger.add(_text_item("a", "x" * 40))
+        ledger.add(_text_item("b", "x" * 40))
+        ledger.prune(keep_last=0)
+
+        metrics = call.call_metrics
+        assert metrics.conversation_items["session_a"] == 0
+        assert metrics.conversation_tokens["session_a"] == 0
+        assert metrics.conversation_peak_tokens["session_a"] == 20
+
+
+class _RecordingWs:
+    def __init__(self):
+        self.sent: list[dict] = []
+
+    async def send(self, raw: str) -> None:
+        await asyncio.sleep(0)
+        self.sent.append(json.loads(raw))
+
+
+class TestSessionDeleteQueue:
+    def _make_session(self) -> RealtimeSession:
+        session = RealtimeSession(
+            "SessionA",
+            SessionConfig(mode=CallMode.RELAY, source_language="en", target_language="ko"),
+        )
+        session.ws = _RecordingWs()
+        return session
+
+    @pytest.mark.asyncio
+    async def test_deletes_flushed_in_background(self):
+        session = self._make_session()
+
+        session.queue_item_deletes(["a", "b"])
+        await session._delete_flush_task
+
+        assert [e["item_id"] for e in session.ws.sent] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_deletes_precede_next_event(self):
+        session = self._make_session()
+
+        session.queue_item_deletes(["a", "b", "c"])
+        await session.create_response()
+
+        types = [e["type"] for e in session.ws.sent]
+        assert types == ["conversation.item.delete"] * 3 + ["response.create"]
+
+    @pytest.mark.asyncio
+    async def test_queued_context_item_cleared(self):
+        session = self._make_session()
+        item_id = await session.send_context_item("context")
+
+        session.queue_item_deletes([item_id])
+
+        assert session.context_item_id == ""
+        await session._delete_flush_task
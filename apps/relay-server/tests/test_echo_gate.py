@@ -73,6 +73,7 @@ def _make_router() -> AudioRouter:
         mock_settings.audio_energy_min_rms = 150.0
         mock_settings.echo_energy_threshold_rms = 400.0
         mock_settings.local_vad_enabled = False  # 테스트에서는 Server VAD 사용
+        mock_settings.user_audio_silence_suppression_enabled = False
         router = AudioRouter(
             call=call,
             dual_session=dual,
@@ -0,0 +1,230 @@
+"""TurnEndpointer 테스트 (운율/의미 기반 조기 발화 종료).
+
+핵심 검증 사항:
+  - F0 추정: 유성음(정현파) Hz 추정, 무음/잡음 → 0
+  - 하강 에너지/피치 + 깊은 무음 → 짧은 무음 후 조기 종료
+  - 평탄한 꼬리 + 얕은 무음(발화 내 쉼) → 폴백 대기
+  - 부분 STT 종결 어미: 최근 텍스트만 신호로 사용
+  - shadow 모드: 판정만 하고 종료하지 않음, trace JSONL 기록
+  - 오프라인 평가: 절감 레이턴시 vs 오절단
+  - LocalVAD 통합: endpointer 판정 시 min_silence_frames 이전 종료
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.realtime.endpointer import (
+    EndpointFrame,
+    EndpointTrace,
+    TurnEndpointer,
+    completion_score,
+    create_turn_endpointer,
+    estimate_f0,
+    evaluate_endpointing,
+)
+
+
+def _speech(n: int, falling: bool) -> list[EndpointFrame]:
+    """발화 프레임: falling이면 에너지/피치가 문장 끝처럼 하강."""
+    frames = []
+    for i in range(n):
+        if falling:
+            frames.append(EndpointFrame(prob=0.9, energy_db=-20.0 - 1.5 * i, f0=220.0 * 2 ** (-0.4 * i / 12)))
+        else:
+            frames.append(EndpointFrame(prob=0.9, energy_db=-20.0, f0=200.0))
+    return frames
+
+
+def _silence(n: int, prob: float = 0.02) -> list[EndpointFrame]:
+    return [EndpointFrame(prob=prob, energy_db=-60.0) for _ in range(n)]
+
+
+class TestEstimateF0:
+    def test_voiced_sine(self):
+        t = np.arange(512) / 16000
+        frame = (0.3 * np.sin(2 * np.pi * 200.0 * t)).astype(np.float32)
+        assert estimate_f0(frame) == pytest.approx(200.0, rel=0.05)
+
+    def test_silence_and_noise_unvoiced(self):
+        assert estimate_f0(np.zeros(512, dtype=np.float32)) == 0.0
+        noise = np.random.default_rng(0).normal(0, 0.1, 512).astype(np.float32)
+        assert estimate_f0(noise) == 0.0
+
+
+class TestCompletionScore:
+    def test_falling_tail_and_deep_silence_scores_high(self):
+        trace = EndpointTrace(frames=_speech(10, falling=True) + _silence(8))
+        assert completion_score(trace, len(trace.frames)) >= 0.8
+
+    def test_flat_tail_and_shallow_silence_scores_low(self):
+        trace = EndpointTrace(frames=_speech(10, falling=False) + _silence(8, prob=0.25))
+        assert completion_score(trace, len(trace.frames)) < 0.5
+
+    def test_too_short_tail_returns_none(self):
+        trace = EndpointTrace(frames=_speech(2, falling=True) + _silence(8))
+        assert completion_score(trace, len(trace.frames)) is None
+
+    def test_sentence_final_text_raises_score(self):
+        frames = _speech(10, falling=False) + _silence(8, prob=0.1)
+        without = completion_score(EndpointTrace(frames=frames), len(frames))
+        ended = EndpointTrace(frames=frames, texts=[(8, "예약하고 싶습니다.")])
+        unfinished = EndpointTrace(frames=frames, texts=[(8, "예약을 하고")])
+        assert completion_score(ended, len(frames)) > without > completion_score(unfinished, len(frames))
+
+    def test_stale_text_ignored(self):
+        """텍스트 관측 후 발화가 오래 이어졌으면 텍스트 신호는 무시."""
+        frames = _speech(30, falling=False) + _silence(8, prob=0.1)
+        stale = EndpointTrace(frames=frames, texts=[(0, "네 알겠습니다.")])
+        assert completion_score(stale, len(frames)) == completion_score(EndpointTrace(frames=frames), len(frames))
+
+
+class TestTurnEndpointer:
+    def _feed(self, endpointer: TurnEndpointer, frames: list[EndpointFrame]) -> None:
+        for frame in frames:
+            endpointer.observe_features(frame)
+
+    def test_ends_after_min_silence(self):
+        ep = TurnEndpointer(min_silence_frames=8)
+        ep.start_turn()
+        self._feed(ep, _speech(10, falling=True) + _silence(7))
+        assert ep.should_end() is False  # 최소 무음 미달
+        self._feed(ep, _silence(1))
+        assert ep.should_end() is True
+
+    def test_ambiguous_pause_waits(self):
+        ep = TurnEndpointer(min_silence_frames=8)
+        ep.start_turn()
+        self._feed(ep, _speech(10, falling=False) + _silence(12, prob=0.25))
+        assert ep.should_end() is False
+
+    @pytest.mark.asyncio
+    async def test_shadow_never_ends_and_writes_trace(self, tmp_path):
+        path = tmp_path / "traces.jsonl"
+        ep = TurnEndpointer(min_silence_frames=8, shadow=True, trace_path=str(path))
+        ep.start_turn()
+        self._feed(ep, _speech(10, falling=True) + _silence(10))
+        ep.note_transcript("감사합니다.")
+        assert ep.should_end() is False
+        await ep.finish_turn()
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        trace = EndpointTrace.from_json(lines[0])
+        assert len(trace.frames) == 20
+        assert trace.texts == [(20, "감사합니다.")]
+
+
+    @pytest.mark.parametrize(
+        "enabled,shadow,trace_path,expected",
+        [
+            (False, False, "", False),
+            (True, True, "", False),  # shadow + trace 없음: 판정이 쓰이지 않으므로 분석 생략
+            (True, True, "traces.jsonl", True),
+            (True, False, "", True),
+        ],
+    )
+    def test_created_only_when_decision_is_used(self, enabled, shadow, trace_path, expected):
+        with patch("src.realtime.endpointer.settings") as mock_settings:
+            mock_settings.local_vad_endpointing_enabled = enabled
+            mock_settings.local_vad_endpoint_shadow = shadow
+            mock_settings.local_vad_endpoint_trace_path = trace_path
+            mock_settings.local_vad_silence_threshold = 0.35
+            mock_settings.local_vad_endpoint_min_silence_frames = 8
+            mock_settings.local_vad_endpoint_score_threshold = 0.7
+            ep = create_turn_endpointer()
+        assert (ep is not None) is expected
+
+class TestOfflineEvaluation:
+    def test_saved_latency_and_false_cutoffs(self):
+        complete = EndpointTrace(frames=_speech(10, falling=True) + _silence(25))
+        # 발화 내 쉼(10프레임) 후 재개 — 꼬리가 하강해 보여도 재개되면 오절단
+        cut = EndpointTrace(frames=_speech(10, falling=True) + _silence(10) + _speech(10, falling=False) + _silence(25))
+        ambiguous = EndpointTrace(frames=_speech(10, falling=False) + _silence(25, prob=0.25))
+
+        result = evaluate_endpointing([complete, cut, ambiguous], fallback_silence_frames=25, min_silence_frames=8)
+
+        assert result.turns == 3
+        assert result.early_ends == 2
+        assert result.false_cutoffs == 1
+        assert result.saved_ms == [(25 - 8) * 32.0, 0.0, 0.0]
+        assert result.summary()["false_cutoff_rate"] == pytest.approx(0.333)
+
+    def test_higher_threshold_is_more_conservative(self):
+        traces = [EndpointTrace(frames=_speech(10, falling=True) + _silence(25, prob=0.2))]
+        loose = evaluate_endpointing(traces, score_threshold=0.5)
+        strict = evaluate_endpointing(traces, score_threshold=0.95)
+        assert loose.early_ends == 1
+        assert strict.early_ends == 0
+
+
+class TestLocalVADEarlyEndpoint:
+    def _make_vad(self, endpointer, **kwargs):
+        with patch("src.realtime.local_vad.LocalVAD._init_model"):
+            from src.realtime.local_vad import LocalVAD
+            vad = LocalVAD(endpointer=endpointer, **kwargs)
+        vad._model = MagicMock()
+        return vad
+
+    @pytest.mark.asyncio
+    async def test_early_end_before_min_silence(self):
+        on_end = AsyncMock()
+        endpointer = MagicMock()
+        endpointer.should_end.return_value = True
+        endpointer.finish_turn = AsyncMock()
+        vad = self._make_vad(
+            endpointer,
+            rms_threshold=0.0,
+            min_speech_frames=1,
+            min_silence_frames=25,
+            on_speech_end=on_end,
+        )
+        loud = bytes([0x10] * 160)
+
+        vad._model.process.return_value = 0.8
+        for _ in range(4):
+            await vad.process(loud)
+        assert vad.is_speaking
+        endpointer.start_turn.assert_called_once()
+
+        vad._model.process.return_value = 0.1
+        for _ in range(2):
+            await vad.process(loud)
+
+        assert vad.is_speaking is False
+        on_end.assert_awaited_once()
+        assert vad.last_end_early is True
+        assert vad.last_end_silence_ms == 32.0
+        endpointer.finish_turn.assert_awaited_once()
+        assert endpointer.observe.call_count >= 2
+
+    @pytest.mark.asyncio
+    async def test_resume_after_early_end_flagged(self):
+        endpointer = MagicMock()
+        endpointer.should_end.return_value = True
+        endpointer.finish_turn = AsyncMock()
+        vad = self._make_vad(endpointer, rms_threshold=0.0, min_speech_frames=1, min_silence_frames=25)
+        loud = bytes([0x10] * 160)
+
+        for prob in (0.8, 0.1, 0.8):
+            vad._model.process.return_value = prob
+            for _ in range(4):
+                await vad.process(loud)
+
+        assert vad.is_speaking
+        assert vad.resumed_after_early_end is True
+
+    @pytest.mark.asyncio
+    async def test_no_endpointer_uses_min_silence(self):
+        vad = self._make_vad(None, rms_threshold=0.0, min_speech_frames=1, min_silence_frames=3)
+        loud = bytes([0x10] * 160)
+        vad._model.process.return_value = 0.8
+        for _ in range(4):
+            await vad.process(loud)
+        vad._model.process.return_value = 0.1
+        for _ in range(6):
+            await vad.process(loud)
+        assert vad.is_speaking is False
+        assert vad.last_end_early is False
+        assert vad.last_end_silence_ms == 3 * 32.0
@@ -0,0 +1,180 @@
+"""EventDispatcher / RealtimeSession.listen 단위 테스트.
+
+핵심 검증 사항:
+  - 이벤트 타입 → lane 매핑 (audio / text / control)
+  - detached 핸들러가 다음 이벤트 dispatch를 막지 않음
+  - lane 간 순서: control 이벤트는 선행 audio/text 델타 처리 후 실행
+  - 느린 audio 핸들러가 text 델타(자막)를 막지 않음
+  - 이벤트 타입별 dispatch lag 통계
+  - listen(): 수신 종료 시 남은 이벤트 drain + on_connection_lost 호출
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.realtime.sessions.event_dispatcher import (
+    LANE_AUDIO,
+    LANE_CONTROL,
+    LANE_TEXT,
+    EventDispatcher,
+    lane_for,
+)
+from src.realtime.sessions.session_manager import RealtimeSession
+from src.types import CallMode, SessionConfig
+
+
+def _make_dispatcher(handlers, detached=None):
+    stats: dict = {}
+    d = EventDispatcher("Test", handlers, detached or set(), stats)
+    return d, stats
+
+
+class TestLaneFor:
+    def test_audio_delta(self):
+        assert lane_for("response.audio.delta") == LANE_AUDIO
+
+    def test_text_deltas(self):
+        assert lane_for("response.audio_transcript.delta") == LANE_TEXT
+        assert lane_for("response.text.delta") == LANE_TEXT
+        assert lane_for("response.function_call_arguments.delta") == LANE_TEXT
+
+    def test_control(self):
+        assert lane_for("response.done") == LANE_CONTROL
+        assert lane_for("conversation.item.input_audio_transcription.completed") == LANE_CONTROL
+
+
+class TestEventDispatcher:
+    @pytest.mark.asyncio
+    async def test_detached_handler_does_not_block(self):
+        """detached 핸들러가 대기 중이어도 다음 control 이벤트가 처리된다."""
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def slow_done(event):
+            await release.wait()
+            order.append("transcript.done")
+
+        async def stt_completed(event):
+            order.append("stt")
+            release.set()
+
+        handlers = {
+            "response.audio_transcript.done": [slow_done],
+            "conversation.item.input_audio_transcription.completed": [stt_completed],
+        }
+        d, _ = _make_dispatcher(handlers, {("response.audio_transcript.done", slow_done)})
+        d.start()
+        d.submit({"type": "response.audio_transcript.done"})
+        d.submit({"type": "conversation.item.input_audio_transcription.completed"})
+        await d.drain(timeout=1.0)
+        await asyncio.sleep(0)
+
+        assert order == ["stt", "transcript.done"]
+
+    @pytest.mark.asyncio
+    async def test_control_waits_for_prior_audio(self):
+        """response.done은 먼저 수신된 audio delta 처리 후 실행된다."""
+        order: list[str] = []
+
+        async def audio(event):
+            await asyncio.sleep(0.02)
+            order.append("audio")
+
+        async def done(event):
+            order.append("done")
+
+        d, _ = _make_dispatcher({"response.audio.delta": [audio], "response.done": [done]})
+        d.start()
+        d.submit({"type": "response.audio.delta"})
+        d.submit({"type": "response.done"})
+        await d.drain(timeout=1.0)
+
+        assert order == ["audio", "done"]
+
+    @pytest.mark.asyncio
+    async def test_text_not_blocked_by_slow_audio(self):
+        """느린 audio 전송이 자막 델타를 막지 않는다."""
+        order: list[str] = []
+
+        async def audio(event):
+            await asyncio.sleep(0.05)
+            order.append("audio")
+
+        async def caption(event):
+            order.append("caption")
+
+        d, _ = _make_dispatcher({
+            "response.audio.delta": [audio],
+            "response.audio_transcript.delta": [caption],
+        })
+        d.start()
+        d.submit({"type": "response.audio.delta"})
+        d.submit({"type": "response.audio_transcript.delta"})
+        await d.drain(timeout=1.0)
+
+        assert order == ["caption", "audio"]
+
+    @pytest.mark.asyncio
+    async def test_lag_stats_recorded(self):
+        handler = AsyncMock()
+        d, stats = _make_dispatcher({"response.done": [handler]})
+        d.start()
+        d.submit({"type": "response.done"})
+        d.submit({"type": "response.done"})
+        await d.drain(timeout=1.0)
+
+        assert stats["response.done"].count == 2
+        assert stats["response.done"].max_ms >= 0
+        assert handler.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_handler_error_isolated(self):
+        """핸들러 예외가 lane worker를 중단시키지 않는다."""
+        ok = AsyncMock()
+        d, _ = _make_dispatcher({
+            "response.done": [AsyncMock(side_effect=RuntimeError("boom")), ok],
+        })
+        d.start()
+        d.submit({"type": "response.done"})
+        await d.drain(timeout=1.0)
+        ok.assert_awaited_once()
+
+
+class _FakeWs:
+    def __init__(self, events):
+        self._messages = [json.dumps(e) for e in events]
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for m in self._messages:
+            yield m
+
+
+class TestRealtimeSessionListen:
+    @pytest.mark.asyncio
+    async def test_listen_dispatches_and_drains(self):
+        session = RealtimeSession(
+            "SessionA",
+            SessionConfig(mode=CallMode.RELAY, source_language="en", target_language="ko"),
+        )
+        handler = AsyncMock()
+        lost = AsyncMock()
+        session.on("response.done", handler)
+        session.set_on_connection_lost(lost)
+        session.ws = _FakeWs([
+            {"type": "session.created", "session": {"id": "sess_1"}},
+            {"type": "response.done"},
+        ])
+
+        await session.listen()
+
+        assert session.session_id == "sess_1"
+        handler.assert_awaited_once()
+        lost.assert_awaited_once()
+        assert session.is_closed
+        assert session.dispatch_lag_summary()["response.done"]["count"] == 1
@@ -0,0 +1,203 @@
+"""FillerAudioCache 단위 테스트.
+
+핵심 검증 사항:
+  - (음성, 언어, 정규화 문장) 키: 끝 구두점/공백 무시
+  - 캡처 검증: transcript 불일치, 잘린 오디오는 저장 안 함
+  - 영속화: cache_dir 저장 (루프 안에서는 스레드) → 새 인스턴스 load()
+  - play_clip: Twilio 직접 전송 + echo gate 통보
+  - Session A 캡처: 완료된 응답만 캐시
+  - T2V 타이핑 필러: hit 시 create_response 생략
+  - Guardrail 필러: 캐시 클립 재생 (BasePipeline 공통)
+"""
+
+import asyncio
+import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.realtime.filler_audio import FillerAudioCache, play_clip
+from src.realtime.sessions.session_a import SessionAHandler
+from src.types import ActiveCall, CallMode, CommunicationMode
+
+_CLIP = b"\x7f" * 8000  # 1초 g711_ulaw
+
+
+def _capture(cache: FillerAudioCache, text: str, transcript: str, audio: bytes = _CLIP):
+    capture = cache.capture("ko", text)
+    capture.chunks.append(audio)
+    capture.transcript = transcript
+    return capture
+
+
+class TestFillerAudioCache:
+    def test_hit_ignores_trailing_punct(self):
+        cache = FillerAudioCache()
+        assert cache.get("ko", "잠시만요.") is None
+        cache.put("ko", "잠시만요.", _CLIP, persist=False)
+        assert cache.get("ko", "잠시만요") == _CLIP
+        assert cache.get("en", "잠시만요") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_voice_separates_keys(self):
+        alloy, coral = FillerAudioCache(voice="alloy"), FillerAudioCache(voice="coral")
+        alloy.put("ko", "잠시만요.", _CLIP, persist=False)
+        assert coral.get("ko", "잠시만요.") is None
+
+    def test_commit_requires_matching_transcript(self):
+        cache = FillerAudioCache()
+        assert not cache.commit(_capture(cache, "잠시만요.", "잠시만 기다려 주세요."))
+        assert cache.commit(_capture(cache, "잠시만요.", "잠시만요"))
+        assert cache.get("ko", "잠시만요.") == _CLIP
+
+    def test_commit_rejects_truncated_audio(self):
+        cache = FillerAudioCache()
+        assert not cache.commit(_capture(cache, "잠시만요.", "잠시만요.", audio=b"\x7f" * 160))
+
+    def test_max_entries(self):
+        cache = FillerAudioCache(max_entries=2)
+        for text in ["하나", "둘", "셋"]:
+            cache.put("ko", text, _CLIP, persist=False)
+        assert cache.get("ko", "하나") is None
+        assert cache.stats()["size"] == 2
+
+    def test_persist_and_load(self, tmp_path):
+        FillerAudioCache(voice="alloy", cache_dir=tmp_path).put("ko", "잠시만요.", _CLIP)
+
+        restored = FillerAudioCache(voice="alloy", cache_dir=tmp_path)
+        assert restored.load() == 1
+        assert restored.get("ko", "잠시만요.") == _CLIP
+        assert FillerAudioCache(voice="coral", cache_dir=tmp_path).load() == 0
+
+    @pytest.mark.asyncio
+    async def test_persist_off_loop(self, tmp_path):
+        """이벤트 루프 안에서는 파일 쓰기를 스레드로 넘기고, flush()가 완료를 기다린다."""
+        cache = FillerAudioCache(voice="alloy", cache_dir=tmp_path)
+        with patch("src.realtime.filler_audio.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            cache.put("ko", "잠시만요.", _CLIP)
+            await cache.flush()
+
+        to_thread.assert_called_once()
+        assert FillerAudioCache(voice="alloy", cache_dir=tmp_path).load() == 1
+
+
+class TestPlayClip:
+    @pytest.mark.asyncio
+    async def test_sends_chunks_and_informs_echo_gate(self):
+        twilio = MagicMock()
+        twilio.send_audio = AsyncMock()
+        echo_gate = MagicMock()
+
+        await play_clip(_CLIP, twilio, echo_gate)
+
+        assert b"".join(c.args[0] for c in twilio.send_audio.await_args_list) == _CLIP
+        echo_gate.on_tts_chunk.assert_called_once_with(len(_CLIP))
+        echo_gate.on_tts_done.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unfinished_leaves_cooldown_to_response_done(self):
+        twilio = MagicMock()
+        twilio.send_audio = AsyncMock()
+        echo_gate = MagicMock()
+
+        await play_clip(_CLIP, twilio, echo_gate, finish=False)
+
+        echo_gate.on_tts_chunk.assert_called_once_with(len(_CLIP))
+        echo_gate.on_tts_done.assert_not_called()
+
+
+class TestSessionACapture:
+    def _make_handler(self) -> SessionAHandler:
+        call = ActiveCall(call_id="filler", mode=CallMode.RELAY, source_language="en", target_language="ko")
+        session = MagicMock()
+        session.on = MagicMock()
+        handler = SessionAHandler(session=session, call=call, on_tts_audio=AsyncMock())
+        handler._response_expected = True
+        return handler
+
+    async def _run_response(self, handler: SessionAHandler, transcript: str, status: str) -> None:
+        audio_b64 = base64.b64encode(_CLIP).decode()
+        await handler._handle_audio_delta({"delta": audio_b64})
+        await handler._handle_transcript_done({"transcript": transcript})
+        await handler._handle_response_done({"response": {"status": status}})
+
+    @pytest.mark.asyncio
+    async def test_completed_response_is_cached(self):
+        cache = FillerAudioCache()
+        handler = self._make_handler()
+        with patch("src.realtime.sessions.session_a.filler_audio_cache", cache):
+            handler.capture_next_response("ko", "잠시만요.")
+            await self._run_response(handler, "잠시만요.", "completed")
+        assert cache.get("ko", "잠시만요.") == _CLIP
+
+    @pytest.mark.asyncio
+    async def test_cancelled_response_not_cached(self):
+        cache = FillerAudioCache()
+        handler = self._make_handler()
+        with patch("src.realtime.sessions.session_a.filler_audio_cache", cache):
+            handler.capture_next_response("ko", "잠시만요.")
+            await self._run_response(handler, "잠시만요.", "cancelled")
+        assert cache.get("ko", "잠시만요.") is None
+
+
+class TestTypingFillerCache:
+    def _make_router(self):
+        from tests.test_text_to_voice_pipeline import _make_router
+
+        router = _make_router(communication_mode=CommunicationMode.TEXT_TO_VOICE)
+        router.session_a = MagicMock()
+        router.session_a.is_generating = False
+        router.session_a.mark_generating = MagicMock()
+        return router
+
+    @pytest.mark.asyncio
+    async def test_hit_plays_clip_without_realtime(self):
+        router = self._make_router()
+        cache = FillerAudioCache()
+        cache.put("ko", "잠시만 기다려주세요, 메시지를 작성 중입니다.", _CLIP, persist=False)
+        with patch("src.realtime.pipeline.text_to_voice.filler_audio_cache", cache):
+            await router.handle_typing_started()
+
+        router.dual_session.session_a.create_response.assert_not_awaited()
+        assert router.twilio_handler.send_audio.await_count > 0
+        assert router.call.call_metrics.filler_audio_cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_miss_generates_live_and_captures(self):
+        router = self._make_router()
+        with patch("src.realtime.pipeline.text_to_voice.filler_audio_cache", FillerAudioCache()):
+            await router.handle_typing_started()
+
+        router.dual_session.session_a.create_response.assert_awaited_once()
+        router.session_a.capture_next_response.assert_called_once_with(
+            "ko", "잠시만 기다려주세요, 메시지를 작성 중입니다."
+        )
+
+
+class TestGuardrailFillerPlayback:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("communication_mode", [CommunicationMode.TEXT_TO_VOICE, CommunicationMode.VOICE_TO_VOICE])
+    async def test_cached_filler_played(self, communication_mode):
+        from tests.test_text_to_voice_pipeline import _make_router
+
+        router = _make_router(communication_mode=communication_mode)
+        cache = FillerAudioCache()
+        cache.put("ko", "잠시만요.", _CLIP, persist=False)
+        with patch("src.realtime.pipeline.base.filler_audio_cache", cache):
+            await router._on_guardrail_filler("잠시만요.")
+
+        router.twilio_handler.send_clear.assert_awaited_once()
+        assert router.twilio_handler.send_audio.await_count > 0
+        assert router.call.call_metrics.filler_audio_cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_filler_only_clears(self):
+        from tests.test_text_to_voice_pipeline import _make_router
+
+        router = _make_router(communication_mode=CommunicationMode.TEXT_TO_VOICE)
+        with patch("src.realtime.pipeline.base.filler_audio_cache", FillerAudioCache()):
+            await router._on_guardrail_filler("잠시만요.")
+
+        router.twilio_handler.send_clear.assert_awaited_once()
+        router.twilio_handler.send_audio.assert_not_awaited()
@@ -0,0 +1,316 @@
+"""First Message ring-time prefetch 단위 테스트.
+
+핵심 검증 사항:
+  - GreetingPrefetch: out-of-band 응답 수집 (완료 응답만 사용, 토큰 비용 합산)
+  - 정확 발화 고지: filler 캐시 hit 시 Realtime 요청 생략
+  - handover: 미완료 prefetch 응답 취소 + response.done까지 drain (ID 수신 전 요청도 취소,
+    고지 준비 후 남은 필러 생성은 대기 없이 취소)
+  - Guardrail 필러: 캐시에 없으면 고지 뒤에 생성해 캐시에 저장
+  - FirstMessageHandler: 수신자 첫 발화 종료 시 prefetch 재생, 문맥 변경/미준비 시 라이브 생성
+"""
+
+import asyncio
+import base64
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.realtime.filler_audio import FillerAudioCache
+from src.realtime.first_message import FirstMessageHandler, GreetingPrefetch
+from src.types import ActiveCall, CallMode, WsMessageType
+
+_AUDIO = b"\x7f" * 8000
+
+
+def _make_call(mode: CallMode = CallMode.RELAY) -> ActiveCall:
+    return ActiveCall(
+        call_id="prefetch",
+        mode=mode,
+        source_language="en",
+        target_language="ko",
+        prompt_a="prompt",
+    )
+
+
+class _FakeWs:
+    """recv()가 미리 정한 이벤트를 순서대로 돌려주고, 소진되면 push()를 기다린다."""
+
+    def __init__(self, events: list[dict]):
+        self._events: asyncio.Queue[str] = asyncio.Queue()
+        for e in events:
+            self.push(e)
+
+    def push(self, event: dict) -> None:
+        self._events.put_nowait(json.dumps(event))
+
+    @property
+    def pending(self) -> int:
+        return self._events.qsize()
+
+    async def recv(self) -> str:
+        return await self._events.get()
+
+
+def _make_session(events: list[dict]) -> MagicMock:
+    session = MagicMock()
+    session.label = "Session A"
+    session.ws = _FakeWs(events)
+    session.create_out_of_band_response = AsyncMock()
+    session.cancel_response = AsyncMock()
+    return session
+
+
+def _cancel_completes(session: MagicMock) -> None:
+    """cancel_response 시 서버처럼 취소된 응답의 response.done을 보낸다."""
+
+    async def _cancel(response_id: str = "") -> None:
+        session.ws.push({"type": "response.done", "response": {"id": response_id, "status": "cancelled"}})
+
+    session.cancel_response = AsyncMock(side_effect=_cancel)
+
+
+def _handover_settings(mock_settings: MagicMock, handover_timeout_s: float) -> None:
+    mock_settings.greeting_prefetch_handover_timeout_s = handover_timeout_s
+    mock_settings.greeting_prefetch_timeout_s = 1.0
+
+
+def _response_events(
+    status: str = "completed", transcript: str = "안녕하세요.", response_id: str = "resp_1"
+) -> list[dict]:
+    return [
+        {"type": "session.created", "session": {"id": "sess_1"}},
+        {"type": "response.created", "response": {"id": response_id}},
+        {"type": "response.audio.delta", "delta": base64.b64encode(_AUDIO).decode()},
+        {"type": "response.audio_transcript.done", "transcript": transcript},
+        {
+            "type": "response.done",
+            "response": {
+                "status": status,
+                "usage": {"output_token_details": {"audio_tokens": 50, "text_tokens": 10}},
+            },
+        },
+    ]
+
+
+async def _connected() -> None:
+    return None
+
+
+async def _prefetch(call: ActiveCall, session: MagicMock, exact: bool = False) -> GreetingPrefetch:
+    prefetch = GreetingPrefetch(call, session, use_exact_utterance=exact)
+    prefetch.start(asyncio.create_task(_connected()))
+    await prefetch._task
+    return prefetch
+
+
+class TestGreetingPrefetch:
+    @pytest.mark.asyncio
+    async def test_collects_completed_response(self):
+        call = _make_call()
+        session = _make_session(_response_events())
+
+        prefetch = await _prefetch(call, session)
+
+        session.create_out_of_band_response.assert_awaited_once()
+        assert prefetch.take(call) == (_AUDIO, "안녕하세요.")
+        assert session.session_id == "sess_1"
+        assert call.cost_tokens.audio_output == 50
+
+    @pytest.mark.asyncio
+    async def test_cancelled_response_not_used(self):
+        call = _make_call()
+        prefetch = await _prefetch(call, _make_session(_response_events(status="cancelled")))
+        assert prefetch.take(call) is None
+
+    @pytest.mark.asyncio
+    async def test_exact_greeting_reuses_filler_cache(self):
+        call = _make_call()
+        session = _make_session([])
+        cache = FillerAudioCache()
+        cache.put("ko", "안녕하세요. AI 통역 서비스입니다.", _AUDIO, persist=False)
+        with patch("src.realtime.first_message.filler_audio_cache", cache), patch(
+            "src.realtime.first_message._greeting_text", return_value="안녕하세요. AI 통역 서비스입니다."
+        ):
+            prefetch = await _prefetch(call, session, exact=True)
+
+        session.create_out_of_band_response.assert_not_awaited()
+        assert prefetch.is_ready
+
+    @pytest.mark.asyncio
+    async def test_context_change_discards_audio(self):
+        call = _make_call()
+        prefetch = await _prefetch(call, _make_session(_response_events()))
+        call.prompt_a = "changed"
+        assert prefetch.take(call) is None
+
+    @pytest.mark.asyncio
+    async def test_handover_cancels_pending_response(self):
+        call = _make_call()
+        session = _make_session(_response_events()[:3])  # response.done 미도착
+        _cancel_completes(session)
+        prefetch = GreetingPrefetch(call, session)
+        prefetch.start(asyncio.create_task(_connected()))
+        await asyncio.sleep(0.01)
+
+        with patch("src.realtime.first_message.settings") as mock_settings:
+            _handover_settings(mock_settings, 0.01)
+            await prefetch.handover()
+
+        session.cancel_response.assert_awaited_once_with("resp_1")
+        assert session.ws.pending == 0  # 취소 응답의 response.done까지 prefetch가 읽음
+        assert prefetch._task.done()
+        assert not prefetch.is_ready
+
+    @pytest.mark.asyncio
+    async def test_handover_cancels_response_before_created(self):
+        """response.created 전에 handover되면 ID를 받는 즉시 취소하고 response.done까지 읽는다."""
+        call = _make_call()
+        session = _make_session(_response_events()[:1])
+        _cancel_completes(session)
+        prefetch = GreetingPrefetch(call, session)
+        prefetch.start(asyncio.create_task(_connected()))
+        await asyncio.sleep(0.01)
+
+        with patch("src.realtime.first_message.settings") as mock_settings:
+            _handover_settings(mock_settings, 0.01)
+            handover = asyncio.create_task(prefetch.handover())
+            await asyncio.sleep(0.05)
+            session.cancel_response.assert_not_awaited()
+            session.ws.push({"type": "response.created", "response": {"id": "resp_1"}})
+            await asyncio.wait_for(handover, timeout=1.0)
+
+        session.cancel_response.assert_awaited_once_with("resp_1")
+        assert session.ws.pending == 0
+        assert not prefetch.is_ready
+
+
+class TestGuardrailFillerSynthesis:
+    @pytest.mark.asyncio
+    async def test_missing_filler_synthesized_after_greeting(self):
+        call = _make_call()
+        session = _make_session(_response_events() + _response_events(transcript="잠시만요.", response_id="resp_2"))
+        cache = FillerAudioCache()
+        with patch("src.realtime.first_message.filler_audio_cache", cache):
+            prefetch = GreetingPrefetch(call, session, filler_text="잠시만요.")
+            prefetch.start(asyncio.create_task(_connected()))
+            await prefetch._task
+
+        assert session.create_out_of_band_response.await_count == 2
+        assert session.create_out_of_band_response.await_args.kwargs["metadata"] == {"purpose": "guardrail_filler"}
+        assert prefetch.take(call) == (_AUDIO, "안녕하세요.")
+        assert cache.get("ko", "잠시만요.") == _AUDIO
+        assert call.cost_tokens.audio_output == 100
+
+    @pytest.mark.asyncio
+    async def test_cached_filler_not_regenerated(self):
+        call = _make_call()
+        session = _make_session(_response_events())
+        cache = FillerAudioCache()
+        cache.put("ko", "잠시만요.", _AUDIO, persist=False)
+        with patch("src.realtime.first_message.filler_audio_cache", cache):
+            prefetch = GreetingPrefetch(call, session, filler_text="잠시만요.")
+            prefetch.start(asyncio.create_task(_connected()))
+            await prefetch._task
+
+        session.create_out_of_band_response.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_handover_does_not_wait_for_filler(self):
+        call = _make_call()
+        session = _make_session(_response_events() + _response_events(response_id="resp_2")[:3])
+        with patch("src.realtime.first_message.filler_audio_cache", FillerAudioCache()):
+            prefetch = GreetingPrefetch(call, session, filler_text="잠시만요.")
+            prefetch.start(asyncio.create_task(_connected()))
+            await asyncio.sleep(0.01)
+
+            _cancel_completes(session)
+            with patch("src.realtime.first_message.settings") as mock_settings:
+                _handover_settings(mock_settings, 5.0)
+                await asyncio.wait_for(prefetch.handover(), timeout=1.0)
+
+        session.cancel_response.assert_awaited_once_with("resp_2")
+        assert session.ws.pending == 0
+        assert prefetch.is_ready
+
+
+class TestFirstMessagePrefetchPlayback:
+    def _make_handler(self, call: ActiveCall, audio: bytes | None = _AUDIO):
+        session_a = MagicMock()
+        session_a.is_generating = False
+        session_a.send_user_text = AsyncMock()
+        prefetch = MagicMock()
+        prefetch.take = MagicMock(return_value=(audio, "안녕하세요.") if audio else None)
+        on_play = AsyncMock()
+        handler = FirstMessageHandler(
+            call=call,
+            session_a=session_a,
+            on_notify_app=AsyncMock(),
+            greeting_prefetch=prefetch,
+            on_play_greeting=on_play,
+        )
+        return handler, session_a, on_play
+
+    @pytest.mark.asyncio
+    async def test_plays_prefetch_when_speech_ends(self):
+        call = _make_call()
+        handler, session_a, on_play = self._make_handler(call)
+
+        await handler.on_recipient_speech_detected()
+        on_play.assert_not_awaited()  # 수신자 "여보세요" 중에는 보류
+        await handler.on_recipient_speech_ended()
+
+        on_play.assert_awaited_once_with(_AUDIO)
+        session_a.send_user_text.assert_not_awaited()
+        assert call.call_metrics.first_message_source == "prefetch"
+        assert call.transcript_bilingual[-1].original_text == "안녕하세요."
+        captions = [c.args[0] for c in handler._on_notify_app.await_args_list]
+        assert any(m.type == WsMessageType.CAPTION for m in captions)
+
+    @pytest.mark.asyncio
+    async def test_plays_after_max_hold_without_speech_end(self):
+        call = _make_call()
+        handler, _, on_play = self._make_handler(call)
+
+        with patch("src.realtime.first_message.settings") as mock_settings:
+            mock_settings.greeting_prefetch_max_hold_s = 0.01
+            await handler.on_recipient_speech_detected()
+            await asyncio.sleep(0.05)
+
+        on_play.assert_awaited_once_with(_AUDIO)
+        await handler.on_recipient_speech_ended()
+        on_play.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_live_without_prefetch(self):
+        call = _make_call()
+        handler, session_a, on_play = self._make_handler(call, audio=None)
+
+        await handler.on_recipient_speech_detected()
+        await handler.on_recipient_speech_ended()
+
+        session_a.send_user_text.assert_awaited_once()
+        on_play.assert_not_awaited()
+        assert call.call_metrics.first_message_source == "live"
+
+    @pytest.mark.asyncio
+    async def test_agent_mode_always_live(self):
+        call = _make_call(mode=CallMode.AGENT)
+        handler, session_a, on_play = self._make_handler(call)
+
+        await handler.on_recipient_speech_detected()
+
+        session_a.send_user_text.assert_awaited_once()
+        handler._greeting_prefetch.take.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_gap_measured_from_speech_end(self):
+        call = _make_call()
+        handler, _, _ = self._make_handler(call, audio=None)
+
+        await handler.on_recipient_speech_detected()
+        await handler.on_recipient_speech_ended()
+        handler._speech_ended_at -= 0.2  # 발화 종료 200ms 후 첫 오디오
+        handler.record_first_audio()
+
+        assert call.call_metrics.first_message_gap_ms >= 200.0
@@ -1,9 +1,20 @@
 """Guardrail Level classification + correction tests."""
 
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from src.guardrail.checker import GuardrailChecker, GuardrailLevel
+from src.guardrail.correction_worker import CorrectionWorker
+from src.guardrail.fallback_llm import FallbackLLM
 from src.guardrail.filter import TextFilter, FilterCategory
 from src.guardrail.dictionary import get_banned_words, get_threat_phrases, get_filler_text
+from src.guardrail.early_correction import EarlyCorrection
+from src.guardrail.rewriter import RuleRewriter
+from src.guardrail.stream_filter import AhoCorasick
+from src.realtime.sessions.session_a import SessionAHandler
+from src.types import ActiveCall, CallMode
 
 
 class TestTextFilter:
@@ -178,3 +189,440 @@ class TestDictionary:
         for lang in ("ko", "en", "ja", "zh"):
             phrases = get_threat_phrases(lang)
             assert len(phrases) > 0, f"No threat phrases for {lang}"
+
+
+def _reference_levels(deltas: list[str], language: str = "ko") -> list[GuardrailLevel]:
+    """Previous check_text_delta behaviour: re-run TextFilter.check on the whole buffer."""
+    text_filter = TextFilter(target_language=language)
+    buffer, level, levels = "", GuardrailLevel.LEVEL_1, []
+    for delta in deltas:
+        buffer += delta
+        if len(buffer) >= 100 or delta.rstrip().endswith((".", "!", "?", "요", "다")):
+            result = text_filter.check(buffer)
+            if result.has_profanity or result.has_threat:
+                level = max(level, GuardrailLevel.LEVEL_3)
+            elif result.has_informal:
+                level = max(level, GuardrailLevel.LEVEL_2)
+        levels.append(level)
+    return levels
+
+
+class TestStreamingFilter:
+    def test_aho_corasick_overlapping_patterns(self):
+        ac = AhoCorasick({"he": 1, "she": 2, "hers": 4, "his": 8})
+        assert ac.feed(0, "ushers")[1] == 1 | 2 | 4
+        assert ac.feed(0, "this")[1] == 8
+        assert ac.feed(0, "xyz")[1] == 0
+
+    def test_aho_corasick_resumes_across_chunks(self):
+        ac = AhoCorasick({"경찰 신고": 1})
+        state, found = ac.feed(0, "바로 경찰")
+        assert found == 0
+        state, found = ac.feed(state, " 신고할게요")
+        assert found == 1
+
+    def test_banned_word_split_across_deltas(self):
+        gc = GuardrailChecker(target_language="ko")
+        gc.check_text_delta("이 씨")
+        gc.check_text_delta("발 뭐")
+        assert gc.check_text_delta("예요?") == GuardrailLevel.LEVEL_3
+
+    def test_informal_ending_spanning_checkpoint(self):
+        """Regex endings that straddle the previous checkpoint are still found."""
+        gc = GuardrailChecker(target_language="ko")
+        assert gc.check_text_delta("네 확인했습니다.") == GuardrailLevel.LEVEL_1
+        gc.check_text_delta(" 그거 알겠")
+        assert gc.check_text_delta("어!") == GuardrailLevel.LEVEL_2
+
+    def test_safe_imperative_not_flagged(self):
+        gc = GuardrailChecker(target_language="ko")
+        assert gc.check_text_delta("네 안녕하세요.") == GuardrailLevel.LEVEL_1
+
+    @pytest.mark.parametrize("language,text", [
+        ("ko", "안녕하세요. 예약 확인했습니다. 그럼 내일 오세요. 창가 자리 괜찮으시죠? 고마워 정말. 바로 경찰 신고하겠습니다."),
+        ("ko", "네 알겠습니다. 주차는 건물 뒤편에 하시면 됩니다. 혹시 더 필요하신 거 있으세요? 그거 몰라! 가만 안 두겠다."),
+        ("en", "Sure, I can help. What the FUCK is this? Please call the police on you now."),
+        ("ja", "少々お待ちください。やってください。バカ"),
+    ])
+    def test_levels_match_full_rescan(self, language, text):
+        """Incremental levels equal the previous full-buffer rescan for every delta split."""
+        for size in (1, 2, 3, 5, 8, 13):
+            deltas = [text[i:i + size] for i in range(0, len(text), size)]
+            gc = GuardrailChecker(target_language=language)
+            levels = [gc.check_text_delta(d) for d in deltas]
+            assert levels == _reference_levels(deltas, language), f"delta size {size}"
+
+
+class TestRuleRewriter:
+    @pytest.mark.parametrize("text,expected", [
+        ("알겠어. 내일 갈게.", "알겠습니다. 내일 가겠습니다."),
+        ("응 그거 몰라", "네 그거 모르겠습니다"),
+        ("이거 해줘!", "이거 해주세요!"),
+        ("그거 먹었어", "그거 먹었어요"),
+        ("그럼 내일까지 준비하세요.", "그럼 내일까지 준비해주세요."),
+    ])
+    def test_korean_rewrites(self, text, expected):
+        result = RuleRewriter("ko").rewrite(text)
+        assert result.covered
+        assert result.text == expected
+
+    def test_substring_false_positive_left_unchanged(self):
+        """'어떻게' contains the casual key '어' but is not informal."""
+        result = RuleRewriter("ko").rewrite("어떻게 해요?")
+        assert result.covered
+        assert result.text == "어떻게 해요?"
+        assert result.rewrites == []
+
+    def test_sentence_entry_only_replaces_whole_utterance(self):
+        """'그래' → '네, 그렇습니다' is a full sentence, so it is only used when it is the whole utterance."""
+        result = RuleRewriter("ko").rewrite("그래.")
+        assert result.covered
+        assert result.text == "네, 그렇습니다."
+
+    @pytest.mark.parametrize("text", ["그래 좋아", "어디 가?"])
+    def test_informal_sentence_end_escalates(self, text):
+        """Sentence-final words the TextFilter regex misses must still end politely, or go to the LLM."""
+        result = RuleRewriter("ko").rewrite(text)
+        assert result.covered is False
+        assert result.text == text
+
+    def test_safe_phrase_untouched(self):
+        result = RuleRewriter("ko").rewrite("네 안녕하세요. 그거 알겠어")
+        assert result.covered
+        assert result.text == "네 안녕하세요. 그거 알겠습니다"
+
+    def test_profanity_escalates(self):
+        assert RuleRewriter("ko").rewrite("씨발 뭐야").covered is False
+
+    def test_unsupported_language_escalates(self):
+        assert RuleRewriter("en").rewrite("shit happens").covered is False
+
+    def test_japanese_dictionary_rewrite(self):
+        result = RuleRewriter("ja").rewrite("ちょうだい。")
+        assert result.covered
+        assert result.text == "ください。"
+
+    def test_japanese_unchanged_match_escalates(self):
+        """ja has no word spacing, so a match that was not rewritten is not a false positive."""
+        result = RuleRewriter("ja").rewrite("毎日やってます")
+        assert result.covered is False
+        assert result.text == "毎日やってます"
+
+    def test_meogeo_ending_keeps_its_meaning(self):
+        """'~먹어' is a statement or question, so it becomes '~먹어요', not the imperative '드세요'."""
+        result = RuleRewriter("ko").rewrite("밥먹어")
+        assert result.covered
+        assert result.text == "밥먹어요"
+
+
+class TestCorrectionRouting:
+    @pytest.mark.asyncio
+    async def test_rule_rewrite_skips_llm(self):
+        gc = GuardrailChecker(target_language="ko")
+        gc._fallback_llm = MagicMock()
+        gc._fallback_llm.try_correct = AsyncMock(return_value="LLM")
+
+        result = await gc.correct_text("알겠어. 내일 갈게.")
+
+        assert result.correction_source == "rule"
+        assert result.corrected_text == "알겠습니다. 내일 가겠습니다."
+        gc._fallback_llm.try_correct.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_uncovered_match_escalates_to_llm(self):
+        gc = GuardrailChecker(target_language="ko")
+        gc._fallback_llm = MagicMock()
+        gc._fallback_llm.try_correct = AsyncMock(return_value="잠시만요, 확인해 보겠습니다.")
+
+        result = await gc.correct_text("씨발 확인해 볼게")
+
+        assert result.correction_source == "llm"
+        assert result.corrected_text == "잠시만요, 확인해 보겠습니다."
+        gc._fallback_llm.try_correct.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rule_rewrite_disabled(self):
+        gc = GuardrailChecker(target_language="ko")
+        gc._fallback_llm = MagicMock()
+        gc._fallback_llm.try_correct = AsyncMock(return_value="알겠습니다.")
+
+        with patch("src.guardrail.checker.settings") as mock_settings:
+            mock_settings.guardrail_rule_rewrite_enabled = False
+            result = await gc.correct_text("알겠어.")
+
+        assert result.correction_source == "llm"
+
+
+def _checker_with_llm(corrections: dict[str, str], delay_s: float = 0.0) -> GuardrailChecker:
+    gc = GuardrailChecker(target_language="ko")
+
+    async def correct(text: str, language: str) -> str:
+        await asyncio.sleep(delay_s)
+        return corrections.get(text, text)
+
+    gc._fallback_llm = MagicMock()
+    gc._fallback_llm.try_correct = AsyncMock(side_effect=correct)
+    return gc
+
+
+class TestEarlyCorrection:
+    @pytest.mark.asyncio
+    async def test_segments_corrected_in_order(self):
+        gc = _checker_with_llm({"씨발 그 시간은 안 돼.": "죄송하지만 그 시간은 어렵습니다."})
+        early = EarlyCorrection(gc)
+
+        early.start("씨발 그 시간은 안 돼. ")
+        await asyncio.sleep(0)
+        gc._fallback_llm.try_correct.assert_awaited_once()  # 응답 완료 전에 시작
+
+        early.extend("씨발 그 시간은 안 돼. 내일 갈게. ")
+        result = await early.finish("씨발 그 시간은 안 돼. 내일 갈게. 예약 확인했습니다.")
+
+        assert result.corrected_text == "죄송하지만 그 시간은 어렵습니다. 내일 가겠습니다. 예약 확인했습니다."
+        assert result.correction_source == "llm"
+        assert gc._fallback_llm.try_correct.await_count == 1  # 규칙/깨끗한 세그먼트는 LLM 생략
+
+    @pytest.mark.asyncio
+    async def test_partial_sentence_waits_for_boundary(self):
+        """진행 중인 문장은 조각으로 보내지 않고 완성(또는 finish)까지 기다린다."""
+        gc = _checker_with_llm({"이 씨발 뭐예요?": "이게 뭐예요?"})
+        early = EarlyCorrection(gc)
+        early.start("이 씨발")
+        early.extend("이 씨발 뭐")
+        await asyncio.sleep(0)
+        gc._fallback_llm.try_correct.assert_not_awaited()
+
+        result = await early.finish("이 씨발 뭐예요?")
+        assert result.corrected_text == "이게 뭐예요?"
+        gc._fallback_llm.try_correct.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_transcript_mismatch_recorrects_full_text(self):
+        gc = _checker_with_llm({"경찰 신고하겠습니다.": "도움을 요청하겠습니다."})
+        early = EarlyCorrection(gc)
+        early.start("경찰 신고할게요. ")
+        result = await early.finish("경찰 신고하겠습니다.")
+        assert result.corrected_text == "도움을 요청하겠습니다."
+
+
+class TestSessionAEarlyCorrection:
+    def _make_handler(self, gc: GuardrailChecker, on_tts: AsyncMock) -> SessionAHandler:
+        call = ActiveCall(call_id="early-fix", mode=CallMode.RELAY, source_language="en", target_language="ko")
+        session = MagicMock()
+        session.on = MagicMock()
+        handler = SessionAHandler(session=session, call=call, guardrail=gc, on_guardrail_corrected_tts=on_tts)
+        handler._response_expected = True
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_correction_starts_at_escalation(self):
+        gc = _checker_with_llm({"씨발 안 돼요.": "안 됩니다."}, delay_s=0.05)
+        on_tts = AsyncMock()
+        handler = self._make_handler(gc, on_tts)
+
+        for delta in ["씨발 ", "안 돼요.", " 다른 시간은", " 괜찮아요."]:
+            await handler._handle_transcript_delta({"delta": delta})
+        await asyncio.sleep(0)
+        assert gc._fallback_llm.try_correct.await_count == 1  # transcript.done 이전
+
+        await handler._handle_transcript_done({"transcript": "씨발 안 돼요. 다른 시간은 괜찮아요."})
+        await asyncio.sleep(0.1)
+
+        on_tts.assert_awaited_once_with("안 됩니다. 다른 시간은 괜찮아요.")
+        metrics = handler._call.call_metrics
+        assert metrics.guardrail_level3_count == 1
+        assert metrics.guardrail_llm_calls == 1
+        assert len(metrics.guardrail_escalation_to_tts_ms) == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_pending_correction(self):
+        gc = _checker_with_llm({"씨발 안 돼요.": "안 됩니다."}, delay_s=1.0)
+        on_tts = AsyncMock()
+        handler = self._make_handler(gc, on_tts)
+
+        await handler._handle_transcript_delta({"delta": "씨발 안 돼요."})
+        await handler._handle_transcript_done({"transcript": "씨발 안 돼요."})
+        tasks = list(handler._correction_tasks)
+        assert len(tasks) == 1  # 참조 유지
+
+        handler.stop()
+        await asyncio.sleep(0)
+
+        assert tasks[0].cancelled()
+        assert not handler._correction_tasks
+        on_tts.assert_not_awaited()
+
+
+def _worker_with_llm(**kwargs) -> tuple[CorrectionWorker, AsyncMock]:
+    async def correct_batch(texts: list[str], language: str) -> list[str]:
+        await asyncio.sleep(0)
+        return [t.replace("했어", "했어요") for t in texts]
+
+    worker = CorrectionWorker(batch_wait_ms=10, **kwargs)
+    worker._fallback_llm = MagicMock()
+    worker._fallback_llm.correct_batch = AsyncMock(side_effect=correct_batch)
+    return worker, worker._fallback_llm.correct_batch
+
+
+class TestCorrectionWorker:
+    @pytest.mark.asyncio
+    async def test_batches_same_language_texts(self, tmp_path):
+        worker, llm = _worker_with_llm(log_path=tmp_path / "corrections.jsonl")
+        results = []
+        for text in ["예약했어", "확인했어", "취소했어"]:
+            worker.submit(text, "ko", lambda corrected, ms: results.append(corrected))
+        while worker.active_workers:
+            await asyncio.sleep(0.01)
+
+        llm.assert_awaited_once_with(["예약했어", "확인했어", "취소했어"], "ko")
+        assert results == ["예약했어요", "확인했어요", "취소했어요"]
+        lines = (tmp_path / "corrections.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["corrected"] for line in lines] == results
+
+    @pytest.mark.asyncio
+    async def test_record_writes_log_off_loop(self, tmp_path):
+        path = tmp_path / "corrections.jsonl"
+        worker, _ = _worker_with_llm(log_path=path)
+        with patch("src.guardrail.correction_worker.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            worker.record("ko", "알겠어", "알겠습니다", "rule")
+            worker.record("ko", "네", "네", "rule")  # 변경 없음 → 기록 안 함
+            await worker.stop()
+
+        to_thread.assert_called_once()
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["source"] for line in lines] == ["rule"]
+
+    @pytest.mark.asyncio
+    async def test_dedupes_pending_and_recent_texts(self):
+        worker, llm = _worker_with_llm()
+        results = []
+        worker.submit("예약했어", "ko", lambda corrected, ms: results.append(corrected))
+        worker.submit(" 예약했어 ", "ko", lambda corrected, ms: results.append(corrected))
+        while worker.active_workers:
+            await asyncio.sleep(0.01)
+        worker.submit("예약했어", "ko", lambda corrected, ms: results.append(corrected))
+
+        assert llm.await_count == 1
+        assert results == ["예약했어요"] * 3
+        assert worker.stats()["deduped"] == 1
+        assert worker.stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_llm_failure_not_cached(self, tmp_path):
+        """LLM 실패는 교정 결과로 캐시/기록하지 않고 실패로 집계 — 같은 텍스트는 다시 요청한다."""
+        worker, llm = _worker_with_llm(log_path=tmp_path / "corrections.jsonl")
+        llm.side_effect = [None, ["예약했어요"]]
+        results = []
+        for _ in range(2):
+            worker.submit("예약했어", "ko", lambda corrected, ms: results.append(corrected))
+            while worker.active_workers:
+                await asyncio.sleep(0.01)
+
+        assert llm.await_count == 2
+        assert results == [None, "예약했어요"]
+        assert worker.stats()["failed"] == 1
+        assert worker.stats()["cache_hits"] == 0
+        assert len((tmp_path / "corrections.jsonl").read_text(encoding="utf-8").splitlines()) == 1
+
+    def test_llm_failure_counted_separately(self):
+        """Level 2 LLM 실패는 guardrail_llm_calls가 아닌 guardrail_llm_failures로 집계된다."""
+        gc = GuardrailChecker(target_language="ko")
+        result = gc.check_full_text("예약했어")
+        result.correction_source = "llm_failed"
+        handler = SessionAHandler(session=MagicMock(), call=ActiveCall(call_id="c"))
+
+        handler._record_correction(result)
+
+        metrics = handler._call.call_metrics
+        assert metrics.guardrail_llm_failures == 1
+        assert metrics.guardrail_llm_calls == 0
+        assert metrics.guardrail_correction_ms == []
+
+    @pytest.mark.asyncio
+    async def test_queue_and_concurrency_bounded(self):
+        worker, llm = _worker_with_llm(queue_size=4, concurrency=1, batch_size=2)
+        accepted = [worker.submit(f"문장{i} 했어", "ko") for i in range(10)]
+
+        assert accepted.count(True) == 4
+        assert worker.stats()["dropped"] == 6
+        assert worker.active_workers == 1
+        while worker.active_workers:
+            await asyncio.sleep(0.01)
+        assert llm.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sampling_skips_llm(self):
+        worker, llm = _worker_with_llm(sample_rate=0.0)
+        assert worker.submit("예약했어", "ko") is False
+        assert worker.stats()["sampled_out"] == 1
+        assert worker.pending_count == 0
+        llm.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stop_discards_pending(self):
+        worker, llm = _worker_with_llm()
+        worker.submit("예약했어", "ko")
+        await worker.stop()
+        assert worker.pending_count == 0
+        assert worker.active_workers == 0
+        llm.assert_not_awaited()
+
+
+class TestLevel2Submission:
+    def test_rule_rewrite_resolves_without_queue(self):
+        gc = GuardrailChecker(target_language="ko")
+        results = []
+        with patch("src.guardrail.checker.correction_worker") as mock_worker:
+            assert gc.submit_level2_correction("알겠어.", results.append)
+        mock_worker.submit.assert_not_called()
+        assert results[0].correction_source == "rule"
+        assert results[0].corrected_text == "알겠습니다."
+
+    def test_uncovered_text_goes_to_worker(self):
+        gc = GuardrailChecker(target_language="ko")
+        results = []
+        with (
+            patch("src.guardrail.checker.correction_worker") as mock_worker,
+            patch("src.guardrail.checker.settings") as mock_settings,
+        ):
+            mock_settings.guardrail_rule_rewrite_enabled = False
+            gc.submit_level2_correction("알겠어.", results.append)
+            text, language, on_result = mock_worker.submit.call_args.args
+            on_result("알겠습니다.", 120.0)
+
+        assert (text, language) == ("알겠어.", "ko")
+        assert results[0].correction_source == "llm"
+        assert results[0].corrected_text == "알겠습니다."
+        assert results[0].correction_time_ms == 120.0
+
+    def test_level1_text_not_submitted(self):
+        gc = GuardrailChecker(target_language="ko")
+        with patch("src.guardrail.checker.correction_worker") as mock_worker:
+            assert gc.submit_level2_correction("예약 확인했습니다.") is False
+        mock_worker.submit.assert_not_called()
+
+
+class TestFallbackBatch:
+    def _llm(self, content: str) -> FallbackLLM:
+        llm = FallbackLLM()
+        response = MagicMock()
+        response.choices = [MagicMock()]
+        response.choices[0].message.content = content
+        llm._client = MagicMock()
+        llm._client.chat.completions.create = AsyncMock(return_value=response)
+        return llm
+
+    @pytest.mark.asyncio
+    async def test_parses_corrections_in_order(self):
+        llm = self._llm(json.dumps({"corrections": ["A요", "B요"]}))
+        assert await llm.correct_batch(["A", "B"], "ko") == ["A요", "B요"]
+
+    @pytest.mark.asyncio
+    async def test_count_mismatch_fails(self):
+        llm = self._llm(json.dumps({"corrections": ["A요"]}))
+        assert await llm.correct_batch(["A", "B"], "ko") is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_fails(self):
+        llm = self._llm("A요\nB요")
+        assert await llm.correct_batch(["A", "B"], "ko") is None
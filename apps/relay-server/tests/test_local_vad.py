@@ -326,3 +326,26 @@ class TestLocalVADStateMachine:
 
         # 상태는 전환됨 (콜백 에러와 무관)
         assert vad.is_speaking is True
+
+    @pytest.mark.asyncio
+    async def test_speech_pause_callback_once_per_pause(self):
+        """SPEAKING 중 pause_frames 연속 무음에서 on_speech_pause 1회 (상태는 SPEAKING 유지)."""
+        on_pause = AsyncMock()
+        vad = self._make_vad(
+            rms_threshold=0.0,
+            min_speech_frames=1,
+            min_silence_frames=10,
+            on_speech_pause=on_pause,
+            pause_frames=2,
+        )
+        loud = bytes([0x10] * 160)
+
+        vad._model.process.return_value = 0.8
+        for _ in range(4):
+            await vad.process(loud)
+        vad._model.process.return_value = 0.1
+        for _ in range(8):  # 5 Silero 프레임 무음 (< min_silence_frames)
+            await vad.process(loud)
+
+        assert vad.is_speaking is True
+        on_pause.assert_awaited_once()
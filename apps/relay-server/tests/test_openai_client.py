@@ -0,0 +1,112 @@
+"""공유 OpenAI HTTP 클라이언트 테스트.
+
+핵심 검증 사항:
+  - ChatTranslator / FallbackLLM이 동일한 클라이언트(커넥션 풀)를 공유
+  - 요청 hook: 새 연결을 연 요청만 cold로 집계 (워밍업 요청 제외)
+  - ensure_warm: keep-alive 만료 전 응답이 없을 때만 워밍업
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src import openai_client
+from src.guardrail.fallback_llm import FallbackLLM
+from src.realtime.chat_translator import ChatTranslator
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    """매 테스트마다 새 클라이언트 + 지표."""
+    with patch.object(openai_client, "_stats", openai_client._ClientStats()):
+        openai_client._client = None
+        openai_client._http_client = None
+        openai_client._warmup_task = None
+        yield
+        openai_client._client = None
+        openai_client._http_client = None
+        openai_client._warmup_task = None
+
+
+class TestSharedClient:
+    def test_components_share_client(self):
+        translator = ChatTranslator(source_language="ko", target_language="en")
+        fallback = FallbackLLM()
+        assert translator._client is fallback._client
+        assert translator._client is openai_client.get_openai_client()
+
+    def test_keepalive_limits_applied(self):
+        factory = openai_client.DefaultAsyncHttpxClient
+        with patch.object(openai_client, "DefaultAsyncHttpxClient", wraps=factory) as ctor:
+            openai_client.get_openai_client()
+        limits = ctor.call_args.kwargs["limits"]
+        assert limits.keepalive_expiry == openai_client.settings.openai_http_keepalive_expiry_s
+
+
+class TestRequestHook:
+    @pytest.mark.asyncio
+    async def test_cold_request_counted_once(self):
+        request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        await openai_client._on_request(request)
+        trace = request.extensions["trace"]
+        await trace("connection.connect_tcp.complete", {})
+        await trace("connection.connect_tcp.complete", {})
+
+        warm = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+        await openai_client._on_request(warm)
+
+        stats = openai_client.openai_client_stats()
+        assert stats["requests"] == 2
+        assert stats["cold_requests"] == 1
+        assert stats["connections_opened"] == 2
+        assert stats["warm_hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_warmup_request_excluded(self):
+        request = httpx.Request(
+            "GET", "https://api.openai.com/v1/models",
+            headers={openai_client._WARMUP_HEADER: "1"},
+        )
+        await openai_client._on_request(request)
+        await request.extensions["trace"]("connection.connect_tcp.complete", {})
+
+        stats = openai_client.openai_client_stats()
+        assert stats["requests"] == 0
+        assert stats["cold_requests"] == 0
+        assert stats["connections_opened"] == 1
+
+
+class TestWarmup:
+    @pytest.mark.asyncio
+    async def test_warmup_opens_connections(self):
+        client = MagicMock()
+        client.models.list = AsyncMock()
+        with patch.object(openai_client, "get_openai_client", return_value=client):
+            await openai_client.warmup_openai_client(connections=3)
+        assert client.models.list.await_count == 3
+        assert openai_client.openai_client_stats()["warmups"] == 1
+
+    @pytest.mark.asyncio
+    async def test_ensure_warm_skips_after_recent_response(self):
+        await openai_client._on_response(MagicMock(spec=httpx.Response))
+        with patch.object(openai_client, "warmup_openai_client", AsyncMock()) as warmup:
+            openai_client.ensure_warm()
+        warmup.assert_not_called()
+        assert openai_client.openai_client_stats()["warm"] is True
+
+    @pytest.mark.asyncio
+    async def test_ensure_warm_starts_when_cold(self):
+        with patch.object(openai_client, "warmup_openai_client", AsyncMock()) as warmup:
+            openai_client.ensure_warm()
+            await openai_client._warmup_task
+        warmup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ensure_warm_starts_after_keepalive_expiry(self):
+        await openai_client._on_response(MagicMock(spec=httpx.Response))
+        openai_client._stats.last_response_at -= openai_client.settings.openai_http_keepalive_expiry_s + 1
+        with patch.object(openai_client, "warmup_openai_client", AsyncMock()) as warmup:
+            openai_client.ensure_warm()
+            await openai_client._warmup_task
+        warmup.assert_awaited_once()
@@ -0,0 +1,43 @@
+"""v3 System Prompt 생성기 테스트.
+
+핵심 검증 사항:
+  - 같은 언어쌍이면 통화별 데이터와 무관하게 prompt 앞부분(고정 prefix)이 동일
+  - 통화별 값(상대 이름, 수집 데이터)은 prefix 뒤 suffix에만 들어감
+  - prefix 렌더링 메모이즈
+"""
+
+from src.prompt.generator_v3 import generate_session_a_prompt, generate_session_b_prompt, stable_prefix
+from src.types import CallMode
+
+_CALL_1 = {"target_name": "강남 미용실", "scenario_type": "reservation", "service": "haircut", "customer_name": "Kim"}
+_CALL_2 = {"target_name": "서울 병원", "scenario_type": "inquiry", "service": "checkup", "customer_name": "Lee"}
+
+
+class TestStablePrefix:
+    def test_relay_prompts_share_prefix(self):
+        prompt_1 = generate_session_a_prompt(CallMode.RELAY, "en", "ko", _CALL_1)
+        prompt_2 = generate_session_a_prompt(CallMode.RELAY, "en", "ko", _CALL_2)
+        prefix = stable_prefix("session_a_relay", "en", "ko")
+
+        assert prompt_1.startswith(prefix) and prompt_2.startswith(prefix)
+        assert "강남 미용실" not in prefix
+        assert "강남 미용실" in prompt_1[len(prefix):]
+
+    def test_agent_collected_data_in_suffix(self):
+        prompt = generate_session_a_prompt(CallMode.AGENT, "en", "ko", _CALL_1)
+        prefix = stable_prefix("session_a_agent", "en", "ko")
+
+        assert prompt.startswith(prefix)
+        assert '"customer_name": "Kim"' in prompt[len(prefix):]
+
+    def test_language_pair_changes_prefix(self):
+        assert stable_prefix("session_a_relay", "en", "ko") != stable_prefix("session_a_relay", "ko", "en")
+        assert "from Korean to English" in generate_session_b_prompt("en", "ko")
+
+    def test_prefix_memoized(self):
+        stable_prefix.cache_clear()
+        first = stable_prefix("session_b", "en", "ko")
+        second = stable_prefix("session_b", "en", "ko")
+
+        assert first is second
+        assert stable_prefix.cache_info().hits == 1
@@ -2,6 +2,7 @@
 
 session_b_speech_durations_ms, session_b_processing_latencies_ms,
 session_b_stt_after_stop_ms 기록 검증.
+STT delta 잠정 원문 자막 (점진 할루시네이션 필터) + session_b_first_caption_ms 검증.
 Speech-only audio commit 검증.
 Korean Whisper append-hallucination 필터 검증.
 """
@@ -15,15 +16,15 @@ import pytest
 
 from src.realtime.sessions.session_b import (
     SessionBHandler,
-    _normalize_for_blocklist,
-    _STT_HALLUCINATION_BLOCKLIST,
-    _KO_WHISPER_APPEND_SUBSTRINGS,
-    _KO_TRAILING_FRAGMENT_RE,
-    _KO_SENTENCE_ENDINGS,
     _MIN_E2E_MS,
+    _provisional_stt_text,
 )
+from src.realtime.stt_filter import get_language_rules, normalize_for_blocklist
 from src.types import ActiveCall, CallMetrics, CallMode, CommunicationMode
 
+# 한국어 Whisper 할루시네이션 규칙 (src/realtime/stt_filter/data/ko.json)
+_KO_RULES = get_language_rules()["ko"]
+
 
 def _make_call(**overrides) -> ActiveCall:
     defaults = dict(
@@ -70,35 +71,35 @@ def _make_handler(call=None, use_local_vad=False, **kwargs) -> SessionBHandler:
 
 
 class TestNormalizeForBlocklist:
-    """_normalize_for_blocklist 구두점 정규화 검증."""
+    """normalize_for_blocklist 구두점 정규화 검증."""
 
     def test_strips_exclamation_mark(self):
         """느낌표가 제거되어 블록리스트에 매칭된다."""
-        assert _normalize_for_blocklist("시청해주셔서 감사합니다!") == "시청해주셔서 감사합니다"
-        assert _normalize_for_blocklist("시청해주셔서 감사합니다!") in _STT_HALLUCINATION_BLOCKLIST
+        assert normalize_for_blocklist("시청해주셔서 감사합니다!") == "시청해주셔서 감사합니다"
+        assert normalize_for_blocklist("시청해주셔서 감사합니다!") in _KO_RULES.phrases("blocklist")
 
     def test_strips_question_mark(self):
         """물음표가 제거된다."""
-        assert _normalize_for_blocklist("MBC 뉴스 이덕영입니다?") == "MBC 뉴스 이덕영입니다"
+        assert normalize_for_blocklist("MBC 뉴스 이덕영입니다?") == "MBC 뉴스 이덕영입니다"
 
     def test_strips_fullwidth_punctuation(self):
         """전각 구두점이 제거된다."""
-        assert _normalize_for_blocklist("전해드립니다！") == "전해드립니다"
-        assert _normalize_for_blocklist("밝혔습니다。") == "밝혔습니다"
+        assert normalize_for_blocklist("전해드립니다！") == "전해드립니다"
+        assert normalize_for_blocklist("밝혔습니다。") == "밝혔습니다"
 
     def test_preserves_ascii_period(self):
         """ASCII 마침표는 유지된다 (블록리스트에 . 포함 버전이 별도 등록)."""
-        assert _normalize_for_blocklist("밝혔습니다.") == "밝혔습니다."
+        assert normalize_for_blocklist("밝혔습니다.") == "밝혔습니다."
 
     def test_normal_text_unchanged(self):
         """일반 텍스트는 변경되지 않는다."""
-        assert _normalize_for_blocklist("안녕하세요") == "안녕하세요"
-        assert _normalize_for_blocklist("Hello, how are you?") == "Hello, how are you"
+        assert normalize_for_blocklist("안녕하세요") == "안녕하세요"
+        assert normalize_for_blocklist("Hello, how are you?") == "Hello, how are you"
 
     def test_empty_and_whitespace(self):
         """빈 문자열/공백 처리."""
-        assert _normalize_for_blocklist("") == ""
-        assert _normalize_for_blocklist("  ") == ""
+        assert normalize_for_blocklist("") == ""
+        assert normalize_for_blocklist("  ") == ""
 
 
 class TestSilenceTimeoutAntiHallucination:
@@ -358,6 +359,61 @@ class TestTimestampReset:
         assert handler._committed_speech_started_at == 0.0
         assert handler._committed_speech_stopped_at == 0.0
 
+    @pytest.mark.asyncio
+    async def test_next_turn_snapshot_not_reset(self):
+        """STT 대기 중 다음 턴이 스냅샷을 갱신하면 완료 시 리셋하지 않는다 (detached 실행)."""
+        call = _make_call()
+        handler = _make_handler(call=call)
+        handler._committed_speech_started_at = time.time() - 2.0
+        handler._committed_speech_stopped_at = time.time() - 0.5
+        handler._stt_check_done.clear()
+
+        task = asyncio.create_task(handler._save_transcript_and_notify("translated text"))
+        await asyncio.sleep(0)
+        next_started = time.time() - 0.1
+        handler._committed_speech_started_at = next_started
+        handler._stt_check_done.set()
+        await task
+
+        assert handler._committed_speech_started_at == next_started
+        assert len(call.call_metrics.session_b_e2e_latencies_ms) == 1
+        assert call.call_metrics.session_b_e2e_latencies_ms[0] >= 2000
+
+
+class TestSttGateWaiters:
+    """detached 번역 저장이 STT 판정을 대기 중일 때 response.done 게이트 처리."""
+
+    @pytest.mark.asyncio
+    async def test_response_done_keeps_gate_while_waiting(self):
+        """대기 중에는 response.done이 게이트를 풀지 않아 뒤늦은 STT 블록 판정이 적용된다."""
+        call = _make_call()
+        handler = _make_handler(call=call)
+        handler._stt_check_done.clear()
+
+        task = asyncio.create_task(handler._save_transcript_and_notify("Thank you"))
+        await asyncio.sleep(0)
+        await handler._handle_response_done({"response": {}})
+        assert not handler._stt_check_done.is_set()
+
+        # 뒤늦은 STT가 블록리스트 매칭
+        handler._stt_blocked = True
+        handler._stt_check_done.set()
+        await task
+
+        assert call.call_metrics.hallucinations_blocked == 1
+        assert call.transcript_bilingual == []
+
+    @pytest.mark.asyncio
+    async def test_response_done_resets_gate_when_idle(self):
+        handler = _make_handler()
+        handler._stt_check_done.clear()
+        handler._stt_blocked = True
+
+        await handler._handle_response_done({"response": {}})
+
+        assert handler._stt_check_done.is_set()
+        assert handler._stt_blocked is False
+
 
 class TestPostEchoSettlingFilter:
     """P3: Post-echo settling 직후 ≤1단어 STT 차단 검증."""
@@ -798,27 +854,126 @@ class TestWhisperAppendFilter:
     def test_ko_sentence_endings_regex(self):
         """한국어 종결 어미 정규식 검증."""
         # 정상 종결 어미
-        assert _KO_SENTENCE_ENDINGS.search("도와드리겠습니다")
-        assert _KO_SENTENCE_ENDINGS.search("감사합니다")
-        assert _KO_SENTENCE_ENDINGS.search("예약하겠습니다.")
-        assert _KO_SENTENCE_ENDINGS.search("그러시죠")
-        assert _KO_SENTENCE_ENDINGS.search("말씀해주세요")
+        assert _KO_RULES.trailing_unless.search("도와드리겠습니다")
+        assert _KO_RULES.trailing_unless.search("감사합니다")
+        assert _KO_RULES.trailing_unless.search("예약하겠습니다.")
+        assert _KO_RULES.trailing_unless.search("그러시죠")
+        assert _KO_RULES.trailing_unless.search("말씀해주세요")
 
         # 종결 어미 아님 (이름/명사)
-        assert not _KO_SENTENCE_ENDINGS.search("배혜지")
-        assert not _KO_SENTENCE_ENDINGS.search("영상편집")
-        assert not _KO_SENTENCE_ENDINGS.search("방송통신위원회")
+        assert not _KO_RULES.trailing_unless.search("배혜지")
+        assert not _KO_RULES.trailing_unless.search("영상편집")
+        assert not _KO_RULES.trailing_unless.search("방송통신위원회")
 
     def test_ko_trailing_fragment_regex(self):
         """Trailing fragment 정규식 매칭 검증."""
         # 매칭되어야 하는 케이스
-        m = _KO_TRAILING_FRAGMENT_RE.search("그러시죠? 영상편집 배혜지")
+        m = _KO_RULES.trailing_fragment.search("그러시죠? 영상편집 배혜지")
         assert m is not None
         assert m.group(1).strip() == "영상편집 배혜지"
 
-        m = _KO_TRAILING_FRAGMENT_RE.search("안녕하세요. 지금까지 재택 플러스")
+        m = _KO_RULES.trailing_fragment.search("안녕하세요. 지금까지 재택 플러스")
         assert m is not None
 
         # 매칭 안 되는 케이스 (문장 종결 부호 없음)
-        m = _KO_TRAILING_FRAGMENT_RE.search("안녕하세요 영상편집")
+        m = _KO_RULES.trailing_fragment.search("안녕하세요 영상편집")
         assert m is None
+
+
+class TestProvisionalSttText:
+    """STT delta 누적 텍스트의 잠정 표시 구간 (점진 필터)."""
+
+    def test_holds_incomplete_last_word(self):
+        assert _provisional_stt_text("예약을 하고 싶", "ko") == "예약을 하고"
+        assert _provisional_stt_text("예약", "ko") == ""
+        assert _provisional_stt_text("예약을 하고 ", "ko") == "예약을 하고"
+
+    def test_holds_blocklist_prefix(self):
+        """블록리스트 문구가 될 수 있는 동안은 보류, 벗어나면 표시."""
+        assert _provisional_stt_text("시청해주셔서 ", "ko") == ""
+        assert _provisional_stt_text("감사합니다. ", "ko") == ""
+        assert _provisional_stt_text("감사합니다 예약 ", "ko") == "감사합니다 예약"
+
+    def test_cuts_at_append_hallucination(self):
+        assert _provisional_stt_text("네 맞습니다 영상편집 ", "ko") == "네 맞습니다"
+
+    def test_holds_short_english_for_non_english_recipient(self):
+        assert _provisional_stt_text("Thank you ", "ko") == ""
+        assert _provisional_stt_text("Thank you ", "en") == "Thank you"
+
+    def test_post_echo_requires_two_words(self):
+        assert _provisional_stt_text("여보세요 ", "ko", post_echo=True) == ""
+        assert _provisional_stt_text("여보세요 네 ", "ko", post_echo=True) == "여보세요 네"
+
+    @pytest.mark.parametrize(
+        "text,language",
+        [("予約をしたいのですが", "ja"), ("我想预订一张桌子", "zh")],
+    )
+    def test_no_space_language_uses_char_threshold(self, text, language):
+        """띄어쓰기 없는 언어는 공백 대신 글자 수로 표시 시점을 판정한다."""
+        assert _provisional_stt_text(text[:2], language) == ""
+        assert _provisional_stt_text(text, language) == text
+        assert _provisional_stt_text(text[:2], language, post_echo=True) == ""
+        assert _provisional_stt_text(text, language, post_echo=True) == text
+
+
+class TestProvisionalOriginalCaption:
+    """transcription.delta → 잠정 원문 자막 스트리밍 + completed 확정/철회."""
+
+    def _handler(self):
+        handler = _make_handler(on_original_caption_partial=AsyncMock())
+        handler._speech_started_at = time.time() - 0.4
+        handler._first_caption_pending = True
+        return handler
+
+    async def _delta(self, handler, delta, item_id="item_1"):
+        await handler._handle_input_transcription_delta(
+            {"item_id": item_id, "delta": delta}
+        )
+
+    @pytest.mark.asyncio
+    async def test_streams_accumulated_stable_text(self):
+        handler = self._handler()
+        for delta in ["예약", "을 ", "하고 ", "싶"]:
+            await self._delta(handler, delta)
+
+        calls = [c.args for c in handler._on_original_caption_partial.await_args_list]
+        assert calls == [("recipient", "예약을"), ("recipient", "예약을 하고")]
+        metrics = handler._call.call_metrics
+        assert len(metrics.session_b_first_caption_ms) == 1
+        assert 300 < metrics.session_b_first_caption_ms[0] < 2000
+
+    @pytest.mark.asyncio
+    async def test_completed_finalizes_without_retract(self):
+        handler = self._handler()
+        await self._delta(handler, "예약을 하고 ")
+        await handler._handle_input_transcription_completed(
+            {"item_id": "item_1", "transcript": "예약을 하고 싶어요"}
+        )
+
+        handler._on_original_caption.assert_awaited_once_with("recipient", "예약을 하고 싶어요")
+        assert handler._on_original_caption_partial.await_count == 1
+        assert handler._stt_partials == {}
+        # 첫 자막 지표는 발화당 1회
+        assert len(handler._call.call_metrics.session_b_first_caption_ms) == 1
+
+    @pytest.mark.asyncio
+    async def test_blocked_completion_retracts_provisional(self):
+        handler = self._handler()
+        await self._delta(handler, "네 ")
+        await self._delta(handler, "ㅋㅋ ")
+        await handler._handle_input_transcription_completed(
+            {"item_id": "item_1", "transcript": "ㅋㅋㅋㅋ"}
+        )
+
+        handler._on_original_caption.assert_not_awaited()
+        assert handler._on_original_caption_partial.await_args_list[-1].args == ("recipient", "")
+
+    @pytest.mark.asyncio
+    async def test_suppressed_output_skips_provisional(self):
+        handler = self._handler()
+        handler.output_suppressed = True
+        await self._delta(handler, "예약을 하고 ")
+
+        handler._on_original_caption_partial.assert_not_awaited()
+        assert handler._stt_partials == {"item_1": "예약을 하고 "}
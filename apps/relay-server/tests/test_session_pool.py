@@ -0,0 +1,142 @@
+"""RealtimeSessionPool 단위 테스트.
+
+핵심 검증 사항:
+  - claim(): 유휴 연결 hit / 빈 풀 miss + hit rate 지표
+  - 끊긴/만료 연결은 claim 시 건너뜀
+  - _maintain_once(): 목표 유휴 수까지 보충, stale 연결 교체
+  - target_idle: claim 도착률에 따라 [min, max] 범위에서 증가
+  - DualSessionManager.connect: 풀 hit 시 핸드셰이크 생략 + pool_hits 기록
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from websockets.protocol import State
+
+from src.realtime.sessions.session_pool import RealtimeSessionPool, _PooledConnection
+
+
+def _fake_ws(state: State = State.OPEN) -> MagicMock:
+    ws = MagicMock()
+    ws.state = state
+    ws.close = AsyncMock()
+    return ws
+
+
+class TestClaim:
+    @pytest.mark.asyncio
+    async def test_claim_hit(self):
+        pool = RealtimeSessionPool(min_idle=2)
+        ws = _fake_ws()
+        pool._idle.append(_PooledConnection(ws=ws, opened_at=time.monotonic()))
+
+        assert pool.claim() is ws
+        stats = pool.stats()
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_claim_miss_on_empty(self):
+        pool = RealtimeSessionPool()
+        assert pool.claim() is None
+        pool.record_miss_latency(800.0)
+        stats = pool.stats()
+        assert stats["misses"] == 1
+        assert stats["claim_latency_avg_ms"] == 800.0
+
+    @pytest.mark.asyncio
+    async def test_claim_skips_closed_and_expired(self):
+        pool = RealtimeSessionPool(max_age_s=60)
+        closed = _fake_ws(State.CLOSED)
+        expired = _fake_ws()
+        good = _fake_ws()
+        now = time.monotonic()
+        pool._idle.extend([
+            _PooledConnection(ws=closed, opened_at=now),
+            _PooledConnection(ws=expired, opened_at=now - 120),
+            _PooledConnection(ws=good, opened_at=now),
+        ])
+
+        assert pool.claim() is good
+        assert pool.idle_count == 0
+
+
+class TestMaintain:
+    @pytest.mark.asyncio
+    async def test_fills_to_target(self):
+        pool = RealtimeSessionPool(min_idle=2, max_idle=4)
+        with patch(
+            "src.realtime.sessions.session_pool.open_realtime_ws",
+            AsyncMock(side_effect=lambda label: _fake_ws()),
+        ) as mock_open:
+            await pool._maintain_once()
+        assert mock_open.await_count == 2
+        assert pool.idle_count == 2
+
+    @pytest.mark.asyncio
+    async def test_replaces_stale(self):
+        pool = RealtimeSessionPool(min_idle=1, max_age_s=60)
+        stale = _fake_ws()
+        pool._idle.append(_PooledConnection(ws=stale, opened_at=time.monotonic() - 120))
+        with patch(
+            "src.realtime.sessions.session_pool.open_realtime_ws",
+            AsyncMock(side_effect=lambda label: _fake_ws()),
+        ):
+            await pool._maintain_once()
+        stale.close.assert_awaited_once()
+        assert pool.idle_count == 1
+        assert pool._idle[0].ws is not stale
+
+    @pytest.mark.asyncio
+    async def test_open_failure_does_not_raise(self):
+        pool = RealtimeSessionPool(min_idle=1)
+        with patch(
+            "src.realtime.sessions.session_pool.open_realtime_ws",
+            AsyncMock(side_effect=OSError("boom")),
+        ):
+            await pool._maintain_once()
+        assert pool.idle_count == 0
+        assert pool.stats()["opening"] == 0
+
+    def test_target_grows_with_arrival_rate(self):
+        pool = RealtimeSessionPool(min_idle=2, max_idle=6, lookahead_s=60)
+        assert pool.target_idle == 2
+        now = time.monotonic()
+        # 10분 윈도우에 60 claim → 0.1/s × 60s = 6
+        pool._arrivals.extend([now] * 60)
+        assert pool.target_idle == 6
+        pool._arrivals.extend([now] * 600)
+        assert pool.target_idle == 6  # max clamp
+
+
+class TestDualSessionPoolIntegration:
+    @pytest.mark.asyncio
+    async def test_connect_uses_pool(self):
+        from src.realtime.sessions.session_manager import DualSessionManager
+        from src.types import CallMode
+
+        dual = DualSessionManager(mode=CallMode.RELAY, source_language="en", target_language="ko")
+        ws = _fake_ws()
+        ws.send = AsyncMock()
+        fake_pool = MagicMock()
+        fake_pool.is_running = True
+        fake_pool.claim = MagicMock(side_effect=[ws, None])
+        fresh = _fake_ws()
+        fresh.send = AsyncMock()
+
+        with (
+            patch("src.realtime.sessions.session_pool.session_pool", fake_pool),
+            patch(
+                "src.realtime.sessions.session_manager.open_realtime_ws",
+                AsyncMock(return_value=fresh),
+            ) as mock_open,
+        ):
+            await dual.connect("prompt a", "prompt b")
+
+        assert dual.pool_hits == 1
+        assert mock_open.await_count == 1
+        fake_pool.record_miss_latency.assert_called_once()
+        # 풀 연결에도 session.update 전송
+        ws.send.assert_awaited_once()
+        assert '"session.update"' in ws.send.await_args[0][0]
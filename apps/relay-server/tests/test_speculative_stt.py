@@ -684,3 +684,136 @@ class TestPendingCountProtocol:
         handler._decrement_pending_stt()
         assert handler._pending_stt_count == 0
         assert handler._stt_ready_event.is_set()
+
+
+# ═══════════════════════════════════════════════════════════
+#  적응형 commit 지연 + 발화 내 쉼 트리거 + hit/waste
+# ═══════════════════════════════════════════════════════════
+
+
+class TestSpeculativeSttTrigger:
+    """SpeculativeSttTrigger: 통화별 발화 길이 분포 기반 지연."""
+
+    def test_default_until_min_samples(self):
+        from src.realtime.sessions.speculative_trigger import SpeculativeSttTrigger
+
+        trigger = SpeculativeSttTrigger(default_delay_s=1.0, min_samples=5)
+        for _ in range(4):
+            trigger.observe(3.0)
+        assert not trigger.adapted
+        assert trigger.delay_s() == 1.0
+
+    def test_short_replies_not_wasted(self):
+        """짧은 응답("네", "예" 0.65~0.75s)이 섞인 통화: 지연이 그 길이 밖으로 이동해 낭비 commit 방지."""
+        from src.realtime.sessions.speculative_trigger import SpeculativeSttTrigger
+
+        trigger = SpeculativeSttTrigger(min_samples=5)
+        durations = (0.7, 0.65, 3.0, 0.7, 0.75, 2.6)
+        for d in durations:
+            trigger.observe(d)
+        delay = trigger.delay_s()
+        assert trigger.adapted
+        assert all(not (delay < d < delay + trigger.min_gain_s) for d in durations)
+        assert delay >= 0.75
+
+    def test_all_short_uses_max_delay(self):
+        from src.realtime.sessions.speculative_trigger import SpeculativeSttTrigger
+
+        trigger = SpeculativeSttTrigger(min_samples=5, max_delay_s=2.5)
+        for d in (0.5, 0.6, 0.55, 0.7, 0.65):
+            trigger.observe(d)
+        assert trigger.delay_s() == 2.5
+
+    def test_long_utterances_keep_overlap(self):
+        """긴 설명(2.5~4s) 위주 통화: 겹침 상한(1s)을 확보하는 범위에서 지연."""
+        from src.realtime.sessions.speculative_trigger import SpeculativeSttTrigger
+
+        trigger = SpeculativeSttTrigger(min_samples=5)
+        for d in (2.5, 3.0, 4.0, 3.5, 2.8):
+            trigger.observe(d)
+        delay = trigger.delay_s()
+        assert 0.6 <= delay <= 1.5
+        assert all(d - delay >= 1.0 for d in (2.5, 3.0, 4.0, 3.5, 2.8))
+
+    def test_is_hit(self):
+        from src.realtime.sessions.speculative_trigger import SpeculativeSttTrigger
+
+        trigger = SpeculativeSttTrigger(min_gain_s=0.3)
+        assert trigger.is_hit(0.5)
+        assert not trigger.is_hit(0.1)
+
+
+class TestSpeculativePauseTrigger:
+    """notify_speech_paused: 발화 내 쉼에서 즉시 commit."""
+
+    @pytest.mark.asyncio
+    async def test_pause_commits_after_min_delay(self):
+        call = _make_call()
+        handler = _make_handler(call=call, use_local_vad=True, chat_translator=_make_chat_translator_mock())
+        handler._is_recipient_speaking = True
+        handler._speech_started_at = time.time() - 0.8
+        handler._speculative_stt_task = asyncio.create_task(asyncio.sleep(10))
+
+        await handler.notify_speech_paused()
+
+        handler.session.commit_audio_only.assert_awaited_once()
+        assert handler._speculative_committed is True
+        assert handler._pending_stt_count == 1
+        assert handler._speculative_stt_task is None  # 타이머 취소
+        assert call.call_metrics.speculative_stt_pause_triggers == 1
+
+    @pytest.mark.asyncio
+    async def test_pause_too_early_ignored(self):
+        handler = _make_handler(use_local_vad=True, chat_translator=_make_chat_translator_mock())
+        handler._is_recipient_speaking = True
+        handler._speech_started_at = time.time() - 0.2
+
+        await handler.notify_speech_paused()
+
+        handler.session.commit_audio_only.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_single_commit_per_utterance(self):
+        handler = _make_handler(use_local_vad=True, chat_translator=_make_chat_translator_mock())
+        handler._is_recipient_speaking = True
+        handler._speech_started_at = time.time() - 1.0
+
+        await handler.notify_speech_paused()
+        await handler.notify_speech_paused()
+        with patch("src.realtime.sessions.session_b.settings") as mock_settings:
+            mock_settings.speculative_stt_delay_s = 0.0
+            await handler._speculative_stt_handler()
+
+        handler.session.commit_audio_only.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_v2v_ignored(self):
+        handler = _make_handler(use_local_vad=True, chat_translator=None)
+        handler._is_recipient_speaking = True
+        handler._speech_started_at = time.time() - 1.0
+
+        await handler.notify_speech_paused()
+
+        handler.session.commit_audio_only.assert_not_awaited()
+
+
+class TestSpeculativeOutcome:
+    """발화 종료 시 hit/waste 집계 + 분포 갱신."""
+
+    @pytest.mark.asyncio
+    async def test_hit_and_waste(self):
+        call = _make_call()
+        handler = _make_handler(call=call, use_local_vad=True, chat_translator=_make_chat_translator_mock())
+        handler._response_debounce_s = 10.0
+
+        for remaining in (0.8, 0.1):
+            await handler.notify_speech_started()
+            handler._speech_started_at = time.time() - 1.0 - remaining
+            handler._speculative_committed = True
+            handler._speculative_commit_time = time.time() - remaining
+            await handler.notify_speech_stopped()
+
+        assert call.call_metrics.speculative_stt_hits == 1
+        assert call.call_metrics.speculative_stt_wasted == 1
+        assert len(handler._speculative_trigger._durations) == 2
+        handler.stop()
@@ -0,0 +1,110 @@
+"""STT 할루시네이션 매처 테스트 (언어별 컴파일 다중 패턴 매칭).
+
+핵심 검증 사항:
+  - 한 번의 match()로 모든 매칭과 사유 반환
+  - scope: always / native / foreign (텍스트 언어 기준)
+  - 구조적 노이즈: 자음 스팸, 짧은 패턴 반복, 단일 문자
+  - append 부분 문자열: 가장 빠른 위치, 긴 문구 우선
+  - 추가 데이터 디렉토리로 코드 변경 없이 규칙 확장
+"""
+
+import json
+
+import pytest
+
+from src.realtime.stt_filter import DEFAULT_DATA_DIR, SttFilterMatcher, get_stt_matcher, load_language_rules
+
+
+def _reasons(matcher: SttFilterMatcher, text: str) -> list[str]:
+    return [h.reason for h in matcher.match(text)]
+
+
+class TestMatch:
+    def test_clean_text_no_hits(self):
+        assert get_stt_matcher("ko").match("내일 저녁 7시에 두 명 예약 가능할까요?") == []
+
+    def test_blocklist_normalized(self):
+        hits = get_stt_matcher("ko").match("감사합니다!")
+        assert [(h.reason, h.language) for h in hits] == [("blocklist", "ko")]
+
+    def test_multiple_hits_in_one_pass(self):
+        text = "네 네 네 예약했습니다 영상편집 [unclear]"
+        reasons = _reasons(get_stt_matcher("ko"), text)
+        assert "append" in reasons
+        assert "unclear" in reasons
+        assert "repetition" in reasons
+
+    def test_append_earliest_and_longest(self):
+        text = "예약 변경할게요 수고 하셨습니다 영상편집"
+        append = [h for h in get_stt_matcher("ko").match(text) if h.reason == "append"]
+        assert append[0].pattern == "수고 하셨습니다"
+        assert text[:append[0].start].rstrip() == "예약 변경할게요"
+
+    def test_unclear_case_insensitive(self):
+        assert "unclear" in _reasons(get_stt_matcher("en"), "Sorry, it's INAUDIBLE")
+
+    @pytest.mark.parametrize("text", ["ㅋㅋㅋ", "ㅎ", "하하하하", "abcabcabc", "", "   ", "a"])
+    def test_noise(self, text):
+        assert "noise" in _reasons(get_stt_matcher("ko"), text)
+
+    @pytest.mark.parametrize("text", ["네 알겠어요", "abcabcab", "안녕히 계세요"])
+    def test_not_noise(self, text):
+        assert "noise" not in _reasons(get_stt_matcher("ko"), text)
+
+    def test_trailing_fragment(self):
+        matcher = get_stt_matcher("ko")
+        text = "왜 바꾸고 싶으시죠? 영상편집 배혜지"
+        hit = matcher.trailing_fragment(text)
+        assert hit is not None
+        assert text[:hit.start + 1] == "왜 바꾸고 싶으시죠?"
+        assert matcher.trailing_fragment("알겠습니다. 내일 뵙겠습니다") is None
+
+
+class TestScopes:
+    def test_english_rules_foreign_only(self):
+        assert _reasons(get_stt_matcher("ko"), "Thank you.") == ["blocklist", "short_phrase"]
+        assert _reasons(get_stt_matcher("ko"), "Okay") == ["short_phrase"]
+        assert _reasons(get_stt_matcher("ko"), "Hi, John.") == ["hi_name"]
+        # 영어 통화에서는 정상 발화
+        assert _reasons(get_stt_matcher("en"), "Thank you.") == []
+        assert _reasons(get_stt_matcher("en"), "Okay") == []
+
+    def test_korean_append_native_only(self):
+        assert "append" not in _reasons(get_stt_matcher("en"), "Reservation 영상편집")
+        assert "append" in _reasons(get_stt_matcher("ko"), "예약할게요 영상편집")
+
+    def test_no_language_applies_always_rules_only(self):
+        matcher = get_stt_matcher("")
+        assert _reasons(matcher, "시청해주셔서 감사합니다.") == ["blocklist"]
+        assert _reasons(matcher, "Thank you.") == []
+
+    def test_blocklist_prefix(self):
+        matcher = get_stt_matcher("ko")
+        assert matcher.is_blocklist_prefix("시청해")
+        assert matcher.is_blocklist_prefix("thank")
+        assert not matcher.is_blocklist_prefix("예약")
+        assert not get_stt_matcher("en").is_blocklist_prefix("thank")
+
+
+class TestExtraDataDir:
+    def test_extends_without_code_change(self, tmp_path):
+        (tmp_path / "ko.json").write_text(json.dumps({
+            "blocklist": {"phrases": ["다음 영상에서 만나요"]},
+            "append_substrings": {"phrases": ["협찬"]},
+        }), encoding="utf-8")
+        (tmp_path / "ja.json").write_text(json.dumps({
+            "language": "ja",
+            "blocklist": {"scope": "native", "phrases": ["ご視聴ありがとうございました"]},
+        }), encoding="utf-8")
+
+        rules = load_language_rules([DEFAULT_DATA_DIR, tmp_path])
+        ko = SttFilterMatcher("ko", rules)
+        assert _reasons(ko, "다음 영상에서 만나요") == ["blocklist"]
+        assert _reasons(ko, "감사합니다") == ["blocklist"]  # 내장 규칙 유지
+        assert "append" in _reasons(ko, "예약 완료됐어요 협찬")
+        assert _reasons(SttFilterMatcher("ja", rules), "ご視聴ありがとうございました") == ["blocklist"]
+        assert _reasons(ko, "ご視聴ありがとうございました") == []
+
+    def test_missing_dir_ignored(self, tmp_path):
+        rules = load_language_rules([DEFAULT_DATA_DIR, tmp_path / "missing"])
+        assert set(rules) == {"ko", "en"}
@@ -7,6 +7,8 @@
   - Dynamic Energy Threshold: echo window 중 높은 에너지 임계값으로 에코 필터링
   - Session A TTS → Twilio 전달 + echo window 활성화
   - First Message: exact utterance 패턴
+  - 긴 텍스트 입력: 문장 단위 파이프라이닝 (첫 문장 즉시 요청)
+  - 연속 텍스트 입력: 응답 진행 중/병합 창 안 도착 메시지 병합
   - Audio Energy Gate 유지 (Twilio 수신자 무음 필터링)
 """
 
@@ -17,7 +19,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.realtime.audio_router import AudioRouter
-from src.types import ActiveCall, CallMode, CommunicationMode
+from src.realtime.pipeline.text_to_voice import split_sentences
+from src.types import ActiveCall, CallMode, CallStatus, CommunicationMode
 
 
 def _make_call(**overrides) -> ActiveCall:
@@ -273,6 +276,181 @@ class TestTextToVoiceTextHandling:
         router.dual_session.session_a.create_response.assert_called_once()
 
 
+class TestTextToVoiceSentencePipeline:
+    """긴 텍스트 입력의 문장 단위 파이프라이닝 검증."""
+
+    def _make_router(self, **overrides):
+        router = _make_router(**overrides)
+        router.session_a = MagicMock()
+        router.session_a.is_generating = False
+        router.session_a.wait_for_done = AsyncMock(return_value=True)
+        router.session_a.prune_before_response = AsyncMock()
+        router.session_a.send_user_text = AsyncMock()
+        router.context_manager = MagicMock()
+        router.context_manager.inject_context = AsyncMock()
+        return router
+
+    def test_split_sentences_merges_short_fragments(self):
+        """짧은 문장은 다음 문장과 합쳐지고, 마지막 짧은 문장은 앞 문장에 붙는다."""
+        text = "네. 내일 오후 세 시에 두 명 예약하고 싶어요. 창가 자리가 있으면 좋겠어요. 감사합니다."
+        assert split_sentences(text, min_chars=12) == [
+            "네. 내일 오후 세 시에 두 명 예약하고 싶어요.",
+            "창가 자리가 있으면 좋겠어요. 감사합니다.",
+        ]
+        assert split_sentences("Hello", min_chars=12) == ["Hello"]
+
+    @pytest.mark.asyncio
+    async def test_long_input_sent_sentence_by_sentence(self):
+        """긴 입력은 문장별 send_text_item + create_response, 두 번째 문장부터 앞 응답 완료 대기."""
+        router = self._make_router()
+        text = "I'd like to book a table for two tomorrow. Could we get a seat by the window, please?"
+
+        await router.handle_user_text(text)
+
+        sent = [c.args[0] for c in router.dual_session.session_a.send_text_item.call_args_list]
+        assert sent == [
+            "I'd like to book a table for two tomorrow.",
+            "Could we get a seat by the window, please?",
+        ]
+        assert router.dual_session.session_a.create_response.call_count == 2
+        router.session_a.wait_for_done.assert_awaited_once()
+        router.session_a.set_last_user_stt.assert_called_with("Could we get a seat by the window, please?")
+        assert router.call.call_metrics.t2v_pipelined_inputs == 1
+        assert router.call.call_metrics.t2v_pipelined_sentences == 2
+        # 전체 원문은 대화 이력에 1회만 기록
+        assert router.call.transcript_history[-1] == {"role": "user", "text": text}
+
+    @pytest.mark.asyncio
+    async def test_short_input_not_split(self):
+        """짧은 입력은 기존과 같이 한 번에 요청한다."""
+        router = self._make_router()
+
+        await router.handle_user_text("Yes. Thanks.")
+
+        router.dual_session.session_a.send_text_item.assert_called_once_with("Yes. Thanks.")
+        assert router.call.call_metrics.t2v_pipelined_inputs == 0
+
+    @pytest.mark.asyncio
+    async def test_stops_when_call_ended(self):
+        """통화가 끝나면 남은 문장은 요청하지 않는다."""
+        router = self._make_router()
+
+        async def _end_call(timeout: float = 5.0) -> bool:
+            router.call.status = CallStatus.ENDED
+            return True
+
+        router.session_a.wait_for_done = AsyncMock(side_effect=_end_call)
+        await router.handle_user_text(
+            "I'd like to book a table for two tomorrow. Could we get a seat by the window, please?"
+        )
+
+        router.dual_session.session_a.send_text_item.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_interrupt_drops_remaining_sentences(self):
+        """첫 문장 재생 중 수신자 Interrupt로 취소되면 나머지 문장은 요청하지 않는다."""
+        router = self._make_router()
+        router.session_a.cancel_generation = 0
+
+        async def _interrupted(timeout: float = 5.0) -> bool:
+            router.session_a.cancel_generation += 1  # InterruptHandler → session_a.cancel()
+            return True
+
+        router.session_a.wait_for_done = AsyncMock(side_effect=_interrupted)
+        await router.handle_user_text(
+            "I'd like to book a table for two tomorrow. Could we get a seat by the window, please? "
+            "We will arrive at seven."
+        )
+
+        router.dual_session.session_a.send_text_item.assert_called_once_with(
+            "I'd like to book a table for two tomorrow."
+        )
+        router.dual_session.session_a.create_response.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_agent_mode_not_split(self):
+        """Agent 모드는 입력 전체를 하나의 대화 턴으로 전달한다."""
+        router = self._make_router(mode=CallMode.AGENT)
+        text = "I'd like to book a table for two tomorrow. Could we get a seat by the window, please?"
+
+        await router.handle_user_text(text)
+
+        router.session_a.send_user_text.assert_called_once_with(text)
+
+
+class TestTextToVoiceInputCoalescing:
+    """연속 텍스트 입력 병합 검증."""
+
+    def _make_router(self, **overrides):
+        router = _make_router(**overrides)
+        router.session_a = MagicMock()
+        router.session_a.is_generating = False
+        router.session_a.wait_for_done = AsyncMock(return_value=True)
+        router.session_a.prune_before_response = AsyncMock()
+        router.context_manager = MagicMock()
+        router.context_manager.inject_context = AsyncMock()
+        return router
+
+    @pytest.mark.asyncio
+    async def test_burst_merged_into_one_request(self):
+        """응답 대기 중 도착한 메시지는 한 번의 번역 요청으로 병합된다."""
+        router = self._make_router()
+        router.call.call_metrics.session_a_latencies_ms = [800.0]
+        router.session_a.is_generating = True
+        release = asyncio.Event()
+
+        async def _wait_for_done(timeout: float = 5.0) -> bool:
+            await release.wait()
+            return True
+
+        router.session_a.wait_for_done = AsyncMock(side_effect=_wait_for_done)
+
+        tasks = [asyncio.create_task(router.handle_user_text(t)) for t in ["안녕하세요", "내일", "예약돼요?"]]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        router.dual_session.session_a.send_text_item.assert_called_once_with("안녕하세요 내일 예약돼요?")
+        router.dual_session.session_a.create_response.assert_called_once()
+        assert [h["text"] for h in router.call.transcript_history] == ["안녕하세요", "내일", "예약돼요?"]
+        assert router.call.call_metrics.t2v_coalesced_inputs == 2
+        assert router.call.call_metrics.t2v_coalesce_saved_ms == [1600.0]
+        # 컨텍스트에는 마지막 메시지가 아니라 병합된 원문 전체가 들어간다
+        await router._on_user_turn_complete("user", "Hello, tomorrow, is it booked?")
+        router.context_manager.add_turn.assert_called_once_with("user", "안녕하세요 내일 예약돼요?")
+
+    @pytest.mark.asyncio
+    async def test_separate_messages_not_merged(self):
+        """병합 창이 지난 뒤 도착한 메시지는 별도로 요청한다."""
+        router = self._make_router()
+
+        await router.handle_user_text("안녕하세요")
+        await router.handle_user_text("예약돼요?")
+
+        sent = [c.args[0] for c in router.dual_session.session_a.send_text_item.call_args_list]
+        assert sent == ["안녕하세요", "예약돼요?"]
+        assert router.call.call_metrics.t2v_coalesced_inputs == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_message_skips_window(self):
+        """대기·진행 중인 요청이 없으면 병합 창을 기다리지 않고 바로 요청한다."""
+        router = self._make_router()
+        with patch("src.realtime.pipeline.text_to_voice.asyncio.sleep", new=AsyncMock()) as sleep:
+            await router.handle_user_text("안녕하세요")
+
+        sleep.assert_not_awaited()
+        router.dual_session.session_a.send_text_item.assert_called_once_with("안녕하세요")
+
+    @pytest.mark.asyncio
+    async def test_disabled_sends_each_message(self):
+        """병합 비활성화 시 동시에 도착해도 메시지마다 요청한다."""
+        router = self._make_router()
+        with patch("src.realtime.pipeline.text_to_voice.settings.t2v_coalesce_enabled", False):
+            await asyncio.gather(router.handle_user_text("안녕하세요"), router.handle_user_text("예약돼요?"))
+
+        assert router.dual_session.session_a.send_text_item.call_count == 2
+
+
 class TestTextToVoiceSessionACallbacks:
     """Session A 콜백 검증."""
 
@@ -476,12 +654,16 @@ class TestTextToVoiceContextHallucination:
         router = _make_router(mode=CallMode.RELAY)
         sa = router._pipeline.session_a
         # 첫 인사 메시지로 생성된 아이템 시뮬레이션
-        sa._conversation_item_ids = ["item_greeting_1", "item_greeting_2", "item_greeting_3"]
+        for item_id in ["item_greeting_1", "item_greeting_2", "item_greeting_3"]:
+            await sa._handle_item_created({"item": {"id": item_id, "type": "message", "role": "assistant"}})
 
         await sa.prune_before_response()
 
-        # context_prune_keep=0이므로 모든 아이템 삭제 시도
-        assert sa._conversation_item_ids == []
+        # context_prune_keep=0이므로 모든 아이템을 한 번에 삭제 큐로
+        assert sa.conversation_size == {"items": 0, "tokens": 0}
+        router.dual_session.session_a.queue_item_deletes.assert_called_once_with(
+            ["item_greeting_1", "item_greeting_2", "item_greeting_3"]
+        )
 
     def test_strict_relay_instruction_anti_hallucination(self):
         """per-response instruction에 anti-hallucination 규칙이 포함된다."""
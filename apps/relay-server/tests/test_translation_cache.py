@@ -0,0 +1,141 @@
+"""TranslationCache 단위 테스트.
+
+핵심 검증 사항:
+  - 정규화: 공백/끝 구두점 무시, 의문문(?)은 구분
+  - 긴 발화는 캐시 대상 아님
+  - LRU 축출 + TTL 만료
+  - 반복 hit 항목 hot set 승격 (LRU 축출 제외)
+  - 컨텍스트 지문 키 분리
+  - ChatTranslator 연동: hit 시 Chat API 미호출, [unclear]는 저장 안 함
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.realtime.chat_translator import ChatTranslator
+from src.realtime.translation_cache import TranslationCache, normalize_utterance
+
+
+class TestNormalize:
+    def test_trailing_punct_and_whitespace(self):
+        assert normalize_utterance(" 감사합니다! ") == "감사합니다"
+        assert normalize_utterance("잠시만요...") == "잠시만요"
+        assert normalize_utterance("Thank   you.") == "thank you"
+
+    def test_question_mark_kept(self):
+        assert normalize_utterance("예약하셨나요?") == "예약하셨나요?"
+        assert normalize_utterance("네?") != normalize_utterance("네.")
+
+
+class TestTranslationCache:
+    def test_hit_and_miss(self):
+        cache = TranslationCache()
+        key = cache.make_key("ko", "en", "네.")
+        assert cache.get(key) is None
+        cache.put(key, "Yes.")
+        assert cache.get(cache.make_key("ko", "en", "네")) == "Yes."
+        stats = cache.stats()
+        assert stats["lookups"] == 2
+        assert stats["hit_rate"] == 0.5
+
+    def test_language_pair_separated(self):
+        cache = TranslationCache()
+        cache.put(cache.make_key("ko", "en", "네"), "Yes.")
+        assert cache.get(cache.make_key("ko", "ja", "네")) is None
+
+    def test_long_utterance_not_cached(self):
+        cache = TranslationCache(max_chars=10)
+        assert cache.make_key("ko", "en", "다음 주 화요일 저녁 일곱 시에 예약 가능할까요") is None
+
+    def test_lru_eviction(self):
+        cache = TranslationCache(max_entries=2, hot_min_hits=99)
+        a, b, c = (cache.make_key("ko", "en", t) for t in ("가", "나", "다"))
+        cache.put(a, "A")
+        cache.put(b, "B")
+        cache.get(a)  # a를 최근 사용으로
+        cache.put(c, "C")
+        assert cache.get(b) is None
+        assert cache.get(a) == "A"
+
+    def test_ttl_expiry(self):
+        cache = TranslationCache(ttl_s=10)
+        key = cache.make_key("ko", "en", "네")
+        cache.put(key, "Yes.")
+        with patch("src.realtime.translation_cache.time.monotonic", return_value=time.monotonic() + 11):
+            assert cache.get(key) is None
+        assert cache.stats()["size"] == 0
+
+    def test_hot_set_survives_lru(self):
+        cache = TranslationCache(max_entries=1, hot_min_hits=2)
+        hot = cache.make_key("ko", "en", "감사합니다")
+        cache.put(hot, "Thank you.")
+        cache.get(hot)
+        cache.get(hot)  # 2회 hit → hot 승격
+        assert cache.stats()["hot_size"] == 1
+        for t in ("가", "나", "다"):
+            cache.put(cache.make_key("ko", "en", t), t)
+        assert cache.get(hot) == "Thank you."
+
+    def test_context_fingerprint_separates_keys(self):
+        cache = TranslationCache()
+        k1 = cache.make_key("ko", "en", "네", context="User: Is it open today?")
+        k2 = cache.make_key("ko", "en", "네", context="User: Do you have a table?")
+        assert k1 != k2
+
+
+def _response(text: str):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = text
+    response.usage = MagicMock(prompt_tokens=10, completion_tokens=2)
+    return response
+
+
+class TestChatTranslatorCache:
+    def _translator(self, create):
+        client = AsyncMock()
+        client.chat.completions.create = create
+        with patch("src.realtime.chat_translator.get_openai_client", return_value=client):
+            return ChatTranslator(source_language="ko", target_language="en", hedge_enabled=False)
+
+    @pytest.mark.asyncio
+    async def test_hit_bypasses_network(self):
+        cache = TranslationCache()
+        create = AsyncMock(return_value=_response("Please hold on."))
+        translator = self._translator(create)
+        with patch("src.realtime.chat_translator.translation_cache", cache):
+            first = await translator.translate("잠시만요")
+            second = await translator.translate("잠시만요.")
+
+        assert create.await_count == 1
+        assert not first.cached
+        assert second.cached
+        assert second.translated_text == "Please hold on."
+        assert second.input_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_hit_emits_single_delta(self):
+        cache = TranslationCache()
+        cache.put(cache.make_key("ko", "en", "네"), "Yes.")
+        create = AsyncMock()
+        translator = self._translator(create)
+        on_delta = AsyncMock()
+        with patch("src.realtime.chat_translator.translation_cache", cache):
+            result = await translator.translate_stream("네", on_delta)
+
+        create.assert_not_awaited()
+        on_delta.assert_awaited_once_with("Yes.")
+        assert result.cached
+
+    @pytest.mark.asyncio
+    async def test_unclear_not_cached(self):
+        cache = TranslationCache()
+        create = AsyncMock(return_value=_response("[unclear]"))
+        translator = self._translator(create)
+        with patch("src.realtime.chat_translator.translation_cache", cache):
+            await translator.translate("음")
+            await translator.translate("음")
+
+        assert create.await_count == 2
@@ -0,0 +1,229 @@
+"""Session B 턴 스케줄러 테스트 (Realtime 응답 생성 파이프라이닝).
+
+핵심 검증 사항:
+  - 진행 중인 응답이 없으면 즉시 디스패치 (queue delay ≈ 0)
+  - 응답 생성 중 제출된 턴은 response.done 직후 디스패치, 쌓인 턴은 병합
+  - 디스패치 실패 시 큐가 막히지 않음
+  - SessionBHandler: 발화 commit은 즉시 (STT 선행), 응답 생성만 대기
+  - 대기 턴의 입력 아이템은 프루닝에서 보존
+  - 대기 중 도착한 STT 판정은 진행 중인 응답과 섞이지 않음 (item_id 기준 귀속)
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.realtime.sessions.session_b import SessionBHandler
+from src.realtime.sessions.turn_scheduler import PendingTurn, TurnScheduler
+from src.types import ActiveCall, CallMode, CommunicationMode
+
+
+def _turn() -> PendingTurn:
+    now = time.time()
+    return PendingTurn(speech_started_at=now - 1.0, speech_stopped_at=now)
+
+
+def _make_handler() -> SessionBHandler:
+    call = ActiveCall(
+        call_id="turn-sched",
+        mode=CallMode.RELAY,
+        source_language="en",
+        target_language="ko",
+        communication_mode=CommunicationMode.VOICE_TO_VOICE,
+    )
+    session = MagicMock()
+    session.on = MagicMock()
+    session.clear_input_buffer = AsyncMock()
+    session.commit_audio_only = AsyncMock()
+    session.create_response = AsyncMock()
+    session.delete_item = AsyncMock()
+    handler = SessionBHandler(
+        session=session,
+        call=call,
+        on_translated_audio=AsyncMock(),
+        on_caption=AsyncMock(),
+        on_original_caption=AsyncMock(),
+        on_transcript_complete=AsyncMock(),
+        on_caption_done=AsyncMock(),
+        use_local_vad=True,
+        context_prune_keep=0,
+    )
+    handler._response_debounce_s = 0.0
+    return handler
+
+
+class TestTurnScheduler:
+    @pytest.mark.asyncio
+    async def test_idle_dispatches_inline(self):
+        dispatch = AsyncMock()
+        delays: list[float] = []
+        scheduler = TurnScheduler(dispatch, on_queue_delay=delays.append)
+
+        turn = _turn()
+        await scheduler.submit(turn)
+
+        dispatch.assert_awaited_once_with([turn])
+        assert scheduler.response_active
+        assert len(delays) == 1 and delays[0] < 50
+
+    @pytest.mark.asyncio
+    async def test_queued_until_response_done_then_merged(self):
+        dispatch = AsyncMock()
+        delays: list[float] = []
+        scheduler = TurnScheduler(dispatch, on_queue_delay=delays.append)
+        await scheduler.submit(_turn())
+
+        second, third = _turn(), _turn()
+        await scheduler.submit(second)
+        await scheduler.submit(third)
+        await asyncio.sleep(0.02)
+        assert dispatch.await_count == 1
+        assert scheduler.pending == 2
+
+        scheduler.response_done()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert dispatch.await_count == 2
+        assert dispatch.await_args.args[0] == [second, third]
+        assert scheduler.pending == 0
+        assert len(delays) == 3
+        assert delays[1] >= 15
+
+    @pytest.mark.asyncio
+    async def test_stalled_response_times_out(self):
+        dispatch = AsyncMock()
+        scheduler = TurnScheduler(dispatch, response_timeout_s=0.01)
+        await scheduler.submit(_turn())
+        await scheduler.submit(_turn())
+
+        await asyncio.sleep(0.05)
+        assert dispatch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_dispatch_failure_releases_queue(self):
+        dispatch = AsyncMock(side_effect=[RuntimeError("ws closed"), None])
+        scheduler = TurnScheduler(dispatch)
+
+        with pytest.raises(RuntimeError):
+            await scheduler.submit(_turn())
+        assert not scheduler.response_active
+
+        await scheduler.submit(_turn())
+        assert dispatch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_drops_queue(self):
+        dispatch = AsyncMock()
+        scheduler = TurnScheduler(dispatch)
+        await scheduler.submit(_turn())
+        await scheduler.submit(_turn())
+
+        scheduler.stop()
+        scheduler.response_done()
+        await asyncio.sleep(0)
+        assert dispatch.await_count == 1
+        assert scheduler.pending == 0
+
+
+class TestSessionBPipelinedTurns:
+    @pytest.mark.asyncio
+    async def test_next_utterance_committed_while_response_active(self):
+        """이전 응답 생성 중에도 다음 발화는 즉시 commit, response.create는 완료 후."""
+        handler = _make_handler()
+
+        await handler._debounced_create_response()
+        assert handler.session.create_response.await_count == 1
+
+        await handler._debounced_create_response()
+        assert handler.session.commit_audio_only.await_count == 2
+        assert handler.session.create_response.await_count == 1
+
+        await handler._handle_response_done({"response": {}})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert handler.session.create_response.await_count == 2
+        delays = handler._call.call_metrics.session_b_turn_queue_delay_ms
+        assert len(delays) == 2
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_unanswered_input(self):
+        handler = _make_handler()
+        await handler._handle_item_created({"item": {"id": "in_1", "type": "message", "role": "user"}})
+        await handler._handle_response_created({})
+        await handler._handle_item_created({"item": {"id": "out_1", "type": "message", "role": "assistant"}})
+        # 응답 생성 중 다음 발화 commit
+        await handler._handle_item_created({"item": {"id": "in_2", "type": "message", "role": "user"}})
+
+        await handler._prune_conversation_items(keep_last=0, keep_unanswered=True)
+
+        handler.session.queue_item_deletes.assert_called_once_with(["in_1", "out_1"])
+        assert handler._ledger.item_ids == ["in_2"]
+
+    @pytest.mark.asyncio
+    async def test_queued_stt_does_not_leak_into_active_response(self):
+        """대기 턴의 STT 원문/차단은 진행 중인 응답에 적용되지 않고 디스패치 시 적용된다."""
+        handler = _make_handler()
+        await handler._debounced_create_response()
+        await handler._handle_audio_committed({"item_id": "in_1"})
+        handler._last_recipient_stt = "first utterance"
+        await handler._debounced_create_response()  # 대기 턴
+        await handler._handle_audio_committed({"item_id": "in_2"})
+
+        await handler._handle_input_transcription_completed({"item_id": "in_2", "transcript": "ㅋ"})  # 노이즈 차단
+        assert handler._stt_blocked is False
+        assert handler._last_recipient_stt == "first utterance"
+
+        await handler._handle_response_done({"response": {}})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert handler.session.create_response.await_count == 2
+        assert handler._stt_blocked is True
+
+    @pytest.mark.asyncio
+    async def test_late_stt_of_active_turn_not_attributed_to_queued_turn(self):
+        """대기 턴이 있어도 진행 중인 턴의 늦은 STT는 item_id 기준으로 현재 턴에 적용된다."""
+        handler = _make_handler()
+        await handler._debounced_create_response()
+        await handler._handle_audio_committed({"item_id": "in_1"})
+        await handler._debounced_create_response()  # 대기 턴
+        await handler._handle_audio_committed({"item_id": "in_2"})
+
+        await handler._handle_input_transcription_completed({"item_id": "in_1", "transcript": "몇 시에 오세요?"})
+        assert handler._last_recipient_stt == "몇 시에 오세요?"
+
+        await handler._handle_input_transcription_completed({"item_id": "in_2", "transcript": "네 알겠습니다"})
+        assert handler._last_recipient_stt == "몇 시에 오세요?"
+        queued = handler._turn_scheduler.find_pending("in_2")
+        assert queued is not None and queued.recipient_stt == "네 알겠습니다"
+
+    @pytest.mark.asyncio
+    async def test_empty_commit_does_not_shift_item_attribution(self):
+        handler = _make_handler()
+        await handler._debounced_create_response()
+        await handler._debounced_create_response()  # 대기 턴 1 (빈 버퍼 commit 실패)
+        await handler._debounced_create_response()  # 대기 턴 2
+        await handler._handle_audio_committed({"item_id": "in_1"})
+        await handler._handle_commit_error({"error": {"code": "input_audio_buffer_commit_empty"}})
+        await handler._handle_audio_committed({"item_id": "in_3"})
+
+        assert handler._turn_scheduler.find_pending("in_1") is None
+        assert handler._turn_scheduler.find_pending("in_3") is handler._turn_scheduler._queue[1]
+
+    @pytest.mark.asyncio
+    async def test_server_vad_turn_takes_speech_stopped_item_ids(self):
+        handler = _make_handler()
+        handler._use_local_vad = False
+        await handler._debounced_create_response()
+        handler._speech_started_at = time.time() - 1.0
+        await handler._handle_speech_stopped({"item_id": "in_2"})
+        handler._response_debounce_task.cancel()
+        await handler._debounced_create_response()
+
+        queued = handler._turn_scheduler.find_pending("in_2")
+        assert queued is not None and queued.item_ids == {"in_2"}
+        assert handler._turn_item_ids == []
@@ -35,6 +35,36 @@ class TestCostTokens:
         t = CostTokens(audio_input=10, audio_output=20, text_input=5, text_output=3)
         assert t.total == 38
 
+    def test_from_realtime_usage_cached_tokens(self):
+        """Realtime usage의 cached_tokens_details를 캐시 입력 토큰으로 변환한다."""
+        t = CostTokens.from_realtime_usage({
+            "input_token_details": {
+                "audio_tokens": 100,
+                "text_tokens": 1200,
+                "cached_tokens": 1088,
+                "cached_tokens_details": {"audio_tokens": 64, "text_tokens": 1024},
+            },
+            "output_token_details": {"audio_tokens": 50, "text_tokens": 10},
+        })
+        assert (t.audio_input, t.text_input, t.audio_output, t.text_output) == (100, 1200, 50, 10)
+        assert (t.cached_audio_input, t.cached_text_input) == (64, 1024)
+        assert t.total == 1360  # 캐시 토큰은 input의 부분집합
+        assert t.realtime_cache_hit_rate == pytest.approx(1088 / 1300)
+
+    def test_from_realtime_usage_without_details(self):
+        """세부 내역 없이 cached_tokens만 있으면 텍스트 캐시로 본다."""
+        t = CostTokens.from_realtime_usage({"input_token_details": {"text_tokens": 1100, "cached_tokens": 1024}})
+        assert t.cached_text_input == 1024
+        assert t.cached_audio_input == 0
+
+    def test_cached_input_discounted(self):
+        """캐시 hit 입력은 할인 단가로 계산되고 절약액이 집계된다."""
+        full = CostTokens(text_input=2000, chat_input=1000)
+        cached = CostTokens(text_input=2000, cached_text_input=1000, chat_input=1000, chat_cached_input=1000)
+        assert cached.cost_usd == pytest.approx(full.cost_usd - cached.cache_savings_usd)
+        assert cached.cache_savings_usd > 0
+        assert cached.chat_cache_hit_rate == 1.0
+
 
 class TestTranscriptEntry:
     def test_create_entry(self):
@@ -0,0 +1,176 @@
+"""UserAudioSilenceGate 단위 테스트.
+
+핵심 검증 사항:
+  - 무음 청크 억제 (pre-roll 버퍼에만 보관)
+  - 발화 시작 시 pre-roll flush + 발화 청크 전달
+  - hangover 구간 무음 전달 → 이후 억제
+  - commit(): 발화 경계 / 잘린 무음 길이 반환 + 세그먼트 리셋
+  - VoiceToVoicePipeline 연동: 억제된 청크는 Session A에 전송되지 않음
+  - Server VAD 모드에서는 게이트 비활성 (end-of-speech 감지 보호)
+"""
+
+import base64
+import struct
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.realtime.user_audio_gate import UserAudioSilenceGate
+from src.types import VadMode
+
+# 100ms @ 16kHz pcm16 = 1600 samples = 3200 bytes
+_CHUNK_SAMPLES = 1600
+
+
+def _pcm16(amplitude: int) -> bytes:
+    return struct.pack(f"<{_CHUNK_SAMPLES}h", *([amplitude] * _CHUNK_SAMPLES))
+
+
+SILENCE = _pcm16(0)
+SPEECH = _pcm16(2000)
+
+
+class TestUserAudioSilenceGate:
+    def test_silence_suppressed(self):
+        """발화 전 무음은 전달되지 않는다."""
+        gate = UserAudioSilenceGate(rms_threshold=200, hangover_ms=200, preroll_ms=200)
+        assert gate.process(SILENCE) == []
+        assert gate.sent_ms == 0
+
+    def test_speech_flushes_preroll(self):
+        """발화 시작 시 preroll_ms 만큼의 직전 무음이 함께 전달된다."""
+        gate = UserAudioSilenceGate(rms_threshold=200, hangover_ms=200, preroll_ms=200)
+        for _ in range(5):
+            gate.process(SILENCE)
+        out = gate.process(SPEECH)
+        assert out == [SILENCE, SILENCE, SPEECH]
+        assert gate.in_speech
+
+    def test_hangover_then_suppress(self):
+        """발화 후 hangover 구간은 전달, 이후 무음은 억제된다."""
+        gate = UserAudioSilenceGate(rms_threshold=200, hangover_ms=200, preroll_ms=0)
+        gate.process(SPEECH)
+        assert gate.process(SILENCE) == [SILENCE]
+        assert gate.process(SILENCE) == [SILENCE]
+        assert gate.process(SILENCE) == []
+        assert not gate.in_speech
+
+    def test_commit_boundaries(self):
+        """commit이 발화 경계와 잘린 무음 길이를 반환하고 세그먼트를 리셋한다."""
+        gate = UserAudioSilenceGate(rms_threshold=200, hangover_ms=100, preroll_ms=100)
+        for chunk in [SILENCE] * 10 + [SPEECH] * 3 + [SILENCE] * 10:
+            gate.process(chunk)
+        b = gate.commit()
+        assert b.has_speech
+        assert b.speech_start_ms == pytest.approx(1000.0)
+        assert b.speech_end_ms == pytest.approx(1300.0)
+        assert b.segment_ms == pytest.approx(2300.0)
+        # pre-roll 100 + speech 300 + hangover 100
+        assert b.sent_ms == pytest.approx(500.0)
+        assert b.trimmed_ms == pytest.approx(1800.0)
+        assert gate.sent_ms == 0
+
+    def test_commit_without_speech(self):
+        """발화 없는 세그먼트는 has_speech=False."""
+        gate = UserAudioSilenceGate(rms_threshold=200)
+        gate.process(SILENCE)
+        assert gate.commit().has_speech is False
+
+
+class TestVoiceToVoiceSilenceGate:
+    """VoiceToVoicePipeline.handle_user_audio/commit 연동."""
+
+    def _make_pipeline(self):
+        from tests.test_voice_to_voice_pipeline import _make_router
+
+        router = _make_router()
+        router.user_audio_gate = UserAudioSilenceGate(
+            rms_threshold=200, hangover_ms=100, preroll_ms=100,
+        )
+        router.session_a.send_user_audio = AsyncMock()
+        router.session_a.commit_user_audio = AsyncMock()
+        router.recovery_a = MagicMock()
+        router.recovery_a.is_recovering = False
+        router.recovery_a.is_degraded = False
+        router.context_manager = MagicMock()
+        router.context_manager.inject_context = AsyncMock()
+        return router
+
+    @pytest.mark.asyncio
+    async def test_silence_not_sent_to_session_a(self):
+        router = self._make_pipeline()
+        await router.handle_user_audio(base64.b64encode(SILENCE).decode())
+        router.session_a.send_user_audio.assert_not_called()
+        # 의도적 폐기 → ring buffer에는 sent로 마킹 (recovery 재전송 방지)
+        assert router.ring_buffer_a.gap == 0
+
+    @pytest.mark.asyncio
+    async def test_commit_records_trimmed_silence(self):
+        router = self._make_pipeline()
+        for chunk in [SILENCE] * 5 + [SPEECH] * 2 + [SILENCE] * 5:
+            await router.handle_user_audio(base64.b64encode(chunk).decode())
+        await router.handle_user_audio_commit()
+
+        m = router.call.call_metrics
+        assert m.session_a_trimmed_silence_ms == [pytest.approx(800.0)]
+        assert m.user_audio_suppressed_ms == pytest.approx(800.0)
+        router.session_a.commit_user_audio.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_commit_without_speech_flushes_preroll(self):
+        """발화가 감지되지 않은 commit은 pre-roll을 전송해 빈 버퍼 commit을 방지한다."""
+        router = self._make_pipeline()
+        for _ in range(3):
+            await router.handle_user_audio(base64.b64encode(SILENCE).decode())
+        await router.handle_user_audio_commit()
+
+        router.session_a.send_user_audio.assert_called_once()
+        router.session_a.commit_user_audio.assert_called_once()
+
+
+class TestSilenceGateVadMode:
+    """Session A VAD 모드별 게이트 활성화."""
+
+    def _make_router(self, vad_mode: VadMode):
+        from src.realtime.audio_router import AudioRouter
+        from tests.test_voice_to_voice_pipeline import _make_call
+
+        dual = MagicMock()
+        dual.vad_mode = vad_mode
+        with (
+            patch("src.realtime.pipeline.voice_to_voice.settings") as mock_settings,
+            patch("src.realtime.pipeline.voice_to_voice.LocalVAD"),
+        ):
+            mock_settings.guardrail_enabled = False
+            mock_settings.ring_buffer_capacity_slots = 100
+            mock_settings.local_vad_enabled = False
+            mock_settings.user_audio_silence_suppression_enabled = True
+            mock_settings.user_audio_silence_rms_threshold = 200.0
+            mock_settings.user_audio_silence_hangover_ms = 500.0
+            mock_settings.user_audio_silence_preroll_ms = 300.0
+            return AudioRouter(
+                call=_make_call(),
+                dual_session=dual,
+                twilio_handler=MagicMock(),
+                app_ws_send=AsyncMock(),
+            )
+
+    def test_disabled_with_server_vad(self):
+        """Server VAD는 무음으로 발화 종료를 판단하므로 게이트를 쓰지 않는다."""
+        router = self._make_router(VadMode.SERVER)
+        assert router.user_audio_gate is None
+
+    @pytest.mark.asyncio
+    async def test_server_vad_receives_silence(self):
+        """Server VAD 모드에서는 무음 청크도 그대로 Session A로 전달된다."""
+        router = self._make_router(VadMode.SERVER)
+        router.session_a.send_user_audio = AsyncMock()
+        router.recovery_a = MagicMock(is_recovering=False, is_degraded=False)
+
+        await router.handle_user_audio(base64.b64encode(SILENCE).decode())
+
+        router.session_a.send_user_audio.assert_awaited_once()
+
+    def test_enabled_with_client_commit(self):
+        router = self._make_router(VadMode.CLIENT)
+        assert router.user_audio_gate is not None
@@ -76,6 +76,7 @@ def _make_router(**call_overrides) -> AudioRouter:
         mock_settings.audio_energy_min_rms = 150.0
         mock_settings.echo_energy_threshold_rms = 400.0
         mock_settings.local_vad_enabled = False
+        mock_settings.user_audio_silence_suppression_enabled = False
         mock_settings.echo_post_settling_s = 2.0
         router = AudioRouter(
             call=call,
@@ -121,6 +122,7 @@ def _make_router_with_local_vad(**call_overrides) -> AudioRouter:
         mock_settings.audio_energy_min_rms = 150.0
         mock_settings.echo_energy_threshold_rms = 400.0
         mock_settings.local_vad_enabled = True
+        mock_settings.user_audio_silence_suppression_enabled = False
         mock_settings.local_vad_rms_threshold = 200.0
         mock_settings.local_vad_speech_threshold = 0.5
         mock_settings.local_vad_silence_threshold = 0.35
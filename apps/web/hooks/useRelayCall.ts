@@ -13,6 +13,7 @@ import { useRelayWebSocket } from './useRelayWebSocket';
 import { useClientVad } from './useClientVad';
 import { useWebAudioPlayer } from './useWebAudioPlayer';
 import { useRelayCallStore, type CallMetrics, type EventLogEntry } from './useRelayCallStore';
+import { retractSupersededCaption } from '@/lib/captions';
 
 // --- Pipeline Event Log helpers (module scope for stable reference) ---
 const PIPELINE_STAGE_TAG_MAP: Record<string, { tag: string; color: string }> = {
@@ -76,6 +77,13 @@ export function useRelayCall(communicationMode: CommunicationMode = 'voice_to_vo
     speaker: string;
   } | null>(null);
 
+  // Provisional original caption (STT deltas): the server sends the accumulated text,
+  // which replaces the previous provisional text; the final caption replaces it too.
+  // len = length of the provisional tail appended to the last Stage 1 caption
+  // Cleared once the turn's caption is final (final original, merged translation,
+  // caption_done or superseded) so a later turn never rewrites an older caption
+  const provisionalRef = useRef<{ len: number } | null>(null);
+
   // Handle incoming WS messages
   const handleMessage = useCallback(
     (msg: RelayWsMessage) => {
@@ -97,6 +105,27 @@ export function useRelayCall(communicationMode: CommunicationMode = 'voice_to_vo
           const text = (msg.data.text as string) ?? '';
 
           const cur = streamingRef.current;
+          const provisional = msg.data.provisional === true;
+          const pending = provisionalRef.current;
+
+          // Provisional original caption already shown: replace its text with the
+          // updated provisional text, the final caption, or nothing (retracted)
+          if (stage === 1 && pending) {
+            provisionalRef.current = provisional && text ? { len: text.length } : null;
+            setCaptions((prev) => {
+              const last = prev[prev.length - 1];
+              if (!last || last.stage !== 1) return prev;
+              const nextText = last.text.slice(0, last.text.length - pending.len) + text;
+              return nextText
+                ? [...prev.slice(0, -1), { ...last, text: nextText }]
+                : prev.slice(0, -1);
+            });
+            break;
+          }
+          if (provisional) {
+            if (!text) break;
+            provisionalRef.current = { len: text.length };
+          }
 
           // Append to existing caption if same speaker + direction + stage
           if (cur &&
@@ -113,6 +142,8 @@ export function useRelayCall(communicationMode: CommunicationMode = 'voice_to_vo
             });
           } else if (stage === 2 && direction === 'inbound') {
             // Stage 2(번역) 시작 시: 직전 Stage 1(원문)을 찾아 병합
+            // 병합된 원문은 더 이상 잠정 자막이 아님 → 이후 턴의 원문이 이 캡션을 덮어쓰지 않도록 해제
+            provisionalRef.current = null;
             setCaptions((prev) => {
               // 직전 Stage 1 엔트리 찾기 (같은 speaker, inbound)
               const lastStage1Idx = prev.length > 0 && prev[prev.length - 1].stage === 1
@@ -213,6 +244,11 @@ export function useRelayCall(communicationMode: CommunicationMode = 'voice_to_vo
             // Session B 번역 완료 → 스트리밍 컨텍스트 리셋
             // 다음 수신자 발화 delta가 새 캡션 엔트리로 생성됨
             streamingRef.current = null;
+            provisionalRef.current = null;
+            // 스트리밍 번역이 대체/실패됨 → 부분 번역 자막 철회 (원문은 복원, 새 번역이 다시 병합)
+            if (msg.data.superseded === true) {
+              setCaptions(retractSupersededCaption);
+            }
           } else if (state) {
             setTranslationState(state as TranslationState);
           }
@@ -329,6 +365,7 @@ export function useRelayCall(communicationMode: CommunicationMode = 'voice_to_vo
       setIsMuted(false);
       captionCounterRef.current = 0;
       streamingRef.current = null;
+      provisionalRef.current = null;
       setWsUrl(relayWsUrl);
     },
     [],
@@ -0,0 +1,64 @@
+import assert from 'node:assert/strict';
+import { describe, it } from 'node:test';
+import type { CaptionEntry } from '../shared/call-types';
+import { retractSupersededCaption } from './captions';
+
+function caption(overrides: Partial<CaptionEntry>): CaptionEntry {
+  return {
+    id: 'caption-1',
+    speaker: 'recipient',
+    text: '',
+    language: '',
+    isFinal: false,
+    timestamp: 0,
+    ...overrides,
+  };
+}
+
+describe('retractSupersededCaption', () => {
+  it('restores the Stage 1 original behind a superseded partial translation', () => {
+    const prev = [
+      caption({ id: 'caption-1', speaker: 'user', text: 'Hi', stage: 1 }),
+      caption({ id: 'caption-2', text: 'What time', originalText: '몇 시에 오실', stage: 2 }),
+    ];
+
+    const next = retractSupersededCaption(prev);
+
+    assert.equal(next.length, 2);
+    assert.equal(next[1].id, 'caption-2');
+    assert.equal(next[1].text, '몇 시에 오실');
+    assert.equal(next[1].stage, 1);
+    assert.equal(next[1].originalText, undefined);
+  });
+
+  it('removes a standalone partial translation', () => {
+    const prev = [
+      caption({ id: 'caption-1', text: '네', originalText: '네', stage: 2 }),
+      caption({ id: 'caption-2', text: 'What ti', stage: 2 }),
+    ];
+
+    assert.deepEqual(retractSupersededCaption(prev), [prev[0]]);
+  });
+
+  it('retracts the last recipient translation even if an outbound caption followed', () => {
+    const prev = [
+      caption({ id: 'caption-1', text: 'What time', originalText: '몇 시', stage: 2 }),
+      caption({ id: 'caption-2', speaker: 'ai', text: '저녁 7시요', stage: 2 }),
+    ];
+
+    const next = retractSupersededCaption(prev);
+
+    assert.deepEqual(
+      next.map((c) => [c.id, c.stage]),
+      [
+        ['caption-1', 1],
+        ['caption-2', 2],
+      ],
+    );
+  });
+
+  it('leaves captions unchanged when there is no translation to retract', () => {
+    const prev = [caption({ text: '여보세요', stage: 1 })];
+    assert.equal(retractSupersededCaption(prev), prev);
+  });
+});
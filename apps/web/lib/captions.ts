@@ -0,0 +1,35 @@
+import type { CaptionEntry } from '../shared/call-types';
+
+/**
+ * Retract a streamed Stage 2 (translation) caption that the server superseded.
+ *
+ * The relay sends `caption_done` with `superseded: true` when an in-flight streamed
+ * translation is cancelled (new speech arrived) or fails mid-stream. The partial
+ * translation is dropped; if it was merged with a Stage 1 original, that original is
+ * restored so the replacement translation merges with it instead of being appended
+ * as a duplicate entry.
+ */
+export function retractSupersededCaption(prev: CaptionEntry[]): CaptionEntry[] {
+  let idx = -1;
+  for (let i = prev.length - 1; i >= 0; i--) {
+    if (prev[i].stage === 2 && prev[i].speaker === 'recipient') {
+      idx = i;
+      break;
+    }
+  }
+  if (idx < 0) return prev;
+
+  const partial = prev[idx];
+  if (!partial.originalText) return [...prev.slice(0, idx), ...prev.slice(idx + 1)];
+
+  const original: CaptionEntry = {
+    id: partial.id,
+    speaker: partial.speaker,
+    text: partial.originalText,
+    language: partial.language,
+    isFinal: false,
+    timestamp: partial.timestamp,
+    stage: 1,
+  };
+  return [...prev.slice(0, idx), original, ...prev.slice(idx + 1)];
+}